@@ -8,29 +8,63 @@
 #***************************************************************************************************
 """ A Python implementation of LinearOperator Set Tomography """
 
+import importlib as _importlib
+
 from . import baseobjs
-from . import algorithms as alg
 from . import circuits
 from . import data
 from . import models
 from . import modelmembers as mm
 from . import forwardsims
 from . import processors
-from . import protocols
-from . import report as rpt
 from . import serialization
 
 # Import the most important/useful routines of each module/sub-package
 # into the package namespace
 from ._version import version as __version__
-from .algorithms.contract import *
-from .algorithms.core import *
-from .algorithms.gaugeopt import *
-from .algorithms.grammatrix import *
-from pygsti.tools.gatetools import *  # *_qubit_gate fns
-from .drivers import *
 from .tools import *
 # NUMPY BUG FIX (imported from tools)
 from pygsti.baseobjs._compatibility import _numpy14einsumfix
 
 _numpy14einsumfix()
+
+# The sub-packages below are slow to import (they pull in, e.g., the report-generation code), so they
+# are only imported when first accessed as attributes of this package, e.g. `pygsti.protocols`.
+_LAZY_SUBPACKAGES = {'alg': 'algorithms', 'algorithms': 'algorithms', 'protocols': 'protocols',
+                     'rpt': 'report', 'report': 'report', 'drivers': 'drivers', 'io': 'io',
+                     'objectivefns': 'objectivefns', 'optimize': 'optimize'}
+
+# Names that `import pygsti` used to star-import from the slow sub-packages, grouped by the module each
+# is imported from when first accessed (test/unit/test_import.py checks these against the modules).
+_LAZY_NAMES = {name: module_name for module_name, names in (
+    ('.algorithms.contract', ('contract',)),
+    ('.algorithms.core', ('BuiltinBasis', 'CUSTOMLM', 'DirectSumBasis', 'FLOATSIZE', 'VerbosityPrinter',
+                          'find_closest_unitary_opmx', 'gram_rank_and_eigenvalues', 'iterative_gst_generator',
+                          'run_gst_fit', 'run_gst_fit_simple', 'run_iterative_gst', 'run_lgst')),
+    ('.algorithms.gaugeopt', ('gaugeopt_custom', 'gaugeopt_to_target')),
+    ('.algorithms.grammatrix', ('max_gram_basis', 'max_gram_rank_and_eigenvalues')),
+    ('.drivers', ('BootstrapStatistics', 'DEFAULT_BAD_FIT_THRESHOLD', 'ForwardSimulator', 'Optional',
+                  'ROBUST_SUFFIX_LIST', 'bootstrap', 'create_bootstrap_dataset', 'create_bootstrap_models',
+                  'create_explicit_model', 'gauge_optimize_models', 'longsequence', 'run_bootstrap_replicas',
+                  'run_linear_gst', 'run_long_sequence_gst', 'run_long_sequence_gst_base', 'run_model_test',
+                  'run_stdpractice_gst'))) for name in names}
+
+# `from pygsti import *` imports the lazily imported names too
+__all__ = sorted(set(name for name in globals() if not name.startswith('_'))
+                 | set(_LAZY_SUBPACKAGES) | set(_LAZY_NAMES))
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBPACKAGES:
+        value = _importlib.import_module('.' + _LAZY_SUBPACKAGES[name], __name__)
+    elif name in _LAZY_NAMES:
+        value = getattr(_importlib.import_module(_LAZY_NAMES[name], __name__), name)
+    else:  # e.g. IPython's probes for `_ipython_display_`, which mustn't import the slow sub-packages
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    globals()[name] = value  # so __getattr__ isn't called again for this name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_LAZY_SUBPACKAGES) | set(_LAZY_NAMES))
@@ -13,7 +13,8 @@ LinearOperator Set Tomography Algorithms Python Package
 #Import the most important/useful routines of each module into
 # the package namespace
 
-from .compilers import compile_clifford, compile_stabilizer_state, compile_stabilizer_measurement, compile_cnot_circuit
+from .compilers import compile_clifford, compile_stabilizer_state, compile_stabilizer_measurement, \
+    compile_cnot_circuit, CliffordCompilationCache
 from .contract import *
 from .core import *
 from .fiducialpairreduction import *
@@ -22,3 +23,5 @@ from .gaugeopt import *
 from .germselection import *
 from .grammatrix import *
 from .mirroring import *
+# (sub-modules used by, e.g., pygsti.protocols, which `import pygsti` no longer imports)
+from . import rbfit, robust_phase_estimation
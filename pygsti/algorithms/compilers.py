@@ -11,11 +11,14 @@ Clifford circuit, CNOT circuit, and stabilizer state/measurement generation comp
 #***************************************************************************************************
 
 import copy as _copy
+import hashlib as _hashlib
 
 import numpy as _np
 
 from pygsti.circuits.circuit import Circuit as _Circuit
 from pygsti.baseobjs.label import Label as _Label
+from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
+from pygsti.tools import listtools as _lt
 from pygsti.tools import matrixmod2 as _mtx
 from pygsti.tools import symplectic as _symp
 
@@ -246,6 +249,196 @@ def compile_clifford(s, p, pspec=None, absolute_compilation=None, paulieq_compil
     return circuit
 
 
+class CliffordCompilationCache(_NicelySerializable):
+    """
+    A cache of compiled Clifford circuits, keyed by the Clifford and the device it was compiled for.
+
+    Entries are keyed by the symplectic matrix and phase vector of the Clifford together with
+    the qubit labels, gate names and connectivity of the processor specification, the content
+    of the compilation rules and the compilation options.  A Clifford that is not yet in the
+    cache is compiled using a random number generator seeded from its symplectic representation,
+    so that each compilation is a deterministic function of its key.  This makes the cache
+    transparent: the circuits obtained are the same whether or not a Clifford was already cached,
+    and caches filled in different processes can be merged with :meth:`update`.  Because keys
+    don't depend on object identities, a cache can be saved with :meth:`write` and reused in a
+    later session by loading it with :meth:`read`.
+
+    Note that, because of this seeding, compilations obtained through a cache generally differ
+    from those obtained by calling :func:`compile_clifford` with a shared `rand_state`.
+
+    A cache can be given to the Clifford, direct and interleaved RB experiment designs, which
+    compile random n-qubit Cliffords.  Mirror RB designs don't take one: their circuits invert
+    sampled native layers gate-by-gate and only look up 1-qubit Cliffords and Paulis in the
+    absolute compilation rules, so they never compile a Clifford.
+    """
+
+    def __init__(self):
+        self._compilations = {}
+        self._keys = []  # insertion order, so recently added entries can be sliced off cheaply
+        self._rules_keys = {}  # id(compilation rules) => (rules, rule-counts, rules key), see _compilation_rules_key
+        super().__init__()
+
+    def __len__(self):
+        return len(self._compilations)
+
+    def __contains__(self, key):
+        return key in self._compilations
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_rules_keys'] = {}  # keyed by object ids, which aren't meaningful in another process
+        return state
+
+    def _compilation_rules_key(self, rules):
+        """ A digest of the content of the compilation rules `rules` (which determine the compiled circuits) """
+        if rules is None: return None
+        rule_counts = (len(rules.gate_unitaries), len(rules.local_templates), len(rules.function_templates),
+                       len(rules.specific_compilations))  # so rules added after a key is computed are noticed
+        cached = self._rules_keys.get(id(rules), None)
+        if cached is not None and cached[0] is rules and cached[1] == rule_counts:
+            return cached[2]
+
+        def _fn_name(fn):
+            return getattr(fn, '__module__', '') + '.' + getattr(fn, '__qualname__', repr(fn))
+
+        def _unitary_str(unitary):
+            if unitary is None: return 'None'
+            if callable(unitary): return _fn_name(unitary)
+            return _np.asarray(unitary, complex).round(12).tobytes().hex()
+
+        contents = [type(rules).__name__, str(getattr(rules, 'compile_type', None))]
+        contents.extend(['U:%s=%s' % (nm, _unitary_str(u)) for nm, u in rules.gate_unitaries.items()])
+        contents.extend(['T:%s=%s' % (nm, c.str) for nm, c in rules.local_templates.items()])
+        contents.extend(['F:%s=%s' % (nm, _fn_name(fn)) for nm, fn in rules.function_templates.items()])
+        contents.extend(['S:%s=%s' % (str(lbl), c.str) for lbl, c in rules.specific_compilations.items()])
+        rules_key = _hashlib.sha256('\n'.join(contents).encode()).hexdigest()
+        self._rules_keys[id(rules)] = (rules, rule_counts, rules_key)
+        return rules_key
+
+    def key(self, s, p, pspec=None, absolute_compilation=None, paulieq_compilation=None, qubit_labels=None,
+            iterations=20, *compilerargs):
+        """
+        The key used to store the compilation of the Clifford `(s, p)`.
+
+        Parameters
+        ----------
+        s : array over [0,1]
+            The symplectic matrix of the Clifford.
+
+        p : array over [0,1]
+            The phase vector of the Clifford.
+
+        pspec : QubitProcessorSpec, optional
+            The processor specification the Clifford is compiled for.
+
+        absolute_compilation : CompilationRules, optional
+            The rules for exactly compiling the native gates of `pspec`, as in :func:`compile_clifford`.
+
+        paulieq_compilation : CompilationRules, optional
+            The rules for compiling the native gates of `pspec` up to Paulis, as in :func:`compile_clifford`.
+
+        qubit_labels : list, optional
+            The qubits the Clifford is compiled for, as in :func:`compile_clifford`.
+
+        iterations : int, optional
+            The number of compilation iterations, as in :func:`compile_clifford`.
+
+        compilerargs : list
+            The remaining positional arguments of :func:`compile_clifford`.
+
+        Returns
+        -------
+        tuple
+        """
+        if pspec is not None:
+            device = (tuple(pspec.qubit_labels), tuple(sorted(pspec.gate_names)),
+                      tuple(pspec.qubit_graph.edges(include_directions=True)))
+        else:
+            device = None
+        if qubit_labels is not None: qubit_labels = tuple(qubit_labels)
+        s = _np.asarray(s, _np.int64); p = _np.asarray(p, _np.int64)
+        return ('%d:%s' % (s.shape[0], _np.packbits(s.astype(_np.uint8)).tobytes().hex()),
+                '%d:%s' % (p.shape[0], _np.packbits(p.astype(_np.uint8)).tobytes().hex()),
+                qubit_labels, device, self._compilation_rules_key(absolute_compilation),
+                self._compilation_rules_key(paulieq_compilation), iterations, repr(compilerargs))
+
+    def compile_clifford(self, s, p, pspec=None, absolute_compilation=None, paulieq_compilation=None,
+                         qubit_labels=None, iterations=20, *compilerargs):
+        """
+        Compiles a Clifford, or retrieves its compilation from the cache.
+
+        Arguments are as for :func:`compile_clifford` except that there is no `rand_state`
+        argument: new compilations are seeded from the symplectic representation of the Clifford.
+
+        Returns
+        -------
+        Circuit
+            A (static) circuit implementing the input Clifford gate/circuit.
+        """
+        key = self.key(s, p, pspec, absolute_compilation, paulieq_compilation, qubit_labels, iterations,
+                       *compilerargs)
+        circuit = self._compilations.get(key, None)
+        if circuit is None:
+            seed = int.from_bytes(_hashlib.sha256((key[0] + key[1]).encode()).digest()[:4], 'little')
+            circuit = compile_clifford(s, p, pspec, absolute_compilation, paulieq_compilation, qubit_labels,
+                                       iterations, *compilerargs, rand_state=_np.random.RandomState(seed))
+            circuit = circuit.copy(editable=False)
+            self._compilations[key] = circuit
+            self._keys.append(key)
+        return circuit
+
+    def entries_since(self, num_entries):
+        """
+        The entries added to this cache after it held `num_entries` entries.
+
+        Parameters
+        ----------
+        num_entries : int
+            The size of the cache before the entries of interest were added.
+
+        Returns
+        -------
+        list
+            A list of `(key, circuit)` tuples, which can be passed to :meth:`update`.
+        """
+        return [(key, self._compilations[key]) for key in self._keys[num_entries:]]
+
+    def update(self, entries):
+        """
+        Adds compilations to this cache.
+
+        Parameters
+        ----------
+        entries : CliffordCompilationCache or list
+            Another cache, or a list of `(key, circuit)` tuples as returned by :meth:`entries_since`.
+
+        Returns
+        -------
+        None
+        """
+        if isinstance(entries, CliffordCompilationCache):
+            entries = entries._compilations.items()
+        for key, circuit in entries:
+            if key not in self._compilations:
+                self._compilations[key] = circuit
+                self._keys.append(key)
+
+    def _to_nice_serialization(self):
+        state = super()._to_nice_serialization()
+        state['compilations'] = [(key, self._compilations[key].str) for key in self._keys]
+        return state
+
+    @classmethod
+    def _from_nice_serialization(cls, state):
+        from pygsti.io import stdinput as _stdinput
+        std = _stdinput.StdInputParser()
+        ret = cls()
+        create_subcircuits = not _Circuit.default_expand_subcircuits
+        ret.update([(_lt.lists_to_tuples(key), std.parse_circuit(circuit_str, create_subcircuits=create_subcircuits))
+                    for key, circuit_str in state['compilations']])
+        return ret
+
+
 def compile_symplectic(s, pspec=None, absolute_compilation=None, paulieq_compilation=None, qubit_labels=None,
                        iterations=20, algorithms=None, costfunction='2QGC:10:depth:1', paulirandomize=False,
                        aargs=None, check=True, rand_state=None):
@@ -749,8 +942,8 @@ def _compile_symplectic_using_gge_core(s, check=True):
         # *** Step 1: Set the upper half of column j to the relevant identity column ***
         upperl_c = sout[:n, j]
         lowerl_c = sout[n:, j]
-        upperl_ones = list(_np.nonzero(upperl_c == 1)[0])
-        lowerl_ones = list(_np.nonzero(lowerl_c == 1)[0])
+        upperl_ones = _np.nonzero(upperl_c == 1)[0].tolist()
+        lowerl_ones = _np.nonzero(lowerl_c == 1)[0].tolist()
 
         # If the jth element in the column is not 1, it needs to be set to 1.
         if j not in upperl_ones:
@@ -779,8 +972,8 @@ def _compile_symplectic_using_gge_core(s, check=True):
             # Update the lists that keep track of where the 1s are in the column.
             upperl_c = sout[:n, j]
             lowerl_c = sout[n:, j]
-            upperl_ones = list(_np.nonzero(upperl_c == 1)[0])
-            lowerl_ones = list(_np.nonzero(lowerl_c == 1)[0])
+            upperl_ones = _np.nonzero(upperl_c == 1)[0].tolist()
+            lowerl_ones = _np.nonzero(lowerl_c == 1)[0].tolist()
 
         # Pair up qubits with 1s in the jth upper jth column, and set all but the
         # jth qubit to 0 in logarithmic depth. When there is an odd number of qubits
@@ -805,8 +998,8 @@ def _compile_symplectic_using_gge_core(s, check=True):
         # *** Step 2: Set the lower half of column j to all zeros ***
         upperl_c = sout[:n, j]
         lowerl_c = sout[n:, j]
-        upperl_ones = list(_np.nonzero(upperl_c == 1)[0])
-        lowerl_ones = list(_np.nonzero(lowerl_c == 1)[0])
+        upperl_ones = _np.nonzero(upperl_c == 1)[0].tolist()
+        lowerl_ones = _np.nonzero(lowerl_c == 1)[0].tolist()
 
         # If the jth element in this lower column is 1, it must be set to 0.
         if j in lowerl_ones:
@@ -821,7 +1014,7 @@ def _compile_symplectic_using_gge_core(s, check=True):
         upperl_c = None
         upperl_ones = None
         lowerl_c = sout[n:, j]
-        lowerl_ones = list(_np.nonzero(lowerl_c == 1)[0])
+        lowerl_ones = _np.nonzero(lowerl_c == 1)[0].tolist()
 
         while len(lowerl_ones) >= 2:
 
@@ -847,8 +1040,8 @@ def _compile_symplectic_using_gge_core(s, check=True):
         # *** Step 3: Set the lower half of column j+d to the relevant identity column ***
         upperl_c = sout[:n, j + n]
         lowerl_c = sout[n:, j + n]
-        upperl_ones = list(_np.nonzero(upperl_c == 1)[0])
-        lowerl_ones = list(_np.nonzero(lowerl_c == 1)[0])
+        upperl_ones = _np.nonzero(upperl_c == 1)[0].tolist()
+        lowerl_ones = _np.nonzero(lowerl_c == 1)[0].tolist()
 
         while len(lowerl_ones) >= 2:
 
@@ -871,8 +1064,8 @@ def _compile_symplectic_using_gge_core(s, check=True):
         # *** Step 4: Set the upper half of column j+d to all zeros ***
         upperl_c = sout[:n, j + n]
         lowerl_c = sout[n:, j + n]
-        upperl_ones = list(_np.nonzero(upperl_c == 1)[0])
-        lowerl_ones = list(_np.nonzero(lowerl_c == 1)[0])
+        upperl_ones = _np.nonzero(upperl_c == 1)[0].tolist()
+        lowerl_ones = _np.nonzero(lowerl_c == 1)[0].tolist()
 
         # If the jth element in the upper column is 1 it must be set to zero
         if j in upperl_ones:
@@ -888,7 +1081,7 @@ def _compile_symplectic_using_gge_core(s, check=True):
         _symp.apply_internal_gate_to_symplectic(sout, 'H', [j, ])
 
         upperl_c = sout[:n, j + n]
-        upperl_ones = list(_np.nonzero(upperl_c == 1)[0])
+        upperl_ones = _np.nonzero(upperl_c == 1)[0].tolist()
         lowerl_c = None
         lowerl_ones = None
 
@@ -781,7 +781,7 @@ def run_iterative_gst(dataset, start_model, circuit_lists,
 
 def iterative_gst_generator(dataset, start_model, circuit_lists,
                       optimizer, iteration_objfn_builders, final_objfn_builders,
-                      resource_alloc, starting_index=0, verbosity=0):
+                      resource_alloc, starting_index=0, verbosity=0, precomputation=None):
     """
     Performs Iterative Gate Set Tomography on the dataset.
     Same as `run_iterative_gst`, except this function produces a
@@ -829,6 +829,10 @@ def iterative_gst_generator(dataset, start_model, circuit_lists,
     verbosity : int, optional
         How much detail to send to stdout.
 
+    precomputation : DatasetCircuitsPrecomputation, optional
+        Precomputed quantities for `dataset` and `circuit_lists` (circuit structures,
+        layouts and count arrays) to use and add to, e.g. to share them with runs on
+        differently-parameterized models.  If None, a new object is used.
 
     Returns
     -------
@@ -874,32 +878,14 @@ def iterative_gst_generator(dataset, start_model, circuit_lists,
     
     #precompute the COPA layouts. During the layout construction there are memory availability checks,
     #So by doing it this way we should be able to reduce the number of instances of running out of memory before the end.
-    #The ModelDatasetCircuitsStore
+    #The circuit structures, layouts and data arrays are taken from (and added to) `precomputation`, so
+    #that they can be shared with other runs on the same data and circuits.
+    if precomputation is None:
+        precomputation = _objfns.DatasetCircuitsPrecomputation(dataset, circuit_lists)
     printer.log('Precomputing CircuitOutcomeProbabilityArray layouts for each iteration.', 2)
-    precomp_layouts = []
-
-    #pre-compute a dictionary caching completed circuits for layout construction performance.
-    unique_circuits = list({ckt for circuit_list in circuit_lists for ckt in circuit_list})
-    if isinstance(mdl.sim, (_fwdsims.MatrixForwardSimulator, _fwdsims.MapForwardSimulator)):
-        precomp_layout_circuit_cache = mdl.sim.create_copa_layout_circuit_cache(unique_circuits, mdl, dataset=dataset)
-    else:
-        precomp_layout_circuit_cache = None
-
     for i, circuit_list in enumerate(circuit_lists):
         printer.log(f'Layout for iteration {i}', 2)
-        precomp_layouts.append(mdl.sim.create_layout(circuit_list, dataset, resource_alloc, array_types, verbosity= printer - 1,
-                                                    layout_creation_circuit_cache = precomp_layout_circuit_cache))
-        
-    #precompute a cache of possible outcome counts for each circuits to accelerate MDC store creation
-    if isinstance(mdl, _models.model.OpModel):
-        if precomp_layout_circuit_cache is not None: #then grab the split circuits from there.
-            expanded_circuit_outcome_list = mdl.bulk_expand_instruments_and_separate_povm(unique_circuits, 
-                                                                                          completed_circuits= precomp_layout_circuit_cache['completed_circuits'].values())
-        else:
-            expanded_circuit_outcome_list = mdl.bulk_expand_instruments_and_separate_povm(unique_circuits)        
-        outcome_count_by_circuit_cache = {ckt: len(outcome_tup) for ckt,outcome_tup in zip(unique_circuits, expanded_circuit_outcome_list)}
-    else:
-        outcome_count_by_circuit_cache = {ckt: mdl.compute_num_outcomes(ckt) for ckt in unique_circuits}
+        precomputation.layout(mdl, circuit_list, resource_alloc, array_types, verbosity=printer - 1)
 
     with printer.progress_logging(1):
         for i in range(starting_index, len(circuit_lists)):
@@ -915,10 +901,8 @@ def iterative_gst_generator(dataset, start_model, circuit_lists,
             if circuitsToEstimate is None or len(circuitsToEstimate) == 0: continue
 
             mdl.basis = start_model.basis  # set basis in case of CPTP constraints (needed?)
-            initial_mdc_store = _objfns.ModelDatasetCircuitsStore(mdl, dataset, circuitsToEstimate, resource_alloc,
-                                                                  array_types=array_types, verbosity=printer - 1, 
-                                                                  precomp_layout = precomp_layouts[i],
-                                                                  outcome_count_by_circuit=outcome_count_by_circuit_cache)
+            initial_mdc_store = precomputation.create_mdc_store(mdl, circuitsToEstimate, resource_alloc,
+                                                               array_types, verbosity=printer - 1)
             mdc_store = initial_mdc_store
 
             for j, obj_fn_builder in enumerate(iteration_objfn_builders):
@@ -1110,7 +1094,8 @@ def _do_term_runopt(objective, optimizer, printer):
         else:
             # Try to get more paths if we can and use those regardless of whether there are failures
             #MEM debug_prof.print_memory("do_term_runopt3", True)
-            pathSet = mdl.sim.find_minimal_paths_set(layout)  # `mdl.sim` instead of `fwdsim` to
+            # only re-prune the circuits whose current paths have become insufficient
+            pathSet = mdl.sim.find_minimal_paths_set(layout, incremental=True)  # `mdl.sim` instead of `fwdsim` to
             #MEM debug_prof.print_memory("do_term_runopt4", True)
             mdl.sim.select_paths_set(layout, pathSet)  # ensure paramvec is updated
             #MEM debug_prof.print_memory("do_term_runopt5", True)
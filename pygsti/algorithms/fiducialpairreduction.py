@@ -32,6 +32,7 @@ from pygsti.tools import slicetools as _slct
 from pygsti.tools.legacytools import deprecate as _deprecated_fn
 
 from pygsti.algorithms.germselection import construct_update_cache, minamide_style_inverse_trace, compact_EVD, compact_EVD_via_SVD, germ_set_spanning_vectors
+from pygsti.algorithms.germselection import _find_best_candidate, _candidate_scoring_pool, _shared_search_state
 from pygsti.algorithms import scoring as _scoring
 
 from pygsti.tools.matrixtools import print_mx
@@ -513,7 +514,7 @@ def find_sufficient_fiducial_pairs_per_germ_greedy(target_model, prep_fiducials,
                                                 germs, prep_povm_tuples="first", constrain_to_tp=True,
                                                 inv_trace_tol= 10, initial_seed_mode='random',
                                                 evd_tol=1e-10, sensitivity_threshold=1e-10, seed=None ,verbosity=0, check_complete_fid_set=True,
-                                                mem_limit=None):
+                                                mem_limit=None, num_processes=1):
     """
     Finds a per-germ set of fiducial pairs that are amplificationally complete.
 
@@ -606,6 +607,10 @@ def find_sufficient_fiducial_pairs_per_germ_greedy(target_model, prep_fiducials,
     mem_limit : int, optional
         A memory limit in bytes.
 
+    num_processes : int, optional
+        The number of local worker processes used to score the candidate
+        fiducial pairs at each step of the greedy search.
+
     Returns
     -------
     dict
@@ -625,7 +630,7 @@ def find_sufficient_fiducial_pairs_per_germ_greedy(target_model, prep_fiducials,
     total_num_amplified_parameters=0
     
     printer.log("------  Per Germ (L=1) Fiducial Pair Reduction --------")
-    with printer.progress_logging(1):
+    with printer.progress_logging(1), _candidate_scoring_pool(num_processes) as pool:
         for i, germ in enumerate(germs):
             #Create a new model containing static target gates and a
             # special "germ" gate that is parameterized only by it's
@@ -650,7 +655,7 @@ def find_sufficient_fiducial_pairs_per_germ_greedy(target_model, prep_fiducials,
                                                                     inv_trace_tol, initial_seed_mode=initial_seed_mode,
                                                                     check_complete_fid_set=check_complete_fid_set, evd_tol=evd_tol,
                                                                     sensitivity_threshold=sensitivity_threshold,
-                                                                    germ_circuit= germ)
+                                                                    germ_circuit= germ, pool=pool, num_processes=num_processes)
             
             #print some output about the minimum eigenvalue acheived.
             printer.log('Score Achieved: ' + str(best_score), 2)
@@ -1299,7 +1304,7 @@ def _get_per_germ_power_fidpairs_greedy(prep_fiducials, meas_fiducials, prep_pov
                                  gsGerm, power, mem_limit, printer, seed, dof_per_povm,
                                  inv_trace_tol=10, initial_seed_mode= 'random',
                                  check_complete_fid_set= True, evd_tol=1e-10, sensitivity_threshold= 1e-10,
-                                 germ_circuit = None):
+                                 germ_circuit = None, pool=None, num_processes=1):
     #Get dP-matrix for full set of fiducials, where
     # P_ij = <E_i|germ^exp|rho_j>, i = composite EVec & fiducial index,
     #   j is similar, and derivs are wrt the "eigenvalues" of the germ
@@ -1419,92 +1424,103 @@ def _get_per_germ_power_fidpairs_greedy(prep_fiducials, meas_fiducials, prep_pov
                                                             elIndicesForPair, 
                                                             eigenvalue_tolerance=evd_tol)
     
-    for nNeededPairs in range(initial_pair_count, nPossiblePairs):
-        if nNeededPairs < min_pairs_needed:
-            printer.log("Searching for the best initial set of %d pairs. Need %d pairs for the initial set." %
-                    (nNeededPairs+1, min_pairs_needed), 2)
-        else:
-            printer.log("Beginning search for a good set of %d pairs" %
-                        (nNeededPairs), 2)
-            printer.log("    Inverse trace must be <= %g times more than the value for the full fiducial set" %
-                        (inv_trace_tol),2)
+    #The fiducial update EVD cache is fixed throughout the search, so it is shared with
+    #any worker processes just once.
+    with _shared_search_state(fiducial_update_EVD_cache, pool) as evd_cache_handle:
+        for nNeededPairs in range(initial_pair_count, nPossiblePairs):
+            if nNeededPairs < min_pairs_needed:
+                printer.log("Searching for the best initial set of %d pairs. Need %d pairs for the initial set." %
+                            (nNeededPairs+1, min_pairs_needed), 2)
+            else:
+                printer.log("Beginning search for a good set of %d pairs" %
+                            (nNeededPairs), 2)
+                printer.log("    Inverse trace must be <= %g times more than the value for the full fiducial set" %
+                            (inv_trace_tol),2)
             
-        #The pairs we want to iterate over in the upcoming greedy search are those
-        #in the set difference of allPairIndices-current_best_fiducial_list
-        if current_best_fiducial_list is None:
-            pairIndicesToIterateOver = cleaned_pair_indices_list
-            current_best_jacobian= None
-        else:
-            pairIndicesToIterateOver = list(set(cleaned_pair_indices_list)-set(current_best_fiducial_list))
-            current_best_jacobian= _np.take(dPall, _np.concatenate([elIndicesForPair[i] for i in current_best_fiducial_list]), axis=0)
-            #take the gramian of this jacobian.
-            current_best_jacobian= current_best_jacobian.T@current_best_jacobian
-            current_best_inv_trace = _np.trace(_np.linalg.pinv(current_best_jacobian))
+            #The pairs we want to iterate over in the upcoming greedy search are those
+            #in the set difference of allPairIndices-current_best_fiducial_list
+            if current_best_fiducial_list is None:
+                pairIndicesToIterateOver = cleaned_pair_indices_list
+                current_best_jacobian= None
+            else:
+                pairIndicesToIterateOver = list(set(cleaned_pair_indices_list)-set(current_best_fiducial_list))
+                current_best_jacobian= _np.take(dPall, _np.concatenate([elIndicesForPair[i]
+                                                                        for i in current_best_fiducial_list]), axis=0)
+                #take the gramian of this jacobian.
+                current_best_jacobian= current_best_jacobian.T@current_best_jacobian
+                current_best_inv_trace = _np.trace(_np.linalg.pinv(current_best_jacobian))
          
-        #Construct the update cache for the current_best_fiducial_list's jacobian.
-        if current_best_jacobian is not None:
-            update_cache= construct_update_cache(current_best_jacobian, evd_tol=evd_tol)
-            current_best_rank= len(update_cache[0])
-
-            #make a CompositeScore object for the current best fiducial set.
-            current_best_score= _scoring.CompositeScore(-current_best_rank, current_best_inv_trace, current_best_rank)
+            #Construct the update cache for the current_best_fiducial_list's jacobian.
+            if current_best_jacobian is not None:
+                update_cache= construct_update_cache(current_best_jacobian, evd_tol=evd_tol)
+                current_best_rank= len(update_cache[0])
+
+                #make a CompositeScore object for the current best fiducial set.
+                current_best_score= _scoring.CompositeScore(-current_best_rank, current_best_inv_trace,
+                                                            current_best_rank)
             
-        else:
-            update_cache= None  
-            current_best_score= None
-
-        printer.log('Initial Score: ' + str(current_best_score), 3)
-        
-        for pairIndexToTest in pairIndicesToIterateOver:    
-            printer.log('Tested Index: %d' %(pairIndexToTest), 4)
+            else:
+                update_cache= None  
+                current_best_score= None
+
+            printer.log('Initial Score: ' + str(current_best_score), 3)
+
+            #With an initial Jacobian every candidate is scored with the same (read-only) low-rank
+            #update caches, so the candidates can be scored concurrently.
+            if pool is not None and update_cache is not None and not (initial_pair_count == 0 and nNeededPairs == 0):
+                best_pair_index, best_pair_score = _find_best_candidate(
+                    _fidpair_candidate_score, update_cache, pairIndicesToIterateOver,
+                    pool, num_processes, evd_cache_handle)
+                if best_pair_score is not None and best_pair_score < current_best_score:
+                    current_best_score = best_pair_score
+                    idx_current_best_update = best_pair_index
+                pairIndicesToIterateOver = []  # all candidates have been scored
+
+            for pairIndexToTest in pairIndicesToIterateOver:    
+                printer.log('Tested Index: %d' %(pairIndexToTest), 4)
             
-            # Same computation of rank as above, but with only a
-            # subset of the total fiducial pairs.
-            elementIndicesToTest = elIndicesForPair[pairIndexToTest]
-            update_to_test = _np.take(dPall, elementIndicesToTest, axis=0)  # subset_of_num_elements x num_params
+                # Same computation of rank as above, but with only a
+                # subset of the total fiducial pairs.
+                elementIndicesToTest = elIndicesForPair[pairIndexToTest]
+                update_to_test = _np.take(dPall, elementIndicesToTest, axis=0)  # subset_of_num_elements x num_params
             
-            #We need some logic to handle the case where we are starting from scratch
-            #and don't have an initial current_best_jacobian.
-            if (initial_pair_count==0) and (nNeededPairs==0) and (current_best_jacobian is None):
-                updated_pinv, updated_rank= _sla.pinv(update_to_test.T@update_to_test, return_rank=True)
-                updated_inv_trace= _np.trace(updated_pinv)
-                current_best_score =  _scoring.CompositeScore(-updated_rank, updated_inv_trace, updated_rank)
-                idx_current_best_update = pairIndexToTest
-            elif (initial_pair_count==0) and (nNeededPairs==0) and (current_best_jacobian is not None):
-                updated_pinv, updated_rank= _sla.pinv(update_to_test.T@update_to_test, return_rank=True)
-                updated_inv_trace= _np.trace(updated_pinv)
-                updated_score =  _scoring.CompositeScore(-updated_rank, updated_inv_trace, updated_rank)
-                if updated_score < current_best_score:
-                    current_best_score= updated_score
+                #We need some logic to handle the case where we are starting from scratch
+                #and don't have an initial current_best_jacobian.
+                if (initial_pair_count==0) and (nNeededPairs==0) and (current_best_jacobian is None):
+                    updated_pinv, updated_rank= _sla.pinv(update_to_test.T@update_to_test, return_rank=True)
+                    updated_inv_trace= _np.trace(updated_pinv)
+                    current_best_score =  _scoring.CompositeScore(-updated_rank, updated_inv_trace, updated_rank)
                     idx_current_best_update = pairIndexToTest
-            #otherwise we already have an initial Jacobian and should use the standard update logic.
-            else:
-                updated_inv_trace, updated_rank, _ = minamide_style_inverse_trace(fiducial_update_EVD_cache[pairIndexToTest], 
-                                                                 update_cache[0], update_cache[1], 
-                                                                 update_cache[2], False)
-                #Construct a composite score object where the major score is
-                #the rank of the updated jacobian and the minor score is
-                #the inverse trace.
-                updated_score= _scoring.CompositeScore(-updated_rank, updated_inv_trace, updated_rank)
+                elif (initial_pair_count==0) and (nNeededPairs==0) and (current_best_jacobian is not None):
+                    updated_pinv, updated_rank= _sla.pinv(update_to_test.T@update_to_test, return_rank=True)
+                    updated_inv_trace= _np.trace(updated_pinv)
+                    updated_score =  _scoring.CompositeScore(-updated_rank, updated_inv_trace, updated_rank)
+                    if updated_score < current_best_score:
+                        current_best_score= updated_score
+                        idx_current_best_update = pairIndexToTest
+                #otherwise we already have an initial Jacobian and should use the standard update logic.
+                else:
+                    updated_score = _fidpair_candidate_score(pairIndexToTest, update_cache, fiducial_update_EVD_cache)
                 
-                printer.log('Updated Score: '+ str(updated_score), 3)
+                    printer.log('Updated Score: '+ str(updated_score), 3)
                 
-                if updated_score < current_best_score:
-                    current_best_score=updated_score
-                    idx_current_best_update= pairIndexToTest
+                    if updated_score < current_best_score:
+                        current_best_score=updated_score
+                        idx_current_best_update= pairIndexToTest
         
-        #Add the best index found to the list for current_best_fiducial_list (or initialize it if this list isn't set yet).
-        if current_best_fiducial_list is None:
-            current_best_fiducial_list= [idx_current_best_update]
-        else:
-            current_best_fiducial_list.append(idx_current_best_update)
+            #Add the best index found to the list for current_best_fiducial_list
+            #(or initialize it if this list isn't set yet).
+            if current_best_fiducial_list is None:
+                current_best_fiducial_list= [idx_current_best_update]
+            else:
+                current_best_fiducial_list.append(idx_current_best_update)
             
-        printer.log('Index of best update fiducial : %d'%(idx_current_best_update), 3)
+            printer.log('Index of best update fiducial : %d'%(idx_current_best_update), 3)
         
-        #check whether we have found an acceptable reduced set of fiducials.
-        if (nNeededPairs>=min_pairs_needed) and (current_best_score.minor < inv_trace_tol*inv_trace_complete)\
-            and (current_best_score.major <= -gsGerm.num_params):
-            break
+            #check whether we have found an acceptable reduced set of fiducials.
+            if (nNeededPairs>=min_pairs_needed) and (current_best_score.minor < inv_trace_tol*inv_trace_complete)\
+                    and (current_best_score.major <= -gsGerm.num_params):
+                break
 
     #Get list of pairs as tuples for printing & returning
     goodPairList = []
@@ -1518,6 +1534,18 @@ def _get_per_germ_power_fidpairs_greedy(prep_fiducials, meas_fiducials, prep_pov
     return goodPairList, current_best_score
 
     
+#helper function for scoring a candidate fiducial pair (a module-level function so that
+#it can be sent to worker processes):
+def _fidpair_candidate_score(pair_index, update_cache, fiducial_update_EVD_cache):
+    updated_inv_trace, updated_rank, _ = minamide_style_inverse_trace(fiducial_update_EVD_cache[pair_index],
+                                                                     update_cache[0], update_cache[1],
+                                                                     update_cache[2], False)
+    #Construct a composite score object where the major score is
+    #the rank of the updated jacobian and the minor score is
+    #the inverse trace.
+    return _scoring.CompositeScore(-updated_rank, updated_inv_trace, updated_rank)
+
+
 #helper function for building a compact evd cache:
 def construct_compact_evd_cache(fiducial_indices, complete_jacobian, element_map, eigenvalue_tolerance=1e-10):
     sqrteU_dict = {}
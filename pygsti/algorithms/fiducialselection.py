@@ -1273,7 +1273,27 @@ def _find_fiducials_integer_slack(model, fid_list, prep_or_meas=None,
     else:
         raise ValueError('prep_or_meas must be specified!')  # pragma: no cover
         # unreachable given check within test_fiducial_list above
-    numMxs = len(fidArrayList)
+
+    #The columns each fiducial contributes to the score matrix: fidColumns[:, i, :] is
+    #the (dimRho, len(fidArrayList)) block of the i-th fiducial.
+    fidColumns = _np.stack(fidArrayList, axis=2)
+
+    #Neighboring weight vectors differ by a single fiducial, so their score matrices
+    #are low-rank updates of the current point's.  The gramian (and its pseudoinverse)
+    #of the current point is kept in `base` -- see `set_base` -- and used to score
+    #neighbors in O(dimRho^2 * len(fidArrayList)) time.
+    base = {'weights': None, 'cache': None}
+
+    def compute_gramian(wts):
+        wtsLoc = _np.where(wts)[0]
+        scoreMx = fidColumns[:, wtsLoc, :].reshape(dimRho, -1)
+        return _np.dot(scoreMx, scoreMx.T)
+
+    def set_base(wts):
+        wts = _np.array(wts)
+        if base['weights'] is None or not _np.array_equal(base['weights'], wts):
+            base['weights'] = wts
+            base['cache'] = construct_gramian_update_cache(compute_gramian(wts))
 
     def compute_score(wts, cache_score=True):
         """ objective function for optimization """
@@ -1284,17 +1304,17 @@ def _find_fiducials_integer_slack(model, fid_list, prep_or_meas=None,
 #            score = forceMinScore
         if score is None:
             numFids = _np.sum(wts)
-            scoreMx = _np.zeros([dimRho, int(numFids) * int(numMxs)], float)
-            colInd = 0
             wts = _np.array(wts)
-            wtsLoc = _np.where(wts)[0]
-            for fidArray in fidArrayList:
-                scoreMx[:, colInd:colInd + int(numFids)] = fidArray[:, wtsLoc]
-                colInd += int(numFids)
-            scoreSqMx = _np.dot(scoreMx, scoreMx.T)
-#            score = numFids * _np.sum(1./_np.linalg.eigvalsh(scoreSqMx))
-            score = numFids * _scoring.list_score(
-                _np.linalg.eigvalsh(scoreSqMx), score_func)
+            toggled = _np.nonzero(wts != base['weights'])[0] if base['weights'] is not None else ()
+            if len(toggled) == 1:
+                iFid = toggled[0]
+                score = numFids * gramian_update_score(fidColumns[:, iFid, :], 1 if wts[iFid] else -1,
+                                                       base['cache'], score_func)
+            else:
+                scoreSqMx = compute_gramian(wts)
+#                score = numFids * _np.sum(1./_np.linalg.eigvalsh(scoreSqMx))
+                score = numFids * _scoring.list_score(
+                    _np.linalg.eigvalsh(scoreSqMx), score_func)
             if score <= 0 or _np.isinf(score):
                 score = 1e10
         if cache_score:
@@ -1381,6 +1401,7 @@ def _find_fiducials_integer_slack(model, fid_list, prep_or_meas=None,
 
         for iIter in range(max_iter):
             scoreD_keys = scoreD.keys()  # list of weight tuples already computed
+            set_base(weights)  # score this iteration's neighbors as updates of `weights`
 
             printer.show_progress(iIter, max_iter,
                                   suffix="score=%g, nFids=%d" % (score, L1))
@@ -1857,6 +1878,84 @@ def _find_fiducials_greedy(model, fids_list, prep_or_meas, op_penalty=0.0,
     
     return best_fiducial_set, final_score    
     
+def construct_gramian_update_cache(gramian, cond_tol=1e8):
+    """
+    Construct a cache for scoring low-rank updates of a fiducial-set gramian.
+
+    Parameters
+    ----------
+    gramian : numpy.ndarray
+        The (symmetric, positive semi-definite) gramian `A @ A.T` of a
+        fiducial set's score matrix `A`.
+
+    cond_tol : float, optional
+        Gramians with a condition number above this value are treated as
+        singular, and updates of them are scored from their full spectrum.
+
+    Returns
+    -------
+    tuple
+        A `(gramian, gramian_inv, inv_trace)` tuple, where `gramian_inv` and
+        `inv_trace` are `None` when `gramian` is (numerically) singular.
+    """
+    evals, evecs = _np.linalg.eigh(gramian)
+    if evals[0] <= 0 or evals[-1] > cond_tol * evals[0]:
+        return gramian, None, None
+    gramian_inv = (evecs / evals) @ evecs.T
+    return gramian, gramian_inv, _np.sum(1. / evals)
+
+
+def gramian_update_score(update, sign, gramian_update_cache, score_func='all', cond_tol=1e8):
+    """
+    Score the gramian obtained by adding or removing columns from a score matrix.
+
+    Computes `list_score(eigvalsh(G + sign * update @ update.T), score_func)`
+    where `G` is the gramian cached by :func:`construct_gramian_update_cache`.
+    When `score_func == 'all'` and both `G` and the updated gramian are well
+    conditioned, the sum of the reciprocal eigenvalues (the trace of the
+    inverse) is updated using the Woodbury identity at a cost of
+    O(dim^2 * num_columns), rather than computing the updated spectrum.
+
+    Parameters
+    ----------
+    update : numpy.ndarray
+        The `(dim, num_columns)` columns being added to or removed from the
+        score matrix.
+
+    sign : int
+        `+1` when the columns are being added and `-1` when they are removed.
+
+    gramian_update_cache : tuple
+        The cache of the gramian being updated, as returned by
+        :func:`construct_gramian_update_cache`.
+
+    score_func : {'all', 'worst'}, optional
+        The objective function passed to :func:`~pygsti.algorithms.scoring.list_score`.
+
+    cond_tol : float, optional
+        Largest condition number of the (`num_columns` x `num_columns`)
+        capacitance matrix for which the low-rank update is used.
+
+    Returns
+    -------
+    float
+    """
+    gramian, gramian_inv, inv_trace = gramian_update_cache
+    if score_func == 'all' and gramian_inv is not None:
+        #Woodbury: (G + s B B^T)^-1 = Ginv - Ginv B C^-1 B^T Ginv with capacitance C = s I + B^T Ginv B.
+        #Diagonalizing C = V diag(e) V^T gives Tr[(G + s B B^T)^-1] = Tr[Ginv] - sum_j |Ginv B V_j|^2 / e_j
+        GinvB = gramian_inv @ update
+        cap_evals, cap_evecs = _np.linalg.eigh(update.T @ GinvB)
+        cap_evals += sign
+        abs_cap_evals = _np.abs(cap_evals)
+        if abs_cap_evals.min() * cond_tol > abs_cap_evals.max():
+            GinvBV = GinvB @ cap_evecs
+            updated_inv_trace = inv_trace - _np.sum(_np.sum(GinvBV**2, axis=0) / cap_evals)
+            if updated_inv_trace > 0:
+                return updated_inv_trace
+    return _scoring.list_score(_np.linalg.eigvalsh(gramian + sign * (update @ update.T)), score_func)
+
+
 #helper function for building a compact evd cache:
 def construct_compact_evd_cache(model, fids_list, prep_or_meas, fid_cache, eigenvalue_tolerance=1e-10):
     sqrteU_dict = {}
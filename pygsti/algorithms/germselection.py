@@ -17,6 +17,9 @@ import numpy.linalg as _nla
 import random as _random
 import scipy.linalg as _sla
 import itertools
+import multiprocessing as _mp
+import contextlib as _contextlib
+from functools import partial as _partial
 from math import floor
 
 from pygsti.algorithms import grasp as _grasp
@@ -24,6 +27,7 @@ from pygsti.algorithms import scoring as _scoring
 from pygsti import circuits as _circuits
 from pygsti import baseobjs as _baseobjs
 from pygsti.tools import mpitools as _mpit
+from pygsti.tools import sharedmemtools as _smt
 from pygsti.baseobjs.statespace import ExplicitStateSpace as _ExplicitStateSpace
 from pygsti.baseobjs.statespace import QuditSpace as _QuditSpace
 from pygsti.models import ExplicitOpModel as _ExplicitOpModel
@@ -1210,6 +1214,127 @@ def _sq_sing_vals_from_deriv(deriv, weights=None):
     return sortedEigenvals
 
 
+def _eigenspace_mask(evals, eps):
+    """
+    Returns a boolean matrix whose (i,j)-th element is True when `evals[i]` and `evals[j]` are degenerate.
+
+    Eigenvalues are grouped into (approximately) degenerate eigenspaces in the same
+    way as in :func:`_super_op_for_perfect_twirl`.
+
+    Parameters
+    ----------
+    evals : numpy.ndarray
+        A 1D array of eigenvalues.
+
+    eps : float
+        Tolerance used for evaluating whether two eigenvalues are degenerate.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    group_of = _np.empty(len(evals), dtype=int)
+    group_evals = []  # list of the eigenvalues in each group
+    for current_idx in reversed(range(len(evals))):
+        current_eval = evals[current_idx]
+        for i, sublist in enumerate(group_evals):
+            if any([abs(current_eval - ev) <= eps for ev in sublist]):
+                sublist.append(current_eval)
+                group_of[current_idx] = i
+                break
+        else:
+            group_evals.append([current_eval])
+            group_of[current_idx] = len(group_evals) - 1
+    return group_of[:, None] == group_of[None, :]
+
+
+def _bulk_perfect_twirl(prods, derivs, eps, float_type=_np.cdouble, tol=1e-12, max_cond=1e6):
+    """
+    Twirl (project onto the commutant of) each of a set of derivatives with respect to a corresponding operator.
+
+    This computes the same thing as applying the superoperator returned by
+    :func:`_super_op_for_perfect_twirl` to each derivative, but without ever
+    constructing this op_dim^2 x op_dim^2 matrix.  Instead, all the `prods` are
+    eigendecomposed at once, and the twirl of each column `X` (reshaped into an
+    op_dim x op_dim matrix) of a derivative is performed in the eigenbasis `M`
+    of the corresponding product as `M * (mask * (Minv * X * M)) * Minv`, where
+    `mask` selects the blocks belonging to (degenerate) eigenspaces.  Only the
+    unmasked elements are ever computed, so for a product with a non-degenerate
+    spectrum this takes O(op_dim^3 * num_params) rather than O(op_dim^4 * num_params)
+    operations, and the memory required is O(op_dim^2 * num_params) per product.
+
+    Parameters
+    ----------
+    prods : numpy.ndarray
+        An array of shape (num_circuits, op_dim, op_dim) holding the operators to twirl with respect to.
+
+    derivs : numpy.ndarray
+        An array of shape (num_circuits, op_dim^2, num_params) holding the flattened derivatives to twirl.
+
+    eps : float
+        Tolerance used for evaluating whether two eigenvalues are degenerate.
+
+    float_type : numpy dtype (optional, default numpy.cdouble)
+        The dtype of the returned array.
+
+    tol : float (optional, default 1e-12)
+        Tolerance used for evaluating whether an operator is normal.
+
+    max_cond : float (optional, default 1e6)
+        When the eigenvector matrix of a normal operator has a condition number greater than this,
+        a (unitary) Schur decomposition is used for that operator instead.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (num_circuits, op_dim^2, num_params).
+    """
+    nCircuits, dim, _ = prods.shape
+    nParams = derivs.shape[2]
+    ret = _np.empty((nCircuits, dim**2, nParams), dtype=float_type)
+    if nCircuits == 0: return ret
+
+    prods_conj_transpose = prods.conj().transpose(0, 2, 1)
+    commutator_norms = _np.linalg.norm(prods @ prods_conj_transpose - prods_conj_transpose @ prods, axis=(1, 2))
+    is_normal = commutator_norms < tol * (dim**0.5)
+    if not _np.all(is_normal):
+        _warnings.warn('Warning: Input matrix is not normal, using the general eigenvalue decomposition '\
+                       +'from numpy.linalg.eig. This code path has been found to suffer from numerical '\
+                       +'instability problems before, so proceed with caution.')
+
+    all_evals, all_evecs = _np.linalg.eig(prods)  # stacked: decomposes all of the products at once
+    conds = _np.linalg.cond(all_evecs)
+
+    for i in range(nCircuits):
+        if is_normal[i] and not conds[i] < max_cond:  # (also catches nan/inf condition numbers)
+            schur_form, evecs = _sla.schur(prods[i], output='complex')
+            evals = _np.diag(schur_form)
+            evecs_inv = evecs.conj().T
+        else:
+            evals, evecs = all_evals[i], all_evecs[i]
+            evecs_inv = _np.linalg.inv(evecs)
+
+        #Only the elements (k,l) of Minv*X*M with k and l in the same eigenspace survive the projection,
+        # so the twirl factors as L * R, where R maps X to these elements and L maps them back.
+        pairs_k, pairs_l = _np.nonzero(_eigenspace_mask(evals, eps))
+        R = (evecs_inv[pairs_k][:, :, None] * evecs[:, pairs_l].T[:, None, :]).reshape(len(pairs_k), dim**2)
+        L = (evecs[:, pairs_k][:, None, :] * evecs_inv[pairs_l].T[None, :, :]).reshape(dim**2, len(pairs_k))
+        X = derivs[i]
+        Y = (R.real @ X) + 1j * (R.imag @ X) if _np.isrealobj(X) else R @ X  # (avoids a complex copy of X)
+
+        #The twirled derivative should be real (for real-valued derivatives); check this before
+        # casting it to a real-valued float type.
+        if (float_type is _np.double) or (float_type is _np.single):
+            twirled = L @ Y
+            if _np.any(_np.abs(twirled.imag) > eps * max(1.0, _np.max(_np.abs(twirled)))):
+                raise ValueError("Attempting to cast a twirled derivative with non-trivial imaginary component "
+                                 "to a real-valued data type.")
+            ret[i] = twirled.real
+        else:
+            _np.matmul(L, Y, out=ret[i])
+    return ret
+
+
 def _twirled_deriv(model, circuit, eps=1e-6, float_type=_np.cdouble):
     """
     Compute the "Twirled Derivative" of a circuit.
@@ -1249,6 +1374,49 @@ def _twirled_deriv(model, circuit, eps=1e-6, float_type=_np.cdouble):
     return _np.dot(twirler, dProd)
 
 
+def _iter_bulk_twirled_derivs(model, circuits, eps=1e-6, comm=None, float_type=_np.cdouble,
+                              max_batch_bytes=2**27):
+    """
+    Iterate over the twirled derivatives of `circuits`, computing them in batches.
+
+    Each batch is computed with :func:`_bulk_twirled_deriv`, and contains as many
+    circuits as fit within (roughly) `max_batch_bytes` of twirled-derivative memory.
+
+    Parameters
+    ----------
+    model : Model
+        The model which associates operation labels with operators.
+
+    circuits : list of Circuits
+        The set of circuits to compute the twirled derivative of.
+
+    eps : float, optional
+        Tolerance used for testing whether two eigenvectors are degenerate
+        (i.e. abs(eval1 - eval2) < eps ? )
+
+    comm : mpi4py.MPI.Comm, optional
+        When not None, an MPI communicator for distributing the computation
+        across multiple processors.
+
+    float_type : numpy dtype object, optional
+        Numpy data type to use for floating point arrays.
+
+    max_batch_bytes : int, optional
+        The approximate maximum size, in bytes, of the twirled derivatives of a single batch.
+
+    Returns
+    -------
+    iterator
+        Yields a numpy array of shape (op_dim^2, num_model_params) for each circuit, in order.
+    """
+    bytes_per_circuit = model.dim**2 * model.num_params * _np.dtype(float_type).itemsize
+    batch_size = max(1, int(max_batch_bytes // max(bytes_per_circuit, 1)))
+    for start in range(0, len(circuits), batch_size):
+        for twirledDeriv in _bulk_twirled_deriv(model, circuits[start:start + batch_size], eps,
+                                                comm=comm, float_type=float_type):
+            yield twirledDeriv
+
+
 def _bulk_twirled_deriv(model, circuits, eps=1e-6, check=False, comm=None, float_type=_np.cdouble):
     """
     Compute the "Twirled Derivative" of a set of circuits.
@@ -1295,14 +1463,9 @@ def _bulk_twirled_deriv(model, circuits, eps=1e-6, check=False, comm=None, float
     fd = op_dim**2  # flattened gate dimension
     nCircuits = len(circuits)
 
-    ret = _np.empty((nCircuits, fd, dProds.shape[1]), dtype=float_type)
-    
-    for i in range(nCircuits):
-        # flattened_op_dim x flattened_op_dim
-        twirler = _super_op_for_perfect_twirl(prods[i], eps, float_type=float_type)
-
-        # flattened_op_dim x vec_model_dim
-        ret[i] = _np.dot(twirler, dProds[i * fd:(i + 1) * fd])
+    # nCircuits x flattened_op_dim x vec_model_dim (no twirling superoperators are constructed)
+    ret = _bulk_perfect_twirl(_np.asarray(prods), dProds.reshape(nCircuits, fd, dProds.shape[1]),
+                              eps, float_type=float_type)
 
     if check:
         for i, circuit in enumerate(circuits):
@@ -3021,17 +3184,20 @@ def _compute_bulk_twirled_ddd_compact(model, germs_list, eps,
     if len(model.preps) > 0 or len(model.povms) > 0:
         model = _remove_spam_vectors(model)
         # This function assumes model has no spam elements so `lookup` below
+
+    #the twirled derivatives are computed a batch of germs at a time (see _iter_bulk_twirled_derivs)
+    twirled_derivs = _iter_bulk_twirled_derivs(model, germs_list, eps, comm, float_type)
     
     if printer is not None:
         printer.log('Generating compact EVD Cache',1)
         
         with printer.progress_logging(1):
     
-            for i, germ in enumerate(germs_list):
+            for i, (germ, twirledDeriv) in enumerate(zip(germs_list, twirled_derivs)):
             
                 printer.show_progress(iteration=i, total=len(germs_list), bar_length=25)
                     
-                twirledDeriv = _twirled_deriv(model, germ, eps, float_type) / len(germ)
+                twirledDeriv = twirledDeriv / len(germ)
                 #twirledDerivDaggerDeriv = _np.tensordot(_np.conjugate(twirledDeriv),
                 #                                        twirledDeriv, (0, 0))
                 twirledDerivDerivDagger = twirledDeriv@(twirledDeriv.conj().T) 
@@ -3060,9 +3226,9 @@ def _compute_bulk_twirled_ddd_compact(model, germs_list, eps,
                 
                 sqrteU_list.append( U_remapped@_np.diag(_np.sqrt(e)) )       
     else: 
-        for i, germ in enumerate(germs_list):
+        for germ, twirledDeriv in zip(germs_list, twirled_derivs):
                 
-            twirledDeriv = _twirled_deriv(model, germ, eps, float_type) / len(germ)
+            twirledDeriv = twirledDeriv / len(germ)
             #twirledDerivDaggerDeriv = _np.tensordot(_np.conjugate(twirledDeriv),
             #                                        twirledDeriv, (0, 0))
             twirledDerivDerivDagger = twirledDeriv@(twirledDeriv.conj().T) 
@@ -3574,7 +3740,8 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
                             float_type= _np.cdouble, 
                             mode="all-Jac", force_rank_increase=False,
                             save_cevd_cache_filename=None, load_cevd_cache_filename=None,
-                            file_compression=False, evd_tol=1e-10, initial_germ_set_test=True):
+                            file_compression=False, evd_tol=1e-10, initial_germ_set_test=True,
+                            num_processes=1):
     """
     Greedy algorithm starting with 0 germs.
 
@@ -3683,6 +3850,13 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
         be expensive) if the user has reason to believe this initial set won't be AC. Most of the time
         this initial set won't be.
 
+    num_processes : int, optional
+        The number of local worker processes used to score the candidate germs
+        of each greedy iteration.  The (read-only) caches the candidates are
+        scored against are handed to the workers once per iteration, and the
+        best candidate is selected exactly as in the serial case.  This is
+        independent of (and can be combined with) MPI parallelization via `comm`.
+
     Returns
     -------
     list
@@ -3811,7 +3985,7 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
     # Dict of keyword arguments passed to compute_score_non_AC that don't
     # change from call to call
     nonAC_kwargs = {
-        'score_fn': lambda x: _scoring.list_score(x, score_func=score_func),
+        'score_fn': _partial(_scoring.list_score, score_func=score_func),  # picklable, for num_processes > 1
         'threshold_ac': threshold,
         'num_nongauge_params': numNonGaugeParams,
         'op_penalty': op_penalty,
@@ -3977,156 +4151,345 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
         initN=None
         first_outer_iter_log= True
     
-    while _np.any(weights == 0):
-        if first_outer_iter_log:
-            printer.log("Outer iteration: %d germs" %
-                        (len(goodGerms)), 2)
-            first_outer_iter=False
-        else:
-            printer.log("Outer iteration: %d of %d amplified, %d germs" %
-                        (initN, numNonGaugeParams, len(goodGerms)), 2)
-        # As long as there are some unused germs, see if you need to add
-        # another one.
-        if initN == numNonGaugeParams:
-            break   # We are AC for all models, so we can stop adding germs.
+    # Everything a candidate germ is scored against that is fixed throughout the search
+    search_state = {'mode': mode, 'score_func': score_func, 'tol': tol, 'float_type': float_type,
+                    'germ_lengths': germLengths,
+                    'twirled_ddds': twirledDerivDaggerDerivList if mode != "single-Jac" else None,
+                    'germs_list': germs_list if mode == "single-Jac" else None,
+                    'model_list': model_list if mode == "single-Jac" else None}
 
-        candidateGermIndices = _np.where(weights == 0)[0]
-        loc_candidateIndices, owners, _ = _mpit.distribute_indices(
-            candidateGermIndices, comm, False)
+    with _candidate_scoring_pool(num_processes) as pool, \
+            _shared_search_state(search_state, pool) as search_state_handle:
+        while _np.any(weights == 0):
+            if first_outer_iter_log:
+                printer.log("Outer iteration: %d germs" %
+                            (len(goodGerms)), 2)
+                first_outer_iter=False
+            else:
+                printer.log("Outer iteration: %d of %d amplified, %d germs" %
+                            (initN, numNonGaugeParams, len(goodGerms)), 2)
+            # As long as there are some unused germs, see if you need to add
+            # another one.
+            if initN == numNonGaugeParams:
+                break   # We are AC for all models, so we can stop adding germs.
 
-        # Since the germs aren't sufficient, add the best single candidate germ
-        bestDDDs = None
-        bestGermScore = _scoring.CompositeScore(1.0e100, 0, None)  # lower is better
-        iBestCandidateGerm = None
+            candidateGermIndices = _np.where(weights == 0)[0]
+            loc_candidateIndices, owners, _ = _mpit.distribute_indices(
+                candidateGermIndices, comm, False)
+
+            # Since the germs aren't sufficient, add the best single candidate germ
+            bestDDDs = None
+            bestGermScore = _scoring.CompositeScore(1.0e100, 0, None)  # lower is better
+            iBestCandidateGerm = None
         
-        if mode=="compactEVD":
-            #calculate the update cache for each element of currentDDDList 
-            printer.log('Creating update cache.')
-            #TODO: I think I ought to be able to speed up the construction of the update
-            #cache by adding some logic to leverage the same trick I use now in the
-            #construction of the EVD cache, but that is a problem for another day.
-            currentDDDList_update_cache = [construct_update_cache(currentDDD, evd_tol=evd_tol) for currentDDD in currentDDDList]
-            #the return value of the update cache is a tuple with the elements
-            #(e, U, projU)    
-        with printer.progress_logging(2):
-            for i, candidateGermIdx in enumerate(loc_candidateIndices):
-                printer.show_progress(i, len(loc_candidateIndices),
-                                      prefix="Inner iter over candidate germs",
-                                      suffix=germs_list[candidateGermIdx].str)
+            if mode=="compactEVD":
+                #calculate the update cache for each element of currentDDDList 
+                printer.log('Creating update cache.')
+                #TODO: I think I ought to be able to speed up the construction of the update
+                #cache by adding some logic to leverage the same trick I use now in the
+                #construction of the EVD cache, but that is a problem for another day.
+                currentDDDList_update_cache = [construct_update_cache(currentDDD, evd_tol=evd_tol) for currentDDD in currentDDDList]
+                #the return value of the update cache is a tuple with the elements
+                #(e, U, projU)    
+                nonAC_kwargs['num_params'] = Np
+                nonAC_kwargs['force_rank_increase'] = force_rank_increase
+
+            # The rest of what a candidate germ is scored against (read-only while scoring this iteration)
+            scoring_state = {'init_n': initN, 'nonAC_kwargs': nonAC_kwargs,
+                             'good_germ_lengths': [len(germ) for germ in goodGerms],
+                             'current': currentDDDList_update_cache if mode == "compactEVD" else currentDDDList}
+
+            if num_processes > 1:
+                printer.log("Scoring %d candidate germs using %d processes" %
+                            (len(loc_candidateIndices), num_processes), 3)
+                iBest, bestScore = _find_best_candidate(_greedy_germ_candidate_score, scoring_state,
+                                                        loc_candidateIndices, pool, num_processes,
+                                                        search_state_handle)
+                if iBest is not None and bestScore < bestGermScore:
+                    bestGermScore = bestScore
+                    iBestCandidateGerm = iBest
+            else:
+                with printer.progress_logging(2):
+                    for i, candidateGermIdx in enumerate(loc_candidateIndices):
+                        printer.show_progress(i, len(loc_candidateIndices),
+                                              prefix="Inner iter over candidate germs",
+                                              suffix=germs_list[candidateGermIdx].str)
+
+                        # Take the score for the current germ to be its worst score
+                        # over all the models.
+                        germScore = _greedy_germ_candidate_score(candidateGermIdx, scoring_state, search_state)
+                        printer.log(str(germScore), 4)
+                        if germScore < bestGermScore:
+                            bestGermScore = germScore
+                            iBestCandidateGerm = candidateGermIdx
+
+            #Only (re)construct the J^T J matrices of the winning candidate
+            if iBestCandidateGerm is not None:
+                bestDDDs = _greedy_germ_candidate_ddds(iBestCandidateGerm, currentDDDList, search_state)
+
+            # Add the germ that gives the best germ score
+            if comm is not None and comm.Get_size() > 1:
+                #figure out which processor has best germ score and distribute
+                # its information to the rest of the procs
+                globalMinScore = comm.allreduce(bestGermScore, op=MPI.MIN)
+                toSend = comm.Get_rank() if (globalMinScore == bestGermScore) \
+                    else comm.Get_size() + 1
+                winningRank = comm.allreduce(toSend, op=MPI.MIN)
+                bestGermScore = globalMinScore
+                toCast = iBestCandidateGerm if (comm.Get_rank() == winningRank) else None
+                iBestCandidateGerm = comm.bcast(toCast, root=winningRank)
+                for k in range(len(model_list)):
+                    comm.Bcast(bestDDDs[k], root=winningRank)
+
+            #Update variables for next outer iteration
+            weights[iBestCandidateGerm] = 1
+            initN = bestGermScore.N
+            goodGerms.append(germs_list[iBestCandidateGerm])
 
-                worstScore = _scoring.CompositeScore(-1.0e100, 0, None)  # worst of all models
+            for k in range(len(model_list)):
+                currentDDDList[k][:, :] = bestDDDs[k][:, :]
+                bestDDDs[k] = None
 
-                # Loop over all models
-                testDDDs = []
-                
-                if mode == "all-Jac":
-                    # Loop over all models
-                    for k, currentDDD in enumerate(currentDDDList):
-                        testDDD = currentDDD.copy()
-                    
-                        #just get cached value of deriv-dagger-deriv
-                        derivDaggerDeriv = twirledDerivDaggerDerivList[k][candidateGermIdx]
-                        testDDD += derivDaggerDeriv
-                        
-                        nonAC_kwargs['germ_lengths'] = \
-                        _np.array([len(germ) for germ in
-                                   (goodGerms + [germs_list[candidateGermIdx]])])
-                        worstScore = max(worstScore, compute_composite_germ_set_score(
-                                    partial_deriv_dagger_deriv=testDDD[None, :, :], init_n=initN,
-                                    **nonAC_kwargs))
-                        testDDDs.append(testDDD)  # save in case this is a keeper
-                
-                elif mode == "single-Jac":
-                    # Loop over all models
-                    for k, currentDDD in enumerate(currentDDDList):
-                        testDDD = currentDDD.copy()
-                        
-                        #compute value of deriv-dagger-deriv
-                        model = model_list[k]
-                        testDDD += _compute_twirled_ddd(
-                            model, germs_list[candidateGermIdx], tol, float_type=float_type)
-                            
-                        nonAC_kwargs['germ_lengths'] = \
-                        _np.array([len(germ) for germ in
-                                   (goodGerms + [germs_list[candidateGermIdx]])])
-                        worstScore = max(worstScore, compute_composite_germ_set_score(
-                                    partial_deriv_dagger_deriv=testDDD[None, :, :], init_n=initN,
-                                    **nonAC_kwargs))
-                        testDDDs.append(testDDD)  # save in case this is a keeper
-                    
-                elif mode == "compactEVD":
-                    # Loop over all models
-                    for k, update_cache in enumerate(currentDDDList_update_cache):
-                    
-                        nonAC_kwargs['germ_lengths'] = \
-                            _np.array([len(germ) for germ in
-                                       (goodGerms + [germs_list[candidateGermIdx]])])
-                        nonAC_kwargs['num_params']=Np
-                        nonAC_kwargs['force_rank_increase']= force_rank_increase
-                        
-                        
-                        if score_func=="worst":
-                            worstScore = max(worstScore, compute_composite_germ_set_score_compactevd(
-                                                current_update_cache= update_cache,
-                                                germ_update=twirledDerivDaggerDerivList[k][candidateGermIdx], 
-                                                init_n=initN, **nonAC_kwargs))
-                        elif score_func=="all":
-                            worstScore = max(worstScore, compute_composite_germ_set_score_low_rank_trace(
-                                                current_update_cache= update_cache,
-                                                germ_update=twirledDerivDaggerDerivList[k][candidateGermIdx], 
-                                                init_n=initN, **nonAC_kwargs))
-                            
-                # Take the score for the current germ to be its worst score
-                # over all the models.
-                germScore = worstScore
-                printer.log(str(germScore), 4)
-                if germScore < bestGermScore:
-                    bestGermScore = germScore
-                    iBestCandidateGerm = candidateGermIdx
-                    
-                    #If we are using the modes "all-Jac" or "single-Jac" then we will
-                    #have been appending to testDDD throughout the process and can just set
-                    #bestDDDs to testDDDs
-                    if mode == "all-Jac" or mode == "single-Jac":
-                        bestDDDs = testDDDs
-                    
-                    elif mode == "compactEVD":
-                        #if compact EVD mode then we'll avoid reconstructing the J^T J matrix
-                        #unless the germ is the current best.
-                        bestDDDs= [currentDDD.copy() + \
-                            twirledDerivDaggerDerivList[k][candidateGermIdx]@\
-                            twirledDerivDaggerDerivList[k][candidateGermIdx].T\
-                            for k, currentDDD in enumerate(currentDDDList)]
-                testDDDs = None
+                printer.log("Added %s to final germs (%s)" %
+                            (germs_list[iBestCandidateGerm].str, str(bestGermScore)), 2)
 
-        # Add the germ that gives the best germ score
-        if comm is not None and comm.Get_size() > 1:
-            #figure out which processor has best germ score and distribute
-            # its information to the rest of the procs
-            globalMinScore = comm.allreduce(bestGermScore, op=MPI.MIN)
-            toSend = comm.Get_rank() if (globalMinScore == bestGermScore) \
-                else comm.Get_size() + 1
-            winningRank = comm.allreduce(toSend, op=MPI.MIN)
-            bestGermScore = globalMinScore
-            toCast = iBestCandidateGerm if (comm.Get_rank() == winningRank) else None
-            iBestCandidateGerm = comm.bcast(toCast, root=winningRank)
-            for k in range(len(model_list)):
-                comm.Bcast(bestDDDs[k], root=winningRank)
+    return goodGerms
 
-        #Update variables for next outer iteration
-        weights[iBestCandidateGerm] = 1
-        initN = bestGermScore.N
-        goodGerms.append(germs_list[iBestCandidateGerm])
 
-        for k in range(len(model_list)):
-            currentDDDList[k][:, :] = bestDDDs[k][:, :]
-            bestDDDs[k] = None
+def _greedy_germ_candidate_score(candidate_germ_idx, scoring_state, search_state):
+    """
+    The score of adding a candidate germ within :func:`find_germs_breadthfirst_greedy`.
+
+    Parameters
+    ----------
+    candidate_germ_idx : int
+        Index of the candidate germ within the (full) list of germs.
+
+    scoring_state : dict
+        The per-iteration state of the greedy search, as constructed by
+        :func:`find_germs_breadthfirst_greedy`.
+
+    search_state : dict
+        The state that is fixed throughout the greedy search, as constructed by
+        :func:`find_germs_breadthfirst_greedy`.
+
+    Returns
+    -------
+    CompositeScore
+        The worst score, over all the models, of the current germ set plus the candidate.
+    """
+    mode = search_state['mode']
+    nonAC_kwargs = scoring_state['nonAC_kwargs'].copy()
+    nonAC_kwargs['germ_lengths'] = _np.array(scoring_state['good_germ_lengths']
+                                             + [search_state['germ_lengths'][candidate_germ_idx]])
+    init_n = scoring_state['init_n']
+
+    worstScore = _scoring.CompositeScore(-1.0e100, 0, None)  # worst of all models
+    for k, current in enumerate(scoring_state['current']):
+        if mode == "all-Jac":
+            #just get cached value of deriv-dagger-deriv
+            testDDD = current + search_state['twirled_ddds'][k][candidate_germ_idx]
+            score = compute_composite_germ_set_score(partial_deriv_dagger_deriv=testDDD[None, :, :],
+                                                     init_n=init_n, **nonAC_kwargs)
+        elif mode == "single-Jac":
+            #compute value of deriv-dagger-deriv
+            testDDD = current + _compute_twirled_ddd(search_state['model_list'][k],
+                                                     search_state['germs_list'][candidate_germ_idx],
+                                                     search_state['tol'], float_type=search_state['float_type'])
+            score = compute_composite_germ_set_score(partial_deriv_dagger_deriv=testDDD[None, :, :],
+                                                     init_n=init_n, **nonAC_kwargs)
+        elif mode == "compactEVD":
+            # `current` is the update cache of the current germ set's J^T J matrix
+            score_fn = compute_composite_germ_set_score_compactevd if search_state['score_func'] == "worst" \
+                else compute_composite_germ_set_score_low_rank_trace
+            score = score_fn(current_update_cache=current,
+                             germ_update=search_state['twirled_ddds'][k][candidate_germ_idx],
+                             init_n=init_n, **nonAC_kwargs)
+        worstScore = max(worstScore, score)
+    return worstScore
+
+
+def _greedy_germ_candidate_ddds(candidate_germ_idx, current_ddd_list, search_state):
+    """
+    The J^T J matrices, one per model, of the current germ set plus a candidate germ.
+
+    Parameters
+    ----------
+    candidate_germ_idx : int
+        Index of the candidate germ within the (full) list of germs.
+
+    current_ddd_list : list
+        The J^T J matrices of the current germ set, one per model.
+
+    search_state : dict
+        The state that is fixed throughout the greedy search, as constructed by
+        :func:`find_germs_breadthfirst_greedy`.
+
+    Returns
+    -------
+    list of numpy.ndarray
+    """
+    mode = search_state['mode']
+    if mode == "all-Jac":
+        return [currentDDD + search_state['twirled_ddds'][k][candidate_germ_idx]
+                for k, currentDDD in enumerate(current_ddd_list)]
+    elif mode == "single-Jac":
+        return [currentDDD + _compute_twirled_ddd(search_state['model_list'][k],
+                                                  search_state['germs_list'][candidate_germ_idx],
+                                                  search_state['tol'], float_type=search_state['float_type'])
+                for k, currentDDD in enumerate(current_ddd_list)]
+    else:  # compactEVD: the cached matrices are half of a symmetric rank decomposition
+        return [currentDDD + search_state['twirled_ddds'][k][candidate_germ_idx]
+                @ search_state['twirled_ddds'][k][candidate_germ_idx].T
+                for k, currentDDD in enumerate(current_ddd_list)]
+
+
+_CANDIDATE_SCORING_HANDLES = {}  # the (per-step and per-search) states most recently used by a worker process
+
+
+def _candidate_scoring_pool(num_processes):
+    """
+    The process pool used by :func:`_find_best_candidate`, as a context manager.
+
+    The pool is meant to be created once, around a whole greedy search, and given to
+    every :func:`_find_best_candidate` call of the search.
+
+    Parameters
+    ----------
+    num_processes : int
+        The number of worker processes.
+
+    Returns
+    -------
+    multiprocessing.pool.Pool or contextlib.nullcontext
+        A pool, or a context yielding `None` when `num_processes <= 1`.
+    """
+    if num_processes <= 1:
+        return _contextlib.nullcontext()
+    _smt.ensure_resource_tracker_running()  # so workers share it, as they attach to broadcast scoring states
+    return _mp.Pool(num_processes)
+
+
+@_contextlib.contextmanager
+def _shared_search_state(search_state, pool):
+    """
+    The state that stays fixed throughout a greedy search, shared once with the workers of `pool`.
+
+    The state is broadcast (see :func:`sharedmemtools.broadcast_object`) when the
+    context is entered and its shared memory is freed when the context exits, so
+    it is not re-sent for each step of the search.
+
+    Parameters
+    ----------
+    search_state : object
+        The (read-only) state, e.g. the cached J^T J matrices of all the candidates.
+
+    pool : multiprocessing.pool.Pool or None
+        The pool created by :func:`_candidate_scoring_pool`.  If `None`, nothing is broadcast.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        A context yielding a :class:`sharedmemtools.SharedObjectHandle` to `search_state`,
+        to be given to :func:`_find_best_candidate`.
+    """
+    if pool is None:
+        yield _smt.SharedObjectHandle(None, 0, [], search_state)
+        return
+    search_state_handle, shm = _smt.broadcast_object(search_state)
+    try:
+        yield search_state_handle
+    finally:
+        _smt.cleanup_shared_ndarray(shm)
+
+
+def _attach_to_candidate_scoring_state(role, handle):
+    previous_handle = _CANDIDATE_SCORING_HANDLES.get(role, None)
+    if previous_handle is not None and previous_handle.shm_name != handle.shm_name:
+        previous_handle.release()  # the state of a previous greedy step or search
+    _CANDIDATE_SCORING_HANDLES[role] = handle
+    return handle.get()
+
+
+def _score_candidates_in_worker(score_fn, scoring_state_handle, search_state_handle, candidates):
+    scoring_state = _attach_to_candidate_scoring_state('step', scoring_state_handle)
+    search_state = _attach_to_candidate_scoring_state('search', search_state_handle)
+    return [score_fn(candidate, scoring_state, search_state) for candidate in candidates]
+
+
+def _find_best_candidate(score_fn, scoring_state, candidates, pool=None, num_processes=1,
+                         search_state_handle=None):
+    """
+    Find the candidate with the lowest score, optionally scoring candidates in parallel.
+
+    When `pool` is given the candidates are scored by its worker processes.
+    `scoring_state`, the state of the current step of a greedy search, is
+    placed in shared memory (see :func:`sharedmemtools.broadcast_object`)
+    rather than copied, so only candidates and scores are communicated per
+    task, and workers attach to it once per call.  The state that is fixed
+    throughout the search is shared just once, via `search_state_handle`.
+    Ties are resolved in favor of the candidate that comes first, so the
+    result does not depend on `num_processes`.
+
+    Parameters
+    ----------
+    score_fn : function
+        A module-level (picklable) function with signature
+        `score_fn(candidate, scoring_state, search_state)` returning a
+        comparable score.  Lower scores are better.
+
+    scoring_state : object
+        The (read-only) state of the current step that `score_fn` scores candidates against.
+
+    candidates : list
+        The candidates to score.
+
+    pool : multiprocessing.pool.Pool, optional
+        A pool created by :func:`_candidate_scoring_pool`, which may be reused
+        across calls.  If `None`, candidates are scored in this process.
+
+    num_processes : int, optional
+        The number of worker processes in `pool`, used to split the candidates into tasks.
+
+    search_state_handle : SharedObjectHandle, optional
+        A handle, yielded by :func:`_shared_search_state`, to the (read-only) state
+        that is fixed throughout the search.  `score_fn` is given `None` if this is `None`.
+
+    Returns
+    -------
+    best_candidate : object
+        The best candidate, or `None` if `candidates` is empty.
+
+    best_score : object
+        The score of `best_candidate`, or `None` if `candidates` is empty.
+    """
+    candidates = list(candidates)
+    if search_state_handle is None:
+        search_state_handle = _smt.SharedObjectHandle(None, 0, [], None)
+    if pool is not None and len(candidates) > 1:
+        num_tasks = min(4 * max(num_processes, 1), len(candidates))
+        chunks = [candidates[i::num_tasks] for i in range(num_tasks)]
+        scoring_state_handle, shm = _smt.broadcast_object(scoring_state)
+        try:
+            chunk_scores = pool.starmap(_score_candidates_in_worker,
+                                        [(score_fn, scoring_state_handle, search_state_handle, chunk)
+                                         for chunk in chunks])
+        finally:
+            _smt.cleanup_shared_ndarray(shm)
+        scores = [None] * len(candidates)
+        for i, chunk_score in enumerate(chunk_scores):
+            scores[i::num_tasks] = chunk_score
+    else:
+        search_state = search_state_handle.get()
+        scores = [score_fn(candidate, scoring_state, search_state) for candidate in candidates]
+
+    best_candidate = best_score = None
+    for candidate, score in zip(candidates, scores):
+        if best_score is None or score < best_score:
+            best_candidate, best_score = candidate, score
+    return best_candidate, best_score
 
-            printer.log("Added %s to final germs (%s)" %
-                        (germs_list[iBestCandidateGerm].str, str(bestGermScore)), 2)
 
-    return goodGerms
-    
 def compute_composite_germ_set_score_compactevd(current_update_cache, germ_update, 
                                                 score_fn="all", threshold_ac=1e6, init_n=1, model=None,
                                                  partial_germs_list=None, eps=None, num_germs=None,
@@ -778,7 +778,8 @@ def create_random_circuit(pspec, length, qubit_labels=None, sampler='Qeliminatio
 
 def create_direct_rb_circuit(pspec, clifford_compilations, length, qubit_labels=None, sampler='Qelimination',
                              samplerargs=None, addlocal=False, lsargs=None, randomizeout=True, cliffordtwirl=True,
-                             conditionaltwirl=True, citerations=20, compilerargs=None, partitioned=False, seed=None):
+                             conditionaltwirl=True, citerations=20, compilerargs=None, partitioned=False, seed=None,
+                             compilation_cache=None):
     """
     Generates a "direct randomized benchmarking" (DRB) circuit.
 
@@ -887,6 +888,11 @@ def create_direct_rb_circuit(pspec, clifford_compilations, length, qubit_labels=
         A seed to initialize the random number generator used for creating random clifford
         circuits.
 
+    compilation_cache : CliffordCompilationCache, optional
+        If not None, full Clifford compilations (used when `conditionaltwirl` is False) are
+        retrieved from, and added to, this cache rather than being compiled using the random
+        number generator seeded by `seed`.
+
     Returns
     -------
     Circuit or list of Circuits
@@ -935,11 +941,8 @@ def create_direct_rb_circuit(pspec, clifford_compilations, length, qubit_labels=
                                                              *compilerargs, rand_state=rand_state)
         # If not conditionaltwirl, we do a full random Clifford.
         else:
-            initial_circuit = _cmpl.compile_clifford(s_initial, p_initial, pspec,
-                                                     clifford_compilations.get('absolute', None),
-                                                     clifford_compilations.get('paulieq', None),
-                                                     qubit_labels, citerations,
-                                                     *compilerargs, rand_state=rand_state)
+            initial_circuit = _compile_clifford(s_initial, p_initial, pspec, clifford_compilations, qubit_labels,
+                                                citerations, compilerargs, rand_state, compilation_cache)
     # If we are not Clifford twirling, we just copy the effect of the random circuit as the effect
     # of the "composite" prep + random circuit (as here the prep circuit is the null circuit).
     else:
@@ -965,10 +968,8 @@ def create_direct_rb_circuit(pspec, clifford_compilations, length, qubit_labels=
         if randomizeout: p_for_inversion = _symp.random_phase_vector(s_inverse, n, rand_state=rand_state)
         else: p_for_inversion = p_inverse
         # Compile the Clifford.
-        inversion_circuit = _cmpl.compile_clifford(s_inverse, p_for_inversion, pspec,
-                                                   clifford_compilations.get('absolute', None),
-                                                   clifford_compilations.get('paulieq', None),
-                                                   qubit_labels, citerations, *compilerargs, rand_state=rand_state)
+        inversion_circuit = _compile_clifford(s_inverse, p_for_inversion, pspec, clifford_compilations, qubit_labels,
+                                              citerations, compilerargs, rand_state, compilation_cache)
     if cliffordtwirl:
         full_circuit = initial_circuit.copy(editable=True)
         full_circuit.append_circuit_inplace(circuit)
@@ -1006,8 +1007,22 @@ def create_direct_rb_circuit(pspec, clifford_compilations, length, qubit_labels=
     return outcircuit, idealout
 
 
+def _compile_clifford(s, p, pspec, clifford_compilations, qubit_labels, citerations, compilerargs, rand_state,
+                      compilation_cache=None):
+    """
+    Helper function to compile a Clifford with :func:`compile_clifford`, using `compilation_cache` if given.
+    """
+    if compilation_cache is not None:
+        return compilation_cache.compile_clifford(s, p, pspec, clifford_compilations.get('absolute', None),
+                                                  clifford_compilations.get('paulieq', None),
+                                                  qubit_labels, citerations, *compilerargs)
+    return _cmpl.compile_clifford(s, p, pspec, clifford_compilations.get('absolute', None),
+                                  clifford_compilations.get('paulieq', None),
+                                  qubit_labels, citerations, *compilerargs, rand_state=rand_state)
+
+
 def _sample_clifford_circuit(pspec, clifford_compilations, qubit_labels, citerations,
-        compilerargs, exact_compilation_key, srep_cache, rand_state):
+                             compilerargs, exact_compilation_key, srep_cache, rand_state, compilation_cache=None):
     """Helper function to compile a random Clifford circuit.
 
     Parameters
@@ -1074,6 +1089,9 @@ def _sample_clifford_circuit(pspec, clifford_compilations, qubit_labels, citerat
     rand_state: np.random.RandomState
         A RandomState to use for RNG
 
+    compilation_cache: CliffordCompilationCache, optional
+        If not None, a cache that randomly compiled Cliffords are retrieved from and added to.
+
     Returns
     -------
     clifford_circuit : Circuit
@@ -1117,18 +1135,15 @@ def _sample_clifford_circuit(pspec, clifford_compilations, qubit_labels, citerat
     else:
         # Random compilation
         s, p = _symp.random_clifford(n, rand_state=rand_state)
-        circuit = _cmpl.compile_clifford(s, p, pspec,
-                                        clifford_compilations.get('absolute', None),
-                                        clifford_compilations.get('paulieq', None),
-                                        qubit_labels=qubit_labels, iterations=citerations, *compilerargs,
-                                            rand_state=rand_state)
+        circuit = _compile_clifford(s, p, pspec, clifford_compilations, qubit_labels, citerations, compilerargs,
+                                    rand_state, compilation_cache)
     
     return circuit, s, p
 
 
 def create_clifford_rb_circuit(pspec, clifford_compilations, length, qubit_labels=None, randomizeout=False,
                                citerations=20, compilerargs=None, interleaved_circuit=None, seed=None,
-                               return_native_gate_counts=False, exact_compilation_key=None):
+                               return_native_gate_counts=False, exact_compilation_key=None, compilation_cache=None):
     """
     Generates a "Clifford randomized benchmarking" (CRB) circuit.
 
@@ -1226,6 +1241,12 @@ def create_clifford_rb_circuit(pspec, clifford_compilations, length, qubit_label
         however, larger number of qubits can be used so long as the user specifies the processor spec and
         compilation rules properly.
 
+    compilation_cache: CliffordCompilationCache, optional
+        If not None, the compilations of the random and inversion Cliffords are retrieved from, and added
+        to, this cache.  Compilations of Cliffords not already in the cache are seeded from the Clifford
+        itself rather than from `seed` (see :class:`CliffordCompilationCache`), so the returned circuit
+        does not depend on the contents of the cache.
+
     Returns
     -------
     full_circuit : Circuit
@@ -1273,7 +1294,8 @@ def create_clifford_rb_circuit(pspec, clifford_compilations, length, qubit_label
     for _ in range(0, length + 1):
         # Perform sampling
         circuit, s, p = _sample_clifford_circuit(pspec, clifford_compilations, qubit_labels, citerations,
-                                 compilerargs, exact_compilation_key, srep_cache, rand_state)
+                                                 compilerargs, exact_compilation_key, srep_cache, rand_state,
+                                                 compilation_cache)
         num_native_gates += circuit.num_gates
         num_native_2q_gates += circuit.num_nq_gates(2)
         native_size += circuit.size
@@ -1295,11 +1317,8 @@ def create_clifford_rb_circuit(pspec, clifford_compilations, length, qubit_label
     else: p_for_inversion = p_inverse
 
     # Compile the inversion circuit
-    inversion_circuit = _cmpl.compile_clifford(s_inverse, p_for_inversion, pspec,
-                                               clifford_compilations.get('absolute', None),
-                                               clifford_compilations.get('paulieq', None),
-                                               qubit_labels=qubit_labels,
-                                               iterations=citerations, *compilerargs, rand_state=rand_state)
+    inversion_circuit = _compile_clifford(s_inverse, p_for_inversion, pspec, clifford_compilations, qubit_labels,
+                                          citerations, compilerargs, rand_state, compilation_cache)
     full_circuit.append_circuit_inplace(inversion_circuit)
     full_circuit.done_editing()
     # Find the expected outcome of the circuit.
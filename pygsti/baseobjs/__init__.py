@@ -24,3 +24,5 @@ from .qubitgraph import QubitGraph
 from .errorgenbasis import ElementaryErrorgenBasis, ExplicitElementaryErrorgenBasis, CompleteElementaryErrorgenBasis
 from .errorgenspace import ErrorgenSpace
 from .unitarygatefunction import UnitaryGateFunction
+# (used by, e.g., pygsti.drivers, which `import pygsti` no longer imports)
+from . import advancedoptions
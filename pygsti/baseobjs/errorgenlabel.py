@@ -19,7 +19,9 @@ class ElementaryErrorgenLabel(object):
     """
     TODO: docstring - for entire module
     """
-    pass
+
+    def __deepcopy__(self, memo):
+        return self  # labels are immutable (and hashable), so they needn't be copied
 
 
 class LocalElementaryErrorgenLabel(ElementaryErrorgenLabel):
@@ -148,6 +148,9 @@ class Label(object):
         """
         return 1  # most labels are depth=1
 
+    def __deepcopy__(self, memo):
+        return self  # labels are immutable, so (like tuples & strs) they needn't be copied
+
     @property
     def reps(self):
         """
@@ -293,6 +293,8 @@ class WriteOpsByCollection(dict):
             super().__init__()
         self.special_ops = []
         self.session = session
+        self._prefetched_docs = {}  # collection_name => {uid key => existing db document or None}
+        self._local_doc_indices = {}  # (collection_name, uid fields) => {uid values => queued document}
 
     def add_ops_by_collection(self, other_ops):
         """
@@ -312,6 +314,8 @@ class WriteOpsByCollection(dict):
             if self.allowed_collection_names is None and k not in self:
                 self[k] = []
             self[k].extend(v)
+            for collection_name, fields in list(self._local_doc_indices.keys()):
+                if collection_name == k: del self._local_doc_indices[collection_name, fields]  # rebuilt when needed
 
     def add_one_op(self, collection_name, uid, doc, overwrite_existing, mongodb, check_local_ops=True):
         """
@@ -371,7 +375,7 @@ class WriteOpsByCollection(dict):
             if '_id' in uid:
                 doc_id = uid['_id']
             else:
-                existing_doc = _find_one_doc(mongodb, collection_name, uid) #, ('_id',))  # entire doc so can use later
+                existing_doc = self._find_one_db_doc(mongodb, collection_name, uid)  # entire doc so can use later
                 if existing_doc is None and check_local_ops:
                     existing_doc = self._find_one_local_doc(collection_name, uid)
                 doc_id = _ObjectId() if (existing_doc is None) else existing_doc['_id']
@@ -385,10 +389,11 @@ class WriteOpsByCollection(dict):
 
         if overwrite_existing is True:
             self[collection_name].append(ReplaceOne({'_id': doc_id}, doc, upsert=True))
+            self._index_local_doc(collection_name, doc)
             #mongodb[collection_name].replace_one(doc_id, doc, upsert=True)  # alt line for DEBUG
         else:
             if not tried_to_find_existing_doc:  # then try now
-                existing_doc = mongodb[collection_name].find_one(doc_id)
+                existing_doc = self._find_one_db_doc(mongodb, collection_name, {'_id': doc_id})
             if existing_doc is None and check_local_ops:
                 existing_doc = self._find_one_local_doc(collection_name, doc_id)
                 if existing_doc is not None:
@@ -396,6 +401,7 @@ class WriteOpsByCollection(dict):
 
             if existing_doc is None:  # then insert the document as given
                 self[collection_name].append(InsertOne(doc))
+                self._index_local_doc(collection_name, doc)
                 #mongodb[collection_name].insert_one(doc)  # alt line for DEBUG
             else:
                 #print("Found existing doc: ", doc.get('module','?'), doc.get('class','?'), doc.get('circuit_str','?'))
@@ -409,12 +415,71 @@ class WriteOpsByCollection(dict):
                 # else do nothing, since doc exists and matches what we want to write => no error
         return doc_id
 
+    def prefetch_existing_docs(self, collection_name, uids, mongodb, chunk_size=10000):
+        """
+        Look up which of a number of documents already exist in a MongoDB database, using as few queries as possible.
+
+        Subsequent :meth:`add_one_op` calls for these documents use the pre-fetched
+        documents instead of querying the database one document at a time, which can
+        greatly speed up adding operations for many (e.g., circuit or data-row) documents.
+
+        Parameters
+        ----------
+        collection_name : str
+            The collection name the documents belong to.
+
+        uids : list
+            The unique identifiers of the documents, as given to :meth:`add_one_op`.  When
+            these are dictionaries, they must all have the same keys.
+
+        mongodb : pymongo.database.Database
+            The MongoDB instance documents will eventually be written to.
+
+        chunk_size : int, optional
+            The maximum number of documents to look up in a single query.
+
+        Returns
+        -------
+        None
+        """
+        uids = [(uid if isinstance(uid, dict) else {'_id': uid}) for uid in uids]
+        if len(uids) == 0: return
+        fields = tuple(sorted(uids[0].keys()))
+        assert all([tuple(sorted(uid.keys())) == fields for uid in uids]), "All `uids` must have the same keys!"
+
+        shared = {f: uids[0][f] for f in fields if all([uid[f] == uids[0][f] for uid in uids])}
+        varying = [f for f in fields if f not in shared]
+        prefetched = self._prefetched_docs.setdefault(collection_name, {})
+        for uid in uids:
+            prefetched[_uid_key(uid)] = None
+        found = set()
+
+        for i in range(0, len(uids), chunk_size):
+            query = shared.copy()
+            if len(varying) == 1:
+                query[varying[0]] = {'$in': [uid[varying[0]] for uid in uids[i:i + chunk_size]]}
+            elif len(varying) > 1:
+                query['$or'] = [{f: uid[f] for f in varying} for uid in uids[i:i + chunk_size]]
+            for doc in mongodb[collection_name].find(query):
+                key = _uid_key({f: doc[f] for f in fields})
+                if key in found:
+                    raise ValueError((f"Multiple records where identified by the given `doc_id` ({dict(key)})."
+                                      " `doc_id` must specify exactly one record."))
+                prefetched[key] = doc; found.add(key)
+
+    def _find_one_db_doc(self, mongodb, collection_name, uid):
+        try:
+            return self._prefetched_docs[collection_name][_uid_key(uid)]
+        except (KeyError, TypeError):  # TypeError if uid is unhashable
+            return _find_one_doc(mongodb, collection_name, uid)
+
     def add_gridfs_put_op(self, collection_name, doc_id, binary_data, overwrite_existing, mongodb):
         """
         Add a GridFS put operation to this dictionary of write operations.
 
         This is a special type of operation for placing large chunks of binary data into a MongoDB.
-        Arguments are similar to :meth:`add_one_op`.
+        Arguments are similar to :meth:`add_one_op`.  If `binary_data` is a numpy array, it is
+        streamed into GridFS (in the `.npy` format) rather than first being converted to bytes.
         """
         import gridfs as _gridfs
         fs = _gridfs.GridFS(mongodb, collection=collection_name)
@@ -450,12 +515,20 @@ class WriteOpsByCollection(dict):
             if op_info['type'] == 'GridFS_put':
                 import gridfs as _gridfs
                 fs = _gridfs.GridFS(mongodb, collection=op_info['collection_name'])
+
+                def put():
+                    if isinstance(op_info['data'], _np.ndarray):
+                        with fs.new_file(_id=op_info['id']) as f:
+                            _np.save(f, op_info['data'], allow_pickle=False)
+                        return f._id
+                    return fs.put(op_info['data'], _id=op_info['id'])
+
                 try:
-                    file_id = fs.put(op_info['data'], _id=op_info['id'])
+                    file_id = put()
                 except _gridfs.errors.FileExists as e:
                     if op_info['overwrite_existing']:
                         fs.delete(op_info['id'])
-                        file_id = fs.put(op_info['data'], _id=op_info['id'])  # try again
+                        file_id = put()  # try again
                     else:
                         raise e
 
@@ -468,17 +541,39 @@ class WriteOpsByCollection(dict):
                 mongodb[collection_name].bulk_write(ops, session=self.session)
         self.clear()
         self.special_ops = []
+        self._prefetched_docs = {}
+        self._local_doc_indices = {}
 
     def _find_one_local_doc(self, collection_name, uid):
         if not isinstance(uid, dict): uid = {'_id': uid}
-        for op in self.get(collection_name, []):
-            doc = op._doc  # Warning: using *private* attribute of InsertOne & ReplaceOne objects
-            for key, val in uid.items():
-                if (key not in doc) or doc[key] != val:
-                    break  # doc does not match uid
-            else:  # doc *does* match uid
-                return doc
-        return None
+        fields = tuple(sorted(uid.keys()))
+        try:
+            index = self._local_doc_indices.get((collection_name, fields), None)
+            if index is None:  # index the queued documents by the values of `fields`, so lookups are fast
+                index = self._local_doc_indices[collection_name, fields] = {}
+                for op in self.get(collection_name, []):
+                    self._add_to_local_doc_index(index, fields, op._doc)  # Warning: *private* attribute of ops
+            return index.get(tuple([uid[f] for f in fields]), None)
+        except TypeError:  # unhashable uid values - fall back to checking every queued document
+            self._local_doc_indices.pop((collection_name, fields), None)
+            for op in self.get(collection_name, []):
+                doc = op._doc  # Warning: using *private* attribute of InsertOne & ReplaceOne objects
+                if all([(key in doc) and doc[key] == val for key, val in uid.items()]):
+                    return doc
+            return None
+
+    def _index_local_doc(self, collection_name, doc):
+        for (cname, fields), index in list(self._local_doc_indices.items()):
+            if cname == collection_name:
+                try:
+                    self._add_to_local_doc_index(index, fields, doc)
+                except TypeError:
+                    del self._local_doc_indices[cname, fields]
+
+    @staticmethod
+    def _add_to_local_doc_index(index, fields, doc):
+        if all([f in doc for f in fields]):
+            index.setdefault(tuple([doc[f] for f in fields]), doc)  # first matching doc takes precedence
 
 
 def prepare_doc_for_existing_doc_check(doc, existing_doc, set_id=True, convert_tuples_to_lists=True,
@@ -595,6 +690,11 @@ def recursive_compare_str(a, b, a_name='first obj', b_name='second obj', prefix=
     return diff_accum
 
 
+def _uid_key(uid):
+    """ A hashable key for the unique-identifier dictionary `uid` """
+    return tuple(sorted(uid.items()))
+
+
 def _find_one_doc(db, collection_name, doc_id, projection=None, error_if_no_doc=False):
     if doc_id is not None and not isinstance(doc_id, dict):
         doc_id = {'_id': doc_id}
@@ -32,6 +32,8 @@ except ImportError:
 
     from .slowopcalc import *
 
+from .compiledpolys import CompiledPolynomials
+
 
 def bulk_eval_compact_polynomials(vtape, ctape, paramvec, dest_shape):
     """Typechecking wrapper for real- and complex-specific routines..
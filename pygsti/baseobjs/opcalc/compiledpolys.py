@@ -0,0 +1,226 @@
+"""
+Defines the CompiledPolynomials class
+"""
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import numpy as _np
+import scipy.sparse as _sps
+
+
+class CompiledPolynomials(object):
+    """
+    An evaluation plan for a fixed list of compact polynomials with real-valued variables.
+
+    The (vtape, ctape) pair of a list of compact polynomials (see :meth:`Polynomial.compact`)
+    is converted, once, into a table of the distinct monomials appearing in any of the
+    polynomials and a sparse matrix of coefficients, so that evaluating all the polynomials
+    amounts to computing each monomial once and performing a single sparse matrix-vector
+    product.  Derivatives are similarly computed via a single sparse matrix-matrix product.
+
+    Only the *real parts* of the polynomial values are computed (as is needed for
+    outcome probabilities), and so only the real parts of the coefficients are stored.
+
+    Parameters
+    ----------
+    vtape, ctape : numpy.ndarray
+        Specifies "variable" and "coefficient" 1D numpy arrays of the polynomials.  These
+        "tapes" can be generated by concatenating the tapes of individual compact-polynomial
+        tuples returned by :meth:`Polynomial.compact`.
+
+    num_polys : int, optional
+        The number of polynomials in the tapes.  If None, this is determined from the tapes.
+
+    vtape_lengths : array-like, optional
+        The lengths of the individual polynomials' vtapes within `vtape`.  These are
+        determined from `vtape` when None, but it's faster to supply them when known.
+    """
+
+    def __init__(self, vtape, ctape, num_polys=None, vtape_lengths=None):
+        vtape = _np.asarray(vtape, _np.int64)
+        ctape = _np.real(_np.asarray(ctape))
+
+        #Locate the per-polynomial (number-of-terms) and per-term (number-of-variables) headers of the tape
+        if vtape_lengths is None:
+            poly_headers = _poly_header_positions(vtape)
+        else:
+            vtape_lengths = _np.asarray(vtape_lengths, _np.int64)
+            poly_headers = _np.cumsum(vtape_lengths) - vtape_lengths
+        term_headers, term_polys = _term_header_positions(vtape, poly_headers)
+        assert len(term_headers) == ctape.size, "Coeff Tape length error: %d != %d !" % (len(term_headers), ctape.size)
+        if num_polys is None: num_polys = len(poly_headers)
+        assert len(poly_headers) == num_polys, "Number of polynomials mismatch: %d != %d !" % \
+            (len(poly_headers), num_polys)
+
+        #Table of each term's variable indices, padded with an index to an appended 1.0
+        nvars = vtape[term_headers]
+        var_terms = _np.repeat(_np.arange(len(term_headers)), nvars)
+        var_positions = _np.arange(var_terms.size) - _np.repeat(_np.cumsum(nvars) - nvars, nvars)
+        var_indices = vtape[_np.repeat(term_headers + 1, nvars) + var_positions]
+        self.num_params = int(var_indices.max()) + 1 if (var_indices.size > 0) else 0
+        term_table = _np.full((len(term_headers), int(nvars.max()) if (nvars.size > 0) else 0),
+                              self.num_params, _np.int64)
+        term_table[var_terms, var_positions] = var_indices
+
+        #Monomial table: the distinct rows of the term table, found by sorting integer encodings
+        # of the rows (or the rows themselves, when they're too long to encode as integers)
+        base = self.num_params + 1
+        if term_table.shape[1] * _np.log2(base) < 62:
+            row_keys = _np.zeros(len(term_table), _np.int64)
+            for j in range(term_table.shape[1]):
+                row_keys = row_keys * base + term_table[:, j]
+            _, first_rows, term_monomials = _np.unique(row_keys, return_index=True, return_inverse=True)
+        else:
+            _, first_rows, term_monomials = _np.unique(term_table, axis=0, return_index=True, return_inverse=True)
+        self.monomial_table = term_table[first_rows]
+        term_monomials = term_monomials.reshape(-1)
+        num_monomials = self.monomial_table.shape[0]
+
+        #Coefficient matrix: rows = polynomials, cols = monomials (duplicate entries are summed)
+        self.coefficients = _sps.csr_matrix((ctape, (term_polys, term_monomials)),
+                                            shape=(num_polys, num_monomials), dtype='d')
+        self.coefficients.sum_duplicates()
+
+        #Structure of d(monomials)/d(params): an entry for each (monomial, variable position)
+        # pair - repeated variables produce repeated entries, which are summed as needed.
+        present = self.monomial_table < self.num_params
+        self._deriv_rows, self._deriv_positions = _np.nonzero(present)
+        self._deriv_cols = self.monomial_table[self._deriv_rows, self._deriv_positions]
+
+    @property
+    def num_polynomials(self):
+        """ The number of polynomials this object evaluates. """
+        return self.coefficients.shape[0]
+
+    @property
+    def num_monomials(self):
+        """ The number of distinct monomials appearing in the polynomials. """
+        return self.coefficients.shape[1]
+
+    def _extended_paramvec(self, paramvec):
+        paramvec = _np.asarray(paramvec, 'd')
+        assert paramvec.size >= self.num_params, "Parameter vector is too short!"
+        return _np.concatenate((paramvec[0:self.num_params], (1.0,)))  # last element pads monomial table
+
+    def evaluate(self, paramvec):
+        """
+        Evaluate (the real parts of) the polynomials at a given set of variable values.
+
+        Parameters
+        ----------
+        paramvec : numpy.ndarray
+            The values to substitute for the polynomial variables (x_i = `paramvec[i]`).
+
+        Returns
+        -------
+        numpy.ndarray
+            A 1D array of length `num_polynomials`.
+        """
+        x = self._extended_paramvec(paramvec)
+        monomial_vals = _np.prod(x[self.monomial_table], axis=1)
+        return self.coefficients.dot(monomial_vals)
+
+    def evaluate_derivs(self, paramvec, wrt_params=None):
+        """
+        Evaluate the derivatives of (the real parts of) the polynomials at a given set of variable values.
+
+        Parameters
+        ----------
+        paramvec : numpy.ndarray
+            The values to substitute for the polynomial variables (x_i = `paramvec[i]`).
+
+        wrt_params : numpy.ndarray, optional
+            The indices of the variables to differentiate with respect to.  If None,
+            then derivatives with respect to all the elements of `paramvec` are computed.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape `(num_polynomials, len(wrt_params))`.
+        """
+        x = self._extended_paramvec(paramvec)
+        nParams = len(paramvec)
+        if wrt_params is None: wrt_params = _np.arange(nParams)
+
+        #The derivative of a monomial w.r.t. the variable at a given position is the product of the
+        # variables at all the *other* positions - computed as products of prefixes and suffixes
+        # so that zero-valued variables are handled correctly.
+        vals = x[self.monomial_table]
+        ones = _np.ones((vals.shape[0], 1), 'd')
+        prefix = _np.cumprod(_np.concatenate((ones, vals[:, :-1]), axis=1), axis=1)
+        suffix = _np.cumprod(_np.concatenate((ones, vals[:, :0:-1]), axis=1), axis=1)[:, ::-1]
+        others = prefix * suffix
+        dmonomials = _sps.csr_matrix((others[self._deriv_rows, self._deriv_positions],
+                                      (self._deriv_rows, self._deriv_cols)),
+                                     shape=(self.num_monomials, max(nParams, self.num_params)))
+        dmonomials = dmonomials[:, wrt_params]
+
+        return _np.asarray(self.coefficients.dot(dmonomials).todense())
+
+
+def _chain_positions(next_positions, start):
+    """
+    The positions visited by repeatedly following `next_positions` from `start`.
+
+    `next_positions` must be strictly increasing along any chain until its last element,
+    a "sink" position that maps to itself and that is not included in the returned positions.
+    Chains are followed by pointer jumping, so all the visited positions are found
+    using a logarithmic number of vectorized steps.
+    """
+    sink = len(next_positions) - 1
+    visited = _np.zeros(len(next_positions), bool)
+    visited[start] = True
+    jump = next_positions  # maps each position to the position 2**k steps further along
+    while not visited[sink]:
+        visited[jump[visited]] = True
+        jump = jump[jump]
+    return _np.flatnonzero(visited[0:sink])
+
+
+def _poly_header_positions(vtape):
+    """
+    The positions of the polynomial headers (numbers of terms) of a vtape.
+    """
+    tape_len = len(vtape)
+    positions = _np.arange(tape_len + 1)
+    counts = _np.append(vtape, 0)  # header values (when they are headers) - the sink position has none
+
+    #Following a term header skips over its variable indices; following a polynomial header
+    # skips over its terms, i.e. applies `after_term` (number of terms) times.
+    after_term = _np.minimum(positions + 1 + counts, tape_len)
+    after_poly = _np.minimum(positions + 1, tape_len)
+    jump = after_term
+    while _np.any(counts > 0):
+        odd = (counts & 1).astype(bool)
+        after_poly[odd] = jump[after_poly[odd]]
+        counts = counts >> 1
+        jump = jump[jump]
+    return _chain_positions(after_poly, 0)
+
+
+def _term_header_positions(vtape, poly_headers):
+    """
+    The positions of the term headers (numbers of variables) of a vtape and the polynomial index of each term.
+
+    The terms of all the polynomials are stepped through together, so the number of
+    vectorized steps is the maximum number of terms in any one polynomial.
+    """
+    nterms = vtape[poly_headers]
+    term_offsets = _np.cumsum(nterms) - nterms
+    term_headers = _np.empty(int(nterms.sum()), _np.int64)
+
+    by_nterms = _np.argsort(-nterms, kind='stable')  # so the polynomials with > k terms are a prefix
+    sorted_nterms = nterms[by_nterms]
+    sorted_offsets = term_offsets[by_nterms]
+    positions = poly_headers[by_nterms] + 1
+    for k in range(int(sorted_nterms[0]) if len(sorted_nterms) > 0 else 0):
+        n = _np.searchsorted(-sorted_nterms, -k, side='left')  # number of polynomials with > k terms
+        term_headers[sorted_offsets[0:n] + k] = positions[0:n]
+        positions[0:n] += 1 + vtape[positions[0:n]]
+    return term_headers, _np.repeat(_np.arange(len(nterms)), nterms)
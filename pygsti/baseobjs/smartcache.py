@@ -13,8 +13,11 @@ Defines SmartCache and supporting functions
 import functools as _functools
 import hashlib as _hashlib
 import inspect as _inspect
+import os as _os
 import pickle as _pickle
-from collections import Counter, defaultdict
+import sys as _sys
+import uuid as _uuid
+from collections import Counter, OrderedDict, defaultdict
 
 import numpy as _np
 
@@ -82,6 +85,37 @@ def _show_cache_percents(hits, misses, printer):
     printer.log('    {}% effective\n'.format(round((nHits / max(1, nRequests)) * 100, 2)))
 
 
+def _show_cache_memory(nbytes, max_bytes, evictions, spills, printer):
+    """
+    Shows the memory used by a cache and how many of its entries have been evicted
+
+    Parameters
+    ----------
+    nbytes : int
+        (estimated) memory used, in bytes
+
+    max_bytes : int or None
+        memory budget, in bytes
+
+    evictions : Counter
+        evicted entries
+
+    spills : Counter
+        evicted entries that were written to disk
+
+    printer : pygsti.objects.VerbosityPrinter
+        logging object
+
+    Returns
+    -------
+    None
+    """
+    printer.log('    {:<10} bytes in memory{}'.format(
+        nbytes, '' if (max_bytes is None) else ' (max {})'.format(max_bytes)))
+    printer.log('    {:<10} evictions'.format(_csize(evictions)))
+    printer.log('    {:<10} spilled to disk\n'.format(_csize(spills)))
+
+
 def _show_kvs(title, kvs, printer):
     """
     Pretty-print key-value pairs w/ a title and printer object
@@ -107,6 +141,241 @@ def _show_kvs(title, kvs, printer):
     printer.log('')
 
 
+def _restrict_entry_info(state):
+    """
+    Restricts the memory accounting in a :class:`SmartCache` state dict to the entries of its `'cache'`.
+
+    Parameters
+    ----------
+    state : dict
+        A state dictionary (as from `__getstate__`), updated in place.
+
+    Returns
+    -------
+    None
+    """
+    cache = state['cache']
+    entry_info = OrderedDict([(k, list(info)) for k, info in state['entry_info'].items() if k in cache])
+    fn_nbytes = Counter()
+    for name_key, nbytes in entry_info.values():
+        fn_nbytes[name_key] += nbytes
+    state['entry_info'] = entry_info
+    state['nbytes'] = sum(fn_nbytes.values())
+    state['fn_nbytes'] = fn_nbytes
+
+
+def _estimate_nbytes(obj, max_depth=4):
+    """
+    Estimates the memory used by `obj`, in bytes.
+
+    NumPy arrays are sized by their `nbytes`, and containers (and the `__dict__`
+    of general objects) are traversed up to a depth of `max_depth`.  Objects
+    referenced more than once within `obj` are only counted once.
+
+    Parameters
+    ----------
+    obj : object
+        The object to size.
+
+    max_depth : int, optional
+        The maximum depth of the traversal.
+
+    Returns
+    -------
+    int
+    """
+    seen = set()
+
+    def size(o, depth):
+        if id(o) in seen or isinstance(o, SmartCache): return 0
+        seen.add(id(o))
+        if isinstance(o, _np.ndarray):
+            return _sys.getsizeof(o) + (o.nbytes if o.base is not None else 0)  # views don't own data
+        n = _sys.getsizeof(o)
+        if depth >= max_depth or isinstance(o, (str, bytes, bytearray, int, float, complex, type)):
+            return n
+        if isinstance(o, dict):
+            n += sum([size(k, depth + 1) + size(v, depth + 1) for k, v in o.items()])
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            n += sum([size(el, depth + 1) for el in o])
+        elif hasattr(o, '__dict__') and not _inspect.isroutine(o) and not _inspect.ismodule(o):
+            n += size(o.__dict__, depth + 1)
+        return n
+    return size(obj, 0)
+
+
+class DiskCache(object):
+    """
+    A content-addressed, size-bounded on-disk store for cached values.
+
+    Each value is pickled into its own file, named by a digest of its cache key,
+    so that separate processes (and separate sessions) sharing the same directory
+    can reuse each other's results.  When the total size of the stored files
+    exceeds `max_bytes`, the least-recently-used files are removed.
+
+    Parameters
+    ----------
+    directory : str
+        The directory holding the cache files.  It is created if it doesn't exist.
+
+    max_bytes : int, optional
+        The maximum total size, in bytes, of the cache files.  `None` means
+        the cache is unbounded.
+
+    namespace : str, optional
+        A string mixed into every file name, so that values computed by
+        different code versions (e.g. pyGSTi releases) are not confused.
+
+    Attributes
+    ----------
+    nbytes : int
+        The (approximate) total size, in bytes, of the files currently in the cache.
+    """
+    FILE_EXT = '.pkl'
+
+    def __init__(self, directory, max_bytes=None, namespace=''):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.unpickleable = set()
+        _os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        """ Rebuild the LRU-ordered index of cache files from the contents of `self.directory` """
+        entries = []
+        for dirpath, _, filenames in _os.walk(self.directory):
+            for fname in filenames:
+                if not fname.endswith(self.FILE_EXT): continue
+                pth = _os.path.join(dirpath, fname)
+                try:
+                    st = _os.stat(pth)
+                except OSError:
+                    continue  # removed by another process
+                entries.append((st.st_mtime, pth, st.st_size))
+        self._index = OrderedDict([(pth, sz) for _, pth, sz in sorted(entries)])  # least -> most recently used
+        self.nbytes = sum(self._index.values())
+
+    def _path(self, key):
+        """ The file path used to store the value for `key` """
+        hexdigest = _hashlib.sha1((self.namespace + repr(key)).encode('utf-8')).hexdigest()
+        return _os.path.join(self.directory, hexdigest[0:2], hexdigest + self.FILE_EXT)
+
+    def _dumps(self, value):
+        return _pickle.dumps(value, protocol=_pickle.HIGHEST_PROTOCOL)
+
+    def _loads(self, data):
+        return _pickle.loads(data)
+
+    def __contains__(self, key):
+        return _os.path.exists(self._path(key))
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, key, default=None):
+        """
+        Retrieve the value stored for `key`.
+
+        Parameters
+        ----------
+        key : tuple
+            A cache key, as computed by a :class:`SmartCache`.
+
+        default : object, optional
+            The value returned when `key` is not in the cache.
+
+        Returns
+        -------
+        object
+        """
+        pth = self._path(key)
+        try:
+            with open(pth, 'rb') as f:
+                data = f.read()
+            value = self._loads(data)
+        except FileNotFoundError:
+            self._index.pop(pth, None)
+            return default
+        except Exception:  # a corrupted or no-longer-loadable file: treat as a miss
+            self._remove(pth)
+            return default
+
+        try:
+            _os.utime(pth)  # mark as recently used (shared with other processes via mtime)
+        except OSError:
+            pass
+        if pth not in self._index: self.nbytes += len(data)
+        self._index[pth] = len(data)
+        self._index.move_to_end(pth)
+        return value
+
+    def put(self, key, value):
+        """
+        Store `value` under `key`, evicting least-recently-used entries as needed.
+
+        Parameters
+        ----------
+        key : tuple
+            A cache key, as computed by a :class:`SmartCache`.
+
+        value : object
+            The value to store.  Values that cannot be pickled are not stored.
+
+        Returns
+        -------
+        bool
+            Whether `value` was stored.
+        """
+        try:
+            data = self._dumps(value)
+        except Exception as e:
+            self.unpickleable.add(str(key[0]) + str(type(value)) + str(e))
+            return False
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return False  # would never fit
+
+        pth = self._path(key)
+        _os.makedirs(_os.path.dirname(pth), exist_ok=True)
+        tmp_pth = pth + '.%s.tmp' % _uuid.uuid4().hex
+        with open(tmp_pth, 'wb') as f:
+            f.write(data)
+        _os.replace(tmp_pth, pth)  # atomic, so concurrent readers never see a partial file
+
+        self.nbytes += len(data) - self._index.get(pth, 0)
+        self._index[pth] = len(data)
+        self._index.move_to_end(pth)
+
+        if self.max_bytes is not None and self.nbytes > self.max_bytes:
+            self._scan()  # pick up files written by other processes before evicting
+            self._evict(self.max_bytes)
+        return True
+
+    def _remove(self, pth):
+        try:
+            _os.remove(pth)
+        except OSError:
+            pass
+        self.nbytes -= self._index.pop(pth, 0)
+
+    def _evict(self, max_bytes):
+        """ Remove least-recently-used files until the cache holds at most `max_bytes` """
+        while self.nbytes > max_bytes and len(self._index) > 0:
+            pth = next(iter(self._index))
+            self._remove(pth)
+
+    def clear(self):
+        """
+        Remove all the files in this cache.
+
+        Returns
+        -------
+        None
+        """
+        self._scan()
+        self._evict(-1)
+
+
 class SmartCache(object):
     """
     Cache object that profiles itself
@@ -116,14 +385,38 @@ class SmartCache(object):
     decorating : tuple
         module and function being decorated by the smart cache
 
+    disk_cache : DiskCache, optional
+        A persistent store that backs this (in-memory) cache.  When given,
+        call keys are computed using process-independent digests, values are
+        looked up in `disk_cache` before being computed, and newly computed
+        values are written to it.
+
+    max_bytes : int, optional
+        The maximum (estimated) total size, in bytes, of the values held in
+        memory.  When this is exceeded, entries are evicted according to
+        `policy`.  `None` means the cache is unbounded.
+
+    policy : {"lru", "lfu"}
+        The eviction policy: evict the least-recently-used ("lru") or the
+        least-frequently-used ("lfu") entries first.
+
+    spill_cache : DiskCache, optional
+        When given, evicted entries are written to this store and are reloaded
+        from it (rather than being recomputed) when they are requested again.
+
     Attributes
     ----------
     StaticCacheList : list
         A list of all :class:`SmartCache` instances.
+
+    EVICTION_POLICIES : tuple
+        The allowed eviction policies.  The "none" policy, which can only be
+        given to :meth:`set_policy`, exempts a function's entries from eviction.
     """
     StaticCacheList = []
+    EVICTION_POLICIES = ('lru', 'lfu', 'none')
 
-    def __init__(self, decorating=(None, None)):
+    def __init__(self, decorating=(None, None), disk_cache=None, max_bytes=None, policy='lru', spill_cache=None):
         '''
         Construct a smart cache object
 
@@ -131,8 +424,29 @@ class SmartCache(object):
         ----------
         decorating : tuple
             module and function being decorated by the smart cache
+
+        disk_cache : DiskCache, optional
+            A persistent store that backs this (in-memory) cache.
+
+        max_bytes : int, optional
+            The maximum (estimated) total size, in bytes, of the cached values.
+
+        policy : {"lru", "lfu"}
+            The eviction policy.
+
+        spill_cache : DiskCache, optional
+            A store for evicted entries.
         '''
+        assert(policy in ('lru', 'lfu')), "Invalid eviction policy: %s" % str(policy)
         self.cache = dict()
+        self.disk_cache = disk_cache
+        self.spill_cache = spill_cache
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.fn_policies = dict()  # per-function eviction settings (see set_policy)
+        self.entry_info = OrderedDict()  # key -> [name_key, nbytes], least- to most-recently used
+        self.nbytes = 0
+        self.fn_nbytes = Counter()
         self.outargs = dict()
         self.ineffective = set()
         self.decoratingModule, self.decoratingFn = decorating
@@ -141,6 +455,10 @@ class SmartCache(object):
         self.misses = Counter()
         self.hits = Counter()
         self.fhits = Counter()
+        self.diskhits = Counter()
+        self.spillhits = Counter()
+        self.evictions = Counter()
+        self.spills = Counter()
 
         self.requests = Counter()
         self.ineffectiveRequests = Counter()
@@ -159,6 +477,17 @@ class SmartCache(object):
         SmartCache.StaticCacheList.append(self)
 
     def __setstate__(self, d):
+        d.setdefault('disk_cache', None)  # backward compatibility
+        d.setdefault('diskhits', Counter())
+        d.setdefault('spill_cache', None)
+        d.setdefault('max_bytes', None)
+        d.setdefault('policy', 'lru')
+        d.setdefault('fn_policies', dict())
+        d.setdefault('entry_info', OrderedDict())
+        d.setdefault('nbytes', 0)
+        d.setdefault('fn_nbytes', Counter())
+        for counter_name in ('spillhits', 'evictions', 'spills'):
+            d.setdefault(counter_name, Counter())
         return self.__dict__.update(d)
 
     def __getstate__(self):
@@ -181,6 +510,7 @@ class SmartCache(object):
 
         d['cache'] = _get_pickleable_dict(self.cache)
         d['outargs'] = _get_pickleable_dict(self.outargs)
+        _restrict_entry_info(d)
         return d
 
     def __pygsti_getstate__(self):  # same but for json/msgpack
@@ -200,6 +530,7 @@ class SmartCache(object):
 
         d['cache'] = _get_jsonable_dict(self.cache)
         d['outargs'] = _get_jsonable_dict(self.outargs)
+        _restrict_entry_info(d)
         return d
 
     def add_digest(self, custom):
@@ -219,6 +550,110 @@ class SmartCache(object):
         """
         self.customDigests.append(custom)
 
+    def set_policy(self, fn, policy=None, max_bytes=None):
+        """
+        Set the eviction policy and memory budget used for the cached values of a single function.
+
+        Parameters
+        ----------
+        fn : function or str
+            The function, or its name (as used in this cache's statistics).
+
+        policy : {"lru", "lfu", "none"}, optional
+            The policy used to evict `fn`'s entries when they exceed `max_bytes`.
+            `"none"` exempts `fn`'s entries from eviction altogether, even when this
+            cache's overall `max_bytes` is exceeded.  `None` means this cache's policy.
+
+        max_bytes : int, optional
+            The maximum (estimated) total size, in bytes, of `fn`'s cached values.
+            `None` means that `fn`'s entries are only limited by this cache's
+            overall `max_bytes`.
+
+        Returns
+        -------
+        None
+        """
+        assert(policy is None or policy in self.EVICTION_POLICIES), "Invalid eviction policy: %s" % str(policy)
+        name_key = fn if isinstance(fn, str) else _get_fn_name_key(fn)
+        self.fn_policies[name_key] = {'policy': policy if (policy is not None) else self.policy,
+                                      'max_bytes': max_bytes}
+        self._enforce_limits(name_key)
+
+    def _store(self, key, value):
+        """ Hold `value` in memory under `key`, evicting other entries as needed to stay within budget """
+        self._forget(key)
+        self.cache[key] = value
+        nbytes = _estimate_nbytes(value) + _estimate_nbytes(self.outargs.get(key, None))
+        name_key = key[0]
+        self.entry_info[key] = [name_key, nbytes]
+        self.nbytes += nbytes
+        self.fn_nbytes[name_key] += nbytes
+        self._enforce_limits(name_key, protect=key)
+
+    def _touch(self, key):
+        """ Mark the entry for `key` as the most recently used one """
+        if key in self.entry_info:
+            self.entry_info.move_to_end(key)
+
+    def _forget(self, key):
+        """ Stop accounting for the memory used by `key`'s entry """
+        if key in self.entry_info:
+            name_key, nbytes = self.entry_info.pop(key)
+            self.nbytes -= nbytes
+            self.fn_nbytes[name_key] -= nbytes
+
+    def _enforce_limits(self, name_key, protect=None):
+        """ Evict entries until the budgets for `name_key`'s entries and for the whole cache are met """
+        fn_policy = self.fn_policies.get(name_key, None)
+        if fn_policy is not None and fn_policy['policy'] != 'none' and fn_policy['max_bytes'] is not None \
+           and self.fn_nbytes[name_key] > fn_policy['max_bytes']:
+            self._evict(fn_policy['policy'], fn_policy['max_bytes'], name_key, protect)
+
+        if self.max_bytes is not None and self.nbytes > self.max_bytes:
+            self._evict(self.policy, self.max_bytes, None, protect)
+
+    def _evict(self, policy, max_bytes, name_key, protect):
+        """
+        Evict the entries of function `name_key` (or of any evictable function if `None`),
+        in the order given by `policy`, until they use at most `max_bytes`.
+        """
+        def evictable(nk):
+            return (nk == name_key) if (name_key is not None) else \
+                (self.fn_policies.get(nk, {}).get('policy', None) != 'none')
+
+        candidates = [k for k, (nk, _) in self.entry_info.items() if k != protect and evictable(nk)]
+        if policy == 'lfu':  # (a stable sort, so ties are broken by recency)
+            candidates.sort(key=lambda k: self.hits[k] + self.misses[k])
+
+        for k in candidates:
+            if (self.fn_nbytes[name_key] if (name_key is not None) else self.nbytes) <= max_bytes:
+                break
+            self._evict_entry(k)
+
+    def _evict_entry(self, key):
+        """ Remove the entry for `key` from memory, spilling it to `spill_cache` if there is one """
+        name_key = self.entry_info[key][0]
+        self._forget(key)
+        value = self.cache.pop(key, None)
+        outargs = self.outargs.pop(key, None)
+        self.evictions[name_key] += 1
+        if self.spill_cache is not None and self.spill_cache.put(key, (value, outargs)):
+            self.spills[name_key] += 1
+
+    def _load_stored(self, key, name_key, persistent):
+        """ Try to load the value for `key` from `disk_cache` (if `persistent`) or `spill_cache` into memory """
+        for store, hit_counter, use in ((self.disk_cache, self.diskhits, persistent),
+                                        (self.spill_cache, self.spillhits, True)):
+            if not use or store is None: continue
+            stored_val = store.get(key, None)
+            if stored_val is not None:
+                value, outargs = stored_val
+                if outargs is not None: self.outargs[key] = outargs
+                self._store(key, value)
+                hit_counter[name_key] += 1
+                return True
+        return False
+
     def low_overhead_cached_compute(self, fn, arg_vals, kwargs=None):
         """
         Cached compute with less profiling. See :meth:`cached_compute` docstring.
@@ -252,9 +687,12 @@ class SmartCache(object):
                 key = _call_key(fn, tuple(arg_vals) + (kwargs,), self.customDigests)  # cache by call key
             if key not in self.cache:
                 with _timed_block('call', times):
-                    self.cache[key] = fn(*arg_vals, **kwargs)
+                    value = fn(*arg_vals, **kwargs)
+                self._store(key, value)
                 if times['hash'] > times['call']:
                     self.ineffective.add(name_key)
+            else:
+                self._touch(key)
             result = self.cache[key]
         return key, result
 
@@ -298,8 +736,15 @@ class SmartCache(object):
         else:
             from pygsti.tools.opttools import timed_block as _timed_block
             times = dict()
+            persistent = self.disk_cache is not None
             with _timed_block('hash', times):
-                key = _call_key(fn, tuple(arg_vals) + (kwargs,), self.customDigests)  # cache by call key
+                key, stable = _call_key(fn, tuple(arg_vals) + (kwargs,), self.customDigests,
+                                        persistent, return_stability=True)  # cache by call key
+            persistent = persistent and stable
+
+            if key not in self.cache:  # try to load a previously computed (or evicted) value from disk
+                self._load_stored(key, name_key, persistent)
+
             if key not in self.cache:
                 #DB: if "_compute_sub_mxs" in fn.__name__:
                 #DB: print(fn.__name__, " --> computing... (not found in %d keys)" % len(list(self.cache.keys()))) # DB
@@ -309,11 +754,14 @@ class SmartCache(object):
                     str({k: str(type(v)) for k, v in kwargs.items()})
                 self.typesigs[name_key] = typesig
                 with _timed_block('call', times):
-                    self.cache[key] = fn(*arg_vals, **kwargs)
+                    value = fn(*arg_vals, **kwargs)
                     if "_filledarrays" in special_kwargs:
                         self.outargs[key] = tuple((arg_vals[i] if isinstance(i, int) else kwargs[i]
                                                    for i in special_kwargs['_filledarrays']))  # copy?
                 self.misses[key] += 1
+                self._store(key, value)
+                if persistent:
+                    self.disk_cache.put(key, (self.cache[key], self.outargs.get(key, None)))
                 hashtime = times['hash']
                 calltime = times['call']
                 if hashtime > calltime:
@@ -328,6 +776,7 @@ class SmartCache(object):
                 #DB: print(fn.__name__, " --> cache hit!") # DB
                 self.hits[key] += 1
                 self.fhits[name_key] += 1
+                self._touch(key)
 
                 #Special kwarg processing: any keyword argument that starts with an
                 # underscore is considered to be directed the SmartCache.
@@ -343,6 +792,64 @@ class SmartCache(object):
             result = self.cache[key]
         return key, result
 
+    def lookup(self, fn, arg_vals, kwargs=None):
+        """
+        Computes the key that :meth:`cached_compute` would use, without calling `fn`.
+
+        Parameters
+        ----------
+        fn : function
+            Cached function
+
+        arg_vals : tuple or list
+            Arguments to cached function
+
+        kwargs : dictionary
+            Keyword arguments to cached function
+
+        Returns
+        -------
+        key : the key used to hash the function call, or `'INEFFECTIVE'` if
+            `fn` isn't cached because doing so is ineffective.
+        is_cached : whether a value for `key` is already cached, in memory or on disk.
+        persistent : whether `key` can be used with this cache's `disk_cache`.
+        """
+        if kwargs is None: kwargs = dict()
+        kwargs = {k: v for k, v in kwargs.items() if not k.startswith('_')}
+        if _get_fn_name_key(fn) in self.ineffective:
+            return 'INEFFECTIVE', False, False
+
+        persistent = self.disk_cache is not None
+        key, stable = _call_key(fn, tuple(arg_vals) + (kwargs,), self.customDigests,
+                                persistent, return_stability=True)
+        persistent = persistent and stable
+        is_cached = (key in self.cache) or (persistent and key in self.disk_cache) \
+            or (self.spill_cache is not None and key in self.spill_cache)
+        return key, is_cached, persistent
+
+    def add_computed_value(self, key, value, persistent=False):
+        """
+        Adds a value computed elsewhere (e.g. by another process) to this cache.
+
+        Parameters
+        ----------
+        key : tuple
+            The key, as returned by :meth:`lookup`.
+
+        value : object
+            The computed value.
+
+        persistent : bool, optional
+            Whether to also store `value` in this cache's `disk_cache`.
+
+        Returns
+        -------
+        None
+        """
+        self._store(key, value)
+        if persistent and self.disk_cache is not None:
+            self.disk_cache.put(key, (value, None))
+
     @staticmethod
     def global_status(printer):
         """
@@ -360,6 +867,9 @@ class SmartCache(object):
         totalSaved = 0
         totalHits = Counter()
         totalMisses = Counter()
+        totalBytes = 0
+        totalEvictions = Counter()
+        totalSpills = Counter()
 
         suggestRemove = set()
         warnNoHits = set()
@@ -370,6 +880,9 @@ class SmartCache(object):
             totalHits += cache.hits
             totalMisses += cache.misses
             totalSaved += cache.saved
+            totalBytes += cache.nbytes
+            totalEvictions += cache.evictions
+            totalSpills += cache.spills
 
             fullname = '{}.{}'.format(cache.decoratingModule, cache.decoratingFn)
 
@@ -410,6 +923,7 @@ class SmartCache(object):
 
         printer.log('\nGlobal cache overview:')
         _show_cache_percents(totalHits, totalMisses, printer)
+        _show_cache_memory(totalBytes, None, totalEvictions, totalSpills, printer)
         printer.log('    {} seconds saved total'.format(totalSaved))
 
     def avg_timedict(self, d):
@@ -450,11 +964,16 @@ class SmartCache(object):
         printer.log('Status of smart cache decorating {}.{}:\n'.format(
             self.decoratingModule, self.decoratingFn))
         _show_cache_percents(self.hits, self.misses, printer)
+        _show_cache_memory(self.nbytes, self.max_bytes, self.evictions, self.spills, printer)
 
         with printer.verbosity_env(2):
             _show_kvs('Most common requests:\n', self.requests.most_common(), printer)
             _show_kvs('Ineffective requests:\n', self.ineffectiveRequests.most_common(), printer)
             _show_kvs('Hits:\n', self.fhits.most_common(), printer)
+            _show_kvs('Disk hits:\n', self.diskhits.most_common(), printer)
+            _show_kvs('Spill hits:\n', self.spillhits.most_common(), printer)
+            _show_kvs('Memory used (bytes):\n', self.fn_nbytes.most_common(), printer)
+            _show_kvs('Evictions:\n', self.evictions.most_common(), printer)
 
             printer.log('Type signatures of functions and their hash times:\n')
             for k, v in self.typesigs.items():
@@ -512,10 +1031,16 @@ class CustomDigestError(Exception):
     pass
 
 
-def digest(obj, custom_digests=None):
+def digest(obj, custom_digests=None, persistent=False, return_stability=False):
     """
     Returns an MD5 digest of an arbitary Python object, `obj`.
 
+    Objects whose type defines a `__pygsti_digest__` method (e.g. models, data sets,
+    circuits and circuit lists) are digested by calling this method, which returns
+    a `bytes` digest of the object's contents.  Such objects typically memoize their
+    digest until they are mutated, so that digesting them is cheap regardless of
+    their size.  NumPy arrays are digested directly from their data buffers.
+
     Parameters
     ----------
     obj : object
@@ -527,12 +1052,86 @@ def digest(obj, custom_digests=None):
         or similar) or raise a :class:`CustomDigestError` to indicate it was unable to
         digest `value`.
 
+    persistent : bool, optional
+        Whether to compute a digest that is reproducible across processes, as needed
+        for keys of a :class:`DiskCache`.  Python's built-in `hash` is randomized per
+        process (and is identity-based for many objects), so in this mode strings and
+        numbers are digested by value and other objects are digested by their pickled
+        contents rather than by their `hash`.
+
+    return_stability : bool, optional
+        When `True`, also return whether the digest is reproducible across processes.
+        This can only be the case when `persistent=True`, and fails to be when some
+        part of `obj` could only be digested using its `hash`.
+
     Returns
     -------
-    MD5_digest
+    MD5_digest : bytes
+    stable : bool
+        Only returned when `return_stability=True`.
     """
     if custom_digests is None:
         custom_digests = []
+    unstable = []  # gets an element whenever hash(.) is used when computing a persistent digest
+
+    def add_custom_or_attributes(md5, v):
+        """Add `v` using a custom digest or, failing that, by walking its attributes."""
+        for custom_digest in custom_digests:
+            try:
+                custom_digest(md5, v)
+                break
+            except CustomDigestError:
+                pass
+        else:
+            attribs = sorted(v.__dict__.keys()) if hasattr(v, '__dict__') else list(sorted(dir(v)))
+            for k in attribs:
+                if k.startswith('__'):
+                    continue
+                a = getattr(v, k)
+                if _inspect.isroutine(a):
+                    continue
+                add(md5, k)
+                add(md5, a)
+
+    def add_persistent(md5, v):
+        """Add `v` to the hash in a process-independent way, recursively if needed."""
+        if isinstance(v, str):
+            md5.update(v.encode('utf-8'))
+        elif isinstance(v, (bool, int, float, complex, _np.generic)):
+            md5.update(repr(v).encode('utf-8'))
+        elif isinstance(v, _uuid.UUID):
+            md5.update(v.bytes)
+        elif isinstance(v, (tuple, list)):
+            for el in v: add(md5, el)
+        elif isinstance(v, (set, frozenset)):
+            el_digests = [digest(el, custom_digests, True, True) for el in v]
+            if not all([stable for _, stable in el_digests]): unstable.append(type(v))
+            for el_digest in sorted([d for d, _ in el_digests]):
+                md5.update(el_digest)
+        elif isinstance(v, dict):
+            keys = list(v.keys())
+            for k in sorted(keys):
+                add(md5, k)
+                add(md5, v[k])
+        elif type(v).__module__ == 'mpi4py.MPI':
+            pass  # don't hash comm objects
+        elif isinstance(getattr(v, 'uuid', None), _uuid.UUID):  # uuid is a persistent id (e.g. Model, DataSet)
+            md5.update(v.uuid.bytes)
+        else:
+            for custom_digest in custom_digests:
+                try:
+                    custom_digest(md5, v)
+                    return
+                except CustomDigestError:
+                    pass
+            try:
+                md5.update(_pickle.dumps(v, protocol=_pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                unstable.append(type(v))
+                try:
+                    md5.update(str(hash(v)).encode('utf-8'))
+                except TypeError:
+                    add_custom_or_attributes(md5, v)
 
     # a function to recursively serialize 'v' into an md5 object
     def add(md5, v):
@@ -543,15 +1142,24 @@ def digest(obj, custom_digests=None):
             if isinstance(v, SmartCache): return  # don't hash SmartCache args
             if isinstance(v, bytes):
                 md5.update(v)  # can add bytes directly
+            elif hasattr(type(v), '__pygsti_digest__'):
+                md5.update(v.__pygsti_digest__())  # structural (and usually memoized) digest
+            elif isinstance(v, _np.ndarray):
+                if v.dtype == object:
+                    md5.update(str(v.shape).encode('utf-8'))
+                    for el in v.flat: add(md5, el)
+                else:
+                    md5.update(ndarray_digest(v))
             elif v is None:
-                md5.update(str(hash("(_NONE_)")).encode('utf-8'))  # make all None's hash the same
+                md5.update(b"(_NONE_)" if persistent else  # make all None's hash the same
+                           str(hash("(_NONE_)")).encode('utf-8'))
+            elif persistent:
+                add_persistent(md5, v)
             else:
                 try:
                     md5.update(str(hash(v)).encode('utf-8'))
                 except TypeError:  # as hashException:
-                    if isinstance(v, _np.ndarray):
-                        md5.update(v.tobytes() + str(v.shape).encode('utf-8'))  # numpy gives us bytes
-                    elif isinstance(v, (tuple, list)):
+                    if isinstance(v, (tuple, list)):
                         for el in v: add(md5, el)
                     elif isinstance(v, dict):
                         keys = list(v.keys())
@@ -561,29 +1169,39 @@ def digest(obj, custom_digests=None):
                     elif type(v).__module__ == 'mpi4py.MPI':  # don't import mpi4py (not always available)
                         pass  # don't hash comm objects
                     else:
-                        for custom_digest in custom_digests:
-                            try:
-                                custom_digest(md5, v)
-                                break
-                            except CustomDigestError:
-                                pass
-                        else:
-                            attribs = sorted(v.__dict__.keys()) if hasattr(v, '__dict__') else list(sorted(dir(v)))
-                            for k in attribs:
-                                if k.startswith('__'):
-                                    continue
-                                a = getattr(v, k)
-                                if _inspect.isroutine(a):
-                                    continue
-                                add(md5, k)
-                                add(md5, a)
+                        add_custom_or_attributes(md5, v)
             return
 
     M = _hashlib.md5()
     add(M, obj)
+    if return_stability:
+        return M.digest(), (persistent and len(unstable) == 0)
     return M.digest()  # return native hash of the MD5 digest
 
 
+def ndarray_digest(a):
+    """
+    Returns an MD5 digest of the contents of a (non-object) NumPy array.
+
+    This plays the role of a `__pygsti_digest__` method for :class:`numpy.ndarray`
+    objects, and digests the array's data buffer directly, only copying it when
+    `a` is not C-contiguous.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The array to digest.
+
+    Returns
+    -------
+    bytes
+    """
+    md5 = _hashlib.md5()
+    md5.update((str(a.shape) + str(a.dtype)).encode('utf-8'))
+    md5.update(_np.ascontiguousarray(a).data)
+    return md5.digest()
+
+
 def _get_fn_name_key(fn):
     """
     Get the name (str) used to hash the function `fn`
@@ -603,7 +1221,7 @@ def _get_fn_name_key(fn):
     return name
 
 
-def _call_key(fn, args, custom_digests):
+def _call_key(fn, args, custom_digests, persistent=False, return_stability=False):
     """
     Returns a hashable key for caching the result of a function call.
 
@@ -621,6 +1239,13 @@ def _call_key(fn, args, custom_digests):
         or similar) or raise a :class:`CustomDigestError` to indicate it was unable to
         digest `value`.
 
+    persistent : bool, optional
+        Whether to compute argument digests that are reproducible across processes.
+        See :func:`digest`.
+
+    return_stability : bool, optional
+        When `True`, also return whether the key is reproducible across processes.
+
     Returns
     -------
     tuple
@@ -630,5 +1255,9 @@ def _call_key(fn, args, custom_digests):
         pass  # special case: don't hash "self" in _create functions (b/c self doesn't matter - "self" is being created)
     elif hasattr(fn, '__self__'):  # add "self" to args when it's an instance's method call
         args = (fn.__self__,) + args
-    inner_digest = _functools.partial(digest, custom_digests=custom_digests)
+    if return_stability:
+        digests_and_stabilities = [digest(arg, custom_digests, persistent, True) for arg in args]
+        key = (fnName,) + tuple([d for d, _ in digests_and_stabilities])
+        return key, all([stable for _, stable in digests_and_stabilities])
+    inner_digest = _functools.partial(digest, custom_digests=custom_digests, persistent=persistent)
     return (fnName,) + tuple(map(inner_digest, args))
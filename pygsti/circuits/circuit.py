@@ -11,6 +11,7 @@ Defines the Circuit class
 #***************************************************************************************************
 
 import collections as _collections
+import hashlib as _hashlib
 import itertools as _itertools
 import warnings as _warnings
 
@@ -808,6 +809,25 @@ class Circuit(object):
             self.done_editing()
         return self._hash
 
+    def __pygsti_digest__(self):
+        """
+        An MD5 digest of this circuit, used by :func:`pygsti.baseobjs.smartcache.digest`.
+
+        The digest is computed from the circuit's string representation (which includes
+        its line labels and occurrence id), and is memoized for static (read-only) circuits.
+
+        Returns
+        -------
+        bytes
+        """
+        memo = self.__dict__.get('_pygsti_digest', None)
+        if memo is not None:
+            return memo
+        dgst = _hashlib.md5(self.str.encode('utf-8')).digest()
+        if self._static:
+            self._pygsti_digest = dgst
+        return dgst
+
     def __len__(self):
         return len(self._labels)
 
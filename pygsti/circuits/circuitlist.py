@@ -10,10 +10,12 @@ Defines the CircuitList class, for holding meta-data alongside a list or tuple o
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 # ***************************************************************************************************
 import copy as _copy
+import hashlib as _hashlib
 import uuid as _uuid
 import numpy as _np
 
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
+from pygsti.baseobjs.smartcache import digest as _digest
 from pygsti.circuits.circuit import Circuit as _Circuit
 from pygsti.tools import listtools as _lt
 
@@ -202,6 +204,35 @@ class CircuitList(_NicelySerializable):
         if 'uuid' not in state_dict:  # backward compatibility
             self.uuid = _uuid.uuid4()  # create a new uuid
 
+    def _structure_digest(self):
+        """
+        An MD5 digest of the immutable part of this circuit list (its circuits).
+
+        Derived classes that hold additional (immutable) structure should extend this.
+        """
+        md5 = _hashlib.md5()
+        md5.update('\n'.join([c.str for c in self._circuits]).encode('utf-8'))
+        return md5.digest()
+
+    def __pygsti_digest__(self):
+        """
+        An MD5 digest of this circuit list, used by :func:`pygsti.baseobjs.smartcache.digest`.
+
+        Because the circuits of a circuit list cannot change, their digest is computed
+        only once and memoized.  The (mutable) aliases, rules and weights are cheaply
+        digested each time this method is called.
+
+        Returns
+        -------
+        bytes
+        """
+        if self.__dict__.get('_pygsti_structure_digest', None) is None:
+            self._pygsti_structure_digest = self._structure_digest()
+        md5 = _hashlib.md5(str(type(self)).encode('utf-8'))
+        md5.update(self._pygsti_structure_digest)
+        md5.update(_digest((self.op_label_aliases, self.circuit_rules, self.circuit_weights), persistent=True))
+        return md5.digest()
+
     def elementvec_to_array(self, elementvec, layout, mergeop="sum"):
         """
         Form an array of values corresponding to this CircuitList from an element vector.
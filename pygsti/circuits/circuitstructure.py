@@ -12,10 +12,13 @@ Defines the CircuitStructure class and supporting functionality.
 
 import collections as _collections
 import copy as _copy
+import hashlib as _hashlib
+import json as _json
 
 import numpy as _np
 
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
+from pygsti.baseobjs.smartcache import digest as _digest
 from pygsti.circuits.circuit import Circuit as _Circuit
 from pygsti.circuits.circuitlist import CircuitList as _CircuitList
 from pygsti.circuits.circuitconstruction import manipulate_circuit as _manipulate_circuit
@@ -684,6 +687,15 @@ class PlaquetteGridCircuitStructure(_CircuitList):
             _np.array([circuit_weights_dict.get(c, 0.0) for c in circuits], 'd')
         super().__init__(circuits, op_label_aliases, circuit_rules, circuit_weights, name)
 
+    def _structure_digest(self):
+        md5 = _hashlib.md5(super()._structure_digest())
+        md5.update(_digest((self.xs, self.ys, self.xlabel, self.ylabel, self._addl_location,
+                            [c.str for c in self._additional_circuits]), persistent=True))
+        for (x, y), plaq in self._plaquettes.items():
+            md5.update(_digest((x, y), persistent=True))
+            md5.update(_json.dumps(plaq.to_nice_serialization(), sort_keys=True).encode('utf-8'))
+        return md5.digest()
+
     def _to_nice_serialization(self):  # memo holds already serialized objects
         from pygsti.io.writers import convert_circuits_to_strings as _convert_circuits_to_strings
 
@@ -14,7 +14,6 @@ import copy as _copy
 
 import numpy as _np
 import scipy as _scipy
-from scipy import stats as _stats
 
 from pygsti.data.hypothesistest import HypothesisTest as _HypothesisTest
 from pygsti.data.multidataset import MultiDataSet as _MultiDataSet
@@ -130,6 +129,7 @@ def _pval(llrval, dof):
         the chi^2_k distribution. The validity of this approximation
         is due to Wilks' theorem.
     """
+    from scipy import stats as _stats  # (slow to import, so only import when needed)
     return 1 - _stats.chi2.cdf(llrval, dof)
 
 
@@ -13,6 +13,7 @@ Defines the DataSet class and supporting classes and functions
 import bisect as _bisect
 from collections.abc import Iterable as _Iterable
 import copy as _copy
+import hashlib as _hashlib
 import itertools as _itertools
 import numbers as _numbers
 import pickle as _pickle
@@ -26,8 +27,10 @@ import numpy as _np
 from pygsti.circuits import circuit as _cir
 from pygsti.baseobjs import outcomelabeldict as _ld, _compatibility as _compat
 from pygsti.baseobjs.mongoserializable import MongoSerializable as _MongoSerializable
+from pygsti.baseobjs import smartcache as _smartcache
 from pygsti.tools import NamedDict as _NamedDict
 from pygsti.tools import listtools as _lt
+from pygsti.tools import slicetools as _slct
 from pygsti.tools.legacytools import deprecate as _deprecated_fn
 
 # import scipy.special as _sps
@@ -481,6 +484,7 @@ class _DataSetRow(object):
                                    % str(index_or_outcome_label))
 
     def __setitem__(self, index_or_outcome_label, val):
+        self.dataset._invalidate_digest()
         if isinstance(index_or_outcome_label, _numbers.Integral):
             index = index_or_outcome_label; tup = val
             assert(len(tup) in (2, 3)), "Must set to a (<outcomeLabel>,<time>[,<repetitions>]) value"
@@ -574,7 +578,7 @@ class _DataSetRow(object):
                         cntDict.setitem_unsafe(ol, cnt)
             else:
                 for ol, i in self.dataset.olIndex.items():
-                    inds = oli_tslc[oli_tslc == i]
+                    inds = _np.nonzero(oli_tslc == i)[0]
                     if len(inds) > 0 or all_outcomes:
                         cntDict.setitem_unsafe(ol, float(sum(self.reps[tslc][inds])))
         else:
@@ -738,6 +742,7 @@ class _DataSetRow(object):
             raise ValueError(("Cannot scale a DataSet without repetition "
                               "counts. Call DataSet._add_explicit_repetition_counts()"
                               " and try this again."))
+        self.dataset._invalidate_digest()
         for i, cnt in enumerate(self.reps):
             self.reps[i] = cnt * factor
 
@@ -1141,6 +1146,48 @@ class DataSet(_MongoSerializable):
         else:
             raise TypeError('Use digest hash')
 
+    def _invalidate_digest(self):
+        """ Clear the memoized value of :meth:`__pygsti_digest__` (call whenever data is modified) """
+        self._pygsti_digest = None
+
+    def __pygsti_digest__(self):
+        """
+        An MD5 digest of this data set's contents, used by :func:`pygsti.baseobjs.smartcache.digest`.
+
+        The digest is computed from the circuits, outcome labels, data arrays, auxiliary
+        information and comment of this data set, and is memoized until the data set is
+        modified (e.g. by :meth:`add_count_dict`), so that digesting a large data set is
+        usually O(1).
+
+        Returns
+        -------
+        bytes
+        """
+        if getattr(self, '_pygsti_digest', None) is not None:
+            return self._pygsti_digest
+
+        def index_key(i):
+            return (i.start, i.stop) if isinstance(i, slice) else i
+
+        md5 = _hashlib.md5()
+        md5.update(str(type(self)).encode('utf-8'))
+        md5.update(b'static' if self.bStatic else b'nonstatic')
+        md5.update('\n'.join([c.str for c in self.cirIndex.keys()]).encode('utf-8'))
+        md5.update(_smartcache.digest([index_key(i) for i in self.cirIndex.values()], persistent=True))
+        md5.update(_smartcache.digest(list(self.olIndex.items()), persistent=True))
+        for data in (self.oliData, self.timeData, self.repData):
+            if data is None:
+                md5.update(b'(_NONE_)')
+            elif isinstance(data, _np.ndarray):
+                md5.update(_smartcache.ndarray_digest(data))
+            else:  # a list of per-circuit arrays (non-static case)
+                for ar in data: md5.update(_smartcache.ndarray_digest(_np.asarray(ar)))
+        aux_items = [(c.str if isinstance(c, _cir.Circuit) else str(c), aux) for c, aux in self.auxInfo.items()]
+        md5.update(_smartcache.digest(sorted(aux_items, key=lambda x: x[0]), persistent=True))
+        md5.update(_smartcache.digest(self.comment, persistent=True))
+        self._pygsti_digest = md5.digest()
+        return self._pygsti_digest
+
     def __getitem__(self, circuit):
         return self._get_row(circuit)
 
@@ -1387,6 +1434,81 @@ class DataSet(_MongoSerializable):
             nDOF += nOutcomes - 1  # last time stamp
         return nDOF
 
+    def fill_counts_and_totals(self, counts_array, totals_array, circuits, elindices_and_outcomes):
+        """
+        Fills arrays with the counts and total counts of outcomes of many circuits at once.
+
+        This is equivalent to setting, for each circuit, `counts_array[element_indices]`
+        to the counts of `outcomes` (0 for outcomes that aren't present) and
+        `totals_array[element_indices]` to the circuit's total count, but works directly
+        with the underlying arrays of this (static) data set rather than creating a count
+        dictionary for each row, which makes it much faster for large numbers of elements.
+
+        Parameters
+        ----------
+        counts_array : numpy.ndarray
+            The 1D array to fill with counts.
+
+        totals_array : numpy.ndarray
+            The 1D array to fill with total counts.
+
+        circuits : list of Circuits
+            The circuits (keys of this data set) whose counts are extracted.
+
+        elindices_and_outcomes : list
+            A list of `(element_indices, outcomes)` tuples, one per circuit in `circuits`,
+            where `element_indices` is a slice or integer array of indices into `counts_array`
+            and `totals_array`, and `outcomes` is a parallel tuple of outcome labels.  This is
+            the format returned by a layout's `indices_and_outcomes_for_index` method.
+
+        Returns
+        -------
+        None
+        """
+        if not self.bStatic: raise ValueError("Can only bulk-extract counts from a *static* DataSet.")
+        if len(circuits) == 0: return
+
+        # Gather the data of `circuits` from the underlying (concatenated) arrays
+        row_slices = [self.cirIndex[circuit] for circuit in circuits]
+        row_starts = _np.array([slc.start for slc in row_slices], _np.int64)
+        row_lengths = _np.array([slc.stop - slc.start for slc in row_slices], _np.int64)
+        rows = _np.repeat(_np.arange(len(circuits), dtype=_np.int64), row_lengths)
+        row_offsets = _np.cumsum(row_lengths) - row_lengths  # offsets of each row within the gathered data
+        gather = _np.arange(len(rows), dtype=_np.int64) + _np.repeat(row_starts - row_offsets, row_lengths)
+        reps = self.repData[gather] if (self.repData is not None) else _np.ones(len(gather), 'd')
+        row_totals = _np.bincount(rows, weights=reps, minlength=len(circuits))
+
+        # Sum the repetitions of each distinct (row, outcome index) pair, identified by a single integer key
+        nOutcomes = self.olIndex_max + 1
+        keys = rows * nOutcomes + self.oliData[gather]
+        order = _np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        is_first = _np.ones(len(sorted_keys), bool)
+        is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        unique_keys = sorted_keys[is_first]
+
+        # Get the (row, outcome index) key of each element - outcomes not in this data set get key = -1
+        elindices = []; eloli = []
+        oli_cache = {}  # outcome indices by outcomes tuple, as many circuits usually have the same outcomes
+        for indices, outcomes in elindices_and_outcomes:
+            oli = oli_cache.get(outcomes, None)
+            if oli is None:
+                oli = oli_cache[outcomes] = _np.array([self.olIndex.get(ol, -1) for ol in outcomes], _np.int64)
+            elindices.append(_slct.indices(indices) if isinstance(indices, slice) else indices)
+            eloli.append(oli)
+        elrows = _np.repeat(_np.arange(len(eloli), dtype=_np.int64), [len(oli) for oli in eloli])
+        elindices = _np.concatenate(elindices).astype(_np.int64)
+        eloli = _np.concatenate(eloli)
+        elkeys = _np.where(eloli >= 0, elrows * nOutcomes + eloli, -1)
+
+        totals_array[elindices] = row_totals[elrows]
+        if len(unique_keys) > 0:
+            key_counts = _np.add.reduceat(reps[order], _np.nonzero(is_first)[0])
+            pos = _np.minimum(_np.searchsorted(unique_keys, elkeys), len(unique_keys) - 1)
+            counts_array[elindices] = _np.where(unique_keys[pos] == elkeys, key_counts[pos], 0.0)
+        else:
+            counts_array[elindices] = 0.0
+
     def _collisionaction_update_circuit(self, circuit):
         if not isinstance(circuit, _cir.Circuit):
             circuit = _cir.Circuit(circuit)  # make sure we have a Circuit
@@ -1425,6 +1547,7 @@ class DataSet(_MongoSerializable):
         if self.repData is not None: return
         if self.bStatic:
             raise ValueError("Cannot build repetition counts in a static DataSet object")
+        self._invalidate_digest()
         self.repData = []
         for oliAr in self.oliData:
             self.repData.append(_np.ones(len(oliAr), self.repType))
@@ -1720,6 +1843,7 @@ class DataSet(_MongoSerializable):
                         overwrite_existing, record_zero_counts, aux):
         assert not self.bStatic, "Attempting to add arrays to a static DataSet. " + \
             "Consider using .copy_nonstatic() to get a mutable DataSet first."
+        self._invalidate_digest()
         
         if rep_array is None:
             if self.repData is not None:
@@ -1773,6 +1897,7 @@ class DataSet(_MongoSerializable):
         -------
         None
         """
+        self._invalidate_digest()
         self.ol = _OrderedDict([(i, sl) for (sl, i) in self.olIndex.items()])
 
     def add_series_data(self, circuit, count_dict_list, time_stamp_list,
@@ -2087,6 +2212,7 @@ class DataSet(_MongoSerializable):
         -------
         None
         """
+        self._invalidate_digest()
         self.auxInfo[circuit].clear()  # needed? (could just update?)
         self.auxInfo[circuit].update(aux)
 
@@ -2555,6 +2681,7 @@ class DataSet(_MongoSerializable):
         None
         """
         if self.bStatic: raise ValueError("Cannot process_circuits_inplace on a static DataSet object")
+        self._invalidate_digest()
 
         to_delete = []
         new_cirIndex = _OrderedDict()
@@ -2651,6 +2778,7 @@ class DataSet(_MongoSerializable):
     def _remove(self, gstr_indices):
         """ Removes the data in indices given by gstr_indices """
         if self.bStatic: raise ValueError("Cannot _remove on a static DataSet object")
+        self._invalidate_digest()
 
         #Removing elements from oli_data, time_data, and rep_data is easy since
         # these are just lists.  Hard part is adjusting cirIndex values: we
@@ -2747,6 +2875,7 @@ class DataSet(_MongoSerializable):
         None
         """
         if self.bStatic: return
+        self._invalidate_digest()
         #Convert normal dataset to static mode.
         #  olIndex stays the same
         #  cirIndex changes to hold slices into 1D arrays
@@ -2950,6 +3079,7 @@ class DataSet(_MongoSerializable):
         -------
         None
         """
+        self._invalidate_digest()
         bOpen = isinstance(file_or_filename, str)
         if bOpen:
             if file_or_filename.endswith(".gz"):
@@ -3040,6 +3170,7 @@ class DataSet(_MongoSerializable):
         -------
         None
         """
+        self._invalidate_digest()
         mapdict = {}
         for old, new in old_to_new_dict.items():
             if isinstance(old, str): old = (old,)
@@ -3099,6 +3230,7 @@ class DataSet(_MongoSerializable):
         -------
         None
         """
+        self._invalidate_digest()
         added = False
         iNext = self.olIndex_max
         for ol in outcome_labels:
@@ -3221,6 +3353,9 @@ class DataSet(_MongoSerializable):
             trivial_times = not with_times
 
         dataset_id = doc['_id']
+        write_ops.prefetch_existing_docs(datarow_collection_name,
+                                         [{'circuit': circuit.str, 'parent': dataset_id} for circuit in circuits],
+                                         mongodb)
 
         for i, circuit in enumerate(circuits):  # circuit should be a Circuit object here
             dataRow = self[circuit]
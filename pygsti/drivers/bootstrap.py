@@ -10,11 +10,17 @@ Functions for generating bootstrapped error bars
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import multiprocessing as _mp
+import os as _os
+
 import numpy as _np
 
 from pygsti.drivers import longsequence as _longseq
 from pygsti import algorithms as _alg
+from pygsti import baseobjs as _baseobjs
 from pygsti.data.dataset import DataSet as _DataSet
+from pygsti.tools import mptools as _mptools
+from pygsti.tools import sharedmemtools as _smt
 
 
 def create_bootstrap_dataset(input_data_set, generation_method, input_model=None,
@@ -110,7 +116,7 @@ def create_bootstrap_models(num_models, input_data_set, generation_method,
                             fiducial_prep, fiducial_measure, germs, max_lengths,
                             input_model=None, target_model=None, start_seed=0,
                             outcome_labels=None, lsgst_lists=None,
-                            return_data=False, verbosity=2):
+                            return_data=False, verbosity=2, num_processes=1):
     """
     Creates a series of "bootstrapped" Models.
 
@@ -181,6 +187,11 @@ def create_bootstrap_models(num_models, input_data_set, generation_method,
     verbosity : int
         Level of detail printed to stdout.
 
+    num_processes : int, optional
+        The number of processes used to run the (independent) replicas.  See
+        :func:`run_bootstrap_replicas`, which also allows streaming results to
+        disk and computing statistics without holding all the models in memory.
+
     Returns
     -------
     models : list
@@ -194,47 +205,334 @@ def create_bootstrap_models(num_models, input_data_set, generation_method,
         print("No max_lengths value specified; using [0,1,2,4,...,1024]")
         max_lengths = [0] + [2**k for k in range(10)]
 
+    ret = run_bootstrap_replicas(num_models, input_data_set, generation_method,
+                                 fiducial_prep, fiducial_measure, germs, max_lengths,
+                                 input_model, target_model, start_seed, outcome_labels, lsgst_lists,
+                                 num_processes=num_processes, return_data=return_data, verbosity=verbosity)
+    if not return_data:
+        return ret[0]
+    else:
+        return ret[0], ret[2]
+
+
+def run_bootstrap_replicas(num_models, input_data_set, generation_method,
+                           fiducial_prep, fiducial_measure, germs, max_lengths,
+                           input_model=None, target_model=None, start_seed=0,
+                           outcome_labels=None, lsgst_lists=None, num_processes=1,
+                           output_dir=None, keep_models=True, return_data=False,
+                           comm=None, verbosity=2):
+    """
+    Runs bootstrap replicas, each generating a data set and fitting a model to it, in parallel.
+
+    Each replica runs :func:`create_bootstrap_dataset` (with seed `start_seed + i`
+    for the i-th replica) followed by long-sequence GST, independently of the
+    others, so replicas can be distributed over a pool of processes and/or the
+    processors of an MPI communicator.  As replicas finish, their results are
+    (optionally) written to `output_dir` and folded into a
+    :class:`BootstrapStatistics` object, so that when `keep_models=False` the
+    memory required doesn't grow with the number of replicas.
+
+    Parameters
+    ----------
+    num_models : int
+        The number of replicas (models) to create.
+
+    input_data_set : DataSet
+        The data set to use for generating the "bootstrapped" data sets.
+
+    generation_method : { 'nonparametric', 'parametric' }
+        The type of data to generate.  See :func:`create_bootstrap_models`.
+
+    fiducial_prep : list of Circuits
+        The state preparation fiducial circuits used by MLGST.
+
+    fiducial_measure : list of Circuits
+        The measurement fiducial circuits used by MLGST.
+
+    germs : list of Circuits
+        The germ circuits used by MLGST.
+
+    max_lengths : list of ints
+        List of integers, one per MLGST iteration, which set truncation lengths
+        for repeated germ strings.
+
+    input_model : Model, optional
+        The model used to compute the probabilities for circuits when
+        generation_method is set to 'parametric'.
+
+    target_model : Model, optional
+        The target model for MLGST.  Defaults to `input_model` when
+        generation_method is set to 'parametric'.
+
+    start_seed : int, optional
+        The seed used for the first replica's data set.  The i-th replica uses
+        `start_seed + i`, so results don't depend on how replicas are distributed.
+
+    outcome_labels : list, optional
+        The list of Outcome labels to include in the generated data sets.
+
+    lsgst_lists : list of circuit lists, optional
+        Provides explicit list of circuit lists to be used in analysis.
+
+    num_processes : int, optional
+        The number of processes (per MPI processor, if `comm` is given) used
+        to run replicas.
+
+    output_dir : str, optional
+        A directory to which each replica's model (and, if `return_data` is True,
+        its data set) is written as soon as the replica finishes, as
+        `bootstrap_model_<i>.json` (and `bootstrap_data_<i>.bin`).
+
+    keep_models : bool, optional
+        Whether to hold (and return) all the replica models in memory.  Set this
+        to `False` for large numbers of replicas, and use the returned statistics
+        and/or the files in `output_dir`.
+
+    return_data : bool, optional
+        Whether generated data sets should be returned (when `keep_models=True`)
+        and written to `output_dir`.
+
+    comm : mpi4py.MPI.Comm, optional
+        When not None, an MPI communicator used to divide the replicas among
+        processors.  All processors receive the same (combined) results.
+
+    verbosity : int, optional
+        Level of detail printed to stdout.
+
+    Returns
+    -------
+    models : list or None
+        The replica models, ordered by replica index, or `None` if `keep_models=False`.
+    statistics : BootstrapStatistics
+        Statistics of the parameter vectors of all the replica models.
+    data : list or None
+        The generated data sets, ordered by replica index, when `return_data`
+        and `keep_models` are True, and otherwise `None`.
+    """
     if (input_model is None and target_model is None):
         raise ValueError("Must supply either input_model or target_model!")
-    #if (input_model is not None and target_model is not None):
-    #    raise ValueError("Cannot supply both input_model and target_model!")
 
     if generation_method == 'parametric' and target_model is None:
         target_model = input_model
 
-    datasetList = []
-    print("Creating DataSets: ")
-    for run in range(num_models):
-        print("%d " % run, end='')
-        datasetList.append(
-            create_bootstrap_dataset(input_data_set, generation_method,
-                                     input_model, start_seed + run,
-                                     outcome_labels)
-        )
-
-    modelList = []
-    print("Creating Models: ")
-    for run in range(num_models):
-        print("Running MLGST Iteration %d " % run)
-        if lsgst_lists is not None:
-            results = _longseq.run_long_sequence_gst_base(
-                datasetList[run], target_model, lsgst_lists, verbosity=verbosity)
-        else:
-            results = _longseq.run_long_sequence_gst(
-                datasetList[run], target_model,
-                fiducial_prep, fiducial_measure, germs, max_lengths,
-                verbosity=verbosity)
-        modelList.append(results.estimates.get('default', next(iter(results.estimates.values()))).models['go0'])
+    printer = _baseobjs.VerbosityPrinter.create_printer(verbosity, comm)
+    if output_dir is not None:
+        _os.makedirs(output_dir, exist_ok=True)
+
+    replica_args = {'input_data_set': input_data_set, 'generation_method': generation_method,
+                    'input_model': input_model, 'target_model': target_model, 'outcome_labels': outcome_labels,
+                    'fiducial_prep': fiducial_prep, 'fiducial_measure': fiducial_measure, 'germs': germs,
+                    'max_lengths': max_lengths, 'lsgst_lists': lsgst_lists, 'output_dir': output_dir,
+                    'keep_models': keep_models, 'return_data': return_data, 'verbosity': verbosity}
+
+    runs = list(range(num_models))
+    if comm is not None:
+        runs = runs[comm.Get_rank()::comm.Get_size()]
+
+    statistics = BootstrapStatistics()
+    models = {}; datasets = {}
+
+    def collect(results):
+        for run, paramvec, mdl, ds in results:  # results stream in as replicas finish
+            printer.log("Bootstrap replica %d finished" % run, 1)
+            statistics.add(paramvec)
+            if keep_models:
+                models[run] = mdl
+                if return_data: datasets[run] = ds
+
+    if num_processes == 1:
+        collect(_run_bootstrap_replica(run, start_seed + run, **replica_args) for run in runs)
+    else:
+        # the (large) data set and models are put in shared memory once rather than copied to each (non-forked) worker
+        replica_args_handle, shm = _smt.broadcast_object(replica_args, skip_if_forking=True)
+        try:
+            with _mp.Pool(num_processes, initializer=_init_bootstrap_worker, initargs=(replica_args_handle,)) as pool:
+                collect(pool.imap_unordered(_run_bootstrap_replica_in_worker,
+                                            [(run, start_seed + run) for run in runs]))
+        finally:
+            _smt.cleanup_shared_ndarray(shm)
 
-    if not return_data:
-        return modelList
+    if comm is not None:
+        statistics = BootstrapStatistics.combine(comm.allgather(statistics))
+        if keep_models:
+            for rank_models, rank_datasets in comm.allgather((models, datasets)):
+                models.update(rank_models)
+                datasets.update(rank_datasets)
+
+    models = [models[run] for run in sorted(models)] if keep_models else None
+    datasets = [datasets[run] for run in sorted(datasets)] if (keep_models and return_data) else None
+    return models, statistics, datasets
+
+
+_BOOTSTRAP_WORKER_ARGS = None  # set in worker processes (so shared arguments are only sent once per process)
+
+
+def _init_bootstrap_worker(replica_args_handle):
+    global _BOOTSTRAP_WORKER_ARGS
+    _BOOTSTRAP_WORKER_ARGS = replica_args_handle.get()
+
+
+def _run_bootstrap_replica_in_worker(run_and_seed):
+    run, seed = run_and_seed
+    return _run_bootstrap_replica(run, seed, **_BOOTSTRAP_WORKER_ARGS)
+
+
+def _run_bootstrap_replica(run, seed, input_data_set, generation_method, input_model, target_model, outcome_labels,
+                           fiducial_prep, fiducial_measure, germs, max_lengths, lsgst_lists, output_dir,
+                           keep_models, return_data, verbosity):
+    """
+    Runs a single bootstrap replica: data generation followed by GST.
+
+    Returns a `(run, paramvec, model, dataset)` tuple, where `model` and `dataset` are
+    `None` unless they're to be kept (to avoid sending them between processes).
+    """
+    ds = create_bootstrap_dataset(input_data_set, generation_method, input_model, seed, outcome_labels)
+    if lsgst_lists is not None:
+        results = _longseq.run_long_sequence_gst_base(
+            ds, target_model, lsgst_lists, verbosity=verbosity, disable_checkpointing=True)
     else:
-        return modelList, datasetList
+        results = _longseq.run_long_sequence_gst(
+            ds, target_model, fiducial_prep, fiducial_measure, germs, max_lengths,
+            verbosity=verbosity, disable_checkpointing=True)
+    mdl = results.estimates.get('default', next(iter(results.estimates.values()))).models['go0']
+
+    if output_dir is not None:
+        mdl.write(_os.path.join(output_dir, 'bootstrap_model_%d.json' % run))
+        if return_data:
+            ds.write_binary(_os.path.join(output_dir, 'bootstrap_data_%d.bin' % run))
+
+    return (run, mdl.to_vector().copy(), mdl if keep_models else None,
+            ds if (keep_models and return_data) else None)
+
+
+class BootstrapStatistics(object):
+    """
+    Incrementally-computed statistics of the parameter vectors of bootstrapped models.
+
+    Vectors are added one at a time (using Welford's algorithm), so the mean and
+    standard deviation of many replicas can be computed without holding all of
+    them in memory.  Statistics computed separately (e.g. on different
+    processors) can be combined using :meth:`combine`.
+
+    Attributes
+    ----------
+    count : int
+        The number of vectors added.
+
+    mean : numpy.ndarray
+        The element-wise mean of the vectors added (`None` when `count == 0`).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = None
+        self._m2 = None  # sum of squared differences from the mean
+
+    def add(self, vec):
+        """
+        Add a parameter vector (or model) to these statistics.
+
+        Parameters
+        ----------
+        vec : numpy.ndarray or Model
+            A parameter vector, or a model whose parameter vector is added.
+
+        Returns
+        -------
+        None
+        """
+        vec = _np.array(vec.to_vector() if hasattr(vec, 'to_vector') else vec, 'd')
+        if self.count == 0:
+            self.mean = _np.zeros(len(vec), 'd')
+            self._m2 = _np.zeros(len(vec), 'd')
+        self.count += 1
+        delta = vec - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (vec - self.mean)
+
+    @classmethod
+    def combine(cls, statistics_list):
+        """
+        Combine the statistics of disjoint sets of vectors.
+
+        Parameters
+        ----------
+        statistics_list : list
+            A list of :class:`BootstrapStatistics` objects.
+
+        Returns
+        -------
+        BootstrapStatistics
+        """
+        ret = cls()
+        for stats in statistics_list:
+            if stats.count == 0: continue
+            if ret.count == 0:
+                ret.count, ret.mean, ret._m2 = stats.count, stats.mean.copy(), stats._m2.copy()
+                continue
+            n = ret.count + stats.count
+            delta = stats.mean - ret.mean
+            ret._m2 = ret._m2 + stats._m2 + delta**2 * ret.count * stats.count / n
+            ret.mean = ret.mean + delta * stats.count / n
+            ret.count = n
+        return ret
+
+    def std(self, ddof=1):
+        """
+        The element-wise standard deviation of the vectors added.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            As in numpy.std
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return _np.sqrt(self._m2 / (self.count - ddof))
+
+    def mean_model(self, target_model):
+        """
+        The model whose parameter vector is the mean of the vectors added.
+
+        Parameters
+        ----------
+        target_model : Model
+            A template model used to specify the parameterization of the returned model.
+
+        Returns
+        -------
+        Model
+        """
+        output_mdl = target_model.copy()
+        output_mdl.from_vector(self.mean)
+        return output_mdl
+
+    def std_model(self, target_model, ddof=1):
+        """
+        The model whose parameter vector is the standard deviation of the vectors added.
+
+        Parameters
+        ----------
+        target_model : Model
+            A template model used to specify the parameterization of the returned model.
+
+        ddof : int, optional
+            As in numpy.std
+
+        Returns
+        -------
+        Model
+        """
+        output_mdl = target_model.copy()
+        output_mdl.from_vector(self.std(ddof))
+        return output_mdl
 
 
 def gauge_optimize_models(gs_list, target_model,
                           gate_metric='frobenius', spam_metric='frobenius',
-                          plot=True):
+                          plot=True, num_processes=1):
     """
     Optimizes the "spam weight" parameter used when gauge optimizing a set of models.
 
@@ -263,6 +561,9 @@ def gauge_optimize_models(gs_list, target_model,
         Whether to create a plot of the model-target discrepancy
         as a function of spam weight (figure displayed interactively).
 
+    num_processes : int, optional
+        The number of processes used to gauge optimize the models.
+
     Returns
     -------
     list
@@ -281,13 +582,8 @@ def gauge_optimize_models(gs_list, target_model,
     gateMean = []
     for spWind, spW in enumerate(_np.logspace(-4, 0, 13)):  # try spam weights
         print("Spam weight %s" % spWind)
-        listOfBootStrapEstsNoOptG0toTargetVarSpam = []
-        for mdl in listOfBootStrapEstsNoOpt:
-            listOfBootStrapEstsNoOptG0toTargetVarSpam.append(
-                _alg.gaugeopt_to_target(mdl, target_model,
-                                        item_weights={'spam': spW},
-                                        gates_metric=gate_metric,
-                                        spam_metric=spam_metric))
+        listOfBootStrapEstsNoOptG0toTargetVarSpam = _gaugeopt_models(
+            listOfBootStrapEstsNoOpt, target_model, spW, gate_metric, spam_metric, num_processes)
 
         ModelGOtoTargetVarSpamVecArray = _np.zeros([numResamples],
                                                    dtype='object')
@@ -331,17 +627,20 @@ def gauge_optimize_models(gs_list, target_model,
         _np.array(SPAMMean) * _np.array(gateMean))]
     print("Best SPAM weight is %s" % bestSPAMWeight)
 
-    listOfBootStrapEstsG0toTargetSmallSpam = []
-    for mdl in listOfBootStrapEstsNoOpt:
-        listOfBootStrapEstsG0toTargetSmallSpam.append(
-            _alg.gaugeopt_to_target(mdl, target_model,
-                                    item_weights={'spam': bestSPAMWeight},
-                                    gates_metric=gate_metric,
-                                    spam_metric=spam_metric))
+    listOfBootStrapEstsG0toTargetSmallSpam = _gaugeopt_models(
+        listOfBootStrapEstsNoOpt, target_model, bestSPAMWeight, gate_metric, spam_metric, num_processes)
 
     return listOfBootStrapEstsG0toTargetSmallSpam
 
 
+def _gaugeopt_models(models, target_model, spam_weight, gate_metric, spam_metric, num_processes):
+    """ Gauge optimize each of `models` to `target_model`, using `num_processes` processes """
+    kwargs = {'item_weights': {'spam': spam_weight}, 'gates_metric': gate_metric, 'spam_metric': spam_metric}
+    return _mptools.starmap_with_kwargs(_alg.gaugeopt_to_target, len(models), num_processes,
+                                        [(mdl, target_model) for mdl in models], [kwargs] * len(models),
+                                        broadcast=True)  # target_model is sent to the workers only once
+
+
 ################################################################################
 # Utility functions (perhaps relocate?)
 ################################################################################
@@ -411,8 +710,9 @@ def _to_mean_model(gs_list, target_gs):
 
     Parameters
     ----------
-    gs_list : list
-        A list of :class:`Model` objects.
+    gs_list : list or BootstrapStatistics
+        A list (or other iterable) of :class:`Model` objects, or the
+        already-accumulated statistics of such models.
 
     target_gs : Model
         A template model used to specify the parameterization
@@ -422,13 +722,12 @@ def _to_mean_model(gs_list, target_gs):
     -------
     Model
     """
-    numResamples = len(gs_list)
-    gsVecArray = _np.zeros([numResamples], dtype='object')
-    for i in range(numResamples):
-        gsVecArray[i] = gs_list[i].to_vector()
-    output_gs = target_gs.copy()
-    output_gs.from_vector(_np.mean(gsVecArray))
-    return output_gs
+    if isinstance(gs_list, BootstrapStatistics):
+        return gs_list.mean_model(target_gs)
+    statistics = BootstrapStatistics()
+    for mdl in gs_list:  # incremental, so `gs_list` can be any iterable (e.g. a generator)
+        statistics.add(mdl)
+    return statistics.mean_model(target_gs)
 
 
 def _to_std_model(gs_list, target_gs, ddof=1):
@@ -441,8 +740,9 @@ def _to_std_model(gs_list, target_gs, ddof=1):
 
     Parameters
     ----------
-    gs_list : list
-        A list of :class:`Model` objects.
+    gs_list : list or BootstrapStatistics
+        A list (or other iterable) of :class:`Model` objects, or the
+        already-accumulated statistics of such models.
 
     target_gs : Model
         A template model used to specify the parameterization
@@ -455,13 +755,12 @@ def _to_std_model(gs_list, target_gs, ddof=1):
     -------
     Model
     """
-    numResamples = len(gs_list)
-    gsVecArray = _np.zeros([numResamples], dtype='object')
-    for i in range(numResamples):
-        gsVecArray[i] = gs_list[i].to_vector()
-    output_gs = target_gs.copy()
-    output_gs.from_vector(_np.std(gsVecArray, ddof=ddof))
-    return output_gs
+    if isinstance(gs_list, BootstrapStatistics):
+        return gs_list.std_model(target_gs, ddof)
+    statistics = BootstrapStatistics()
+    for mdl in gs_list:  # incremental, so `gs_list` can be any iterable (e.g. a generator)
+        statistics.add(mdl)
+    return statistics.std_model(target_gs, ddof)
 
 
 def _to_rms_model(gs_list, target_gs):
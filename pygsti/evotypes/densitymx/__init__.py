@@ -14,3 +14,4 @@ minimal_space = 'HilbertSchmidt'
 from .statereps import *
 from .opreps import *
 from .effectreps import *
+from ..densitymx_slow.povmreps import *  # pure-Python POVM reps, which only need dense superkets
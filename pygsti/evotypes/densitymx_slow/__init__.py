@@ -13,4 +13,5 @@ A pure python (and thus slower) density-matrix, evolution type.
 minimal_space = 'HilbertSchmidt'
 from .effectreps import *
 from .opreps import *
+from .povmreps import *
 from .statereps import *
@@ -0,0 +1,116 @@
+"""
+POVM representation classes for the `densitymx_slow` evolution type.
+"""
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import itertools as _itertools
+
+import numpy as _np
+
+from .. import basereps as _basereps
+
+
+class POVMRep(_basereps.POVMRep):
+    def __init__(self):
+        super(POVMRep, self).__init__()
+
+    def probabilities(self, state, rand_state, effect_labels):
+        raise NotImplementedError()
+
+    def sample_outcome(self, state, rand_state):
+        raise NotImplementedError()
+
+
+class TensorProductPOVMRep(POVMRep):
+    """
+    Computes the outcome probabilities of a tensor product of POVMs by contracting a (dense) superket with
+    each factor POVM in turn, rather than by computing each of the exponentially many product-effect
+    probabilities separately.  Marginal probabilities, over any subset of the characters of the outcome
+    labels, are computed in the same way by first summing the effects of each factor that are marginalized over.
+    """
+
+    def __init__(self, povm_factors, state_space):
+        self.povm_factors = povm_factors
+        self.factor_dims = tuple([povm.state_space.dim for povm in povm_factors])
+        self.factor_keys = tuple([tuple(povm.keys()) for povm in povm_factors])
+        self.factor_lbllens = tuple([len(fkeys[0]) for fkeys in self.factor_keys])
+        self.state_space = state_space
+        self.factor_effects_have_changed()
+        super(TensorProductPOVMRep, self).__init__()
+
+    def factor_effects_have_changed(self):
+        self._factor_effect_mxs = [_np.array([povm[elbl].to_dense('HilbertSchmidt') for elbl in fkeys])
+                                   for povm, fkeys in zip(self.povm_factors, self.factor_keys)]
+        self._marginal_factors = {}  # indices_to_keep => (factor matrices, outcome-label => flat-index dict)
+
+    def _marginalized_factors(self, indices_to_keep):
+        """
+        The per-factor effect matrices needed to compute the probabilities of the outcome labels made
+        up of the characters at `indices_to_keep` (in the given order), and a dict mapping these
+        marginalized outcome labels to indices of the flattened contraction result.
+        """
+        if indices_to_keep in self._marginal_factors:
+            return self._marginal_factors[indices_to_keep]
+
+        kept = sorted(indices_to_keep)  # character positions, in the order they appear in the factors
+        factor_mxs = []; factor_sublbls = []; off = 0
+        for fkeys, mx, lbllen in zip(self.factor_keys, self._factor_effect_mxs, self.factor_lbllens):
+            local_kept = [i - off for i in kept if off <= i < off + lbllen]
+            rows = {}  # kept characters of this factor's effect labels => summed effect
+            for elbl, row in zip(fkeys, mx):
+                sublbl = ''.join([elbl[i] for i in local_kept])
+                rows[sublbl] = rows[sublbl] + row if (sublbl in rows) else row
+            factor_sublbls.append(tuple(rows.keys()))
+            factor_mxs.append(_np.array(list(rows.values())))
+            off += lbllen
+
+        order = [kept.index(i) for i in indices_to_keep]  # positions of `indices_to_keep` within `kept`
+        lookup = {}
+        for flat_index, sublbls in enumerate(_itertools.product(*factor_sublbls)):
+            kept_chars = ''.join(sublbls)
+            lookup[''.join([kept_chars[j] for j in order])] = flat_index
+
+        self._marginal_factors[indices_to_keep] = (factor_mxs, lookup)
+        return factor_mxs, lookup
+
+    def _contract(self, state, factor_mxs):
+        probs = _np.reshape(state.to_dense('HilbertSchmidt'), self.factor_dims)
+        for mx in factor_mxs:
+            # contracts the first (remaining) factor of `probs` and adds its outcome axis to the end
+            probs = _np.tensordot(probs, mx, axes=(0, 1))
+        return probs.ravel()
+
+    def marginal_probabilities(self, state, indices_to_keep, effect_labels):
+        """
+        Compute the probabilities of marginalized outcomes, i.e. of the outcome labels formed from
+        the characters at `indices_to_keep` of this POVM's outcome labels.
+        """
+        factor_mxs, lookup = self._marginalized_factors(tuple(indices_to_keep))
+        probs = self._contract(state, factor_mxs)
+        return probs[[lookup[elbl] for elbl in effect_labels]]
+
+    def probabilities(self, state, rand_state, effect_labels):
+        return self.marginal_probabilities(state, range(sum(self.factor_lbllens)), effect_labels)
+
+    def sample_outcome(self, state, rand_state):
+        elbls = [''.join(k) for k in _itertools.product(*self.factor_keys)]
+        probs = self.probabilities(state, rand_state, elbls)
+        return elbls[min(_np.searchsorted(_np.cumsum(probs), rand_state.rand()), len(elbls) - 1)]
+
+
+class MarginalizedPOVMRep(POVMRep):
+    def __init__(self, povm_rep_to_marginalize, indices_to_keep, state_space):
+        self.povm_rep_to_marginalize = povm_rep_to_marginalize
+        self.indices_to_keep = tuple(indices_to_keep)
+        self.state_space = state_space
+        super(MarginalizedPOVMRep, self).__init__()
+
+    def probabilities(self, state, rand_state, effect_labels):
+        return self.povm_rep_to_marginalize.marginal_probabilities(state, self.indices_to_keep, effect_labels)
@@ -214,6 +214,12 @@ class Evotype(object):
     def create_computational_povm_rep(self, nqubits, qubit_filter):
         return self.module.ComputationalPOVMRep(nqubits, qubit_filter)
 
+    def create_tensorproduct_povm_rep(self, povm_factors, state_space):
+        return self.module.TensorProductPOVMRep(povm_factors, state_space)
+
+    def create_marginalized_povm_rep(self, povm_rep_to_marginalize, indices_to_keep, state_space):
+        return self.module.MarginalizedPOVMRep(povm_rep_to_marginalize, indices_to_keep, state_space)
+
     # TERM REPS
     def create_term_rep(self, coeff, mag, logmag, pre_state, post_state,
                         pre_effect, post_effect, pre_ops, post_ops):
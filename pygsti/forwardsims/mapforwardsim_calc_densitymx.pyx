@@ -12,7 +12,7 @@
 from libc.math cimport sqrt, log
 from libcpp.vector cimport vector
 from cython.operator cimport dereference as deref
-from ..evotypes.densitymx.statereps cimport StateRep, StateCRep
+from ..evotypes.densitymx.statereps cimport StateRep, StateRepDense, StateCRep
 from ..evotypes.densitymx.opreps cimport OpRep, OpCRep
 from ..evotypes.densitymx.effectreps cimport EffectRep, EffectCRep
 
@@ -139,9 +139,26 @@ cdef vector[StateCRep*] convert_rhoreps(rhoreps):
 cdef vector[EffectCRep*] convert_ereps(ereps):
     cdef vector[EffectCRep*] c_ereps = vector[EffectCRep_ptr](len(ereps))
     for i in range(len(ereps)):
-        c_ereps[i] = (<EffectRep>ereps[i]).c_effect
+        if ereps[i] is not None:  # (otherwise the entry is left NULL)
+            c_ereps[i] = (<EffectRep>ereps[i]).c_effect
     return c_ereps
 
+def povm_probability_fns(fwdsim, layout_atom):
+    # Maps the indices of the circuits whose POVMs have reps, which compute all their outcome probabilities at once
+    # (e.g. by contracting with the factors of a tensor-product POVM), to (probabilities-function, effect-labels) pairs.
+    povmreps = {plbl: fwdsim.model._circuit_layer_operator(plbl, 'povm')._rep for plbl in layout_atom.povm_labels}
+    return {i: (povmreps[povm_lbl].probabilities, effect_labels)
+            for i, (povm_lbl, *effect_labels) in layout_atom.povm_and_elbls_by_expcircuit.items()
+            if povmreps[povm_lbl] is not None}
+
+def create_ereps(fwdsim, layout_atom, povm_probs):
+    # Only the circuits whose POVMs don't have reps need effect reps (and creating these can be expensive)
+    elbl_indices = set()
+    for i, indices in layout_atom.elbl_indices_by_expcircuit.items():
+        if i not in povm_probs: elbl_indices.update(indices)
+    return [fwdsim.model._circuit_layer_operator(elbl, 'povm')._rep if (j in elbl_indices) else None
+            for j, elbl in enumerate(layout_atom.full_effect_labels)]  # cache these in future
+
 # -----------------------------------------
 # Mapfill functions
 # -----------------------------------------
@@ -164,7 +181,8 @@ def mapfill_probs_atom(fwdsim, np.ndarray[double, mode="c", ndim=1] array_to_fil
     rhoreps = { i: fwdsim.model._circuit_layer_operator(rholbl, 'prep')._rep for rholbl,i in rho_lookup.items() }
     operation_lookup = { lbl:i for i,lbl in enumerate(layout_atom.op_labels) } # operation labels -> ints for faster lookup
     operationreps = { i:fwdsim.model._circuit_layer_operator(lbl, 'op')._rep for lbl,i in operation_lookup.items() }
-    ereps = [fwdsim.model._circuit_layer_operator(elbl, 'povm')._rep for elbl in layout_atom.full_effect_labels]  # cache these in future
+    povm_probs = povm_probability_fns(fwdsim, layout_atom)
+    ereps = create_ereps(fwdsim, layout_atom, povm_probs)
 
     # convert to C-mode:  evaltree, operation_lookup, operationreps
     cdef vector[vector[INT]] c_layout_atom = convert_maplayout(layout_atom.table.contents, operation_lookup, rho_lookup)
@@ -185,7 +203,8 @@ def mapfill_probs_atom(fwdsim, np.ndarray[double, mode="c", ndim=1] array_to_fil
         # Since array_fo_fill is assumed to be shared mem it would need to only update `array_to_fill` *if*
         # it were the host leader.
         dm_mapfill_probs(array_to_fill, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache,
-                         elabel_indices_per_circuit, final_indices_per_circuit, fwdsim.model.dim)
+                         elabel_indices_per_circuit, final_indices_per_circuit, fwdsim.model.dim,
+                         povm_probs, fwdsim.model.state_space)
 
     free_rhocache(rho_cache)  #delete cache entries
 
@@ -198,7 +217,7 @@ cdef dm_mapfill_probs(double[:] array_to_fill,
                       vector[StateCRep*]* prho_cache,
                       vector[vector[INT]] elabel_indices_per_circuit,
                       vector[vector[INT]] final_indices_per_circuit,
-                      INT dim):
+                      INT dim, dict povm_probs, state_space):
 
     #Note: we need to take in rho_cache as a pointer b/c we may alter the values its
     # elements point to (instead of copying the states) - we just guarantee that in the end
@@ -217,6 +236,9 @@ cdef dm_mapfill_probs(double[:] array_to_fill,
     cdef vector[INT] final_indices
     cdef vector[INT] elabel_indices
 
+    # a state rep holding (a copy of) the final state of circuits whose probabilities are computed by POVM reps
+    cdef StateRepDense povm_state = StateRepDense(np.zeros(dim, 'd'), state_space, None) if povm_probs else None
+
     #Invariants required for proper memory management:
     # - upon loop entry, prop2 is allocated and prop1 is not (it doesn't "own" any memory)
     # - all rho_cache entries have been allocated via "new"
@@ -266,12 +288,19 @@ cdef dm_mapfill_probs(double[:] array_to_fill,
         elabel_indices = elabel_indices_per_circuit[i]
         #print("Op actons done - computing %d probs" % elabel_indices.size());t1 = pytime.time() # DEBUG
 
-        precomp_state = prop2  # used as cache/scratch space
-        precomp_id = 0  # this should be a number that is *never* a Python id()
-        for j in range(<INT>elabel_indices.size()):
-            #print("Erep prob %d of %d: elapsed = %.2fs" % (j, elabel_indices.size(), pytime.time() - t1))
-            #OLD: array_to_fill[ final_indices[j] ] = c_ereps[elabel_indices[j]].probability(final_state) #outcome probability
-            array_to_fill[ final_indices[j] ] = c_ereps[elabel_indices[j]].probability_using_cache(final_state, precomp_state, precomp_id) #outcome probability
+        if povm_probs and i in povm_probs:
+            probabilities_fn, effect_labels = povm_probs[i]
+            povm_state.data[:] = <double[:dim]> final_state._dataptr
+            probs = probabilities_fn(povm_state, None, effect_labels)
+            for j in range(<INT>final_indices.size()):
+                array_to_fill[ final_indices[j] ] = probs[j]
+        else:
+            precomp_state = prop2  # used as cache/scratch space
+            precomp_id = 0  # this should be a number that is *never* a Python id()
+            for j in range(<INT>elabel_indices.size()):
+                #print("Erep prob %d of %d: elapsed = %.2fs" % (j, elabel_indices.size(), pytime.time() - t1))
+                #OLD: array_to_fill[ final_indices[j] ] = c_ereps[elabel_indices[j]].probability(final_state) #outcome probability
+                array_to_fill[ final_indices[j] ] = c_ereps[elabel_indices[j]].probability_using_cache(final_state, precomp_state, precomp_id) #outcome probability
 
         if icache != -1:
             deref(prho_cache)[icache] = final_state # store this state in the cache
@@ -317,7 +346,8 @@ def mapfill_dprobs_atom(fwdsim,
     rhoreps = { i: fwdsim.model._circuit_layer_operator(rholbl, 'prep')._rep for rholbl,i in rho_lookup.items() }
     operation_lookup = { lbl:i for i,lbl in enumerate(layout_atom.op_labels) } # operation labels -> ints for faster lookup
     operationreps = { i:fwdsim.model._circuit_layer_operator(lbl, 'op')._rep for lbl,i in operation_lookup.items() }
-    ereps = [fwdsim.model._circuit_layer_operator(elbl, 'povm')._rep for elbl in layout_atom.full_effect_labels]  # cache these in future
+    povm_probs = povm_probability_fns(fwdsim, layout_atom)
+    ereps = create_ereps(fwdsim, layout_atom, povm_probs)
 
     # convert to C-mode:  evaltree, operation_lookup, operationreps
     cdef vector[vector[INT]] c_layout_atom = convert_maplayout(layout_atom.table.contents, operation_lookup, rho_lookup)
@@ -346,7 +376,7 @@ def mapfill_dprobs_atom(fwdsim,
 
     #if resource_alloc.comm_rank == 0:
     #    print("MAPFILL DPROBS ATOM 1"); t=pytime.time(); t0=pytime.time()
-    dm_mapfill_probs(probs_view, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache, elabel_indices_per_circuit, final_indices_per_circuit, model_dim)
+    dm_mapfill_probs(probs_view, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache, elabel_indices_per_circuit, final_indices_per_circuit, model_dim, povm_probs, fwdsim.model.state_space)
     #if resource_alloc.comm_rank == 0:
     #    print("MAPFILL DPROBS ATOM 2 %.3fs" % (pytime.time() - t)); t=pytime.time()
 
@@ -365,7 +395,7 @@ def mapfill_dprobs_atom(fwdsim,
         iFinal = dest_param_indices_view[0]
         fwdsim.model.set_parameter_value(first_param_idx, orig_vec_view[first_param_idx]+eps)
         if shared_mem_leader:  # don't fill assumed-shared array-to_fill on non-mem-leaders
-            dm_mapfill_probs(probs2_view, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache, elabel_indices_per_circuit, final_indices_per_circuit, model_dim)
+            dm_mapfill_probs(probs2_view, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache, elabel_indices_per_circuit, final_indices_per_circuit, model_dim, povm_probs, fwdsim.model.state_space)
             array_to_fill[dest_indices, iFinal] = (probs2 - probs) / eps
 
     for i in range(1, len(param_indices_view)):
@@ -374,7 +404,7 @@ def mapfill_dprobs_atom(fwdsim,
         fwdsim.model.set_parameter_values([param_indices_view[i-1], param_indices_view[i]], [orig_vec_view[param_indices_view[i-1]], orig_vec_view[param_indices_view[i]]+eps])
 
         if shared_mem_leader:  # don't fill assumed-shared array-to_fill on non-mem-leaders
-            dm_mapfill_probs(probs2_view, c_layout_atom, c_opreps, c_rhos, c_ereps,  &rho_cache, elabel_indices_per_circuit, final_indices_per_circuit, model_dim)
+            dm_mapfill_probs(probs2_view, c_layout_atom, c_opreps, c_rhos, c_ereps,  &rho_cache, elabel_indices_per_circuit, final_indices_per_circuit, model_dim, povm_probs, fwdsim.model.state_space)
             array_to_fill[dest_indices, iFinal] = (probs2 - probs) / eps
         
     #reset the final model parameter we changed to it's original value.
@@ -23,6 +23,17 @@ def propagate_staterep(staterep, operationreps):
     return ret
 
 
+def _effectreps_for_povms_without_reps(fwdsim, layout_atom, povmreps):
+    # Only the circuits whose POVMs don't have reps (which compute all the outcome probabilities at once)
+    # need effect reps, and creating effects can be expensive (e.g. for tensor-product or marginalized POVMs).
+    elbl_indices = set()
+    for iDest, (povm_lbl, *_) in layout_atom.povm_and_elbls_by_expcircuit.items():
+        if povmreps[povm_lbl] is None:
+            elbl_indices.update(layout_atom.elbl_indices_by_expcircuit[iDest])
+    return {i: fwdsim.model._circuit_layer_operator(Elbl, 'povm')._rep
+            for i, Elbl in enumerate(layout_atom.full_effect_labels) if i in elbl_indices}  # cache these in future
+
+
 def mapfill_probs_atom(fwdsim, mx_to_fill, dest_indices, layout_atom, resource_alloc):
 
     # The required ending condition is that array_to_fill on each processor has been filled.  But if
@@ -43,11 +54,7 @@ def mapfill_probs_atom(fwdsim, mx_to_fill, dest_indices, layout_atom, resource_a
     rhoreps = {rholbl: fwdsim.model._circuit_layer_operator(rholbl, 'prep')._rep for rholbl in layout_atom.rho_labels}
     operationreps = {gl: fwdsim.model._circuit_layer_operator(gl, 'op')._rep for gl in layout_atom.op_labels}
     povmreps = {plbl: fwdsim.model._circuit_layer_operator(plbl, 'povm')._rep for plbl in layout_atom.povm_labels}
-    if any([(povmrep is None) for povmrep in povmreps.values()]):
-        effectreps = {i: fwdsim.model._circuit_layer_operator(Elbl, 'povm')._rep
-                      for i, Elbl in enumerate(layout_atom.full_effect_labels)}  # cache these in future
-    else:
-        effectreps = None  # not needed, as we use povm reps directly
+    effectreps = _effectreps_for_povms_without_reps(fwdsim, layout_atom, povmreps)
 
     #TODO: if layout_atom is split, distribute somehow among processors(?) instead of punting for all but rank-0 above
     for iDest, iStart, remainder, iCache in layout_atom.table.contents:
@@ -65,9 +72,8 @@ def mapfill_probs_atom(fwdsim, mx_to_fill, dest_indices, layout_atom, resource_a
 
         final_indices = [dest_indices[j] for j in layout_atom.elindices_by_expcircuit[iDest]]
 
-        if effectreps is None:
-            povm_lbl, *effect_labels = layout_atom.povm_and_elbls_by_expcircuit[iDest]
-
+        povm_lbl, *effect_labels = layout_atom.povm_and_elbls_by_expcircuit[iDest]
+        if povmreps[povm_lbl] is not None:
             if shared_mem_leader:
                 mx_to_fill[final_indices] = povmreps[povm_lbl].probabilities(final_state, None, effect_labels)
         else:
@@ -99,11 +105,7 @@ def cond_update_probs_atom(fwdsim, mx_to_fill, dest_indices, layout_atom, param_
     rhoreps = {rholbl: fwdsim.model._circuit_layer_operator(rholbl, 'prep')._rep for rholbl in layout_atom.rho_labels}
     operationreps = {gl: fwdsim.model._circuit_layer_operator(gl, 'op')._rep for gl in layout_atom.op_labels}
     povmreps = {plbl: fwdsim.model._circuit_layer_operator(plbl, 'povm')._rep for plbl in layout_atom.povm_labels}
-    if any([(povmrep is None) for povmrep in povmreps.values()]):
-        effectreps = {i: fwdsim.model._circuit_layer_operator(Elbl, 'povm')._rep
-                      for i, Elbl in enumerate(layout_atom.full_effect_labels)}  # cache these in future
-    else:
-        effectreps = None  # not needed, as we use povm reps directly
+    effectreps = _effectreps_for_povms_without_reps(fwdsim, layout_atom, povmreps)
 
 
     #TODO: if layout_atom is split, distribute somehow among processors(?) instead of punting for all but rank-0 above
@@ -122,9 +124,8 @@ def cond_update_probs_atom(fwdsim, mx_to_fill, dest_indices, layout_atom, param_
 
         final_indices = [dest_indices[j] for j in layout_atom.elindices_by_expcircuit[iDest]]
 
-        if effectreps is None:
-            povm_lbl, *effect_labels = layout_atom.povm_and_elbls_by_expcircuit[iDest]
-
+        povm_lbl, *effect_labels = layout_atom.povm_and_elbls_by_expcircuit[iDest]
+        if povmreps[povm_lbl] is not None:
             if shared_mem_leader:
                 mx_to_fill[final_indices] = povmreps[povm_lbl].probabilities(final_state, None, effect_labels)
         else:
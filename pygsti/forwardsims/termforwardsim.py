@@ -17,7 +17,8 @@ import numpy as _np
 
 from pygsti.baseobjs.opcalc import compact_deriv as _compact_deriv, \
     bulk_eval_compact_polynomials as _bulk_eval_compact_polynomials, \
-    bulk_eval_compact_polynomials_derivs as _bulk_eval_compact_polynomials_derivs
+    bulk_eval_compact_polynomials_derivs as _bulk_eval_compact_polynomials_derivs, \
+    CompiledPolynomials as _CompiledPolynomials
 from pygsti.forwardsims.distforwardsim import DistributableForwardSimulator as _DistributableForwardSimulator
 from pygsti.layouts.termlayout import TermCOPALayout as _TermCOPALayout
 from pygsti.baseobjs.polynomial import Polynomial as _Polynomial
@@ -349,13 +350,10 @@ class TermForwardSimulator(_DistributableForwardSimulator):
             # using "if resource_alloc.is_host_leader" conditions (if we could use  multiple procs elsewhere).
             return
 
-        nEls = layout_atom.num_elements
         if self.mode == "direct":
             probs = self._prs_directly(layout_atom, resource_alloc)  # could make into a fill_routine? HERE
         else:  # "pruned" or "taylor order"
-            polys = layout_atom.merged_compact_polys
-            probs = _bulk_eval_compact_polynomials(
-                polys[0], polys[1], self.model.to_vector(), (nEls,))  # shape (nElements,) -- could make this a *fill*
+            probs = layout_atom.compiled_polys.evaluate(self.model.to_vector())  # shape (nElements,)
         _fas(array_to_fill, [slice(0, array_to_fill.shape[0])], probs)
 
     def _bulk_fill_dprobs_atom(self, array_to_fill, dest_param_slice, layout_atom, param_slice, resource_alloc):
@@ -369,15 +367,8 @@ class TermForwardSimulator(_DistributableForwardSimulator):
             dprobs = self._dprs_directly(layout_atom, param_slice, resource_alloc)
         else:  # "pruned" or "taylor order"
             # evaluate derivative of polys
-            nEls = layout_atom.num_elements
-            polys = layout_atom.merged_compact_polys
-            wrtInds = _np.ascontiguousarray(_slct.indices(param_slice), _np.int64)  # for Cython arg mapping
-            #OLD dpolys = _compact_deriv(polys[0], polys[1], wrtInds)
-            #OLD dprobs = _bulk_eval_compact_polynomials(dpolys[0], dpolys[1],
-            #OLD                                         self.model.to_vector(), (nEls, len(wrtInds)))
-            dprobs = _bulk_eval_compact_polynomials_derivs(polys[0], polys[1], wrtInds, self.model.to_vector(),
-                                                           (nEls, len(wrtInds)))
-            #assert(_np.allclose(dprobs, dprobs_chk))
+            wrtInds = _np.ascontiguousarray(_slct.indices(param_slice), _np.int64)
+            dprobs = layout_atom.compiled_polys.evaluate_derivs(self.model.to_vector(), wrtInds)
 
         _fas(array_to_fill, [slice(0, array_to_fill.shape[0]), dest_param_slice], dprobs)
 
@@ -477,7 +468,8 @@ class TermForwardSimulator(_DistributableForwardSimulator):
 
         return npaths, threshold, target_sopm, achieved_sopm
 
-    def _find_minimal_paths_set_atom(self, layout_atom, resource_alloc, exit_after_this_many_failures=0):
+    def _find_minimal_paths_set_atom(self, layout_atom, resource_alloc, exit_after_this_many_failures=0,
+                                     incremental=False):
         """
         Find the minimal (smallest) path set that achieves the desired accuracy conditions.
 
@@ -494,6 +486,12 @@ class TermForwardSimulator(_DistributableForwardSimulator):
            If > 0, give up after this many circuits fail to meet the desired accuracy criteria.
            This short-circuits doomed attempts to find a good path set so they don't take too long.
 
+        incremental : bool, optional
+            If True and `layout_atom` has a currently selected path set, only the circuits
+            whose sum-of-path-magnitudes gap (at the current parameter-space point) has grown
+            since their paths were selected are re-pruned.  The thresholds and polynomials
+            of all the other circuits are carried over to the returned path set.
+
         Returns
         -------
         TermPathSetAtom
@@ -509,20 +507,51 @@ class TermForwardSimulator(_DistributableForwardSimulator):
         circuitsetup_cache = {}
 
         thresholds = {}
+        circuit_stats = {}
         num_failed = 0  # number of circuits which fail to achieve the target sopm
         failed_circuits = []
         polynomial_vindices_per_int = _Polynomial._vindices_per_int(self.model.num_params)
 
+        pruning_settings = self._pruning_settings()
+        current_pathset = layout_atom.pathset
+        reuse = incremental and current_pathset is not None and current_pathset.thresholds is not None \
+            and current_pathset.pruning_settings == pruning_settings  # paths pruned differently can't be kept
+        if reuse:
+            # the achieved & max SOPMs of the *current* path set tell us which circuits' SOPM gaps have grown
+            current_achieved_sopm, current_max_sopm = self._cached_achieved_and_max_sopm_atom(layout_atom)
+        reused_polys = {}
+        k = 0  # current element position within current_*_sopm arrays
+
         for sep_povm_circuit in layout_atom.expanded_circuits:
             rholabel = sep_povm_circuit.circuit_without_povm[0]
             opstr = sep_povm_circuit.circuit_without_povm[1:]
             elabels = sep_povm_circuit.full_effect_labels
 
+            if reuse:
+                nEls = len(elabels); k += nEls
+                achieved_sopm = sum(current_achieved_sopm[k - nEls:k])
+                max_sopm = sum(current_max_sopm[k - nEls:k])
+                npaths, selected_gap = current_pathset.circuit_stats.get(sep_povm_circuit, (None, None))
+                if npaths is not None and max_sopm - achieved_sopm <= \
+                   selected_gap + nEls * 1e-3 * self.desired_pathmagnitude_gap:
+                    # SOPM gap hasn't grown since this circuit's threshold was found => keep its paths
+                    target_sopm = max_sopm - nEls * self.desired_pathmagnitude_gap
+                    thresholds[sep_povm_circuit] = current_pathset.thresholds[sep_povm_circuit]
+                    circuit_stats[sep_povm_circuit] = (npaths, selected_gap)
+                    reused_polys[sep_povm_circuit] = layout_atom.percircuit_p_polys[sep_povm_circuit][1]
+                    if achieved_sopm < target_sopm: num_failed += 1
+                    tot_npaths += npaths
+                    tot_target_sopm += target_sopm
+                    tot_achieved_sopm += achieved_sopm
+                    continue
+
             npaths, threshold, target_sopm, achieved_sopm = \
                 self._compute_pruned_pathmag_threshold(rholabel, elabels, opstr, polynomial_vindices_per_int,
                                                        repcache, circuitsetup_cache,
                                                        resource_alloc, None)  # add guess?
             thresholds[sep_povm_circuit] = threshold
+            circuit_stats[sep_povm_circuit] = (npaths, target_sopm + len(elabels) * self.desired_pathmagnitude_gap
+                                               - achieved_sopm)
 
             if achieved_sopm < target_sopm:
                 num_failed += 1
@@ -534,6 +563,14 @@ class TermForwardSimulator(_DistributableForwardSimulator):
             tot_target_sopm += target_sopm
             tot_achieved_sopm += achieved_sopm
 
+        if reuse:  # kept circuits use the (refreshed) term reps of the current path set that aren't in `repcache`
+            current_repcache = current_pathset.highmag_termrep_cache
+            for sep_povm_circuit in reused_polys:
+                circuit_without_povm = sep_povm_circuit.circuit_without_povm
+                for key in set(circuit_without_povm) | {tuple(sep_povm_circuit.full_effect_labels)}:
+                    if key not in repcache and key in current_repcache:
+                        repcache[key] = current_repcache[key]
+
         #if comm is None or comm.Get_rank() == 0:
         comm = resource_alloc.comm
         rank = resource_alloc.comm_rank
@@ -548,11 +585,14 @@ class TermForwardSimulator(_DistributableForwardSimulator):
                    nC, num_failed))
             print("%s  (avg per circuit paths=%d, magnitude=%.4g, target=%.4g)" %
                   (rankStr, tot_npaths // nC, tot_achieved_sopm / nC, tot_target_sopm / nC))
+            if reuse:
+                print("%s  (re-pruned %d of %d circuits)" % (rankStr, nC - len(reused_polys), nC))
 
-        return _AtomicTermPathSet(thresholds, repcache, circuitsetup_cache, tot_npaths, max_npaths, num_failed)
+        return _AtomicTermPathSet(thresholds, repcache, circuitsetup_cache, tot_npaths, max_npaths, num_failed,
+                                  circuit_stats, reused_polys, pruning_settings)
 
     # should assert(nFailures == 0) at end - this is to prep="lock in" probs & they should be good
-    def find_minimal_paths_set(self, layout, exit_after_this_many_failures=0):
+    def find_minimal_paths_set(self, layout, exit_after_this_many_failures=0, incremental=False):
         """
         Find a good, i.e. minimal, path set for the current model-parameter space point.
 
@@ -566,6 +606,13 @@ class TermForwardSimulator(_DistributableForwardSimulator):
            If > 0, give up after this many circuits fail to meet the desired accuracy criteria.
            This short-circuits doomed attempts to find a good path set so they don't take too long.
 
+        incremental : bool, optional
+            If True, start from the path set currently selected in `layout` and only re-prune
+            the circuits whose sum-of-path-magnitudes gap has grown since their paths were
+            selected.  This makes re-finding a path set after a parameter update much cheaper
+            when the update only affects some circuits, though the resulting path set need
+            not be minimal.
+
         Returns
         -------
         TermPathSet
@@ -575,7 +622,7 @@ class TermForwardSimulator(_DistributableForwardSimulator):
         for layout_atom in layout.atoms:
             if self.mode == "pruned":
                 pathset = self._find_minimal_paths_set_atom(layout_atom, atom_resource_alloc,
-                                                            exit_after_this_many_failures)
+                                                            exit_after_this_many_failures, incremental)
             else:
                 pathset = _AtomicTermPathSet(None, None, None, 0, 0, 0)
             local_atom_pathsets.append(pathset)
@@ -652,6 +699,44 @@ class TermForwardSimulator(_DistributableForwardSimulator):
         assert(len(achieved_sopm) == len(max_sopm) == layout_atom.num_elements)
         return _np.array(achieved_sopm, 'd'), _np.array(max_sopm, 'd')
 
+    def _pruning_settings(self):
+        """
+        The simulator settings that determine which paths are kept when pruning.
+
+        Returns
+        -------
+        tuple
+        """
+        return (self.max_order, self.desired_pathmagnitude_gap, self.min_term_mag, self.max_paths_per_outcome)
+
+    def _cached_achieved_and_max_sopm_atom(self, layout_atom):
+        """
+        Get the achieved and maximum sum-of-path-magnitudes for a layout atom at the current parameter-space point.
+
+        Term magnitudes are only refreshed, and sums-of-path-magnitudes only recomputed,
+        when the model's parameters, the pruning settings or the atom's circuits have
+        changed since the last time they were computed for the atom's current path set.
+
+        Parameters
+        ----------
+        layout_atom : _TermCOPALayoutAtom
+            The probability array layout specifying the circuits and outcomes.
+
+        Returns
+        -------
+        achieved_sopm : numpy.ndarray
+        max_sopm : numpy.ndarray
+        """
+        paramvec = self.model.to_vector()
+        cache_key = (self._pruning_settings(), tuple(layout_atom.expanded_circuits))
+        pathset = layout_atom.pathset
+        if pathset.sopm_cache is None or pathset.sopm_cache[1] != cache_key \
+           or not _np.array_equal(pathset.sopm_cache[0], paramvec):
+            self.calclib.refresh_magnitudes_in_repcache(pathset.highmag_termrep_cache, paramvec)
+            achieved, maxx = self._achieved_and_max_sopm_atom(layout_atom)
+            pathset.sopm_cache = (paramvec.copy(), cache_key, achieved, maxx)
+        return pathset.sopm_cache[2], pathset.sopm_cache[3]
+
     def _bulk_fill_achieved_and_max_sopm(self, achieved_sopm, max_sopm, layout):
         """
         Compute element arrays of achieved and maximum-possible sum-of-path-magnitudes.
@@ -682,10 +767,7 @@ class TermForwardSimulator(_DistributableForwardSimulator):
             # compute SOPM for layout_atom
             elInds = layout_atom.element_slice
             # MEM debug_prof.print_memory("_bulk_achieved_and_max_sop1", True)
-            self.calclib.refresh_magnitudes_in_repcache(layout_atom.pathset.highmag_termrep_cache,
-                                                        self.model.to_vector())
-            # MEM debug_prof.print_memory("_bulk_achieved_and_max_sop2", True)
-            achieved, maxx = self._achieved_and_max_sopm_atom(layout_atom)
+            achieved, maxx = self._cached_achieved_and_max_sopm_atom(layout_atom)  # refreshes magnitudes if needed
             # MEM debug_prof.print_memory("_bulk_achieved_and_max_sop3", True)
             _fas(max_sopm, [elInds], maxx)
             _fas(achieved_sopm, [elInds], achieved)
@@ -1067,11 +1149,13 @@ class TermForwardSimulator(_DistributableForwardSimulator):
             elabels = sep_povm_circuit.full_effect_labels
             threshold = thresholds[sep_povm_circuit]
 
-            raw_polyreps = self._prs_as_pruned_polynomial_reps(
-                threshold, rholabel, elabels, opstr, polynomial_vindices_per_int,
-                repcache, circuitsetup_cache, resource_alloc)
-
-            compact_polys = [polyrep.compact_complex() for polyrep in raw_polyreps]
+            if sep_povm_circuit in pathset.reused_polys:
+                compact_polys = pathset.reused_polys[sep_povm_circuit]
+            else:
+                raw_polyreps = self._prs_as_pruned_polynomial_reps(
+                    threshold, rholabel, elabels, opstr, polynomial_vindices_per_int,
+                    repcache, circuitsetup_cache, resource_alloc)
+                compact_polys = [polyrep.compact_complex() for polyrep in raw_polyreps]
             layout_atom.percircuit_p_polys[sep_povm_circuit] = (threshold, compact_polys)
             all_compact_polys.extend(compact_polys)  # ok b/c *linear* evaluation order
 
@@ -1079,6 +1163,8 @@ class TermForwardSimulator(_DistributableForwardSimulator):
         vtape = _np.concatenate([t[0] for t in tapes])  # concat all the vtapes
         ctape = _np.concatenate([t[1] for t in tapes])  # concat all teh ctapes
         layout_atom.merged_compact_polys = (vtape, ctape)  # Note: ctape should always be complex here
+        layout_atom.compiled_polys = _CompiledPolynomials(vtape, ctape, layout_atom.num_elements,
+                                                          [len(t[0]) for t in tapes])
         return
 
     def _prs_as_polynomials(self, rholabel, elabels, circuit, polynomial_vindices_per_int,
@@ -1209,6 +1295,8 @@ class TermForwardSimulator(_DistributableForwardSimulator):
         vtape = _np.concatenate([t[0] for t in tapes])  # concat all the vtapes
         ctape = _np.concatenate([t[1] for t in tapes])  # concat all teh ctapes
         layout_atom.merged_compact_polys = (vtape, ctape)  # Note: ctape should always be complex here
+        layout_atom.compiled_polys = _CompiledPolynomials(vtape, ctape, layout_atom.num_elements,
+                                                          [len(t[0]) for t in tapes])
 
     # should assert(nFailures == 0) at end - this is to prep="lock in" probs & they should be good
     def select_paths_set(self, layout, path_set):
@@ -1370,13 +1458,34 @@ class _AtomicTermPathSet(_TermPathSetBase):
     nfailed : int
         The number of circuits that failed to meet the desired accuracy
         (path-magnitude gap) requirements.
+
+    circuit_stats : dict, optional
+        A dictionary whose keys are circuits and values are `(npaths, sopm_gap)` tuples
+        giving the number of paths selected for that circuit and the resulting gap between
+        the maximum and achieved sum-of-path-magnitudes (both summed over its outcomes).
+
+    reused_polys : dict, optional
+        A dictionary whose keys are circuits and values are lists of the compact
+        polynomials that were computed for a previous path set and that remain valid
+        for this one, i.e. that do not need to be recomputed when this path set is
+        selected.
+
+    pruning_settings : tuple, optional
+        The forward simulator's path-pruning settings (see
+        :meth:`TermForwardSimulator._pruning_settings`) used to find `thresholds`.
+        Only path sets found with the same settings can be updated incrementally.
     """
     def __init__(self, thresholds, highmag_termrep_cache,
-                 circuitsetup_cache, npaths, maxpaths, nfailed):
+                 circuitsetup_cache, npaths, maxpaths, nfailed, circuit_stats=None, reused_polys=None,
+                 pruning_settings=None):
         super().__init__(npaths, maxpaths, nfailed)
         self.thresholds = thresholds
         self.highmag_termrep_cache = highmag_termrep_cache
         self.circuitsetup_cache = circuitsetup_cache
+        self.circuit_stats = circuit_stats if (circuit_stats is not None) else {}
+        self.reused_polys = reused_polys if (reused_polys is not None) else {}
+        self.pruning_settings = pruning_settings
+        self.sopm_cache = None  # (paramvec, (settings, circuits), achieved_sopm, max_sopm) of the last SOPM pass
 
 
 class TermPathSet(_TermPathSetBase):
@@ -75,6 +75,7 @@ def _class_for_name(module_and_class_name):
 def _get_auxfile_ext(typ):
     #get expected extension
     if typ == 'text-circuit-list': ext = '.txt'
+    elif typ == 'packed-circuit-list': ext = '.packed'
     elif typ == 'dir-serialized-object': ext = ''  # a directory
     elif typ == 'partialdir-serialized-object': ext = ''  # a directory
     elif typ == 'serialized-object': ext = '.json'
@@ -127,10 +128,15 @@ def load_meta_based_dir(root_dir, auxfile_types_member='auxfile_types',
         serialized) as a separate return value, instead of placing it
         within the returned dict.
 
-    quick_load : bool, optional
+    quick_load : bool or int or "lazy", optional
         Setting this to True skips the loading of members that may take
         a long time to load, namely those in separate files whose files are
         large.  When the loading of an attribute is skipped, it is set to `None`.
+        An integer value gives the file size (in bytes) above which loading is
+        skipped.  The special value `"lazy"` loads everything but defers work
+        until it's needed: dictionary members are loaded as :class:`LazyLoadingDict`
+        objects, whose values are loaded when first accessed, and numpy arrays are
+        memory-mapped (read-only) rather than read into memory.
 
     Returns
     -------
@@ -180,15 +186,160 @@ def load_meta_based_dir(root_dir, auxfile_types_member='auxfile_types',
         return ret
 
 
+class LazyLoadingDict(dict):
+    """
+    A dictionary whose values are loaded (e.g. from disk) when they're first accessed.
+
+    Keys are known up front, and each not-yet-loaded value has an associated
+    loader function.  Accessing a value in any way (indexing, `.get`, `.values`,
+    `.items`, copying, pickling, etc.) loads it and replaces the loader with the
+    loaded value.
+
+    Parameters
+    ----------
+    loaders : dict
+        A dictionary whose keys are the keys of this dictionary and whose values
+        are functions taking no arguments that return the corresponding values.
+
+    Attributes
+    ----------
+    on_load : function or None
+        A function that is called with each value when it is loaded, used to
+        post-process (e.g. link to a parent object) loaded values.
+    """
+
+    def __init__(self, loaders):
+        super().__init__((k, None) for k in loaders)
+        self._loaders = dict(loaders)
+        self.on_load = None
+
+    @property
+    def num_loaded(self):
+        """ The number of values that have been loaded. """
+        return len(self) - len(self._loaders)
+
+    def _load(self, key):
+        if key in self._loaders:
+            val = self._loaders.pop(key)()
+            if self.on_load is not None: self.on_load(val)
+            super().__setitem__(key, val)
+
+    def _load_all(self):
+        for key in list(self._loaders.keys()):
+            self._load(key)
+
+    def __getitem__(self, key):
+        self._load(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, val):
+        self._loaders.pop(key, None)
+        super().__setitem__(key, val)
+
+    def __delitem__(self, key):
+        self._loaders.pop(key, None)
+        super().__delitem__(key)
+
+    def __iter__(self):  # (overriding this stops dict(self) & {**self} from copying unloaded values)
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self._load_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._load_all()
+        return super().__repr__()
+
+    def __reduce__(self):  # pickles & copies are ordinary dicts
+        return (dict, (dict(self.items()),))
+
+    def get(self, key, default=None):
+        return self[key] if (key in self) else default
+
+    def values(self):
+        self._load_all()
+        return super().values()
+
+    def items(self):
+        self._load_all()
+        return super().items()
+
+    def pop(self, key, *default):
+        self._load(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        self._load_all()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._load(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        for key, val in dict(*args, **kwargs).items():
+            self[key] = val
+
+    def clear(self):
+        self._loaders.clear()
+        super().clear()
+
+    def copy(self):
+        return dict(self.items())
+
+
+def apply_when_loaded(d, fn):
+    """
+    Apply a function to each of the values of a dictionary, as they are loaded.
+
+    For an ordinary dictionary, `fn` is applied to all the values immediately.  For
+    a :class:`LazyLoadingDict`, it is applied to loaded values now and to each
+    remaining value when it is loaded.
+
+    Parameters
+    ----------
+    d : dict
+        The dictionary.
+
+    fn : function
+        A function taking a single argument (a value of `d`).
+
+    Returns
+    -------
+    None
+    """
+    if isinstance(d, LazyLoadingDict):
+        for key in d:
+            if key not in d._loaders: fn(dict.__getitem__(d, key))
+        d.on_load = fn
+    else:
+        for val in d.values():
+            fn(val)
+
+
 def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
     subtypes = typ.split(':')
     cur_typ = subtypes[0]
     next_typ = ':'.join(subtypes[1:])
 
+    lazy = (quick_load == 'lazy')
     max_size = quick_load if isinstance(quick_load, int) else QUICK_LOAD_MAX_SIZE
 
     def should_skip_loading(path):
-        return quick_load and (path.stat().st_size >= max_size)
+        return quick_load and not lazy and (path.stat().st_size >= max_size)
+
+    def lazy_loader(filenm_so_far, meta):
+        def load():
+            bLoaded, val = _load_auxfile_member(root_dir, filenm_so_far, next_typ, meta, quick_load)
+            if not bLoaded: raise ValueError("Failed to load dictionary value from " + filenm_so_far)
+            return val
+        return load
 
     if cur_typ == 'list':
         if metadata is None:  # signals that value is None, otherwise would at least be an empty list
@@ -206,6 +357,8 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
     elif cur_typ == 'dict':
         if metadata is None:  # signals that value is None, otherwise would at least be an empty list
             val = None
+        elif lazy:
+            val = LazyLoadingDict({k: lazy_loader(filenm + "_" + k, metadata.get(k, None)) for k in metadata})
         else:
             keys = list(metadata.keys())  # sort?
             val = {}
@@ -221,6 +374,10 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
     elif cur_typ == 'fancykeydict':
         if metadata is None:  # signals that value is None, otherwise would at least be an empty list
             val = None
+        elif lazy:
+            val = LazyLoadingDict({(tuple(k) if isinstance(k, list) else k):  # convert list-type keys -> tuples
+                                   lazy_loader(filenm + "_kvpair" + str(i), meta)
+                                   for i, (k, meta) in enumerate(metadata)})
         else:
             keymeta_pairs = list(metadata)  # should be a list of (key, metadata_for_value) pairs
             val = {}
@@ -290,6 +447,8 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
             val = None  # no file exists for this member
         elif cur_typ == 'text-circuit-list':
             val = _load.read_circuit_list(pth)
+        elif cur_typ == 'packed-circuit-list':
+            val = _load.read_packed_circuit_list(pth, mmap=lazy)
         elif cur_typ == 'dir-serialized-object':
             val = _cls_from_meta_json(pth).from_dir(pth, quick_load=quick_load)
         elif cur_typ == 'partialdir-serialized-object':
@@ -299,7 +458,7 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
         elif cur_typ == 'circuit-str-json':
             val = _load.read_circuit_strings(pth)
         elif typ == 'numpy-array':
-            val = _np.load(pth)
+            val = _np.load(pth, mmap_mode='r' if lazy else None)
         elif typ == 'json':
             with open(str(pth), 'r') as f:
                 val = _json.load(f)
@@ -436,6 +595,8 @@ def _write_auxfile_member(root_dir, filenm, typ, val):
             pass  # and really we shouldn't ever get here since we short circuit in auxmember loop
         elif cur_typ == 'text-circuit-list':
             _write.write_circuit_list(pth, val)
+        elif cur_typ == 'packed-circuit-list':
+            _write.write_packed_circuit_list(pth, val)
         elif cur_typ == 'dir-serialized-object':
             val.write(pth)
         elif cur_typ == 'partialdir-serialized-object':
@@ -13,6 +13,7 @@ Serialization routines to/from a MongoDB database
 
 import pickle as _pickle
 import warnings as _warnings
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 import numpy as _np
 
 from pygsti.circuits.circuit import Circuit as _Circuit
@@ -28,6 +29,10 @@ from pygsti.baseobjs.mongoserializable import RecursiveRemovalSpecification as _
 from pygsti.baseobjs.mongoserializable import WriteOpsByCollection as _WriteOpsByCollection
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 
+GRIDFS_MIN_ARRAY_SIZE = 4 * 1024 * 1024  # numpy arrays this large (in bytes) are stored using GridFS
+MAX_IDS_PER_QUERY = 10000  # the maximum number of documents looked up by id in a single query
+MAX_READ_AHEAD_THREADS = 8  # the maximum number of concurrent queries used to read auxiliary documents
+
 
 def read_auxtree_from_mongodb(mongodb, collection_name, doc_id, auxfile_types_member='auxfile_types',
                               ignore_meta=('_id', 'type',), separate_auxfiletypes=False,
@@ -80,7 +85,7 @@ def read_auxtree_from_mongodb(mongodb, collection_name, doc_id, auxfile_types_me
         directly from the main document were serialized.
     """
     doc = mongodb[collection_name].find_one({'_id': doc_id})
-    return read_auxtree_from_mongodb_doc(mongodb, collection_name, doc, auxfile_types_member,
+    return read_auxtree_from_mongodb_doc(mongodb, doc, auxfile_types_member,
                                          ignore_meta, separate_auxfiletypes, quick_load)
 
 
@@ -140,11 +145,18 @@ def read_auxtree_from_mongodb_doc(mongodb, doc, auxfile_types_member='auxfile_ty
         if key in ignore_meta: continue
         ret[key] = val
 
+    #Read ahead: retrieve all the auxiliary documents using (concurrently) one query per collection
+    ids_by_collection = {}
+    for key, typ in doc[auxfile_types_member].items():
+        if key in ignore_meta: continue
+        _collect_auxdoc_ids(typ, doc.get(key, None), ids_by_collection)
+    prefetched_docs = _find_docs_by_id(mongodb, ids_by_collection)
+
     for key, typ in doc[auxfile_types_member].items():
         if key in ignore_meta: continue  # don't load -> members items in ignore_meta
 
         bLoaded, val = _load_auxdoc_member(mongodb, key, typ,
-                                           doc.get(key, None), quick_load)
+                                           doc.get(key, None), quick_load, prefetched_docs)
         if bLoaded:
             ret[key] = val
         elif val is True:  # val is value of whether to set value to None
@@ -157,7 +169,48 @@ def read_auxtree_from_mongodb_doc(mongodb, doc, auxfile_types_member='auxfile_ty
         return ret
 
 
-def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
+def _collect_auxdoc_ids(typ, metadata, ids_by_collection):
+    """ Gather, by collection, the ids of the documents an aux-doc member with metadata `metadata` is stored in """
+    subtypes = typ.split(':')
+    cur_typ = subtypes[0]
+    next_typ = ':'.join(subtypes[1:])
+
+    if metadata is None:
+        return  # value is None, so there are no documents
+    elif cur_typ == 'list':
+        for meta in metadata:
+            _collect_auxdoc_ids(next_typ, meta, ids_by_collection)
+    elif cur_typ == 'dict':
+        for meta in metadata.values():
+            _collect_auxdoc_ids(next_typ, meta, ids_by_collection)
+    elif cur_typ == 'fancykeydict':
+        for k, meta in metadata:
+            _collect_auxdoc_ids(next_typ, meta, ids_by_collection)
+    elif cur_typ in ('text-circuit-list', 'packed-circuit-list'):
+        ids_by_collection.setdefault(metadata['collection_name'], []).extend(metadata['ids'])
+    elif cur_typ in ('dir-serialized-object', 'partialdir-serialized-object', 'serialized-object',
+                     'circuit-str-json', 'numpy-array', 'json', 'pickle'):
+        ids_by_collection.setdefault(metadata['collection_name'], []).append(metadata['id'])
+
+
+def _find_docs_by_id(mongodb, ids_by_collection):
+    """ Retrieve documents by id, using one query per collection (and chunk of ids), run concurrently """
+    queries = [(collection_name, ids[i:i + MAX_IDS_PER_QUERY])
+               for collection_name, ids in ids_by_collection.items() for i in range(0, len(ids), MAX_IDS_PER_QUERY)]
+
+    def run_query(query):
+        collection_name, ids = query
+        return collection_name, list(mongodb[collection_name].find({'_id': {'$in': ids}}))
+
+    if len(queries) > 1:
+        with _ThreadPoolExecutor(min(len(queries), MAX_READ_AHEAD_THREADS)) as executor:
+            results = list(executor.map(run_query, queries))
+    else:
+        results = list(map(run_query, queries))
+    return {(collection_name, doc['_id']): doc for collection_name, docs in results for doc in docs}
+
+
+def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load, prefetched_docs=None):
     subtypes = typ.split(':')
     cur_typ = subtypes[0]
     next_typ = ':'.join(subtypes[1:])
@@ -167,6 +220,12 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
     #def should_skip_loading(path):
     #    return quick_load and (path.stat().st_size >= max_size)
 
+    def find_doc(meta):  # use a document that was read ahead when available
+        key = (meta['collection_name'], meta['id'])
+        if prefetched_docs is not None and key in prefetched_docs:
+            return prefetched_docs[key]
+        return mongodb[meta['collection_name']].find_one(meta['id'])
+
     if cur_typ == 'list':
         if metadata is None:  # signals that value is None, otherwise would at least be an empty list
             val = None
@@ -175,7 +234,7 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
             for i, meta in enumerate(metadata):
                 membernm_so_far = member_name + str(i)
                 bLoaded, el = _load_auxdoc_member(mongodb, membernm_so_far,
-                                                  next_typ, meta, quick_load)
+                                                  next_typ, meta, quick_load, prefetched_docs)
                 if bLoaded:
                     val.append(el)
                 else:
@@ -191,7 +250,7 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
                 membernm_so_far = member_name + "_" + k
                 meta = metadata.get(k, None)
                 bLoaded, v = _load_auxdoc_member(mongodb, membernm_so_far,
-                                                 next_typ, meta, quick_load)
+                                                 next_typ, meta, quick_load, prefetched_docs)
                 if bLoaded:
                     val[k] = v
                 else:
@@ -206,7 +265,7 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
             for i, (k, meta) in enumerate(keymeta_pairs):
                 membernm_so_far = member_name + "_kvpair" + str(i)
                 bLoaded, el = _load_auxdoc_member(mongodb, membernm_so_far,
-                                                  next_typ, meta, quick_load)
+                                                  next_typ, meta, quick_load, prefetched_docs)
                 if bLoaded:
                     if isinstance(k, list): k = tuple(k)  # convert list-type keys -> tuples
                     val[k] = el
@@ -230,48 +289,53 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
         elif metadata is None:
             # value was None and we do nothing here
             val = None
-        elif cur_typ == 'text-circuit-list':
-            coll = mongodb[metadata['collection_name']]
+        elif cur_typ in ('text-circuit-list', 'packed-circuit-list'):  # circuits stored as separate documents
+            coll_name = metadata['collection_name']
             circuit_doc_ids = metadata['ids']
+            if prefetched_docs is None or any([(coll_name, i) not in prefetched_docs for i in circuit_doc_ids]):
+                prefetched_docs = _find_docs_by_id(mongodb, {coll_name: circuit_doc_ids})
 
-            circuit_strs = []
-            for circuit_doc_id in circuit_doc_ids:
-                cdoc = coll.find_one(circuit_doc_id)
-                circuit_strs.append(cdoc['circuit_str'])
+            circuit_strs = [prefetched_docs[coll_name, circuit_doc_id]['circuit_str']
+                            for circuit_doc_id in circuit_doc_ids]
             val = _load.convert_strings_to_circuits(circuit_strs)
 
         elif cur_typ == 'dir-serialized-object':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = find_doc(metadata)
             val = _MongoSerializable.from_mongodb_doc(mongodb, metadata['collection_name'],
                                                       obj_doc, quick_load=quick_load)
 
         elif cur_typ == 'partialdir-serialized-object':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = find_doc(metadata)
             val = _MongoSerializable.from_mongodb_doc(mongodb, metadata['collection_name'],
                                                       obj_doc, quick_load=quick_load, load_data=False)
 
         elif cur_typ == 'serialized-object':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = find_doc(metadata)
             val = _MongoSerializable.from_mongodb_doc(mongodb, metadata['collection_name'], obj_doc)
 
         elif cur_typ == 'circuit-str-json':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = find_doc(metadata)
             val = _load.convert_strings_to_circuits(obj_doc['circuit_str_json'])
 
         elif typ == 'numpy-array':
-            array_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            array_doc = find_doc(metadata)
             if array_doc is not None:
                 assert(array_doc['auxdoc_type'] == cur_typ)
-                val = _pickle.loads(array_doc['numpy_array_data'])
+                if 'gridfs_collection_name' in array_doc:  # large array stored using GridFS
+                    import gridfs as _gridfs
+                    fs = _gridfs.GridFS(mongodb, collection=array_doc['gridfs_collection_name'])
+                    val = _np.load(fs.get(array_doc['_id']), allow_pickle=False)
+                else:
+                    val = _pickle.loads(array_doc['numpy_array_data'])
 
         elif typ == 'json':
-            json_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            json_doc = find_doc(metadata)
             if json_doc is not None:
                 assert(json_doc['auxdoc_type'] == cur_typ)
                 val = json_doc['json_data']
 
         elif typ == 'pickle':
-            pkl_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            pkl_doc = find_doc(metadata)
             if pkl_doc is not None:
                 assert(pkl_doc['auxdoc_type'] == cur_typ)
                 val = _pickle.loads(pkl_doc['pickle_data'])
@@ -693,7 +757,8 @@ def _write_auxdoc_member(mongodb, write_ops, parent_collection_name, parent_id,
         elif cur_typ in ('none', 'reset'):  # explicitly don't get written
             pass  # and really we shouldn't ever get here since we short circuit in auxmember loop
 
-        elif cur_typ == 'text-circuit-list':
+        elif cur_typ in ('text-circuit-list', 'packed-circuit-list'):  # circuits stored as separate documents
+            write_ops.prefetch_existing_docs('pygsti_circuits', [{'circuit_str': c.str} for c in val], mongodb)
             circuit_doc_ids = []
             for i, circuit in enumerate(val):
                 circuit_doc_ids.append(
@@ -729,9 +794,15 @@ def _write_auxdoc_member(mongodb, write_ops, parent_collection_name, parent_id,
         elif cur_typ == 'numpy-array':
             member_id = {'parent_collection': parent_collection_name, 'parent': parent_id, 'member_name': member_name}
             val_doc = member_id.copy()
-            val_doc.update({'auxdoc_type': cur_typ,
-                            'numpy_array_data': _Binary(_pickle.dumps(val, protocol=2), subtype=128)})
+            val_doc['auxdoc_type'] = cur_typ
+            use_gridfs = isinstance(val, _np.ndarray) and val.dtype != object and val.nbytes >= GRIDFS_MIN_ARRAY_SIZE
+            if use_gridfs:  # stream large arrays into GridFS, as documents are limited to 16MB
+                val_doc['gridfs_collection_name'] = 'pygsti_gridfs'
+            else:
+                val_doc['numpy_array_data'] = _Binary(_pickle.dumps(val, protocol=2), subtype=128)
             val_id = write_ops.add_one_op('pygsti_arrays', member_id, val_doc, overwrite_existing, mongodb)
+            if use_gridfs:
+                write_ops.add_gridfs_put_op('pygsti_gridfs', val_id, val, overwrite_existing, mongodb)
             metadata = {'collection_name': 'pygsti_arrays', 'id': val_id}
 
         elif typ == 'json':
@@ -840,18 +911,24 @@ def _remove_auxdoc_member(mongodb, member_name, typ, metadata, session, recursiv
             return  # done here
         elif metadata is None:
             return  # value was None and so no auxdoc was created -- nothing to remove
-        elif cur_typ == 'text-circuit-list':
+        elif cur_typ in ('text-circuit-list', 'packed-circuit-list'):  # circuits stored as separate documents
             if recursive.circuits:
                 coll = mongodb[metadata['collection_name']]
                 circuit_doc_ids = metadata['ids']
-                for circuit_doc_id in circuit_doc_ids:
-                    coll.delete_one({'_id': circuit_doc_id}, session=session)  # returns deleted count (0 or 1)
+                for i in range(0, len(circuit_doc_ids), MAX_IDS_PER_QUERY):
+                    coll.delete_many({'_id': {'$in': circuit_doc_ids[i:i + MAX_IDS_PER_QUERY]}}, session=session)
         elif cur_typ == 'circuit-str-json':
             mongodb[metadata['collection_name']].delete_one({'_id': metadata['id']}, session=session)
         elif cur_typ in ('dir-serialized-object', 'partialdir-serialized-object', 'serialized-object'):
             _MongoSerializable.remove_from_mongodb(mongodb, metadata['id'], metadata['collection_name'],
                                                    session, recursive=recursive)
-        elif typ in ('numpy-array', 'json', 'pickle'):
+        elif typ == 'numpy-array':
+            array_doc = mongodb[metadata['collection_name']].find_one_and_delete({'_id': metadata['id']},
+                                                                                  session=session)
+            if array_doc is not None and 'gridfs_collection_name' in array_doc:
+                import gridfs as _gridfs
+                _gridfs.GridFS(mongodb, collection=array_doc['gridfs_collection_name']).delete(array_doc['_id'])
+        elif typ in ('json', 'pickle'):
             mongodb[metadata['collection_name']].delete_one({'_id': metadata['id']}, session=session)
         else:
             raise ValueError("Invalid aux-file type: %s" % typ)
@@ -15,6 +15,8 @@ import pathlib as _pathlib
 import warnings as _warnings
 import json as _json
 
+import numpy as _np
+
 from pygsti.io import metadir as _metadir
 from pygsti.io import mongodb as _mongodb
 from pygsti.io import stdinput as _stdinput
@@ -349,6 +351,74 @@ def read_circuit_list(filename, read_raw_strings=False, line_labels='auto', num_
         return std.parse_stringfile(filename, line_labels, num_lines, create_subcircuits)
 
 
+_PACKED_CIRCUIT_LIST_MAGIC = b'PGSTPCL\x01'
+
+
+def read_packed_circuit_list(filename, mmap=False):
+    """
+    Load a circuit list from a binary "packed" circuit list file.
+
+    Such files are written by :func:`write_packed_circuit_list`.  Only the (typically
+    few) distinct layer labels are parsed; circuits are then assembled directly from
+    the stored label indices.
+
+    Parameters
+    ----------
+    filename : string
+        The name of the file
+
+    mmap : bool, optional
+        Whether to memory-map the file's integer arrays rather than reading
+        them into memory up front.
+
+    Returns
+    -------
+    list of Circuit objects
+    """
+    with open(str(filename), 'rb') as f:
+        magic = f.read(len(_PACKED_CIRCUIT_LIST_MAGIC))
+        if magic != _PACKED_CIRCUIT_LIST_MAGIC:
+            raise ValueError("%s is not a packed circuit list file!" % str(filename))
+        header_len = int(_np.frombuffer(f.read(8), '<u8')[0])
+        header = _json.loads(f.read(header_len).decode('utf-8'))
+        data_start = f.tell()
+
+    num_circuits = header['num_circuits']
+    num_layers = header['num_layers']
+
+    def read_array(dtype, count, offset):
+        if count == 0: return _np.empty(0, dtype)
+        if mmap: return _np.memmap(filename, dtype, mode='r', offset=offset, shape=(count,))
+        return _np.fromfile(str(filename), dtype, count=count, offset=offset)
+
+    offsets = read_array('<i8', num_circuits + 1, data_start).tolist()
+    line_label_indices = read_array('<i4', num_circuits, data_start + 8 * (num_circuits + 1)).tolist()
+    layers = read_array(header['layer_dtype'], num_layers, data_start + 12 * num_circuits + 8)
+
+    labels = _np.empty(len(header['labels']), dtype=object)  # so `labels[layers]` gathers label objects
+    for j, s in enumerate(header['labels']):
+        labels[j] = _circuits.Circuit(s, expand_subcircuits=False).layertup[0]
+    line_labels = [tuple(lbls) for lbls in header['line_labels']]
+    occurrences = {i: occ for i, occ in header['occurrences']}
+    compilable_layer_indices = {i: tuple(inds) for i, inds in header['compilable_layer_indices']}
+
+    fastinit = _circuits.Circuit._fastinit
+    circuits = []
+    chunk_size = 2**20  # approximate number of layers to gather at once
+    i = 0
+    while i < num_circuits:
+        start = offsets[i]
+        iend = _np.searchsorted(offsets, start + chunk_size, side='right') - 1
+        iend = min(max(iend, i + 1), num_circuits)
+        chunk_labels = labels[layers[start:offsets[iend]]].tolist()
+        for k in range(i, iend):
+            circuits.append(fastinit(tuple(chunk_labels[offsets[k] - start:offsets[k + 1] - start]),
+                                     line_labels[line_label_indices[k]], False, '', None,
+                                     occurrences.get(k, None), compilable_layer_indices.get(k, ())))
+        i = iend
+    return circuits
+
+
 def convert_strings_to_circuits(obj):
     """
     Converts an object resulting from :func:`convert_circuits_to_strings` back to its original.
@@ -640,10 +710,12 @@ def read_data_from_dir(dirname, preloaded_edesign=None, quick_load=False, comm=N
         when this has been loaded already (only use this if you know what
         you're doing).
 
-    quick_load : bool, optional
+    quick_load : bool or "lazy", optional
         Setting this to True skips the loading of components that may take
         a long time to load. This can be useful when this information isn't
-        needed and loading takes a long time.
+        needed and loading takes a long time.  Setting this to `"lazy"` defers
+        the loading of data sets and child data objects until they're first
+        accessed.
 
     comm : mpi4py.MPI.Comm, optional
         When not ``None``, an MPI communicator used to synchronize file access.
@@ -761,10 +833,16 @@ def read_results_from_dir(dirname, name=None, preloaded_data=None, quick_load=Fa
         when this has been loaded already (only use this if you know what
         you're doing).
 
-    quick_load : bool, optional
+    quick_load : bool or "lazy", optional
         Setting this to True skips the loading of data and experiment-design
         components that may take a long time to load. This can be useful
         all the information of interest lies only within the results objects.
+        Setting this to `"lazy"` loads everything, but only when it's first
+        accessed: child results directories, data sets, and dictionary members
+        (e.g. the estimates of a :class:`ModelEstimateResults` object and the
+        models within each estimate) are loaded on demand, and numpy arrays are
+        memory-mapped.  This makes it fast to open a large results directory and
+        access just a few of its results.
 
     comm : mpi4py.MPI.Comm, optional
         When not ``None``, an MPI communicator used to synchronize file access.
@@ -10,6 +10,7 @@ Functions for writing GST objects to text files.
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import array as _array
 import pathlib as _pathlib
 import warnings as _warnings
 import json as _json
@@ -299,6 +300,84 @@ def write_circuit_list(filename, circuits, header=None):
             output.write(circuit.str + '\n')
 
 
+def write_packed_circuit_list(filename, circuits):
+    """
+    Write a binary "packed" circuit list file.
+
+    Each distinct layer label is stored (as a string) just once, in a label table,
+    and each circuit is stored as a range of integer indices into this table.  This
+    makes the file quick to write and, because no circuit strings need to be parsed,
+    very quick to read using :func:`read_packed_circuit_list`.
+
+    The file consists of an 8-byte magic string, the length of a JSON header as an
+    8-byte little-endian unsigned integer, the JSON header itself (containing the
+    label table, the table of distinct line labels and any circuit occurrence ids
+    and compilable layer indices), padding to a 64-byte boundary and finally three
+    little-endian integer arrays: the (int64) layer offsets of each circuit, the
+    (int32) line-label index of each circuit and the label index of each layer (as
+    the smallest of uint8, uint16 or int32 that can index the label table).
+
+    Parameters
+    ----------
+    filename : string
+        The filename to write.
+
+    circuits : list of Circuits
+        The list of circuits to write.
+
+    Returns
+    -------
+    None
+    """
+    if len(circuits) > 0 and not isinstance(circuits[0], _circuits.Circuit):
+        raise ValueError("Argument circuits must be a list of Circuit objects!")
+
+    # Label equality ignores time stamps, so labels with (non-zero) times are interned by their string rep.
+    label_strs = []  # the label table
+    label_indices = {}  # untimed label => index into label table
+    timed_label_indices = {}  # str(timed label) => index into label table
+    line_label_indices = {}  # line labels tuple => index into line-labels table
+    occurrences = []
+    compilable_layer_indices = []
+    offsets = _np.empty(len(circuits) + 1, _np.int64); offsets[0] = 0
+    circuit_line_labels = _np.empty(len(circuits), _np.int32)
+    layers = _array.array('l')
+
+    for i, circuit in enumerate(circuits):
+        layertup = circuit.layertup
+        try:
+            layers.extend([timed_label_indices[str(lbl)] if lbl.time else label_indices[lbl] for lbl in layertup])
+        except KeyError:  # new label(s) - add them to the label table
+            for lbl in layertup:
+                indices, key = (timed_label_indices, str(lbl)) if lbl.time else (label_indices, lbl)
+                if key not in indices:
+                    indices[key] = len(label_strs)
+                    label_strs.append(str(lbl))
+            layers.extend([timed_label_indices[str(lbl)] if lbl.time else label_indices[lbl] for lbl in layertup])
+        offsets[i + 1] = len(layers)
+        circuit_line_labels[i] = line_label_indices.setdefault(circuit.line_labels, len(line_label_indices))
+        if circuit.occurrence is not None:
+            occurrences.append((i, circuit.occurrence))
+        if circuit.compilable_layer_indices:
+            compilable_layer_indices.append((i, circuit.compilable_layer_indices))
+
+    layer_dtype = '<u1' if len(label_strs) <= 2**8 else ('<u2' if len(label_strs) <= 2**16 else '<i4')
+    header = {'version': 1, 'num_circuits': len(circuits), 'num_layers': len(layers), 'layer_dtype': layer_dtype,
+              'labels': label_strs, 'line_labels': list(line_label_indices.keys()),
+              'occurrences': occurrences, 'compilable_layer_indices': compilable_layer_indices}
+    header_bytes = _json.dumps(header).encode('utf-8')
+    data_start = len(_readers._PACKED_CIRCUIT_LIST_MAGIC) + 8 + len(header_bytes)
+    padding = -data_start % 64
+
+    with open(str(filename), 'wb') as output:
+        output.write(_readers._PACKED_CIRCUIT_LIST_MAGIC)
+        output.write(_np.uint64(len(header_bytes) + padding).astype('<u8').tobytes())
+        output.write(header_bytes + b' ' * padding)
+        output.write(offsets.astype('<i8').tobytes())
+        output.write(circuit_line_labels.astype('<i4').tobytes())
+        output.write(_np.frombuffer(layers, _np.dtype('l')).astype(layer_dtype).tobytes())
+
+
 @_deprecated_fn('pygsti.models.Model.write(...)')
 def write_model(model, filename, title=None):
     """
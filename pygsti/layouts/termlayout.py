@@ -110,6 +110,7 @@ class _TermCOPALayoutAtom(_DistributableAtom):
         self.percircuit_p_polys = {}  # keys = circuits, values = (threshold, compact_polys)
 
         self.merged_compact_polys = None
+        self.compiled_polys = None  # a CompiledPolynomials evaluation plan for merged_compact_polys
         self.merged_achievedsopm_compact_polys = None
 
         super().__init__(element_slice, local_offset)
@@ -595,6 +595,17 @@ class LindbladErrorgen(_LinearOperator):
         self._update_rep()
         #assert(_np.allclose(errgen, self.to_dense()))  # DEBUG
 
+    def __deepcopy__(self, memo):
+        # The Lindblad term superoperators are computed once, in __init__, and only ever read afterward, so
+        # copies share them instead of duplicating these (often large) arrays.
+        memo[id(self.lindblad_term_superops_and_1norms)] = self.lindblad_term_superops_and_1norms
+        memo[id(self.combined_lindblad_term_superops)] = self.combined_lindblad_term_superops
+        cls = self.__class__
+        cpy = cls.__new__(cls)
+        memo[id(self)] = cpy
+        cpy.__setstate__(_copy.deepcopy(self.__getstate__(), memo))  # __getstate__ drops the parent link
+        return cpy
+
     def _update_rep(self):
         """
         Updates self._rep, which contains a representation of this error generator
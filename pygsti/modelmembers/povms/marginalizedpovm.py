@@ -82,8 +82,17 @@ class MarginalizedPOVM(_POVM):
             else:
                 elements_to_sum[mk] = [k]
         self._elements_to_sum = {k: tuple(v) for k, v in elements_to_sum.items()}  # convert to tuples
+
+        # When the parent POVM's rep can compute marginal probabilities directly (e.g. a tensor-product POVM rep),
+        # use a rep that does so, avoiding the (dense) sums of the parent's effects.
+        povm_rep = self.povm_to_marginalize._rep
+        if povm_rep is not None and hasattr(povm_rep, 'marginal_probabilities'):
+            rep = self.povm_to_marginalize.evotype.create_marginalized_povm_rep(
+                povm_rep, self.indices_to_keep, self.povm_to_marginalize.state_space)
+        else:
+            rep = None
         super(MarginalizedPOVM, self).__init__(self.povm_to_marginalize.state_space, self.povm_to_marginalize.evotype,
-                                               rep=None)  # TODO - make marginalized POVM rep type?
+                                               rep=rep)
         self.init_gpindices()  # initialize gpindices and subm_rpindices from sub-members
 
     def to_memoized_dict(self, mmg_memo):
@@ -195,7 +204,8 @@ class MarginalizedPOVM(_POVM):
                 else:
                     effect_vec += e.to_dense()
             rep = e.effect_vec._rep if isinstance(e, _ComposedPOVMEffect) else e._rep
-            effect = _StaticPOVMEffect(effect_vec, rep.basis, self._evotype)
+            basis = getattr(rep, 'basis', None)  # e.g. tensor-product effect reps don't hold a basis
+            effect = _StaticPOVMEffect(effect_vec, basis, self._evotype)
             assert(effect.allocate_gpindices(0, self.parent) == 0)  # functional! (do not remove)
             _collections.OrderedDict.__setitem__(self, key, effect)
             return effect
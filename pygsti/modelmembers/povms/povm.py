@@ -239,7 +239,8 @@ class POVM(_mm.ModelMember, _collections.OrderedDict):
                 outcome_probs[lbl] = E._rep.probability(staterep)
             return outcome_probs
         else:
-            return self._rep.acton(staterep)
+            outcome_lbls = list(self.keys())
+            return _collections.OrderedDict(zip(outcome_lbls, self._rep.probabilities(staterep, None, outcome_lbls)))
 
     def __str__(self):
         s = "%s with effect vectors:\n" % self.__class__.__name__
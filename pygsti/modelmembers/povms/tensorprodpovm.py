@@ -19,6 +19,7 @@ from pygsti.modelmembers.povms.povm import POVM as _POVM
 from pygsti.modelmembers.povms.tensorprodeffect import TensorProductPOVMEffect as _TensorProductPOVMEffect
 from pygsti.modelmembers import modelmember as _mm
 from pygsti.baseobjs import statespace as _statespace
+from pygsti.evotypes import Evotype as _Evotype
 
 
 class TensorProductPOVM(_POVM):
@@ -69,7 +70,15 @@ class TensorProductPOVM(_POVM):
                 "All the effect labels for a given factor POVM must be the *same* length!"
             self._factor_lbllens.append(l)
 
-        super(TensorProductPOVM, self).__init__(state_space, evotype, None, items)
+        # A POVM rep (when the evotype has one) computes all the outcome probabilities at once by contracting
+        # a state with each factor POVM in turn, instead of computing each product effect's probability.
+        evotype = _Evotype.cast(evotype, state_space=state_space)
+        try:
+            rep = evotype.create_tensorproduct_povm_rep(self.factorPOVMs, state_space)
+        except AttributeError:
+            rep = None
+
+        super(TensorProductPOVM, self).__init__(state_space, evotype, rep, items)
         self.init_gpindices()  # initialize gpindices and subm_rpindices from sub-members
 
     #Note: no to_memoized_dict needed, as ModelMember version does all we need.
@@ -230,6 +239,8 @@ class TensorProductPOVM(_POVM):
         """
         for povm, povm_local_inds in zip(self.factorPOVMs, self._submember_rpindices):
             povm.from_vector(v[povm_local_inds], close, dirty_value)
+        if self._rep is not None:
+            self._rep.factor_effects_have_changed()
 
     def depolarize(self, amount):
         """
@@ -250,6 +261,8 @@ class TensorProductPOVM(_POVM):
         """
         for povm in self.factorPOVMs:
             povm.depolarize(amount)
+        if self._rep is not None:
+            self._rep.factor_effects_have_changed()
 
         #No need to re-init effect vectors since they don't store a (dense)
         # version of their vector - they just create it from factor_povms on demand
@@ -12,7 +12,6 @@ Sub-package holding model state preparation objects.
 
 import numpy as _np
 import scipy.linalg as _spl
-import scipy.optimize as _spo
 import warnings as _warnings
 
 from pygsti.modelmembers.povms.computationalpovm import ComputationalBasisPOVM
@@ -264,6 +263,7 @@ def convert(state, to_type, basis, ideal_state=None, flatten_structure=False):
                         errorgen.from_vector(v)
                         return _np.linalg.norm(_spl.expm(errorgen.to_dense()) @ dense_st - dense_state)
                     #def callback(x): print("callbk: ",_np.linalg.norm(x),_objfn(x))  # REMOVE
+                    import scipy.optimize as _spo  # (slow to import, so only import when needed)
                     soln = _spo.minimize(_objfn, _np.zeros(errorgen.num_params, 'd'), method="CG", options={},
                                          tol=1e-8)  # , callback=callback)
                     #print("DEBUG: opt done: ",soln.success, soln.fun, soln.x)  # REMOVE
@@ -514,6 +514,12 @@ class CloudNoiseLayerRules(_LayerRules):
         if layerlbl in caches['povm-layers']: return caches['povm-layers'][layerlbl]
         if layerlbl in model.povm_blks['layers']:
             return model.povm_blks['layers'][layerlbl]
+        elif isinstance(layerlbl, _Lbl) and layerlbl.name in model.povm_blks['layers']:
+            # implicit creation of a marginalized POVM whereby an existing POVM name is used with sslbls that
+            # are not present in the stored POVM's label.  (Not cached, since the model would then try to set
+            # this POVM's parameters, which are owned by the POVM being marginalized.)
+            return _povm.MarginalizedPOVM(model.povm_blks['layers'][layerlbl.name],
+                                          model.state_space, layerlbl.sslbls)
         else:
             # See if this effect label could correspond to a *marginalized* POVM, and
             # if so, create the marginalized POVM and add its effects to model.effect_blks['layers']
@@ -1430,6 +1430,40 @@ class ExplicitOpModel(_mdl.OpModel):
         """
         return tuple(self.povms[povm_lbl].keys())
 
+    def _num_effects_for_povm(self, povm_lbl):
+        """
+        Gets the number of possible outcomes of POVM label `povm_lbl`.
+
+        Parameters
+        ----------
+        povm_lbl : Label
+            POVM label.
+
+        Returns
+        -------
+        int
+        """
+        return len(self.povms[povm_lbl])
+
+    def _observed_effect_labels_for_povm(self, povm_lbl, observed_effect_labels):
+        """
+        Gets the labels in `observed_effect_labels` that correspond to possible outcomes of POVM label `povm_lbl`.
+
+        Parameters
+        ----------
+        povm_lbl : Label
+            POVM label.
+
+        observed_effect_labels : iterable
+            The (observed) effect labels to filter.
+
+        Returns
+        -------
+        tuple
+        """
+        povm = self.povms[povm_lbl]
+        return tuple([elbl for elbl in observed_effect_labels if elbl in povm])
+
     def _member_labels_for_instrument(self, inst_lbl):
         """
         Gets the member labels corresponding to the possible outcomes of the instrument labeled by `inst_lbl`.
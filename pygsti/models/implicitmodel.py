@@ -266,12 +266,49 @@ class ImplicitOpModel(_mdl.OpModel):
         list
             A list of strings which label the POVM outcomes.
         """
+        return tuple(self._povm_for_label(povm_lbl).keys())
+
+    def _num_effects_for_povm(self, povm_lbl):
+        """
+        Gets the number of possible outcomes of POVM label `povm_lbl`.
+
+        Parameters
+        ----------
+        povm_lbl : Label
+            POVM label.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._povm_for_label(povm_lbl))
+
+    def _observed_effect_labels_for_povm(self, povm_lbl, observed_effect_labels):
+        """
+        Gets the labels in `observed_effect_labels` that correspond to possible outcomes of POVM label `povm_lbl`.
+
+        Parameters
+        ----------
+        povm_lbl : Label
+            POVM label.
+
+        observed_effect_labels : iterable
+            The (observed) effect labels to filter.
+
+        Returns
+        -------
+        tuple
+        """
+        povm = self._povm_for_label(povm_lbl)
+        return tuple([elbl for elbl in observed_effect_labels if elbl in povm])
+
+    def _povm_for_label(self, povm_lbl):
+        # the POVM in `self.povm_blks`, or a marginalization of one, labeled by `povm_lbl`
         for povmdict in self.povm_blks.values():
             if povm_lbl in povmdict:
-                return tuple(povmdict[povm_lbl].keys())
+                return povmdict[povm_lbl]
             if isinstance(povm_lbl, _Label) and povm_lbl.name in povmdict:
-                return tuple(_povm.MarginalizedPOVM(povmdict[povm_lbl.name],
-                                                    self.state_space, povm_lbl.sslbls).keys())
+                return _povm.MarginalizedPOVM(povmdict[povm_lbl.name], self.state_space, povm_lbl.sslbls)
 
         raise KeyError("No POVM labeled %s!" % str(povm_lbl))
 
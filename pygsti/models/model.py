@@ -12,7 +12,9 @@ Defines the Model class and supporting functionality.
 
 import bisect as _bisect
 import copy as _copy
+import hashlib as _hashlib
 import itertools as _itertools
+import json as _json
 import uuid as _uuid
 import warnings as _warnings
 import collections as _collections
@@ -483,10 +485,57 @@ class OpModel(Model):
         self.fogi_store = None
         self._index_mm_map = None
         self._index_mm_label_map = None
+        self._invalidate_digest(structure=True)
 
     def __setstate__(self, state_dict):
         self.__dict__.update(state_dict)
         self._sim.model = self  # ensure the simulator's `model` is set to self (usually == None in serialization)
+        self._invalidate_digest(structure=True)
+
+    def _invalidate_digest(self, structure=False):
+        """
+        Clear the memoized value of :meth:`__pygsti_digest__`.
+
+        Called whenever the model's parameters change, and with `structure=True`
+        whenever its parameterization (or other non-parameter structure) changes.
+        """
+        self._pygsti_digest = None
+        if structure:
+            self._pygsti_structure_digest = None
+
+    def __pygsti_digest__(self):
+        """
+        An MD5 digest of this model's contents, used by :func:`pygsti.baseobjs.smartcache.digest`.
+
+        The digest combines a digest of the model's structure (its serialized form),
+        which is only recomputed when the model's parameterization changes, with the
+        current parameter vector and the forward simulator's type and settings.  All but
+        the (small) simulator part is memoized until the model is modified, so digesting
+        a large model is usually O(1).
+
+        Returns
+        -------
+        bytes
+        """
+        self._clean_paramvec()  # invalidates memoized digests if members have been modified
+        if self._pygsti_digest is None:
+            if self._pygsti_structure_digest is None:
+                try:
+                    serial = _json.dumps(self.to_nice_serialization(), sort_keys=True).encode('utf-8')
+                except Exception:  # not all models/members are serializable: fall back to our persistent id
+                    serial = self.uuid.bytes
+                self._pygsti_structure_digest = _hashlib.md5(serial).digest()
+
+            md5 = _hashlib.md5(self._pygsti_structure_digest)
+            md5.update(_np.ascontiguousarray(self._paramvec).data)
+            self._pygsti_digest = md5.digest()
+
+        # simulator settings can be changed in place (e.g. `model.sim.mode = ...`), so they aren't memoized
+        try:
+            sim_serial = _json.dumps(self._sim.to_nice_serialization(), sort_keys=True)
+        except Exception:
+            sim_serial = str(type(self._sim))
+        return _hashlib.md5(self._pygsti_digest + sim_serial.encode('utf-8')).digest()
 
     ##########################################
     ## Get/Set methods
@@ -509,6 +558,7 @@ class OpModel(Model):
         # TODO: This should probably also take evotype (e.g. 'chp' should probably use a CHPForwardSim, etc)
         self._sim = _fwdsim.ForwardSimulator.cast(simulator, nqubits)
         self._sim.model = self  # ensure the simulator's `model` is set to this object
+        self._invalidate_digest()
 
     @property
     def evotype(self):
@@ -542,6 +592,7 @@ class OpModel(Model):
             self._basis = basis
         else:  # create a basis with the proper structure & dimension
             self._basis = _Basis.cast(basis, self.state_space)
+        self._invalidate_digest(structure=True)
 
     def _set_state_space(self, lbls, basis="pp"):
         """
@@ -756,6 +807,7 @@ class OpModel(Model):
             self._reinit_opcaches()  # changes to parameter vector structure invalidate cached ops
 
         if self.dirty:  # if any member object is dirty (ModelMember.dirty setter should set this value)
+            self._invalidate_digest()
             TOL = 1e-8
             ops_paramvec = self._model_paramvec_to_ops_paramvec(self._paramvec)
 
@@ -809,6 +861,7 @@ class OpModel(Model):
     def _mark_for_rebuild(self, modified_obj=None):
         #re-initialze any members that also depend on the updated parameters
         self._need_to_rebuild = True
+        self._invalidate_digest(structure=True)
 
         # Specifically, we need to re-allocate indices for every object that
         # contains a reference to the modified one.  Previously all modelmembers
@@ -994,6 +1047,7 @@ class OpModel(Model):
         """ Resizes self._paramvec and updates gpindices & parent members as needed,
             and will initialize new elements of _paramvec, but does NOT change
             existing elements of _paramvec (use _update_paramvec for this)"""
+        self._invalidate_digest(structure=True)
         w = self._model_paramvec_to_ops_paramvec(self._paramvec)
         Np = len(w)  # NOT self.num_params since the latter calls us!
         wl = self._paramlbls
@@ -1238,6 +1292,7 @@ class OpModel(Model):
         """
         assert(len(v) == self.num_params)
 
+        self._invalidate_digest()
         self._paramvec = v.copy()
         w = self._model_paramvec_to_ops_paramvec(v)
         for _, obj in self._iter_parameterized_objs():
@@ -1309,10 +1364,14 @@ class OpModel(Model):
             #parse the strings into integer indices.
             param_labels_list = self.parameter_labels.tolist()
             indices = [param_labels_list.index(lbl) for lbl in indices]
-                        
+
+        self._invalidate_digest()
         for idx, val in zip(indices, values):
             self._paramvec[idx] = val
 
+        if self._index_mm_map is None and self._param_interposer is None and not self._need_to_rebuild:
+            self._build_index_mm_map()  # e.g. not built yet for a copy of another model
+
         if self._param_interposer is not None or self._index_mm_map is None:
             #fall back to standard from_vector call.
             self.from_vector(self._paramvec)
@@ -1360,6 +1419,7 @@ class OpModel(Model):
         if self._param_interposer is not None:  # remove existing interposer
             self._paramvec = self._model_paramvec_to_ops_paramvec(self._paramvec)
         self._param_interposer = interposer
+        self._invalidate_digest(structure=True)
         if interposer is not None:  # add new interposer
             self._clean_paramvec()
             self._paramvec = self._ops_paramvec_to_model_paramvec(self._paramvec)
@@ -1429,6 +1489,66 @@ class OpModel(Model):
         
         return [tuple(_itertools.chain(*outcomes.values())) for outcomes in outcomes_list]  # concatenate outputs from all sep-povm-circuits
 
+    def compute_num_outcomes(self, circuit):
+        """
+        The number of outcomes of `circuit`, given by it's existing or implied POVM label.
+
+        Parameters
+        ----------
+        circuit : Circuit
+            The circuit to simplify
+
+        Returns
+        -------
+        int
+        """
+        return self.bulk_compute_num_outcomes([circuit])[0]
+
+    def bulk_compute_num_outcomes(self, circuits, split_circuits=None):
+        """
+        The number of outcomes of each of the circuits in a list of circuits.
+
+        Unlike `len(self.circuit_outcomes(circuit))`, this doesn't construct the outcome
+        labels, so it remains inexpensive for many-qubit POVMs, which have exponentially many outcomes.
+
+        Parameters
+        ----------
+        circuits : list of Circuits
+            list of Circuits to get the number of outcomes of.
+
+        split_circuits : list of tuples, optional (default None)
+            If specified, this is a list of tuples for each circuit corresponding to the splitting of
+            the circuit into the prep label, spam-free circuit, and povm label. This is the same format
+            produced by the :meth:split_circuit(s) method, and so this option can allow for accelerating this
+            method when that has previously been run.
+
+        Returns
+        -------
+        list of ints
+        """
+        if split_circuits is None:
+            split_circuits = self.split_circuits(circuits, split_prep=False)
+
+        has_instruments = self._has_instruments()
+        num_effects = {}  # cache of number of effects by POVM label
+        num_outcomes_list = []
+        for _, circuit_without_spam, povm_lbl in split_circuits:
+            if len(circuit_without_spam) > 0 and self._is_primitive_povm_layer_lbl(circuit_without_spam[-1]):
+                # `split_circuits` only splits off labels of entire POVMs, not, e.g., a marginalized POVM
+                # label such as `Mdefault:0:2`, in which case the default POVM label is returned instead
+                povm_lbl = circuit_without_spam[-1]
+                circuit_without_spam = circuit_without_spam[:-1]
+            if povm_lbl not in num_effects:
+                num_effects[povm_lbl] = self._num_effects_for_povm(povm_lbl)
+            num_outcomes = num_effects[povm_lbl]
+            if has_instruments:  # each outcome of an instrument multiplies the number of circuit outcomes
+                for layer_label in circuit_without_spam:
+                    for component in layer_label.components:
+                        if self._is_primitive_instrument_layer_lbl(component):
+                            num_outcomes *= len(self._member_labels_for_instrument(component))
+            num_outcomes_list.append(num_outcomes)
+        return num_outcomes_list
+
     def split_circuit(self, circuit, erroron=('prep', 'povm'), split_prep=True, split_povm=True):
         """
         Splits a circuit into prep_layer + op_layers + povm_layer components.
@@ -1785,8 +1905,7 @@ class OpModel(Model):
                 expanded_circuit_outcomes[_SeparatePOVMCircuit(circuit, povm_lbl, elabels)] = outcomes
 
         has_instruments = self._has_instruments()
-        unique_povm_labels = set(povm_lbls)
-        effect_label_dict = {povm_lbl: self._effect_labels_for_povm(povm_lbl) for povm_lbl in unique_povm_labels}
+        effect_label_dict = {}  # effect labels by POVM label, only created when all of a POVM's outcomes are needed
 
         for povm_lbl, circuit_without_povm, expanded_circuit_outcomes, observed_outcomes in zip(povm_lbls, circuits_without_povm, 
                                                                                                 expanded_circuit_outcomes_list, 
@@ -1797,14 +1916,14 @@ class OpModel(Model):
             if has_instruments:
                 add_expanded_circuit_outcomes(circuit_without_povm, (), ootree, start=0)
             else:
-                # It may be helpful to cache the set of elabels for a POVM (maybe within the model?) because
-                # currently the call to _effect_labels_for_povm may be a bottleneck.  It's needed, even when we have
-                # observed outcomes, because there may be some observed outcomes that aren't modeled (e.g. leakage states)
+                # When we have observed outcomes, only these are included (after removing any that aren't modeled,
+                # e.g. leakage states) - this avoids creating all of a many-qubit POVM's (exponentially many) labels.
                 if observed_outcomes is None:
+                    if povm_lbl not in effect_label_dict:
+                        effect_label_dict[povm_lbl] = self._effect_labels_for_povm(povm_lbl)
                     elabels = effect_label_dict[povm_lbl]
                 else:
-                    possible_lbls = set(effect_label_dict[povm_lbl])
-                    elabels = tuple([oo for oo in ootree.keys() if oo in possible_lbls])
+                    elabels = self._observed_effect_labels_for_povm(povm_lbl, ootree.keys())
                 outcomes = tuple(((elabel,) for elabel in elabels))
                 expanded_circuit_outcomes[_SeparatePOVMCircuit(circuit_without_povm, povm_lbl, elabels)] = outcomes
 
@@ -2171,6 +2290,45 @@ class OpModel(Model):
         """
         raise NotImplementedError("Derived classes must implement this!")
 
+    def _num_effects_for_povm(self, povm_lbl):
+        """
+        Gets the number of possible outcomes of POVM label `povm_lbl`.
+
+        Derived classes should override this to avoid creating all the effect labels.
+
+        Parameters
+        ----------
+        povm_lbl : Label
+            POVM label.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._effect_labels_for_povm(povm_lbl))
+
+    def _observed_effect_labels_for_povm(self, povm_lbl, observed_effect_labels):
+        """
+        Gets the labels in `observed_effect_labels` that correspond to possible outcomes of POVM label `povm_lbl`.
+
+        Derived classes should override this to avoid creating all the effect labels.
+
+        Parameters
+        ----------
+        povm_lbl : Label
+            POVM label.
+
+        observed_effect_labels : iterable
+            The (observed) effect labels to filter.
+
+        Returns
+        -------
+        tuple
+            The elements of `observed_effect_labels` (in order) that label outcomes of the POVM.
+        """
+        possible_lbls = set(self._effect_labels_for_povm(povm_lbl))
+        return tuple([elbl for elbl in observed_effect_labels if elbl in possible_lbls])
+
     def _member_labels_for_instrument(self, inst_lbl):
         """
         Get the member labels corresponding to the possible outcomes of the instrument labeled by `inst_lbl`.
@@ -2318,8 +2476,16 @@ class OpModel(Model):
         Copies any "tricky" member of this model into `copy_into`, before
         deep copying everything else within a .copy() operation.
         """
-        self._clean_paramvec()  # make sure _paramvec is valid before copying (necessary?)
-        copy_into._need_to_rebuild = True  # copy will have all gpindices = None, etc.
+        self._clean_paramvec()  # make sure _paramvec is valid before copying, so the copy can reuse its layout
+        # The copied members keep their gpindices (see `_copy_gpindices`), so the copy's parameter vector, labels,
+        # and bounds are just copies of ours and don't need to be rebuilt; only the member => parent links need
+        # to be restored (in _post_copy).  Parameter labels are immutable, so a shallow copy of them suffices.
+        copy_into._need_to_rebuild = False
+        copy_into._paramvec = self._paramvec.copy()
+        copy_into._paramlbls = self._paramlbls.copy() if (self._paramlbls is not None) else None
+        copy_into._param_bounds = self._param_bounds.copy() if (self._param_bounds is not None) else None
+        copy_into._index_mm_map = None  # refers to members, so is rebuilt (lazily) for the copy
+        copy_into._index_mm_label_map = None
         copy_into._opcaches = {}  # don't copy opcaches
         super(OpModel, self)._init_copy(copy_into, memo)
 
@@ -2329,6 +2495,9 @@ class OpModel(Model):
         the new model (`copy_into`) and its members.
         """
         copy_into._sim.model = copy_into  # set copy's `.model` link
+        parent_memo = set()  # re-link the copied members (and their sub-members) to `copy_into`, keeping gpindices
+        for _, obj in copy_into._iter_parameterized_objs():
+            obj.set_gpindices(obj.gpindices, copy_into, parent_memo)
         copy_into._reinit_opcaches()
         super(OpModel, self)._post_copy(copy_into, memo)
 
@@ -2343,11 +2512,7 @@ class OpModel(Model):
         """
         self._clean_paramvec()  # ensure _paramvec is rebuilt if needed
         if OpModel._pcheck: self._check_paramvec()
-        ret = Model.copy(self)
-        if self._param_bounds is not None and self.parameter_labels is not None:
-            ret._clean_paramvec()  # will *always* rebuild paramvec; do now so we can preserve param bounds
-            assert _np.all(self.parameter_labels == ret.parameter_labels)  # ensure ordering is the same
-            ret._param_bounds = self._param_bounds.copy()
+        ret = Model.copy(self)  # parameter vector, labels & bounds are copied as-is (see _init_copy)
         if OpModel._pcheck: ret._check_paramvec()
         return ret
 
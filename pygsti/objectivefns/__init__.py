@@ -16,4 +16,4 @@ from .objectivefns import ObjectiveFunctionBuilder, \
     Chi2Function, ChiAlphaFunction, FreqWeightedChi2Function, PoissonPicDeltaLogLFunction, DeltaLogLFunction, \
     MaxLogLFunction, TVDFunction, TimeDependentChi2Function, TimeDependentPoissonPicLogLFunction, LogLWildcardFunction
 
-from .objectivefns import ModelDatasetCircuitsStore, EvaluatedModelDatasetCircuitsStore
+from .objectivefns import ModelDatasetCircuitsStore, EvaluatedModelDatasetCircuitsStore, DatasetCircuitsPrecomputation
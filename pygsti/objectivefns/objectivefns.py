@@ -26,6 +26,8 @@ from pygsti.baseobjs.resourceallocation import ResourceAllocation as _ResourceAl
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 from pygsti.models.model import OpModel as _OpModel
+from pygsti.forwardsims.mapforwardsim import MapForwardSimulator as _MapForwardSimulator
+from pygsti.forwardsims.matrixforwardsim import MatrixForwardSimulator as _MatrixForwardSimulator
 
 
 def _objfn(objfn_cls, model, dataset, circuits=None,
@@ -936,16 +938,16 @@ class ModelDatasetCircuitsStore(object):
         """
         Detect omitted frequences (assumed to be 0) so we can compute objective fn correctly
         """
-        if self.firsts is None or force:
+        if self.indicesOfCircuitsWithOmittedData is None or force:  # (self.firsts is None when no data is omitted)
             # FUTURE: add any tracked memory? self.resource_alloc.add_tracked_memory(...)
             self.firsts = [] 
             self.indicesOfCircuitsWithOmittedData = []
 
             if self.outcome_count_by_circuit_cache is None:
                 #bulk compute the number of outcomes.
-                if isinstance(self.model, _OpModel) and self.split_circuits is not None:
-                    bulk_outcomes_list = self.model.bulk_circuit_outcomes(self.circuits, split_circuits=self.split_circuits)
-                    num_outcomes_list = [len(outcome_tup) for outcome_tup in bulk_outcomes_list]
+                if isinstance(self.model, _OpModel):
+                    num_outcomes_list = self.model.bulk_compute_num_outcomes(self.circuits,
+                                                                             split_circuits=self.split_circuits)
                 else:
                     num_outcomes_list = [self.model.compute_num_outcomes(c) for c in self.circuits]
             else:
@@ -992,11 +994,16 @@ class ModelDatasetCircuitsStore(object):
             counts = _np.empty(self.nelements, 'd')
             totals = _np.empty(self.nelements, 'd')
 
-            for (i, circuit) in enumerate(self.ds_circuits):
-                cnts = self.dataset[circuit].counts
-                idcs_for_idx = self.layout.indices_for_index(i)
-                totals[idcs_for_idx] = sum(cnts.values())  # dataset[opStr].
-                counts[idcs_for_idx] = [cnts.getitem_unsafe(x, 0) for x in self.layout.outcomes_for_index(i)]
+            if self.dataset.bStatic:  # extract all the counts at once from the data set's underlying arrays
+                self.dataset.fill_counts_and_totals(counts, totals, self.ds_circuits,
+                                                    [self.layout.indices_and_outcomes_for_index(i)
+                                                     for i in range(len(self.ds_circuits))])
+            else:
+                for (i, circuit) in enumerate(self.ds_circuits):
+                    cnts = self.dataset[circuit].counts
+                    idcs_for_idx = self.layout.indices_for_index(i)
+                    totals[idcs_for_idx] = sum(cnts.values())  # dataset[opStr].
+                    counts[idcs_for_idx] = [cnts.getitem_unsafe(x, 0) for x in self.layout.outcomes_for_index(i)]
 
             if self.circuits.circuit_weights is not None:
                 for i in range(len(self.ds_circuits)):  # multiply N's by weights
@@ -1008,6 +1015,35 @@ class ModelDatasetCircuitsStore(object):
             self.total_counts = totals
             self.freqs = counts / totals
 
+    def share_data_arrays(self, other):
+        """
+        Use the data-derived arrays of another store rather than computing them.
+
+        The count, total-count and frequency arrays and the indices of circuits with
+        omitted data depend only on the layout, data set and circuits of a store, and
+        are not modified once computed.  So stores that share these can share the arrays
+        too, and this method makes this store use any of these arrays that `other` has
+        already computed.
+
+        Parameters
+        ----------
+        other : ModelDatasetCircuitsStore
+            A store with the same layout, data set and circuits as this one.
+
+        Returns
+        -------
+        None
+        """
+        assert(other.layout is self.layout and other.dataset is self.dataset), \
+            "Can only share data arrays between stores with the same layout and data set!"
+        if other.counts is not None and other.total_counts is not None:
+            self.counts, self.total_counts, self.freqs = other.counts, other.total_counts, other.freqs
+        if other.indicesOfCircuitsWithOmittedData is not None:
+            self.firsts = other.firsts
+            self.indicesOfCircuitsWithOmittedData = other.indicesOfCircuitsWithOmittedData
+            if self.firsts is not None:
+                self.dprobs_omitted_rowsum = _np.empty((len(self.firsts), self.nparams), 'd')
+
 
 class EvaluatedModelDatasetCircuitsStore(ModelDatasetCircuitsStore):
     """
@@ -1017,6 +1053,7 @@ class EvaluatedModelDatasetCircuitsStore(ModelDatasetCircuitsStore):
     def __init__(self, mdc_store, verbosity):
         super().__init__(mdc_store.model, mdc_store.dataset, mdc_store.global_circuits, mdc_store.resource_alloc,
                          mdc_store.array_types, mdc_store.layout, verbosity, mdc_store.outcome_count_by_circuit_cache)
+        self.share_data_arrays(mdc_store)  # same layout, data set and circuits => same data-derived arrays
 
         # Memory check - see if there's enough memory to hold all the evaluated quantities
         #persistent_mem = self.layout.memory_estimate()
@@ -1045,6 +1082,206 @@ class EvaluatedModelDatasetCircuitsStore(ModelDatasetCircuitsStore):
         self.v = None  # for time dependence - rename to objfn_terms or objfn_lsvec?
 
 
+
+class DatasetCircuitsPrecomputation(object):
+    """
+    Quantities for a data set and lists of circuits that don't depend on how a model is parameterized.
+
+    When several models that differ only in their parameterization (e.g. the different
+    modes of a :class:`StandardGST` protocol) are fit to, or tested against, the same data
+    and circuit lists, much of the work needed to create a :class:`ModelDatasetCircuitsStore`
+    for each model and circuit list is the same: completing, splitting and expanding the
+    circuits, constructing the forward simulator's layouts (evaluation trees or prefix
+    tables, outcome index maps) and extracting count and frequency arrays from the data set.
+    This object performs that work once, when it is first needed, and shares the results
+    among the stores created by :meth:`create_mdc_store`.
+
+    Precomputed quantities are keyed by the aspects of a model that they depend upon: the
+    model's structure (state space, forward-simulator type and primitive layer labels) and,
+    for layouts, also the forward simulator's options, the number of model parameters and
+    the array types and resources the layout is created for.  Models that differ in these
+    can be used with the same object - they just don't share the corresponding quantities.
+    Models with the same structure are assumed to have the same outcome labels for the same
+    POVMs and instruments.
+
+    Parameters
+    ----------
+    dataset : DataSet
+        The data set.
+
+    circuit_lists : list
+        A list of :class:`CircuitList` objects (or lists of circuits).  Layouts are shared
+        for these lists; stores for other circuit lists can still be created, but their
+        layouts are not shared.
+    """
+
+    _LAYOUT_SIM_OPTIONS = ('_mode', '_max_cache_size', '_num_atoms', '_processor_grid', '_pblk_sizes')
+
+    def __init__(self, dataset, circuit_lists):
+        self.dataset = dataset
+        self.circuit_lists = [lst if isinstance(lst, _CircuitList) else _CircuitList(lst) for lst in circuit_lists]
+        self._list_indices = {self._circuit_list_key(lst): i for i, lst in enumerate(self.circuit_lists)}
+        self._circuit_caches = {}  # model-structure key => (layout-creation circuit cache, outcome counts)
+        self._layouts = {}  # (circuit-list index, layout key) => layout
+        self._data_stores = {}  # (circuit-list index, layout key) => store holding the layout's data arrays
+
+    @staticmethod
+    def _circuit_list_key(circuit_list):
+        aliases = circuit_list.op_label_aliases
+        weights = circuit_list.circuit_weights
+        return (tuple(circuit_list), frozenset(aliases.items()) if (aliases is not None) else None,
+                tuple(weights) if (weights is not None) else None)
+
+    @staticmethod
+    def _model_structure_key(model):
+        if not isinstance(model, _OpModel):
+            return None  # unknown structure => don't share anything
+        return (type(model.sim), model.state_space, model.primitive_prep_labels, model.primitive_povm_labels,
+                model.primitive_op_labels, model.primitive_instrument_labels)
+
+    def _layout_key(self, model, resource_alloc, array_types):
+        sim = model.sim
+        structure_key = self._model_structure_key(model)
+        if structure_key is None or not isinstance(sim, (_MatrixForwardSimulator, _MapForwardSimulator)):
+            return None  # other simulators' layouts can hold parameterization-dependent quantities
+        if getattr(sim, 'calclib', None) is not None and sim.calclib.__name__.endswith('_calc_generic'):
+            return None  # generic-evotype map layouts depend on which parameters each circuit depends on
+        mem_available = resource_alloc.mem_limit - resource_alloc.allocated_memory \
+            if (resource_alloc.mem_limit is not None) else None
+        return (structure_key, tuple(getattr(sim, nm, None) for nm in self._LAYOUT_SIM_OPTIONS),
+                model.num_params, tuple(array_types), id(resource_alloc.comm), resource_alloc.host_comm is not None,
+                mem_available, resource_alloc.distribute_method)
+
+    def circuit_structures(self, model):
+        """
+        The precomputed circuit structures for `model`.
+
+        Parameters
+        ----------
+        model : Model
+            The model.
+
+        Returns
+        -------
+        layout_creation_circuit_cache : dict or None
+            The cache of completed, split and expanded circuits passed to the forward
+            simulator's `create_layout` method, or `None` if the simulator doesn't use one.
+
+        outcome_count_by_circuit : dict
+            The number of outcomes of each circuit.
+        """
+        structure_key = self._model_structure_key(model)
+        if structure_key in self._circuit_caches:
+            return self._circuit_caches[structure_key]
+
+        unique_circuits = _CircuitList(list({ckt for circuit_list in self.circuit_lists for ckt in circuit_list}))
+        if isinstance(model.sim, (_MatrixForwardSimulator, _MapForwardSimulator)):
+            layout_circuit_cache = model.sim.create_copa_layout_circuit_cache(unique_circuits, model,
+                                                                              dataset=self.dataset)
+        else:
+            layout_circuit_cache = None
+
+        if isinstance(model, _OpModel):
+            # count (rather than construct) each circuit's outcomes, as there can be exponentially many of them
+            split_circuits = [layout_circuit_cache['split_circuits'][ckt] for ckt in unique_circuits] \
+                if (layout_circuit_cache is not None) else None  # reuse the layout cache's split circuits
+            outcome_count_by_circuit = dict(zip(unique_circuits, model.bulk_compute_num_outcomes(
+                unique_circuits, split_circuits=split_circuits)))
+        else:
+            outcome_count_by_circuit = {ckt: model.compute_num_outcomes(ckt) for ckt in unique_circuits}
+
+        if structure_key is not None:
+            self._circuit_caches[structure_key] = (layout_circuit_cache, outcome_count_by_circuit)
+        return layout_circuit_cache, outcome_count_by_circuit
+
+    def _list_index_and_layout_key(self, model, circuits, resource_alloc, array_types):
+        circuits = circuits if isinstance(circuits, _CircuitList) else _CircuitList(circuits)
+        list_index = self._list_indices.get(self._circuit_list_key(circuits), None)
+        layout_key = self._layout_key(model, resource_alloc, array_types)
+        return circuits, ((list_index, layout_key) if (list_index is not None and layout_key is not None) else None)
+
+    def layout(self, model, circuits, resource_alloc=None, array_types=(), verbosity=0):
+        """
+        The circuit-outcome-probability-array layout of `circuits` for `model`.
+
+        Parameters
+        ----------
+        model : Model
+            The model whose forward simulator creates the layout.
+
+        circuits : CircuitList
+            The circuits of the layout.
+
+        resource_alloc : ResourceAllocation, optional
+            The resources the layout is created for.
+
+        array_types : tuple, optional
+            The array types the layout is created for (see :meth:`ForwardSimulator.create_layout`).
+
+        verbosity : int, optional
+            Level of detail to print to stdout.
+
+        Returns
+        -------
+        CircuitOutcomeProbabilityArrayLayout
+        """
+        resource_alloc = _ResourceAllocation.cast(resource_alloc)
+        circuits, key = self._list_index_and_layout_key(model, circuits, resource_alloc, array_types)
+        if key is not None and key in self._layouts:
+            return self._layouts[key]
+
+        layout_circuit_cache, _ = self.circuit_structures(model)
+        if layout_circuit_cache is not None:
+            layout = model.sim.create_layout(circuits, self.dataset, resource_alloc, array_types, verbosity=verbosity,
+                                             layout_creation_circuit_cache=layout_circuit_cache)
+        else:
+            layout = model.sim.create_layout(circuits, self.dataset, resource_alloc, array_types, verbosity=verbosity)
+
+        if key is not None:
+            self._layouts[key] = layout
+        return layout
+
+    def create_mdc_store(self, model, circuits, resource_alloc=None, array_types=(), verbosity=0):
+        """
+        Create a store for `model`, the data set and `circuits` using precomputed quantities where possible.
+
+        Parameters
+        ----------
+        model : Model
+            The model.
+
+        circuits : CircuitList
+            The circuits.
+
+        resource_alloc : ResourceAllocation, optional
+            Available resources and how they should be allocated for computations.
+
+        array_types : tuple, optional
+            The array types the store's layout is created for (see :class:`ModelDatasetCircuitsStore`).
+
+        verbosity : int, optional
+            Level of detail to print to stdout.
+
+        Returns
+        -------
+        ModelDatasetCircuitsStore
+        """
+        resource_alloc = _ResourceAllocation.cast(resource_alloc)
+        layout = self.layout(model, circuits, resource_alloc, array_types, verbosity)
+        _, outcome_count_by_circuit = self.circuit_structures(model)
+        circuits, key = self._list_index_and_layout_key(model, circuits, resource_alloc, array_types)
+        mdc_store = ModelDatasetCircuitsStore(model, self.dataset, circuits, resource_alloc, array_types,
+                                              precomp_layout=layout, verbosity=verbosity,
+                                              outcome_count_by_circuit=outcome_count_by_circuit)
+        if key is not None:
+            if key in self._data_stores:
+                mdc_store.share_data_arrays(self._data_stores[key])
+            else:
+                mdc_store.add_count_vectors()
+                mdc_store.add_omitted_freqs()
+                self._data_stores[key] = mdc_store
+        return mdc_store
+
 class MDCObjectiveFunction(ObjectiveFunction, EvaluatedModelDatasetCircuitsStore):
     """
     An objective function whose probabilities and counts are given by a Model and DataSet, respectively.
@@ -220,46 +220,77 @@ class WildcardBudget(_NicelySerializable):
         return
 
     def precompute_for_same_probs_freqs(self, probs_in, freqs, layout):
-        tol = 1e-8  # for checking equality - same as in update_probs
-        tvd_precomp = 0.5 * _np.abs(probs_in - freqs)
-        A_precomp = _np.logical_and(probs_in > freqs + tol, freqs > 0)
-        B_precomp = _np.logical_and(probs_in < freqs - tol, freqs > 0)
-        C_precomp = _np.logical_and(freqs - tol <= probs_in, probs_in <= freqs + tol)  # freqs == probs
-        D_precomp = _np.logical_and(~C_precomp, freqs == 0)  # probs_in != freqs and freqs == 0
-        circuits = layout.circuits
-
-        precomp_info = []
-
-        for i, circ in enumerate(circuits):
-            elInds = layout.indices_for_index(i)
-            fvec = freqs[elInds]
-            qvec = probs_in[elInds]
-
-            initialTVD = sum(tvd_precomp[elInds])  # 0.5 * sum(_np.abs(qvec - fvec))
-
-            A = A_precomp[elInds]
-            B = B_precomp[elInds]
-            C = C_precomp[elInds]
-            D = D_precomp[elInds]
-            sum_fA = float(_np.sum(fvec[A]))
-            sum_fB = float(_np.sum(fvec[B]))
-            sum_qA = float(_np.sum(qvec[A]))
-            sum_qB = float(_np.sum(qvec[B]))
-            sum_qC = float(_np.sum(qvec[C]))
-            sum_qD = float(_np.sum(qvec[D]))
+        """
+        Compute quantities for speeding up repeated calls to :meth:`update_probs`.
 
-            min_qvec = _np.min(qvec)
+        The returned value can be passed to :meth:`update_probs` as `probs_freqs_precomp`
+        whenever the same `probs_in`, `freqs`, and `layout` are used, e.g. while
+        optimizing a wildcard budget.
 
-            # sort(abs(qvec[A] / fvec[A] - 1.0)) but abs and 1.0 irrelevant since ratio is always > 1
-            iA = sorted(zip(_np.nonzero(A)[0], qvec[A] / fvec[A]), key=lambda x: x[1])
+        Parameters
+        ----------
+        probs_in : numpy array
+            The input probabilities, usually computed by a :class:`Model`.
 
-            # sort(abs(1.0 - qvec[B] / fvec[B])) but abs and 1.0 irrelevant since ratio is always < 1
-            iB = sorted(zip(_np.nonzero(B)[0], qvec[B] / fvec[B]), key=lambda x: -x[1])
+        freqs : numpy array
+            An array of frequencies corresponding to each of the
+            outcome probabilites in `probs_in`.
 
-            precomp_info.append((A, B, C, D, sum_fA, sum_fB, sum_qA, sum_qB, sum_qC, sum_qD,
-                                 initialTVD, fvec, qvec, min_qvec, iA, iB))
+        layout : CircuitOutcomeProbabilityArrayLayout
+            The layout for `probs_in` and `freqs`.
 
-        return precomp_info
+        Returns
+        -------
+        dict
+        """
+        tol = 1e-8  # for checking equality - same as in update_probs
+        num_circuits = len(layout.circuits)
+        all_indices = _np.arange(layout.num_elements)
+        element_indices = [all_indices[layout.indices_for_index(i)] for i in range(num_circuits)]
+        element_circuits = _np.concatenate([_np.full(len(inds), i, _np.int64) for i, inds in enumerate(element_indices)])
+        element_indices = _np.concatenate(element_indices)
+        qvec = probs_in[element_indices]
+        fvec = freqs[element_indices]
+
+        # Negative probabilities are moved onto a circuit's largest probability, using up that much of its
+        # budget (see `_adjust_qvec_to_be_nonnegative_and_unit_sum`).  When the budget covers all of the
+        # negative probability and the largest probability stays the largest, the adjusted probabilities
+        # don't depend on the budget and are computed here; other circuits with negative probabilities
+        # are adjusted one at a time by `update_probs`.
+        negative = qvec < 0
+        neg_sums = _np.bincount(element_circuits, qvec * negative, num_circuits)
+        num_negative = _np.bincount(element_circuits, negative, num_circuits)
+        has_negative = num_negative > 0
+        order = _np.lexsort((-_np.arange(len(qvec)), qvec, element_circuits))  # so ties end with the first (argmax)
+        segments = element_circuits[order]
+        last = _np.nonzero(_np.append(segments[1:] != segments[:-1], True))[0]  # largest q of each circuit
+        largest = _np.full(num_circuits, -1, _np.int64); largest[segments[last]] = order[last]
+        max_q = _np.full(num_circuits, -_np.inf); max_q[segments[last]] = qvec[order[last]]
+        next_q = _np.full(num_circuits, -_np.inf)
+        has_next = segments[last - 1] == segments[last]
+        next_q[segments[last][has_next]] = qvec[order[last[has_next] - 1]]
+        adjustable = _np.logical_and(max_q + 2 * neg_sums >= 0,
+                                     _np.logical_or(num_negative == 1, max_q + neg_sums > next_q))
+        adjusted = _np.nonzero(_np.logical_and(has_negative, adjustable))[0]
+        irregular = _np.logical_and(has_negative, ~adjustable)
+
+        adjusted_qvec = _np.where(negative, 0.0, qvec)
+        adjusted_qvec[largest[adjusted]] += neg_sums[adjusted]
+        adjusted_sums = _np.bincount(element_circuits, adjusted_qvec, num_circuits)
+        renormalize = (_np.abs(1.0 - adjusted_sums) > tol)[element_circuits]
+        adjusted_qvec[renormalize] /= adjusted_sums[element_circuits[renormalize]]
+
+        keep = ~irregular[element_circuits]
+        breakpoints = _precompute_breakpoints(adjusted_qvec[keep], fvec[keep], element_indices[keep],
+                                              element_circuits[keep], num_circuits, tol)
+        breakpoints['budget_offsets'][adjusted] = neg_sums[adjusted]
+        breakpoints['unadjusted_initialTVD'] = _np.bincount(element_circuits, 0.5 * _np.abs(qvec - fvec), num_circuits)
+
+        return {'breakpoints': breakpoints, 'adjusted_circuits': adjusted,
+                'irregular_circuits': _np.nonzero(irregular)[0],
+                'negative_prob_circuits': {i: (layout.indices_for_index(i), probs_in[layout.indices_for_index(i)].copy(),
+                                               freqs[layout.indices_for_index(i)])
+                                           for i in _np.nonzero(has_negative)[0]}}
 
     def update_probs(self, probs_in, probs_out, freqs, layout, precomp=None, probs_freqs_precomp=None,
                      return_deriv=False):
@@ -273,6 +304,11 @@ class WildcardBudget(_NicelySerializable):
         maximizes the likelihood between `probs_out` and `freqs`. This method is
         the core function of a :class:`WildcardBudget`.
 
+        All circuits are updated at once: the outcomes of each circuit are sorted
+        by their probability-to-frequency ratio when `probs_freqs_precomp` is
+        computed, after which each update only compares every circuit's budget to
+        the (precomputed) TVDs at which outcomes stop being adjusted.
+
         Parameters
         ----------
         probs_in : numpy array
@@ -295,8 +331,8 @@ class WildcardBudget(_NicelySerializable):
         precomp : numpy.ndarray, optional
             A precomputed quantity for speeding up this calculation.
 
-        probs_freqs_precomp : list, optional
-            A precomputed list of quantities re-used when calling `update_probs`
+        probs_freqs_precomp : dict, optional
+            Precomputed quantities re-used when calling `update_probs`
             using the same `probs_in`, `freqs`, and `layout`.  Generate by calling
             :meth:`precompute_for_same_probs_freqs`.
 
@@ -318,149 +354,45 @@ class WildcardBudget(_NicelySerializable):
         tol = 1e-8  # for checking equality
         circuits = layout.circuits
         circuit_budgets = self.circuit_budgets(circuits, precomp)
-        p_deriv = _np.empty(layout.num_elements, 'd')
+        p_deriv = _np.empty(layout.num_elements, 'd') if return_deriv else None
 
         if probs_freqs_precomp is None:
             probs_freqs_precomp = self.precompute_for_same_probs_freqs(probs_in, freqs, layout)
 
-        for i, (circ, W, info) in enumerate(zip(circuits, circuit_budgets, probs_freqs_precomp)):
-            A, B, C, D, sum_fA, sum_fB, sum_qA, sum_qB, sum_qC, sum_qD, initialTVD, fvec, qvec, min_qvec, iA, iB = info
-            elInds = layout.indices_for_index(i)
+        _update_probs_at_breakpoints(probs_freqs_precomp['breakpoints'], circuit_budgets, probs_out, p_deriv, tol)
+
+        # circuits with negative probabilities whose adjustment depends on the budget
+        adjusted = probs_freqs_precomp['adjusted_circuits']
+        budget_offsets = probs_freqs_precomp['breakpoints']['budget_offsets']
+        irregular = _np.concatenate((probs_freqs_precomp['irregular_circuits'],
+                                     adjusted[circuit_budgets[adjusted] + budget_offsets[adjusted] <= 1e-8]))
+
+        adjusted_inds = []; adjusted_circuits = []; adjusted_qvecs = []; adjusted_fvecs = []
+        adjusted_budgets = circuit_budgets.copy()
+        for i in irregular:
+            elInds, qvec, fvec = probs_freqs_precomp['negative_prob_circuits'][i]
+            W = circuit_budgets[i]
+            if 0.5 * sum(_np.abs(qvec - fvec)) <= W + tol:  # TVD is already "in-budget" for this circuit
+                probs_out[elInds] = fvec
+                if return_deriv: p_deriv[elInds] = 0.0
+                continue
 
-            if initialTVD <= W + tol:  # TVD is already "in-budget" for this circuit - can adjust to fvec exactly
-                probs_out[elInds] = fvec  # _tools.matrixtools._fas(probs_out, (elInds,), fvec)
+            qvec, W = _adjust_qvec_to_be_nonnegative_and_unit_sum(qvec, W, _np.min(qvec), circuits[i], tol)
+            if 0.5 * sum(_np.abs(qvec - fvec)) <= W + tol:  # "in-budget" due to adjustment; leave as is
+                probs_out[elInds] = qvec
                 if return_deriv: p_deriv[elInds] = 0.0
                 continue
 
-            if min_qvec < 0 or abs(1.0 - sum(qvec)) > tol:  # note: this need to be the same tol
-
-                qvec, W = _adjust_qvec_to_be_nonnegative_and_unit_sum(qvec, W, min_qvec, circ, tol)
-
-                initialTVD = 0.5 * sum(_np.abs(qvec - fvec))  # update current TVD
-                if initialTVD <= W + tol:  # TVD is "in-budget" for this circuit due to adjustment; leave as is
-                    probs_out[elInds] = qvec
-                    if return_deriv: p_deriv[elInds] = 0.0
-                    continue
-
-                #recompute A-D b/c we've updated qvec
-                A = _np.logical_and(qvec > fvec, fvec > 0); sum_fA = sum(fvec[A]); sum_qA = sum(qvec[A])
-                B = _np.logical_and(qvec < fvec, fvec > 0); sum_fB = sum(fvec[B]); sum_qB = sum(qvec[B])
-                C = (qvec == fvec); sum_qC = sum(qvec[C])
-                D = _np.logical_and(qvec != fvec, fvec == 0); sum_qD = sum(qvec[D])
-
-                #update other values tht depend on qvec (same as in precompute_for_same_probs_freqs)
-                sum_qA = float(_np.sum(qvec[A]))
-                sum_qB = float(_np.sum(qvec[B]))
-                sum_qC = float(_np.sum(qvec[C]))
-                sum_qD = float(_np.sum(qvec[D]))
-                iA = sorted(zip(_np.nonzero(A)[0], qvec[A] / fvec[A]), key=lambda x: x[1])
-                iB = sorted(zip(_np.nonzero(B)[0], qvec[B] / fvec[B]), key=lambda x: -x[1])
-
-            indices_moved_to_C = []; alist_ptr = blist_ptr = 0
-
-            while alist_ptr < len(iA):  # and sum_fA > 0
-                # if alist_ptr < len(iA):  # always true when sum_fA > 0
-                jA, alphaA = iA[alist_ptr]
-                betaA = (1.0 - alphaA * sum_fA - sum_qC) / sum_fB
-                testA = min(alphaA - 1.0, 1.0 - betaA)
-
-                #if blist_ptr < len(iB):  # also always true
-                assert(sum_fB > 0), 'sum_fB = %g <= 0! %s qvec=%s fvec=%s' % (sum_fB, str(circ), str(qvec), str(fvec))
-                # sum_fB should always be > 0 - otherwise there's nowhere to take probability from
-
-                jB, betaB = iB[blist_ptr]
-                alphaB = (1.0 - betaB * sum_fB - sum_qC) / sum_fA
-                testB = min(alphaB - 1.0, 1.0 - betaB)
-
-                #Note: pushedSD = 0.0
-                if testA < testB:
-                    j, alpha_break, beta_break = jA, alphaA, betaA
-                    TVD_at_breakpt = 0.5 * (sum_qA - alpha_break * sum_fA
-                                            + beta_break * sum_fB - sum_qB
-                                            + sum_qD)  # - pushedSD)  # compute_tvd
-                    if TVD_at_breakpt <= W + tol: break  # exit loop
-
-                    # move j from A -> C
-                    sum_qA -= qvec[j]; sum_qC += qvec[j]; sum_fA -= fvec[j]
-                    alist_ptr += 1
-                else:
-                    j, alpha_break, beta_break = jB, alphaB, betaB
-                    TVD_at_breakpt = 0.5 * (sum_qA - alpha_break * sum_fA
-                                            + beta_break * sum_fB - sum_qB
-                                            + sum_qD)  # - pushedSD)  # compute_tvd
-                    if TVD_at_breakpt <= W + tol: break  # exit loop
-
-                    # move j from B -> C
-                    sum_qB -= qvec[j]; sum_qC += qvec[j]; sum_fB -= fvec[j]
-                    blist_ptr += 1
-                indices_moved_to_C.append(j)
-
-            else:  # if we didn't break due to TVD being small enough, continue to process with empty A-list:
-
-                while blist_ptr < len(iB):  # now sum_fA == 0 => alist_ptr is maxed out
-                    assert(sum_fB > 0)  # otherwise there's nowhere to take probability from
-                    j, beta_break = iB[blist_ptr]
-                    pushedSD = 1.0 - beta_break * sum_fB - sum_qC  # just used for TVD calc below
-
-                    TVD_at_breakpt = 0.5 * (sum_qA + beta_break * sum_fB - sum_qB
-                                            + sum_qD - pushedSD)  # compute_tvd
-
-                    if TVD_at_breakpt <= W + tol: break  # exit loop
-
-                    # move j from B -> C
-                    sum_qB -= qvec[j]; sum_qC += qvec[j]; sum_fB -= fvec[j]
-                    blist_ptr += 1
-                    indices_moved_to_C.append(j)
-                else:
-                    assert(False), "TVD should reach zero: qvec=%s, fvec=%s, W=%g" % (str(qvec), str(fvec), W)
-
-            #Now A,B,C are fixed to what they need to be for our given W
-            # test if len(A) > 0, make tol here *smaller* than that assigned to zero freqs above
-            if sum_fA > tol:
-                alpha = (sum_qA - sum_qB + sum_qD - 2 * W) / sum_fA if sum_fB == 0 else \
-                    (sum_qA - sum_qB + sum_qD + 1.0 - sum_qC - 2 * W) / (2 * sum_fA)  # compute_alpha
-                beta = _np.nan if sum_fB == 0 else (1.0 - alpha * sum_fA - sum_qC) / sum_fB  # beta_fn
-                pushedSD = 0.0  # assume initially that we don't need to push any TVD into the "D" set
-
-                dalpha_dW = -2 / sum_fA if sum_fB == 0 else -1 / sum_fA
-                dbeta_dW = 0.0 if sum_fB == 0 else (- dalpha_dW * sum_fA) / sum_fB
-                dpushedSD_dW = 0.0
-            else:  # fall back to this when len(A) == 0
-                beta = -(sum_qA - sum_qB + sum_qD + sum_qC - 1 - 2 * W) / (2 * sum_fB) if sum_fA == 0 else \
-                    -(sum_qA - sum_qB + sum_qD - 1.0 + sum_qC - 2 * W) / (2 * sum_fB)
-                # compute_beta (assumes pushedSD can be >0)
-                #beta = -(sum_qA - sum_qB + sum_qD - 2 * W) / sum_fB  # assumes pushedSD == 0
-                alpha = 0.0  # doesn't matter OLD: _alpha_fn(beta, A, B, C, qvec, fvec)
-                pushedSD = 1 - beta * sum_fB - sum_qC
-
-                dalpha_dW = 0.0
-                dbeta_dW = 2 / sum_fB if sum_fA == 0 else 1 / sum_fB
-                dpushedSD_dW = -dbeta_dW * sum_fB
-
-            #compute_pvec
-            pvec = fvec.copy()
-            pvec[A] = alpha * fvec[A]
-            pvec[B] = beta * fvec[B]
-            pvec[C] = qvec[C]
-            #indices_moved_to_C = [x[0] for x in sorted_indices_and_ratios[0:nMovedToC]]
-            pvec[indices_moved_to_C] = qvec[indices_moved_to_C]
-
-            pvec[D] = pushedSD * qvec[D] / sum_qD
-            probs_out[elInds] = pvec  # _tools.matrixtools._fas(probs_out, (elInds,), pvec)
-
-            assert(W > 0 or min_qvec < 0 or _np.linalg.norm(qvec - pvec) < 1e-6), \
-                "Probability shouldn't be updated when W=0!"  # don't check this when there are negative probs
-            #Check with other version (for debugging)
-            #check_pvec = update_circuit_probs(qvec.copy(), fvec.copy(), W)
-            #assert(_np.linalg.norm(check_pvec - pvec) < 1e-6)
-
-            if return_deriv:
-                p_deriv_wrt_W = _np.zeros(len(pvec), 'd')
-                p_deriv_wrt_W[A] = dalpha_dW * fvec[A]
-                p_deriv_wrt_W[B] = dbeta_dW * fvec[B]
-                p_deriv_wrt_W[indices_moved_to_C] = 0.0
-                p_deriv_wrt_W[D] = dpushedSD_dW * qvec[D] / sum_qD
-                p_deriv[elInds] = p_deriv_wrt_W
+            adjusted_budgets[i] = W
+            adjusted_inds.append(_np.arange(layout.num_elements)[elInds])
+            adjusted_circuits.append(_np.full(len(qvec), i, _np.int64))
+            adjusted_qvecs.append(qvec); adjusted_fvecs.append(fvec)
+
+        if len(adjusted_inds) > 0:
+            adjusted_breakpoints = _precompute_breakpoints(
+                _np.concatenate(adjusted_qvecs), _np.concatenate(adjusted_fvecs), _np.concatenate(adjusted_inds),
+                _np.concatenate(adjusted_circuits), len(circuits), tol)
+            _update_probs_at_breakpoints(adjusted_breakpoints, adjusted_budgets, probs_out, p_deriv, tol)
 
         return p_deriv if return_deriv else None
 
@@ -828,6 +760,126 @@ def _adjust_qvec_to_be_nonnegative_and_unit_sum(qvec, W, min_qvec, circ=None, to
     return qvec, W
 
 
+def _segment_suffix_sums(values, positions):
+    """ Sums of `values[k:]` over the elements `k` of each segment (`values` sorted by segment). """
+    if len(values) == 0: return _np.zeros(0, 'd')
+    starts = _np.flatnonzero(positions == 0)
+    segment_index = _np.cumsum(positions == 0) - 1  # index into `starts` of each element's segment
+    preceding = _np.cumsum(values) - values  # sum of the (flat) values before each element
+    return _np.add.reduceat(values, starts)[segment_index] - (preceding - preceding[starts][segment_index])
+
+
+def _sort_within_segments(keys, segments):
+    """ Returns the sorting permutation of `keys` within each segment and each element's position in its segment. """
+    order = _np.lexsort((keys, segments))  # stable, like `sorted`
+    sorted_segments = segments[order]
+    starts = _np.searchsorted(sorted_segments, sorted_segments, side='left')
+    return order, sorted_segments, _np.arange(len(order)) - starts
+
+
+def _precompute_breakpoints(qvec, fvec, element_indices, element_circuits, num_circuits, tol):
+    """
+    Precomputes, for every circuit at once, the TVDs at which `update_probs` stops adjusting each outcome.
+
+    `update_probs` scales the "A" outcomes (q > f) down to alpha * f and the "B" outcomes (q < f) up to
+    beta * f, leaving an outcome at q once its ratio q/f is closer to 1 than alpha (or beta).  The TVD
+    at the breakpoint where alpha (beta) equals an outcome's ratio only depends on the outcomes of the
+    same set that are further from 1, so sorting each circuit's A and B outcomes by ratio and taking
+    suffix sums gives every breakpoint TVD up front.  An outcome is adjusted exactly when its
+    breakpoint TVD exceeds the circuit budget.
+    """
+    A = _np.logical_and(qvec > fvec + tol, fvec > 0)
+    B = _np.logical_and(qvec < fvec - tol, fvec > 0)
+    C = _np.logical_and(fvec - tol <= qvec, qvec <= fvec + tol)  # freqs == probs
+    D = _np.logical_and(~C, fvec == 0)  # probs_in != freqs and freqs == 0
+
+    sum_qD = _np.bincount(element_circuits, qvec * D, num_circuits)
+    info = {'element_indices': element_indices, 'element_circuits': element_circuits, 'qvec': qvec, 'fvec': fvec,
+            'C': C, 'D': D, 'num_circuits': num_circuits, 'sum_qD': sum_qD,
+            'sum_qC': _np.bincount(element_circuits, qvec * C, num_circuits),
+            'initialTVD': _np.bincount(element_circuits, 0.5 * _np.abs(qvec - fvec), num_circuits),
+            'budget_offsets': _np.zeros(num_circuits, 'd')}  # budget used up when computing `qvec`
+    info['unadjusted_initialTVD'] = info['initialTVD']  # TVD before any budget-independent adjustment of `qvec`
+
+    for name, mask, sign in (('A', A, 1.0), ('B', B, -1.0)):
+        inds = _np.nonzero(mask)[0]
+        ratios = qvec[inds] / fvec[inds]
+        # A ratios (> 1) ascending, B ratios (< 1) descending: closest to 1 first, as the breakpoints are reached
+        order, segments, positions = _sort_within_segments(sign * ratios, element_circuits[inds])
+        inds, ratios = inds[order], ratios[order]
+        sum_q = _segment_suffix_sums(qvec[inds], positions)
+        sum_f = _segment_suffix_sums(fvec[inds], positions)
+        breakpoint_tvds = sum_qD[segments] + sum_q - ratios * sum_f if name == 'A' else ratios * sum_f - sum_q
+        info[name] = (inds, segments, breakpoint_tvds)
+    return info
+
+
+def _update_probs_at_breakpoints(info, circuit_budgets, probs_out, p_deriv, tol):
+    """
+    Applies `circuit_budgets` to the circuits precomputed by :func:`_precompute_breakpoints`.
+
+    Writes the updated probabilities into `probs_out` and, if `p_deriv` is not None, their derivatives
+    with respect to the circuit budgets into `p_deriv`.
+    """
+    qvec, fvec, num_circuits = info['qvec'], info['fvec'], info['num_circuits']
+    W = circuit_budgets + info['budget_offsets']
+
+    sums = {}
+    for name in ('A', 'B'):
+        inds, segments, breakpoint_tvds = info[name]
+        moved = breakpoint_tvds > W[segments] + tol  # outcomes left at q (moved to set "C")
+        sums[name] = (moved,
+                      _np.bincount(segments, qvec[inds] * ~moved, num_circuits),
+                      _np.bincount(segments, fvec[inds] * ~moved, num_circuits),
+                      _np.bincount(segments, qvec[inds] * moved, num_circuits))
+    movedA, sum_qA, sum_fA, sum_qA_moved = sums['A']
+    movedB, sum_qB, sum_fB, sum_qB_moved = sums['B']
+    sum_qC = info['sum_qC'] + sum_qA_moved + sum_qB_moved
+    sum_qD = info['sum_qD']
+
+    with _np.errstate(divide='ignore', invalid='ignore'):
+        # when len(A) > 0
+        noB = sum_fB == 0
+        alpha = _np.where(noB, (sum_qA - sum_qB + sum_qD - 2 * W) / sum_fA,
+                          (sum_qA - sum_qB + sum_qD + 1.0 - sum_qC - 2 * W) / (2 * sum_fA))  # compute_alpha
+        beta = _np.where(noB, _np.nan, (1.0 - alpha * sum_fA - sum_qC) / sum_fB)  # beta_fn
+        dalpha_dW = _np.where(noB, -2 / sum_fA, -1 / sum_fA)
+        dbeta_dW = _np.where(noB, 0.0, (-dalpha_dW * sum_fA) / sum_fB)
+
+        # fall back to this when len(A) == 0 (compute_beta, assumes pushedSD can be > 0)
+        hasA = sum_fA > tol
+        beta = _np.where(hasA, beta, -(sum_qA - sum_qB + sum_qD + sum_qC - 1 - 2 * W) / (2 * sum_fB))
+        pushedSD = _np.where(hasA, 0.0, 1 - beta * sum_fB - sum_qC)
+        alpha = _np.where(hasA, alpha, 0.0)
+        dalpha_dW = _np.where(hasA, dalpha_dW, 0.0)
+        dbeta_dW = _np.where(hasA, dbeta_dW, 1 / sum_fB)
+        dpushedSD_dW = _np.where(hasA, 0.0, -dbeta_dW * sum_fB)
+        D_scale = _np.where(sum_qD > 0, 1 / sum_qD, 0.0)
+
+    #compute_pvec
+    indsA, segmentsA, _ = info['A']
+    indsB, segmentsB, _ = info['B']
+    element_circuits, D = info['element_circuits'], info['D']
+    pvec = fvec.copy()
+    pvec[info['C']] = qvec[info['C']]
+    pvec[indsA] = _np.where(movedA, qvec[indsA], alpha[segmentsA] * fvec[indsA])
+    pvec[indsB] = _np.where(movedB, qvec[indsB], beta[segmentsB] * fvec[indsB])
+    pvec[D] = (pushedSD * D_scale)[element_circuits[D]] * qvec[D]
+
+    # TVD is already "in-budget" for a circuit - can adjust to fvec exactly (or, if only in-budget after
+    # adjusting qvec, leave as is)
+    in_budget = (info['unadjusted_initialTVD'] <= circuit_budgets + tol)[element_circuits]
+    in_budget_when_adjusted = (info['initialTVD'] <= W + tol)[element_circuits]
+    probs_out[info['element_indices']] = _np.where(in_budget, fvec, _np.where(in_budget_when_adjusted, qvec, pvec))
+
+    if p_deriv is not None:
+        p_deriv_wrt_W = _np.zeros(len(pvec), 'd')
+        p_deriv_wrt_W[indsA] = _np.where(movedA, 0.0, dalpha_dW[segmentsA] * fvec[indsA])
+        p_deriv_wrt_W[indsB] = _np.where(movedB, 0.0, dbeta_dW[segmentsB] * fvec[indsB])
+        p_deriv_wrt_W[D] = (dpushedSD_dW * D_scale)[element_circuits[D]] * qvec[D]
+        p_deriv[info['element_indices']] = _np.where(in_budget | in_budget_when_adjusted, 0.0, p_deriv_wrt_W)
+
+
 def update_circuit_probs(probs, freqs, circuit_budget, circuit=None):
     qvec = probs
     fvec = freqs
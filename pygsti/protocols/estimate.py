@@ -81,8 +81,8 @@ class Estimate(_MongoSerializable):
         ret = cls.__new__(cls)
         _MongoSerializable.__init__(ret)
         ret.__dict__.update(_io.load_meta_based_dir(_pathlib.Path(dirname), 'auxfile_types', quick_load=quick_load))
-        for crf in ret.confidence_region_factories.values():
-            crf.set_parent(ret)  # re-link confidence_region_factories
+        _io.metadir.apply_when_loaded(ret.confidence_region_factories,
+                                      lambda crf: crf.set_parent(ret))  # re-link confidence_region_factories
         return ret
 
     @classmethod
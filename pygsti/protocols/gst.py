@@ -1279,7 +1279,7 @@ class GateSetTomography(_proto.Protocol):
         self.unreliable_ops = ('Gcnot', 'Gcphase', 'Gms', 'Gcn', 'Gcx', 'Gcz')
 
     def run(self, data, memlimit=None, comm=None, checkpoint=None, checkpoint_path=None, disable_checkpointing=False,
-            simulator: Optional[ForwardSimulator.Castable]=None):
+            simulator: Optional[ForwardSimulator.Castable]=None, precomputation=None):
         """
         Run this protocol on `data`.
 
@@ -1317,6 +1317,10 @@ class GateSetTomography(_proto.Protocol):
                 fwdsim = ForwardSimulator.cast(simulator),
             and we set the .sim attribute of every Model we encounter to fwdsim.
 
+        precomputation : DatasetCircuitsPrecomputation, optional
+            Precomputed, parameterization-independent quantities for `data` to use and
+            add to, e.g. so they can be shared with other protocols run on the same data.
+
         Returns
         -------
         ModelEstimateResults
@@ -1408,7 +1412,7 @@ class GateSetTomography(_proto.Protocol):
         gst_iter_generator = _alg.iterative_gst_generator( 
             ds, seed_model, bulk_circuit_lists, self.optimizer,
             self.objfn_builders.iteration_builders, self.objfn_builders.final_builders,
-            resource_alloc, starting_idx, printer)
+            resource_alloc, starting_idx, printer, precomputation)
 
         #The optima don't actually get used right now, so don't bother trying to
         #checkpoint these.
@@ -1773,7 +1777,7 @@ class StandardGST(_proto.Protocol):
         self.starting_point = {}  # a dict whose keys are modes
 
     def run(self, data, memlimit=None, comm=None, checkpoint=None, checkpoint_path=None,
-            disable_checkpointing=False, simulator: Optional[ForwardSimulator.Castable]=None):
+            disable_checkpointing=False, simulator: Optional[ForwardSimulator.Castable]=None, num_processes=1):
         """
         Run this protocol on `data`.
 
@@ -1811,6 +1815,12 @@ class StandardGST(_proto.Protocol):
                 fwdsim = ForwardSimulator.cast(simulator),
             and we set the .sim attribute of every Model we encounter to fwdsim.
 
+        num_processes : int, optional
+            The number of processes used to run the different modes concurrently (each
+            mode is run by a single process).  Only used when `comm` is None.  The
+            circuit structures, layouts and data arrays that don't depend on a mode's
+            parameterization are shared by the modes in any case.
+
         Returns
         -------
         ProtocolResults
@@ -1873,72 +1883,114 @@ class StandardGST(_proto.Protocol):
             else:
                 NotImplementedError('The only currently valid checkpoint inputs are None and StandardGSTCheckpoint.')
 
-        ret = ModelEstimateResults(data, self)
-        with printer.progress_logging(1):
-            for i, mode in enumerate(modes):
-                printer.show_progress(i, len(modes), prefix='-- Std Practice: ', suffix=' (%s) --' % mode)
-                if disable_checkpointing:
-                    checkpoint_path = None
-                    child_checkpoint = None
-                else:
-                    child_checkpoint = checkpoint.children[mode]
-                    #The line below is for compatibility with Python 3.8 and lower.
-                    checkpoint_path = checkpoint_path_base.with_name(f"{checkpoint_path_base.stem}_{mode.replace(' ', '_')}")
-                    #The line below only works for python 3.9+
-                    #checkpoint_path = checkpoint_path_base.with_stem(f"{checkpoint_path_base.stem}_{mode.replace(' ', '_')}")
-                if mode == "Target":
-                    if target_model is None:
-                        raise ValueError(("Must specify `target_model` when creating this StandardGST, since one could"
-                                          " not be inferred from the given experiment design."))
-                    
-                    mdltest = _ModelTest(target_model, target_model, self.gaugeopt_suite,
-                                         mt_builder, self.badfit_options, verbosity=printer - 1, name=mode)
-                    result = mdltest.run(data, memlimit, comm,
-                                         disable_checkpointing=disable_checkpointing,
-                                         checkpoint=child_checkpoint,
-                                         checkpoint_path=checkpoint_path)
-                    ret.add_estimates(result)
+        # Mode-independent quantities (circuit structures, layouts, data arrays) are computed
+        # once and shared by all the modes.
+        circuit_lists = data.edesign.circuit_lists
+        aliases = circuit_lists[-1].op_label_aliases if isinstance(circuit_lists[-1], _CircuitList) else None
+        precomputation = _objfns.DatasetCircuitsPrecomputation(data.dataset, [_CircuitList(lst, aliases)
+                                                                              for lst in circuit_lists])
 
-                elif mode in models_to_test:
-                    mdl = models_to_test[mode]
-                    if simulator is not None:
-                        mdl.sim = simulator
-                    mdltest = _ModelTest(mdl, target_model, self.gaugeopt_suite,
-                                         None, self.badfit_options, verbosity=printer - 1, name=mode)
-                    result = mdltest.run(data, memlimit, comm,
-                                         disable_checkpointing=disable_checkpointing,
-                                         checkpoint=child_checkpoint,
-                                         checkpoint_path=checkpoint_path)
-                    ret.add_estimates(result)
+        mode_args = []
+        for mode in modes:
+            if disable_checkpointing:
+                mode_args.append((mode, None, None))
+            else:
+                #The line below is for compatibility with Python 3.8 and lower.
+                mode_checkpoint_path = checkpoint_path_base.with_name(
+                    f"{checkpoint_path_base.stem}_{mode.replace(' ', '_')}")
+                #The line below only works for python 3.9+
+                #checkpoint_path = checkpoint_path_base.with_stem(f"{checkpoint_path_base.stem}_{mode.replace(' ', '_')}")
+                mode_args.append((mode, checkpoint.children[mode], mode_checkpoint_path))
 
-                else:
-                    if target_model is None:
-                        raise ValueError(("Must specify `target_model` when creating this StandardGST, since one could"
-                                          " not be inferred from the given experiment design."))
-
-                    #Try to interpret `mode` as a parameterization
-                    parameterization = mode  # for now, 1-1 correspondence
-                    initial_model = target_model.copy()
-
-                    try:
-                        initial_model.set_all_parameterizations(parameterization)
-                    except ValueError as e:
-                        raise ValueError("Could not interpret '%s' mode as a parameterization! Details:\n%s"
-                                         % (mode, str(e)))
-
-                    initial_model = GSTInitialModel(initial_model, self.starting_point.get(mode, None))
-                    if simulator is not None:
-                        initial_model.sim = simulator
-                    gst = GST(initial_model, self.gaugeopt_suite, self.objfn_builders,
-                              self.optimizer, self.badfit_options, verbosity=printer - 1, name=mode)
-                    result = gst.run(data, memlimit, comm,
-                                     disable_checkpointing=disable_checkpointing,
-                                     checkpoint=child_checkpoint,
-                                     checkpoint_path=checkpoint_path)
+        ret = ModelEstimateResults(data, self)
+        if num_processes > 1 and len(modes) > 1 and comm is None:
+            if target_model is not None:
+                precomputation.circuit_structures(target_model)  # so the workers needn't each compute these
+            printer.log("-- Std Practice: running %d modes using %d processes --" % (len(modes), num_processes))
+            shared_args = (self, data, memlimit, target_model, models_to_test, mt_builder, simulator,
+                           disable_checkpointing, precomputation)  # one object, so it's sent to workers once
+            estimates_list = _tools.mptools.starmap_with_kwargs(
+                _run_standard_gst_mode, len(modes), min(num_processes, len(modes)),
+                [(shared_args,) + args for args in mode_args], [{}] * len(modes), broadcast=True)
+            for estimates in estimates_list:
+                for estimate_key, estimate in estimates.items():
+                    estimate.set_parent(ret)
+                    ret.add_estimate(estimate, estimate_key)
+        else:
+            with printer.progress_logging(1):
+                for i, (mode, child_checkpoint, mode_checkpoint_path) in enumerate(mode_args):
+                    printer.show_progress(i, len(modes), prefix='-- Std Practice: ', suffix=' (%s) --' % mode)
+                    result = self._run_mode(mode, data, memlimit, comm, target_model, models_to_test, mt_builder,
+                                            simulator, disable_checkpointing, child_checkpoint, mode_checkpoint_path,
+                                            precomputation, printer - 1)
                     ret.add_estimates(result)
 
         return ret
 
+    def _run_mode(self, mode, data, memlimit, comm, target_model, models_to_test, mt_builder, simulator,
+                  disable_checkpointing, checkpoint, checkpoint_path, precomputation, verbosity):
+        """ Run the model test or GST protocol of a single mode, returning its results """
+        if mode == "Target":
+            if target_model is None:
+                raise ValueError(("Must specify `target_model` when creating this StandardGST, since one could"
+                                  " not be inferred from the given experiment design."))
+
+            mdltest = _ModelTest(target_model, target_model, self.gaugeopt_suite,
+                                 mt_builder, self.badfit_options, verbosity=verbosity, name=mode)
+            return mdltest.run(data, memlimit, comm,
+                               disable_checkpointing=disable_checkpointing,
+                               checkpoint=checkpoint,
+                               checkpoint_path=checkpoint_path,
+                               precomputation=precomputation)
+
+        elif mode in models_to_test:
+            mdl = models_to_test[mode]
+            if simulator is not None:
+                mdl.sim = simulator
+            mdltest = _ModelTest(mdl, target_model, self.gaugeopt_suite,
+                                 None, self.badfit_options, verbosity=verbosity, name=mode)
+            return mdltest.run(data, memlimit, comm,
+                               disable_checkpointing=disable_checkpointing,
+                               checkpoint=checkpoint,
+                               checkpoint_path=checkpoint_path,
+                               precomputation=precomputation)
+
+        else:
+            if target_model is None:
+                raise ValueError(("Must specify `target_model` when creating this StandardGST, since one could"
+                                  " not be inferred from the given experiment design."))
+
+            #Try to interpret `mode` as a parameterization
+            parameterization = mode  # for now, 1-1 correspondence
+            initial_model = target_model.copy()
+
+            try:
+                initial_model.set_all_parameterizations(parameterization)
+            except ValueError as e:
+                raise ValueError("Could not interpret '%s' mode as a parameterization! Details:\n%s"
+                                 % (mode, str(e)))
+
+            initial_model = GSTInitialModel(initial_model, self.starting_point.get(mode, None))
+            if simulator is not None:
+                initial_model.sim = simulator
+            gst = GST(initial_model, self.gaugeopt_suite, self.objfn_builders,
+                      self.optimizer, self.badfit_options, verbosity=verbosity, name=mode)
+            return gst.run(data, memlimit, comm,
+                           disable_checkpointing=disable_checkpointing,
+                           checkpoint=checkpoint,
+                           checkpoint_path=checkpoint_path,
+                           precomputation=precomputation)
+
+
+def _run_standard_gst_mode(shared_args, mode, checkpoint, checkpoint_path):
+    """ Runs a single mode of a StandardGST protocol in a worker process and returns its estimates """
+    (protocol, data, memlimit, target_model, models_to_test, mt_builder, simulator,
+     disable_checkpointing, precomputation) = shared_args
+    result = protocol._run_mode(mode, data, memlimit, None, target_model, models_to_test, mt_builder, simulator,
+                                disable_checkpointing, checkpoint, checkpoint_path, precomputation,
+                                protocol.verbosity - 1)
+    return result.estimates  # (estimates are sent back without their parent, which holds the data)
+
 
 # ------------------ HELPER FUNCTIONS -----------------------------------
 
@@ -2413,12 +2465,15 @@ def _compute_1d_reference_values_and_name(estimate, badfit_options, gaugeopt_sui
                 povmops_dict = {}  # HACK - need to rewrite povm_diamonddist below to work
 
             dd = {}
-            for key, op in operations_dict.items():
-                dd[key] = 0.5 * _tools.diamonddist(op.to_dense(), targetops_dict[key].to_dense())
+            op_keys = list(operations_dict.keys())
+            dists = _tools.diamonddists([operations_dict[key].to_dense() for key in op_keys],
+                                        [targetops_dict[key].to_dense() for key in op_keys])
+            for key, dist in zip(op_keys, dists):
+                dd[key] = 0.5 * dist
                 if dd[key] < 0:  # indicates that diamonddist failed (cvxpy failure)
                     _warnings.warn(("Diamond distance failed to compute %s reference value for 1D wildcard budget!"
                                     " Falling back to trace distance.") % str(key))
-                    dd[key] = _tools.jtracedist(op.to_dense(), targetops_dict[key].to_dense())
+                    dd[key] = _tools.jtracedist(operations_dict[key].to_dense(), targetops_dict[key].to_dense())
 
             spamdd = {}
             for key, op in preps_dict.items():
@@ -2437,12 +2492,16 @@ def _compute_1d_reference_values_and_name(estimate, badfit_options, gaugeopt_sui
             gaugeopt_models = [estimate.models[lbl] for lbl in gaugeopt_suite.gaugeopt_suite_names]
             dd = {lbl: {} for lbl in gaugeopt_suite.gaugeopt_suite_names}
             for gaugeopt_model, lbl in zip(gaugeopt_models, gaugeopt_suite.gaugeopt_suite_names):
-                for key, op in gaugeopt_model.operations.items():
-                    dd[lbl][key] = 0.5 * _tools.diamonddist(op.to_dense(), target_model.operations[key].to_dense())
+                op_keys = list(gaugeopt_model.operations.keys())
+                dists = _tools.diamonddists([gaugeopt_model.operations[key].to_dense() for key in op_keys],
+                                            [target_model.operations[key].to_dense() for key in op_keys])
+                for key, dist in zip(op_keys, dists):
+                    dd[lbl][key] = 0.5 * dist
                     if dd[lbl][key] < 0:  # indicates that diamonddist failed (cvxpy failure)
                         _warnings.warn(("Diamond distance failed to compute %s reference value for 1D wildcard budget!"
                                         " Falling back to trace distance.") % str(key))
-                        dd[lbl][key] = _tools.jtracedist(op.to_dense(), target_model.operations[key].to_dense())
+                        dd[lbl][key] = _tools.jtracedist(gaugeopt_model.operations[key].to_dense(),
+                                                         target_model.operations[key].to_dense())
 
             spamdd = {}
             for key, op in gaugeopt_model.preps.items():
@@ -2903,8 +2962,7 @@ class ModelEstimateResults(_proto.ProtocolResults):
         """
         ret = super().from_dir(dirname, name, preloaded_data, quick_load)  # loads members; doesn't make parent "links"
         ret.circuit_lists = ret._create_circuit_lists(ret.data.edesign)  # because circuit_lists auxfile_type == 'none'
-        for est in ret.estimates.values():
-            est.parent = ret  # link estimate to parent results object
+        _io.metadir.apply_when_loaded(ret.estimates, lambda est: setattr(est, 'parent', ret))  # link to parent
         return ret
 
     @classmethod
@@ -15,7 +15,6 @@ import warnings as _warnings
 import pathlib as _pathlib
 from typing import Optional
 from pygsti.baseobjs.profiler import DummyProfiler as _DummyProfiler
-from pygsti.objectivefns.objectivefns import ModelDatasetCircuitsStore as _ModelDatasetCircuitStore
 from pygsti.protocols.estimate import Estimate as _Estimate
 from pygsti.protocols import protocol as _proto
 from pygsti import baseobjs as _baseobjs
@@ -129,7 +128,7 @@ class ModelTest(_proto.Protocol):
         self.unreliable_ops = ('Gcnot', 'Gcphase', 'Gms', 'Gcn', 'Gcx', 'Gcz')
 
     def run(self, data, memlimit=None, comm=None, checkpoint=None, checkpoint_path=None, disable_checkpointing=False,
-            simulator: Optional[ForwardSimulator.Castable]=None):
+            simulator: Optional[ForwardSimulator.Castable]=None, precomputation=None):
         """
         Run this protocol on `data`.
 
@@ -167,6 +166,10 @@ class ModelTest(_proto.Protocol):
                 fwdsim = ForwardSimulator.cast(simulator),
             and we set the .sim attribute of every Model we encounter to fwdsim.
 
+        precomputation : DatasetCircuitsPrecomputation, optional
+            Precomputed, parameterization-independent quantities for `data` to use and
+            add to, e.g. so they can be shared with other protocols run on the same data.
+
         Returns
         -------
         ModelEstimateResults
@@ -235,9 +238,15 @@ class ModelTest(_proto.Protocol):
             chi2k_distributed_vals = []
 
         assert(len(self.objfn_builders) == 1), "Only support for a single objective function so far."
+        if precomputation is None:
+            precomputation = _objfns.DatasetCircuitsPrecomputation(ds, bulk_circuit_lists)
+        objfn_array_types = self.objfn_builders[0].compute_array_types(('fn',), the_model.sim)
+
         for i in range(starting_idx, len(bulk_circuit_lists)):
             circuit_list = bulk_circuit_lists[i]
-            objective = self.objfn_builders[0].build(the_model, ds, circuit_list, resource_alloc, printer - 1)
+            objfn_store = precomputation.create_mdc_store(the_model, circuit_list, resource_alloc, objfn_array_types,
+                                                          printer - 1)
+            objective = self.objfn_builders[0].build_from_store(objfn_store, printer - 1)
             f = objective.fn(the_model.to_vector())
             objfn_vals.append(f)
             chi2k_distributed_vals.append(objective.chi2k_distributed_qty(f))
@@ -252,7 +261,7 @@ class ModelTest(_proto.Protocol):
                 if resource_alloc.comm_rank == 0:
                     checkpoint.write(f'{checkpoint_path}_iteration_{i}.json')
 
-        mdc_store = _ModelDatasetCircuitStore(the_model, ds, bulk_circuit_lists[-1], resource_alloc)
+        mdc_store = precomputation.create_mdc_store(the_model, bulk_circuit_lists[-1], resource_alloc)
         parameters = _collections.OrderedDict()
         parameters['final_objfn_builder'] = self.objfn_builders[-1]
         parameters['final_mdc_store'] = mdc_store
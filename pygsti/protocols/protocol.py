@@ -11,8 +11,10 @@ Protocol object
 # ***************************************************************************************************
 import collections as _collections
 import copy as _copy
+import functools as _functools
 import numpy as _np
 import itertools as _itertools
+import multiprocessing as _mp
 import pathlib as _pathlib
 import warnings as _warnings
 
@@ -22,6 +24,7 @@ from pygsti import circuits as _circuits
 from pygsti import data as _data
 from pygsti.tools import NamedDict as _NamedDict
 from pygsti.tools import listtools as _lt
+from pygsti.tools import mpitools as _mpit
 from pygsti.tools.dataframetools import _process_dataframe
 from pygsti.baseobjs.mongoserializable import MongoSerializable as _MongoSerializable
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
@@ -293,6 +296,44 @@ class ProtocolRunner(object):
         """
         raise NotImplementedError()
 
+    def _protocol_tasks(self, results_dir):
+        """
+        The protocols run by this runner and the data-tree nodes they're run at.
+
+        Each protocol run is independent of the others, which allows them to be
+        run concurrently (see :class:`ConcurrentRunner`).
+
+        Parameters
+        ----------
+        results_dir : ProtocolResultsDir
+            The (empty) root results directory, created from the data being run on.
+
+        Returns
+        -------
+        list
+            A list of `(path, name, protocol)` tuples, in the order the protocols are
+            run serially.  `path` is a tuple of child keys specifying the node of
+            `results_dir` whose `.data` `protocol` is run on, and `name` is the key
+            of the node's `.for_protocol` dictionary under which the results are stored.
+        """
+        raise NotImplementedError("This protocol runner cannot be run concurrently!")
+
+    def _run_tasks_serially(self, results_dir, memlimit, comm, log=False):
+        """ Run (serially) all the protocols given by :meth:`_protocol_tasks` on `results_dir`. """
+        for path, name, protocol in self._protocol_tasks(results_dir):
+            node = _results_dir_node(results_dir, path)
+            if log: print("Running protocol %s at %s" % (name, '/'.join(('.',) + tuple(map(str, path)))))
+            node.for_protocol[name] = protocol.run(node.data, memlimit, comm)
+        return results_dir
+
+
+def _results_dir_node(results_dir, path):
+    """ The node of the results-directory tree `results_dir` at `path` (a tuple of child keys). """
+    node = results_dir
+    for el in path:  # traverse path
+        node = node[el]
+    return node
+
 
 class TreeRunner(ProtocolRunner):
     """
@@ -345,14 +386,10 @@ class TreeRunner(ProtocolRunner):
         ProtocolResultsDir
         """
         ret = ProtocolResultsDir(data)  # creates entire tree of nodes
-        for path, protocol in self.protocols.items():
+        return self._run_tasks_serially(ret, memlimit, comm)
 
-            root = ret
-            for el in path:  # traverse path
-                root = root[el]
-            root.for_protocol[protocol.name] = protocol.run(root.data, memlimit, comm)  # run the protocol
-
-        return ret
+    def _protocol_tasks(self, results_dir):
+        return [(tuple(path), protocol.name, protocol) for path, protocol in self.protocols.items()]
 
 
 class SimpleRunner(ProtocolRunner):
@@ -422,21 +459,24 @@ class SimpleRunner(ProtocolRunner):
         ProtocolResultsDir
         """
         ret = ProtocolResultsDir(data)  # creates entire tree of nodes
+        return self._run_tasks_serially(ret, memlimit, comm)
+
+    def _protocol_tasks(self, results_dir):
+        tasks = []
 
-        def visit_node(node):
+        def visit_node(node, path):
             if len(node.data) > 0:
                 for subname, subnode in node.items():
-                    visit_node(subnode)
+                    visit_node(subnode, path + (subname,))
             elif node.data.is_multipass() and self.do_passes_separately:
                 implicit_multipassprotocol = MultiPassProtocol(self.protocol)
-                node.for_protocol[implicit_multipassprotocol.name] = \
-                    implicit_multipassprotocol.run(node.data, memlimit, comm)
+                tasks.append((path, implicit_multipassprotocol.name, implicit_multipassprotocol))
             elif self.edesign_type == 'all' or isinstance(node.data.edesign, self.edesign_type):
-                node.for_protocol[self.protocol.name] = self.protocol.run(node.data, memlimit, comm)
+                tasks.append((path, self.protocol.name, self.protocol))
             else:
                 pass  # don't run on this node, since the experiment design has the wrong type
-        visit_node(ret)
-        return ret
+        visit_node(results_dir, ())
+        return tasks
 
 
 class DefaultRunner(ProtocolRunner):
@@ -493,24 +533,171 @@ class DefaultRunner(ProtocolRunner):
         ProtocolResultsDir
         """
         ret = ProtocolResultsDir(data)  # creates entire tree of nodes
+        return self._run_tasks_serially(ret, memlimit, comm, log=True)
+
+    def _protocol_tasks(self, results_dir):
+        tasks = []
 
-        def visit_node(node, breadcrumb):
+        def visit_node(node, path):
             for name, protocol in node.data.edesign.default_protocols.items():
                 assert(name == protocol.name), "Protocol name inconsistency"
-                print("Running protocol %s at %s" % (name, breadcrumb))
                 if node.data.is_multipass() and self.run_passes_separately:
                     implicit_multipassprotocol = MultiPassProtocol(protocol)
-                    node.for_protocol[implicit_multipassprotocol.name] = \
-                        implicit_multipassprotocol.run(node.data, memlimit, comm)
+                    tasks.append((path, implicit_multipassprotocol.name, implicit_multipassprotocol))
                 else:
-                    node.for_protocol[name] = protocol.run(node.data, memlimit, comm)
+                    tasks.append((path, name, protocol))
 
             for subname, subnode in node.items():
-                visit_node(subnode, breadcrumb + '/' + str(subname))
+                visit_node(subnode, path + (subname,))
 
-        visit_node(ret, '.')
+        visit_node(results_dir, ())
+        return tasks
+
+
+class ConcurrentRunner(ProtocolRunner):
+    """
+    Runs the protocols of another protocol-runner concurrently.
+
+    The protocol runs performed by a :class:`TreeRunner`, :class:`SimpleRunner` or
+    :class:`DefaultRunner` are independent of one another, e.g., they analyze the
+    separate sub-designs of a :class:`SimultaneousExperimentDesign` or
+    :class:`CombinedExperimentDesign`.  This runner schedules these runs onto a
+    pool of processes or, when an MPI communicator is given, onto groups of the
+    communicator's processors.  Results may be written to disk as they finish.
+
+    Parameters
+    ----------
+    runner : ProtocolRunner
+        The protocol-runner whose protocols are run.
+
+    num_processes : int, optional
+        The number of processes to run protocols in when no MPI communicator is given.
+        If None, the number of CPUs is used.  When `num_processes == 1` protocols are
+        run serially within the current process.
+
+    output_dir : str or Path, optional
+        If not None, a root directory that the data and results are written to.  Each
+        node's results are written as soon as they are computed, so that the directory
+        holds all the results that have completed at any given time.  The completed
+        directory can be loaded using :meth:`ProtocolResultsDir.from_dir`.
+
+    memlimits : dict, optional
+        A dictionary whose keys are data-tree paths (tuples of child keys) and whose values
+        are per-processor memory limits, in bytes, for the protocols run at those nodes.  These
+        override the `memlimit` given to :meth:`run`.
+    """
+
+    def __init__(self, runner, num_processes=None, output_dir=None, memlimits=None):
+        """
+        Create a new ConcurrentRunner object, which runs the protocols of `runner` concurrently.
+
+        Parameters
+        ----------
+        runner : ProtocolRunner
+            The protocol-runner whose protocols are run.
+
+        num_processes : int, optional
+            The number of processes to run protocols in when no MPI communicator is given.
+            If None, the number of CPUs is used.
+
+        output_dir : str or Path, optional
+            If not None, a root directory that the data and results are written to as
+            results are computed.
+
+        memlimits : dict, optional
+            Per-processor memory limits for the protocols run at specific data-tree paths.
+
+        Returns
+        -------
+        ConcurrentRunner
+        """
+        self.runner = runner
+        self.num_processes = num_processes
+        self.output_dir = output_dir
+        self.memlimits = memlimits if (memlimits is not None) else {}
+
+    def _protocol_tasks(self, results_dir):
+        return self.runner._protocol_tasks(results_dir)
+
+    def run(self, data, memlimit=None, comm=None):
+        """
+        Run all the protocols specified by this protocol-runner on `data`.
+
+        Parameters
+        ----------
+        data : ProtocolData
+            The input data.
+
+        memlimit : int, optional
+            A rough per-processor memory limit in bytes.  Each process (or
+            processor of `comm`) runs a single protocol at a time, and is given
+            this limit (or the limit given in `memlimits` for the node being run).
+
+        comm : mpi4py.MPI.Comm, optional
+            When not ``None``, an MPI communicator whose processors are divided
+            among the protocol runs.  When there are more processors than runs,
+            `comm` is split into sub-communicators which are given to the protocols.
+            In this case `num_processes` is ignored.
+
+        Returns
+        -------
+        ProtocolResultsDir
+        """
+        ret = ProtocolResultsDir(data)  # creates entire tree of nodes
+        tasks = self._protocol_tasks(ret)
+        nodes = [_results_dir_node(ret, path) for path, _, _ in tasks]
+        memlimits = [self.memlimits.get(path, memlimit) for path, _, _ in tasks]
+
+        if self.output_dir is not None:
+            if comm is None or comm.Get_rank() == 0:
+                ret.write(self.output_dir)  # writes data and a results tree that results are added to as they finish
+            if comm is not None: comm.barrier()
+
+        results_list = [None] * len(tasks)
+
+        def store_results(i, results, write=True):
+            results.data = nodes[i].data  # (results computed by another process hold a copy of the data)
+            results_list[i] = results
+            if write and self.output_dir is not None:
+                results.write(self._node_dirname(ret, tasks[i][0]), data_already_written=True)
+
+        if comm is not None:
+            my_task_indices, owners, my_comm = _mpit.distribute_indices(list(range(len(tasks))), comm)
+            for i in my_task_indices:
+                results = tasks[i][2].run(nodes[i].data, memlimits[i], my_comm)
+                store_results(i, results, write=(my_comm is None or my_comm.Get_rank() == 0))
+            for i in range(len(tasks)):  # share results with all the processors
+                store_results(i, comm.bcast(results_list[i], root=owners[i]), write=False)
+        else:
+            num_processes = _mp.cpu_count() if (self.num_processes is None) else self.num_processes
+            num_processes = min(num_processes, len(tasks))
+            if num_processes <= 1:
+                for i, (_, _, protocol) in enumerate(tasks):
+                    store_results(i, protocol.run(nodes[i].data, memlimits[i]))
+            else:
+                task_args = [(i, protocol, nodes[i].data, memlimits[i]) for i, (_, _, protocol) in enumerate(tasks)]
+                with _mp.Pool(num_processes) as pool:
+                    for i, results in pool.imap_unordered(_run_protocol_task, task_args):  # results stream in
+                        store_results(i, results)
+
+        for (_, name, _), node, results in zip(tasks, nodes, results_list):
+            node.for_protocol[name] = results  # (in the order a serial run would add them)
         return ret
 
+    def _node_dirname(self, results_dir, path):
+        """ The directory that the results-directory node at `path` is written to. """
+        dirname = _pathlib.Path(self.output_dir)
+        node = results_dir
+        for el in path:
+            dirname = dirname / node._dirs[el]
+            node = node[el]
+        return dirname
+
+
+def _run_protocol_task(task_args):
+    i, protocol, data, memlimit = task_args
+    return i, protocol.run(data, memlimit)
+
 
 class ExperimentDesign(_TreeNode, _MongoSerializable):
     """
@@ -682,6 +869,9 @@ class ExperimentDesign(_TreeNode, _MongoSerializable):
         # *isn't* listed in this dict, then it's assumed to be json-able and included
         # in the main 'meta.json' file.  Allowed values are:
         # 'text-circuit-list' - a text circuit list file
+        # 'packed-circuit-list' - a binary circuit list file, which is much faster to read for large
+        #     numbers of circuits but isn't human-readable (or readable by older versions of pyGSTi).
+        #     To use it, set e.g. `auxfile_types['all_circuits_needing_data'] = 'packed-circuit-list'`.
         # 'json' - a json file
         # 'pickle' - a python pickle file (use only if really needed!)
         typ = 'serialized-object' if isinstance(self.all_circuits_needing_data, _circuits.CircuitList) \
@@ -1775,11 +1965,13 @@ class ProtocolData(_TreeNode, _MongoSerializable):
             is already loaded, it can be passed in here.  Otherwise leave this
             as None and it will be loaded.
 
-        quick_load : bool, optional
+        quick_load : bool or "lazy", optional
             Setting this to True skips the loading of components that may take
             a long time, e.g. the actual raw data set(s). This can be useful
             when loading takes a long time and all the information of interest
-            lies elsewhere, e.g. in an encompassing results object.
+            lies elsewhere, e.g. in an encompassing results object.  If `"lazy"`,
+            a (single) data set is only read when the `.dataset` attribute is
+            first accessed, and child data objects are loaded when first accessed.
 
         record_zero_counts : bool, optional
             Whether zero-counts are actually recorded (stored) in the datasets
@@ -1796,19 +1988,27 @@ class ProtocolData(_TreeNode, _MongoSerializable):
 
         data_dir = p / 'data'
         attributes_from_meta = _io.load_meta_based_dir(data_dir, auxfile_types_member=None, quick_load=quick_load)
+        dataset_loader = None
 
-        if quick_load:
+        if quick_load and quick_load != 'lazy':
             dataset = None  # don't load any dataset - just the cache (usually b/c loading is slow)
             # Note: could also use (path.stat().st_size >= max_size) to condition on size of data files
         else:
             #Load dataset or multidataset based on what files exist
             dataset_files = sorted(list(data_dir.glob('*.txt')))
             if len(dataset_files) == 0:  # assume same dataset as parent
-                if parent is None: parent = ProtocolData.from_dir(dirname / '..')
-                dataset = parent.dataset
+                if parent is None: parent = ProtocolData.from_dir(dirname / '..', quick_load=quick_load)
+                if parent._dataset_loader is not None:  # parent's (single) dataset isn't loaded yet
+                    dataset = None; dataset_loader = _functools.partial(getattr, parent, 'dataset')
+                else:
+                    dataset = parent.dataset
             elif len(dataset_files) == 1 and dataset_files[0].name == 'dataset.txt':  # a single dataset.txt file
-                dataset = _io.read_dataset(dataset_files[0], record_zero_counts=record_zero_counts,
-                                           ignore_zero_count_lines=False, verbosity=0)
+                dataset = None
+                dataset_loader = _functools.partial(_io.read_dataset, dataset_files[0],
+                                                    record_zero_counts=record_zero_counts,
+                                                    ignore_zero_count_lines=False, verbosity=0)
+                if quick_load != 'lazy':
+                    dataset = dataset_loader(); dataset_loader = None
             else:
                 dataset = {pth.stem: _io.read_dataset(pth, record_zero_counts=record_zero_counts,
                                                       ignore_zero_count_lines=False, verbosity=0)
@@ -1822,6 +2022,7 @@ class ProtocolData(_TreeNode, _MongoSerializable):
         cache = _io.metadir._read_json_or_pkl_files_to_dict(data_dir / 'cache')
 
         ret = cls(edesign, dataset, cache)
+        ret._dataset_loader = dataset_loader
         ret.__dict__.update(attributes_from_meta)  # attribute updates, e.g. dbcoordinates
         ret._init_children(dirname, 'data', quick_load=quick_load)  # loads child nodes
         return ret
@@ -1833,7 +2034,7 @@ class ProtocolData(_TreeNode, _MongoSerializable):
             (preloaded_edesign if preloaded_edesign is not None else
              _io.read_edesign_from_mongodb(mongodb, doc['edesign_id'], quick_load=quick_load, comm=None))
 
-        if quick_load:
+        if quick_load and quick_load != 'lazy':  # (lazy loading from a database isn't supported - load eagerly)
             dataset = None  # don't load any dataset - just the cache (usually b/c loading is slow)
         else:
             #Load dataset or multidataset from database
@@ -1904,10 +2105,28 @@ class ProtocolData(_TreeNode, _MongoSerializable):
         return to_pickle
 
     def __setstate__(self, state_dict):
+        if 'dataset' in state_dict:  # (objects pickled before `dataset` became a property)
+            state_dict['_dataset'] = state_dict.pop('dataset')
+            state_dict['_dataset_loader'] = None
         self.__dict__.update(state_dict)
         if self._passdatas is None:
             self._passdatas = {None: self}
 
+    @property
+    def dataset(self):
+        """
+        The data counts: a :class:`DataSet`, :class:`MultiDataSet` or dictionary of data sets (or `None`).
+        """
+        if self._dataset_loader is not None:  # then the data set hasn't been loaded yet
+            self._dataset = self._dataset_loader()
+            self._dataset_loader = None
+        return self._dataset
+
+    @dataset.setter
+    def dataset(self, value):
+        self._dataset = value
+        self._dataset_loader = None
+
     def _create_childval(self, key):  # (this is how children are created on-demand)
         """ Create the value for `key` on demand. """
         return self.edesign._create_subdata(key, self.dataset)
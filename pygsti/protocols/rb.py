@@ -11,6 +11,9 @@ RB Protocol objects
 #***************************************************************************************************
 
 from collections import defaultdict
+import itertools as _itertools
+import multiprocessing as _mp
+
 import numpy as _np
 
 from pygsti.protocols import protocol as _proto
@@ -113,6 +116,17 @@ class CliffordRBDesign(_vb.BenchmarkingDesign):
 
     verbosity : int, optional
         If > 0 the number of circuits generated so far is shown.
+
+    num_processes : int, optional
+        The number of worker processes used to sample the circuits.  Each circuit is sampled
+        from its own seed, so the design does not depend on `num_processes`.
+
+    compilation_cache : CliffordCompilationCache, optional
+        A cache of Clifford compilations that is used, and added to, when compiling the
+        Cliffords in each circuit so that no Clifford is compiled more than once.  The same
+        cache can be passed to several designs for the same `pspec`.  When given, compilations
+        are seeded by the Clifford being compiled rather than by `seed` (see
+        :class:`CliffordCompilationCache`).
     """
 
     @classmethod
@@ -206,7 +220,8 @@ class CliffordRBDesign(_vb.BenchmarkingDesign):
 
     def __init__(self, pspec, clifford_compilations, depths, circuits_per_depth, qubit_labels=None, randomizeout=False,
                  interleaved_circuit=None, citerations=20, compilerargs=(), exact_compilation_key=None,
-                 descriptor='A Clifford RB experiment', add_default_protocol=False, seed=None, verbosity=1, num_processes=1):
+                 descriptor='A Clifford RB experiment', add_default_protocol=False, seed=None, verbosity=1,
+                 num_processes=1, compilation_cache=None):
         if qubit_labels is None: qubit_labels = tuple(pspec.qubit_labels)
         circuit_lists = []
         ideal_outs = []
@@ -217,20 +232,25 @@ class CliffordRBDesign(_vb.BenchmarkingDesign):
         else:
             self.seed = seed
 
+        args_list = []
+        kwargs_list = []
         for lnum, l in enumerate(depths):
             lseed = self.seed + lnum * circuits_per_depth
             if verbosity > 0:
                 print('- Sampling {} circuits at CRB length {} ({} of {} depths) with seed {}'.format(
                     circuits_per_depth, l, lnum + 1, len(depths), lseed))
 
-            args_list = [(pspec, clifford_compilations, l)] * circuits_per_depth
-            kwargs_list = [dict(qubit_labels=qubit_labels, randomizeout=randomizeout, citerations=citerations,
-                                compilerargs=compilerargs, interleaved_circuit=interleaved_circuit,
-                                seed=lseed + i, return_native_gate_counts=True, exact_compilation_key=exact_compilation_key)
-                                for i in range(circuits_per_depth)]
-            results = _tools.mptools.starmap_with_kwargs(_rc.create_clifford_rb_circuit, circuits_per_depth,
-                                                         num_processes, args_list, kwargs_list)
-
+            args_list.extend([(pspec, clifford_compilations, l)] * circuits_per_depth)
+            kwargs_list.extend([dict(qubit_labels=qubit_labels, randomizeout=randomizeout, citerations=citerations,
+                                     compilerargs=compilerargs, interleaved_circuit=interleaved_circuit,
+                                     seed=lseed + i, return_native_gate_counts=True,
+                                     exact_compilation_key=exact_compilation_key)
+                                for i in range(circuits_per_depth)])
+        all_results = _sample_rb_circuits(_rc.create_clifford_rb_circuit, args_list, kwargs_list,
+                                          num_processes, compilation_cache)
+
+        for lnum in range(len(depths)):
+            results = all_results[lnum * circuits_per_depth:(lnum + 1) * circuits_per_depth]
             circuits_at_depth = []
             idealouts_at_depth = []
             native_gate_counts_at_depth = []
@@ -510,6 +530,14 @@ class DirectRBDesign(_vb.BenchmarkingDesign):
 
     verbosity : int, optional
         If > 0 the number of circuits generated so far is shown.
+
+    num_processes : int, optional
+        The number of worker processes used to sample the circuits.  Each circuit is sampled
+        from its own seed, so the design does not depend on `num_processes`.
+
+    compilation_cache : CliffordCompilationCache, optional
+        A cache of Clifford compilations used, and added to, when `conditionaltwirl` is False
+        (see :class:`CliffordRBDesign`).
     """
 
     @classmethod
@@ -634,7 +662,7 @@ class DirectRBDesign(_vb.BenchmarkingDesign):
                  sampler='edgegrab', samplerargs=None,
                  addlocal=False, lsargs=(), randomizeout=False, cliffordtwirl=True, conditionaltwirl=True,
                  citerations=20, compilerargs=(), partitioned=False, descriptor='A DRB experiment',
-                 add_default_protocol=False, seed=None, verbosity=1, num_processes=1):
+                 add_default_protocol=False, seed=None, verbosity=1, num_processes=1, compilation_cache=None):
 
         if samplerargs is None:
             samplerargs = [0.25, ]
@@ -647,23 +675,26 @@ class DirectRBDesign(_vb.BenchmarkingDesign):
         else:
             self.seed = seed
 
+        args_list = []
+        kwargs_list = []
         for lnum, l in enumerate(depths):
             lseed = self.seed + lnum * circuits_per_depth
             if verbosity > 0:
                 print('- Sampling {} circuits at DRB length {} ({} of {} depths) with seed {}'.format(
                     circuits_per_depth, l, lnum + 1, len(depths), lseed))
 
-            args_list = [(pspec, clifford_compilations, l)] * circuits_per_depth
-            kwargs_list = [dict(qubit_labels=qubit_labels, sampler=sampler, samplerargs=samplerargs,
-                                addlocal=addlocal, lsargs=lsargs, randomizeout=randomizeout,
-                                cliffordtwirl=cliffordtwirl, conditionaltwirl=conditionaltwirl,
-                                citerations=citerations, compilerargs=compilerargs,
-                                partitioned=partitioned,
-                                seed=lseed + i) for i in range(circuits_per_depth)]
-            #results = [_rc.create_direct_rb_circuit(*(args_list[0]), **(kwargs_list[0]))]  # num_processes == 1 case
-            results = _tools.mptools.starmap_with_kwargs(_rc.create_direct_rb_circuit, circuits_per_depth,
-                                                         num_processes, args_list, kwargs_list)
-
+            args_list.extend([(pspec, clifford_compilations, l)] * circuits_per_depth)
+            kwargs_list.extend([dict(qubit_labels=qubit_labels, sampler=sampler, samplerargs=samplerargs,
+                                     addlocal=addlocal, lsargs=lsargs, randomizeout=randomizeout,
+                                     cliffordtwirl=cliffordtwirl, conditionaltwirl=conditionaltwirl,
+                                     citerations=citerations, compilerargs=compilerargs,
+                                     partitioned=partitioned,
+                                     seed=lseed + i) for i in range(circuits_per_depth)])
+        all_results = _sample_rb_circuits(_rc.create_direct_rb_circuit, args_list, kwargs_list,
+                                          num_processes, compilation_cache)
+
+        for lnum in range(len(depths)):
+            results = all_results[lnum * circuits_per_depth:(lnum + 1) * circuits_per_depth]
             circuits_at_depth = []
             idealouts_at_depth = []
             for c, iout in results:
@@ -1198,22 +1229,28 @@ class InterleavedRBDesign(_proto.CombinedExperimentDesign):
         Whether the circuits of the standard CRB and IRB sub designs should be interleaved to
         form the circuit ordering of this experiment design. E.g. when calling the `all_circuits_needing_data`
         attribute.
+
+    compilation_cache : CliffordCompilationCache, optional
+        A cache of Clifford compilations shared by the standard and interleaved CRB sub-designs
+        (see :class:`CliffordRBDesign`).
     """
 
     def __init__(self, pspec, clifford_compilations, depths, circuits_per_depth, interleaved_circuit, qubit_labels=None, randomizeout=False,
                  citerations=20, compilerargs=(), exact_compilation_key=None,
                  descriptor='An Interleaved RB experiment', add_default_protocol=False, seed=None, verbosity=1, num_processes=1,
-                 interleave = False):
+                 interleave=False, compilation_cache=None):
         #Farm out the construction of the experiment designs to CliffordRBDesign:
         print('Constructing Standard CRB Subdesign:')
-        crb_subdesign = CliffordRBDesign(pspec, clifford_compilations, depths, circuits_per_depth, qubit_labels, randomizeout,
-                                              None, citerations, compilerargs, exact_compilation_key,
-                                              descriptor + ' (Standard)', add_default_protocol, seed, verbosity, num_processes)
+        crb_subdesign = CliffordRBDesign(pspec, clifford_compilations, depths, circuits_per_depth, qubit_labels,
+                                         randomizeout, None, citerations, compilerargs, exact_compilation_key,
+                                         descriptor + ' (Standard)', add_default_protocol, seed, verbosity,
+                                         num_processes, compilation_cache)
         print('Constructing Interleaved CRB Subdesign:')
-        icrb_subdesign = CliffordRBDesign(pspec, clifford_compilations, depths, circuits_per_depth, qubit_labels, randomizeout,
-                                              interleaved_circuit, citerations, compilerargs, exact_compilation_key,
-                                              descriptor + ' (Interleaved)', add_default_protocol, seed+1 if seed is not None else None, 
-                                              verbosity, num_processes)
+        icrb_subdesign = CliffordRBDesign(pspec, clifford_compilations, depths, circuits_per_depth, qubit_labels,
+                                          randomizeout, interleaved_circuit, citerations, compilerargs,
+                                          exact_compilation_key, descriptor + ' (Interleaved)', add_default_protocol,
+                                          seed + 1 if seed is not None else None, verbosity, num_processes,
+                                          compilation_cache)
 
         self._init_foundation(crb_subdesign, icrb_subdesign, circuits_per_depth, interleaved_circuit, randomizeout,
                               citerations, compilerargs, exact_compilation_key, interleave)
@@ -1772,3 +1809,43 @@ class InterleavedRandomizedBenchmarkingResults(_proto.ProtocolResults):
 
 RB = RandomizedBenchmarking
 RBResults = RandomizedBenchmarkingResults  # shorthand
+
+
+_RB_COMPILATION_CACHE = None
+
+
+def _init_rb_sampling_worker(compilation_cache):
+    global _RB_COMPILATION_CACHE
+    _RB_COMPILATION_CACHE = compilation_cache
+
+
+def _sample_rb_circuit_in_worker(fn, args, kwargs):
+    # Return the compilations this circuit added to the worker's cache, so they can be merged into the parent's.
+    num_cached = len(_RB_COMPILATION_CACHE)
+    result = fn(*args, compilation_cache=_RB_COMPILATION_CACHE, **kwargs)
+    return result, _RB_COMPILATION_CACHE.entries_since(num_cached)
+
+
+def _sample_rb_circuits(fn, args_list, kwargs_list, num_processes=1, compilation_cache=None):
+    """
+    Calls `fn(*args, compilation_cache=compilation_cache, **kwargs)` for each element of `args_list` and `kwargs_list`.
+
+    When `num_processes > 1` the calls are made in a single process pool.  Each worker holds its own
+    copy of `compilation_cache`, sent once when the worker starts, and the compilations added by the
+    workers are merged back into `compilation_cache` in the order of the calls.
+    """
+    if compilation_cache is None:
+        return _tools.mptools.starmap_with_kwargs(fn, len(args_list), num_processes, args_list, kwargs_list)
+    if num_processes == 1:
+        return [fn(*args, compilation_cache=compilation_cache, **kwargs)
+                for args, kwargs in zip(args_list, kwargs_list)]
+
+    chunksize = max(1, len(args_list) // (4 * num_processes))
+    with _mp.Pool(num_processes, initializer=_init_rb_sampling_worker, initargs=(compilation_cache,)) as pool:
+        outputs = pool.starmap(_sample_rb_circuit_in_worker,
+                               zip(_itertools.repeat(fn), args_list, kwargs_list), chunksize)
+    results = []
+    for result, new_compilations in outputs:
+        compilation_cache.update(new_compilations)
+        results.append(result)
+    return results
@@ -11,6 +11,7 @@ The TreeNode class
 #***************************************************************************************************
 
 import copy as _copy
+import functools as _functools
 import json as _json
 import pathlib as _pathlib
 
@@ -76,7 +77,7 @@ class TreeNode(object):
             child_dirs[nm] = d
 
         self._dirs = child_dirs
-        self._vals = {}
+        child_loaders = {}
 
         for nm, subdir in child_dirs.items():
             subobj_dir = dirname / subdir
@@ -89,11 +90,17 @@ class TreeNode(object):
                     # if we can't find a meta.json - default to same class as self
                     classobj = _io.metadir._cls_from_meta_json(submeta_dir) \
                         if (submeta_dir / 'meta.json').exists() else self.__class__
-                    self._vals[nm] = classobj.from_dir(subobj_dir, parent=self, name=nm, **kwargs)
+                    child_loaders[nm] = _functools.partial(classobj.from_dir, subobj_dir,
+                                                           parent=self, name=nm, **kwargs)
                 # **If there's no subdirectory, don't load a value here - generate a child value if needed**
             else:
                 instance = self.__class__  # no meta.json - default to same class as self
-                self._vals[nm] = instance.from_dir(subobj_dir, parent=self, name=nm, **kwargs)
+                child_loaders[nm] = _functools.partial(instance.from_dir, subobj_dir, parent=self, name=nm, **kwargs)
+
+        if kwargs.get('quick_load', False) == 'lazy':
+            self._vals = _io.metadir.LazyLoadingDict(child_loaders)  # children are loaded when first accessed
+        else:
+            self._vals = {nm: load() for nm, load in child_loaders.items()}
 
     def _init_children_from_mongodb_doc(self, doc, mongodb, **kwargs):
         #if preloaded_edesign is None:
@@ -112,9 +119,15 @@ class TreeNode(object):
         self._dirs = {_to_immutable(nm): subdir for subdir, nm in doc['children'].items()}
         self._vals = {}
 
+        child_docs = {}  # read ahead all the child documents using a single query
+        if len(doc['children_ids']) > 0:
+            children_collection = mongodb[doc['children_collection_name']]
+            for child_doc in children_collection.find({'_id': {'$in': list(doc['children_ids'].values())}}):
+                child_docs[child_doc['_id']] = child_doc
+
         for subdir, child_id in doc['children_ids'].items():
             child_nm = _to_immutable(doc['children'][subdir])
-            child_doc = mongodb[doc['children_collection_name']].find_one({'_id': child_id})
+            child_doc = child_docs.get(child_id, None)
             if child_doc is None:  # if there's no child document, generate the child value later
                 continue  # don't load anything - create child value on demand
 
@@ -122,7 +135,8 @@ class TreeNode(object):
                 classobj = _io.metadir._class_for_name(child_doc['type'])
             else:
                 classobj = self.__class__
-            self._vals[child_nm] = classobj.from_mongodb(mongodb, child_id, parent=self, name=child_nm, **kwargs)
+            self._vals[child_nm] = classobj.from_mongodb_doc(mongodb, doc['children_collection_name'], child_doc,
+                                                             parent=self, name=child_nm, **kwargs)
 
 
     def keys(self):
@@ -732,6 +732,11 @@ def create_standard_report(results, filename, title="auto",
             Background color for the color box plots in this report.  Can be common
             color names, e.g. `"black"`, or string RGB values, e.g. `"rgb(255,128,0)"`.
 
+        - num_processes : int, optional
+            The number of processes used to compute the report's tables and
+            plots.  Values greater than 1 compute independent tables and plots
+            concurrently.
+
     verbosity : int, optional
         How much detail to send to stdout.
 
@@ -1172,6 +1177,15 @@ def construct_standard_report(results, title="auto",
         - idt_idle_oplabel : Label, optional
             The label identifying the idle gate (for use with idle tomography).
 
+        - num_processes : int, optional
+            The number of processes used to compute the report's tables and
+            plots when it is built (written).  Values greater than 1 enable a
+            parallel build, in which the independent workspace outputs (e.g.
+            those for different estimates, gauge optimizations and switchboard
+            positions) are computed concurrently.  This default can be overridden
+            by passing `build_options={'num_processes': N}` to the report's
+            `write_*` methods.
+
     verbosity : int, optional
         How much detail to send to stdout.
 
@@ -1191,6 +1205,7 @@ def construct_standard_report(results, title="auto",
     combine_robust = advanced_options.get('combine_robust', True)
     idtPauliDicts = advanced_options.get('idt_basis_dicts', 'auto')
     idtIdleOp = advanced_options.get('idt_idle_oplabel', _Lbl('Gi'))
+    num_processes = advanced_options.get('num_processes', 1)
 
     if isinstance(title, int):  # to catch backward compatibility issues
         raise ValueError(("'title' argument must be a string.  You may be accidentally"
@@ -1329,7 +1344,8 @@ def construct_standard_report(results, title="auto",
     build_defaults = dict(
         errgen_type='logGTi',
         ci_brevity=1,
-        bgcolor='white'
+        bgcolor='white',
+        num_processes=num_processes
     )
 
     pdf_available = True
@@ -84,11 +84,20 @@ class Report:
         }
         full_params.update(self._build_defaults)
         full_params.update(build_options or {})
-        qtys = self._global_qtys.copy()
-        for section in self._sections:
-            qtys.update(section.render(self._workspace, **full_params))
 
-        return qtys
+        def render_sections():
+            qtys = self._global_qtys.copy()
+            for section in self._sections:
+                qtys.update(section.render(self._workspace, **full_params))
+            return qtys
+
+        # Independent tables & plots (across estimates, gauge optimizations, etc.) can be
+        # computed concurrently, after which rendering the sections just hits the cache.
+        num_processes = full_params.get('num_processes', 1)
+        if num_processes > 1:
+            self._workspace.precompute_in_parallel(render_sections, num_processes)
+
+        return render_sections()
 
     def write_html(self, path, auto_open=False, link_to=None,
                    connected=False, build_options=None, brevity=0,
@@ -11,8 +11,10 @@ Defines the Workspace class and supporting functionality.
 #***************************************************************************************************
 
 import collections as _collections
+import copy as _copy
 import inspect as _inspect
 import itertools as _itertools
+import multiprocessing as _mp
 import os as _os
 import pickle as _pickle
 # import uuid        as _uuid
@@ -27,6 +29,7 @@ from pygsti.report import merge_helpers as _merge
 from pygsti.report import plotly_plot_ex as _plotly_ex
 from pygsti import baseobjs as _baseobjs
 from pygsti.baseobjs.smartcache import CustomDigestError as _CustomDigestError
+from pygsti.baseobjs.smartcache import DiskCache as _DiskCache
 from pygsti.baseobjs import _compatibility as _compat
 
 _PYGSTI_WORKSPACE_INITIALIZED = False
@@ -175,6 +178,75 @@ def random_id():
     #return str(_uuid.uuid4().hex) #alternative
 
 
+_WORKER_WORKSPACE = None  # the workspace used by a worker process of Workspace.precompute_in_parallel
+
+
+def _compute_in_worker(pickled_task, cachedir, cachedir_max_bytes):
+    """
+    Evaluates a pickled `(fn, arg_vals)` task within a worker process's workspace.
+
+    Returns the pickled value of `fn(*arg_vals)`, or None if the task can't be
+    unpickled or its result can't be pickled (so it must be computed by the parent
+    process).  Results are returned pickled so the parent process can catch errors
+    when unpickling them.  Errors raised by `fn` itself are propagated.
+    """
+    global _WORKER_WORKSPACE
+    if _WORKER_WORKSPACE is None:
+        _WORKER_WORKSPACE = Workspace(cachedir=cachedir, cachedir_max_bytes=cachedir_max_bytes)
+    try:
+        fn, arg_vals = _pickle.loads(pickled_task)  # some objects (e.g. Switchboards) pickle but don't unpickle
+    except Exception:
+        return None
+    fn_owner = getattr(fn, '__self__', None)
+    if isinstance(fn_owner, WorkspaceOutput):
+        fn_owner.ws = _WORKER_WORKSPACE  # `ws` isn't pickled with WorkspaceOutput objects
+    result = _WORKER_WORKSPACE.smartCache.cached_compute(fn, arg_vals)[1]
+    enable_plotly_pickling()
+    try:
+        return _pickle.dumps(result, protocol=_pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    finally:
+        disable_plotly_pickling()
+
+
+class WorkspaceDiskCache(_DiskCache):
+    """
+    A :class:`DiskCache` that holds the persistent results of a :class:`Workspace`.
+
+    This enables plotly pickling while (un)pickling values, and never stores
+    :class:`WorkspaceOutput` objects, which hold a reference to their workspace.
+
+    Parameters
+    ----------
+    directory : str
+        The directory holding the cache files.
+
+    max_bytes : int, optional
+        The maximum total size, in bytes, of the cache files.
+    """
+
+    def __init__(self, directory, max_bytes=None):
+        from pygsti import __version__ as _pygsti_version
+        super().__init__(directory, max_bytes, namespace='pygsti' + str(_pygsti_version))
+
+    def _dumps(self, value):
+        if isinstance(value[0], WorkspaceOutput):
+            raise ValueError("WorkspaceOutput objects are not persisted")
+        enable_plotly_pickling()
+        try:
+            return super()._dumps(value)
+        finally:
+            disable_plotly_pickling()
+
+    def _loads(self, data):
+        enable_plotly_pickling()
+        try:
+            return super()._loads(data)
+        finally:
+            disable_plotly_pickling()
+
+
 class Workspace(object):
     """
     Central to data analysis, Workspace objects facilitate the building of reports and dashboards.
@@ -193,9 +265,26 @@ class Workspace(object):
     ----------
     cachefile : str, optional
         filename with cached workspace results
+
+    cachedir : str, optional
+        A directory holding a persistent, content-addressed cache of workspace
+        results (one file per result).  Results are read from and written to
+        this directory incrementally, so they are reused across processes and
+        sessions that share it.
+
+    cachedir_max_bytes : int, optional
+        The maximum total size, in bytes, of the files in `cachedir`.  When this
+        is exceeded the least-recently-used results are removed.  `None` means
+        no limit.
+
+    cache_max_bytes : int, optional
+        The maximum (estimated) total size, in bytes, of the results held in
+        memory.  When this is exceeded the least-recently-used results are
+        evicted from memory (results that are also in `cachedir` are reloaded
+        from there when needed again).  `None` means no limit.
     """
 
-    def __init__(self, cachefile=None):
+    def __init__(self, cachefile=None, cachedir=None, cachedir_max_bytes=None, cache_max_bytes=None):
         """
         Initialize a Workspace object.
 
@@ -203,9 +292,20 @@ class Workspace(object):
         ----------
         cachefile : str, optional
             filename with cached workspace results
+
+        cachedir : str, optional
+            directory of a persistent, content-addressed cache of workspace results
+
+        cachedir_max_bytes : int, optional
+            the maximum total size, in bytes, of the files in `cachedir`
+
+        cache_max_bytes : int, optional
+            the maximum (estimated) total size, in bytes, of the in-memory cache
         """
         self._register_components(False)
-        self.smartCache = _baseobjs.SmartCache()
+        disk_cache = WorkspaceDiskCache(cachedir, cachedir_max_bytes) if (cachedir is not None) else None
+        self.smartCache = _baseobjs.SmartCache(disk_cache=disk_cache, max_bytes=cache_max_bytes)
+        self._deferred_tasks = None  # a dict while collecting computations to run in parallel
         if cachefile is not None:
             self.load_cache(cachefile)
         self.smartCache.add_digest(ws_custom_digest)
@@ -256,7 +356,8 @@ class Workspace(object):
                 if isinstance(v, WorkspaceOutput):  # hasattr(v,'ws') == True for plotly dicts (why?)
                     print('Updated {} object to set ws to self'.format(type(v)))
                     v.ws = self
-            self.smartCache.cache.update(oldCache)
+            for k, v in oldCache.items():
+                self.smartCache.add_computed_value(k, v)
 
     def __getstate__(self):
         return {'smartCache': self.smartCache}
@@ -264,6 +365,7 @@ class Workspace(object):
     def __setstate__(self, state_dict):
         self._register_components(False)
         self.smartCache = state_dict['smartCache']
+        self._deferred_tasks = None
 
     def _makefactory(self, cls, autodisplay):  # , printer=_objs.VerbosityPrinter(1)):
         # XXX this indirection is so wild -- can we please rewrite directly?
@@ -586,6 +688,106 @@ class Workspace(object):
         self._register_components(autodisplay)
         return
 
+    def _defer_compute(self, fn, arg_vals):
+        """
+        Records a computation to be performed later by :meth:`precompute_in_parallel`.
+
+        Returns a `(key, result)` tuple like :meth:`SmartCache.cached_compute`,
+        where `result` is a placeholder :class:`NotApplicable` object unless
+        the value is already cached.
+        """
+        key, is_cached, persistent = self.smartCache.lookup(fn, arg_vals)
+        if is_cached:
+            return self.smartCache.cached_compute(fn, arg_vals)
+        if key != 'INEFFECTIVE' and key not in self._deferred_tasks:
+            fn_owner = getattr(fn, '__self__', None)
+            if isinstance(fn_owner, WorkspaceOutput):
+                # Don't send the (partially constructed) output's init-args, which hold switchboards.
+                fn_owner = _copy.copy(fn_owner)
+                for attr in ('initargs', 'tablefn', 'plotfn', 'textfn'):
+                    fn_owner.__dict__.pop(attr, None)
+                fn = getattr(fn_owner, fn.__name__)
+            try:  # only computations that can be sent to another process are deferred
+                self._deferred_tasks[key] = _pickle.dumps((fn, arg_vals), protocol=_pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                pass  # computed serially later on
+        return key, NotApplicable(self)
+
+    def precompute_in_parallel(self, build_fn, num_processes, verbosity=0):
+        """
+        Computes the workspace outputs needed by `build_fn` using a pool of processes.
+
+        `build_fn` is first called in a "planning" mode, in which the computation
+        functions of workspace tables, plots and texts are not evaluated but are
+        instead collected (for every relevant switchboard position).  The results
+        of these computations only depend on their arguments, so they are evaluated
+        concurrently by `num_processes` worker processes and placed into this
+        workspace's cache.  Computations whose arguments depend on the results of
+        other computations can't be collected until those results are known, so
+        planning and computing are repeated until no new computations are found.
+        A subsequent (serial) call to `build_fn` then finds every computation
+        already cached.  The objects created by `build_fn` during the planning
+        calls are discarded.
+
+        Parameters
+        ----------
+        build_fn : function
+            A function taking no arguments that creates workspace outputs, e.g.
+            one that renders all the sections of a report.  Exceptions raised
+            while planning are ignored; they are raised again (by the subsequent
+            serial build) if they persist.
+
+        num_processes : int
+            The number of worker processes to use.
+
+        verbosity : int, optional
+            Amount of detail to print to stdout.
+
+        Returns
+        -------
+        int
+            The number of computations performed in parallel.
+        """
+        printer = _baseobjs.VerbosityPrinter.create_printer(verbosity)
+        disk_cache = self.smartCache.disk_cache
+        cache_args = (disk_cache.directory, disk_cache.max_bytes) if (disk_cache is not None) else (None, None)
+
+        nComputed = 0
+        attempted_keys = set()
+        with _mp.Pool(num_processes) as pool:
+            while True:
+                self._deferred_tasks = {}
+                try:
+                    build_fn()
+                except Exception as e:
+                    printer.log("Planning of workspace computations stopped early: " + str(e), 2)
+                finally:
+                    tasks = self._deferred_tasks
+                    self._deferred_tasks = None
+
+                keys = [k for k in tasks if k not in attempted_keys]  # previously failed tasks are done serially
+                if len(keys) == 0: break
+                attempted_keys.update(keys)
+                printer.log("Computing %d workspace outputs using %d processes" % (len(keys), num_processes))
+                results = pool.starmap(_compute_in_worker, [(tasks[k],) + cache_args for k in keys])
+
+                nFailed = 0
+                enable_plotly_pickling()
+                try:
+                    for k, pickled_result in zip(keys, results):
+                        try:
+                            result = _pickle.loads(pickled_result)
+                        except Exception:  # sending the task or its result failed (e.g. None): compute serially
+                            nFailed += 1; continue
+                        self.smartCache.add_computed_value(k, result, persistent=False)  # workers update disk cache
+                        nComputed += 1
+                finally:
+                    disable_plotly_pickling()
+                if nFailed > 0:
+                    printer.log("%d workspace outputs couldn't be transferred between processes and will be "
+                                "computed serially" % nFailed, 2)
+        return nComputed
+
     def switched_compute(self, fn, *args):
         """
         Calls a compute function with special handling of :class:`SwitchedValue` arguments.
@@ -594,11 +796,12 @@ class Workspace(object):
         some or all of those arguments are :class:`SwitchedValue` objects.
 
         Caching is employed to avoid duplicating function evaluations which have
-        the same arguments.  Note that the function itself doesn't need to deal
-        with SwitchValue objects, as this routine resolves such objects into a
-        series of function evaluations using the underlying value(s) within the
-        SwitchValue.  This routine is primarily used internally for the
-        computation of tables and plots.
+        the same arguments.  When this workspace has a `cachedir`, results are
+        also looked up in (and saved to) that persistent cache.  Note that the
+        function itself doesn't need to deal with SwitchValue objects, as this
+        routine resolves such objects into a series of function evaluations
+        using the underlying value(s) within the SwitchValue.  This routine is
+        primarily used internally for the computation of tables and plots.
 
         if any of the arguments is an instance of `NotApplicable` then `fn`
         is *not* evaluated and the instance is returned as the evaluation
@@ -710,7 +913,10 @@ class Workspace(object):
                 if isinstance(v, NotApplicable):
                     key = "NA"; result = v; break
             else:
-                key, result = self.smartCache.cached_compute(fn, argVals)
+                if self._deferred_tasks is not None:
+                    key, result = self._defer_compute(fn, argVals)
+                else:
+                    key, result = self.smartCache.cached_compute(fn, argVals)
 
             if key not in storedKeys or key == 'INEFFECTIVE':
                 switchpos_map[pos] = len(resultValues)
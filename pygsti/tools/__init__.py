@@ -10,6 +10,8 @@ pyGSTi Tools Python Package
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import importlib as _importlib
+
 from .basistools import *
 from .chi2fns import *
 from .edesigntools import *
@@ -34,3 +36,17 @@ from .rbtheory import *
 from .slicetools import *
 from .symplectic import *
 from .typeddict import TypedDict
+
+# Modules that are not imported above (`import pygsti` no longer imports the sub-packages that used to
+# import them), imported when first accessed as attributes of this package, e.g. `pygsti.tools.group`.
+_LAZY_SUBMODULES = ('compilationtools', 'dataframetools', 'group')
+
+
+def __getattr__(name):
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    return _importlib.import_module('.' + name, __name__)  # also sets it as an attribute of this package
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_LAZY_SUBMODULES))
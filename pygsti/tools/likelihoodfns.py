@@ -13,7 +13,6 @@ Functions related to computation of the log-likelihood.
 import warnings as _warnings
 
 import numpy as _np
-import scipy.stats as _stats
 
 from pygsti.tools import basistools as _bt
 from pygsti.tools import jamiolkowski as _jam
@@ -792,6 +791,7 @@ def two_delta_logl(model, dataset, circuits=None,
         _warnings.warn("Max-model params (%d) <= model params (%d)!  Using k == 1." % (ds_dof, mdl_dof))
 
     nsigma = (two_delta_logl - k) / _np.sqrt(2 * k)
+    import scipy.stats as _stats  # (slow to import, so only import when needed)
     pvalue = 1.0 - _stats.chi2.cdf(two_delta_logl, k)
     return two_delta_logl, nsigma, pvalue
 
@@ -904,6 +904,7 @@ def two_delta_logl_per_circuit(model, dataset, circuits=None,
     k = int(_np.ceil(k / (1.0 * len(circuits))))
 
     nsigma = (two_dlogl_percircuit - k) / _np.sqrt(2 * k)
+    import scipy.stats as _stats  # (slow to import, so only import when needed)
     pvalue = _np.array([1.0 - _stats.chi2.cdf(x, k) for x in two_dlogl_percircuit], 'd')
     return two_dlogl_percircuit, nsigma, pvalue
 
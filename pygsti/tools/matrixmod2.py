@@ -15,6 +15,9 @@ General matrix utilities. Some, but not all, are specific to matrices over the i
 import numpy as _np
 
 
+_BLAS_DOT_MIN_DIM = 32  # inner dimension above which integer products are computed using floating point BLAS
+
+
 def dot_mod2(m1, m2):
     """
     Returns the product over the integers modulo 2 of two matrices.
@@ -31,6 +34,12 @@ def dot_mod2(m1, m2):
     -------
     numpy.ndarray
     """
+    m1 = _np.asarray(m1); m2 = _np.asarray(m2)
+    if m1.dtype.kind in 'iu' and m2.dtype.kind in 'iu' and m1.ndim == 2 and m1.shape[1] >= _BLAS_DOT_MIN_DIM:
+        # numpy's integer matmul doesn't use BLAS; the floating point product is exact for (the
+        # small integer) entries of mod-2 matrices, and is much faster for large matrices.
+        prod = _np.dot(m1.astype(_np.float64), m2.astype(_np.float64)) % 2
+        return prod.astype(_np.result_type(m1, m2))
     return _np.dot(m1, m2) % 2
 
 
@@ -47,6 +56,11 @@ def multidot_mod2(mlist):
     -------
     numpy.ndarray
     """
+    if all(_np.ndim(m) == 2 for m in mlist) and _np.shape(mlist[0])[0] >= _BLAS_DOT_MIN_DIM:
+        prod = mlist[0]
+        for m in mlist[1:]:
+            prod = dot_mod2(prod, m)
+        return prod
     return _np.linalg.multi_dot(mlist) % 2
 
 
@@ -136,6 +150,9 @@ def gaussian_elimination_mod2(a):
     """
     Gaussian elimination mod2 of a.
 
+    The rows of `a` are bit-packed (see :func:`packbits_mod2`) so that each
+    row operation is an XOR of 64-column words.
+
     Parameters
     ----------
     a : numpy.ndarray
@@ -148,19 +165,69 @@ def gaussian_elimination_mod2(a):
 
     a = _np.array(a, dtype='int')
     m, n = a.shape
+    packed = packbits_mod2(a)
     i, j = 0, 0
 
     while (i < m) and (j < n):
-        k = a[i:m, j].argmax() + i
-        a[_np.array([i, k]), :] = a[_np.array([k, i]), :]
-        aijn = _np.array([a[i, j:]])
-        col = _np.array([a[:, j]]).T
+        word, bit = divmod(j, 64)
+        col = (packed[:, word] >> _np.uint64(bit)) & _np.uint64(1)
+        k = col[i:m].argmax() + i
+        packed[[i, k], :] = packed[[k, i], :]
+        col[[i, k]] = col[[k, i]]
         col[i] = 0
-        flip = _np.dot(col, aijn)
-        a[:, j:] = _np.bitwise_xor(a[:, j:], flip)
+        flip_rows = col.astype(bool)
+        if flip_rows.any():
+            pivot_row = packed[i].copy()  # only the columns >= j are XOR-ed into the other rows
+            pivot_row[:word] = 0
+            pivot_row[word] &= ~_np.uint64((1 << bit) - 1)
+            packed[flip_rows] ^= pivot_row
         i += 1
         j += 1
-    return a
+    return unpackbits_mod2(packed, n).astype('int')
+
+
+def packbits_mod2(a):
+    """
+    Packs the rows of a matrix over the integers modulo 2 into 64-bit words.
+
+    Column `j` of `a` is stored in bit `j % 64` of word `j // 64` of each row.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        A 2D array of 0s and 1s (entries are taken modulo 2).
+
+    Returns
+    -------
+    numpy.ndarray
+        A `(a.shape[0], ceil(a.shape[1] / 64))` array of dtype `uint64`.
+    """
+    a = _np.asarray(a)
+    bits = _np.packbits((a % 2).astype(bool), axis=1, bitorder='little')
+    nwords = -(-a.shape[1] // 64)
+    packed = _np.zeros((a.shape[0], nwords * 8), _np.uint8)
+    packed[:, 0:bits.shape[1]] = bits
+    return packed.view('<u8')
+
+
+def unpackbits_mod2(packed, ncols):
+    """
+    Unpacks a matrix packed by :func:`packbits_mod2`.
+
+    Parameters
+    ----------
+    packed : numpy.ndarray
+        A 2D `uint64` array, as returned by :func:`packbits_mod2`.
+
+    ncols : int
+        The number of columns of the unpacked matrix.
+
+    Returns
+    -------
+    numpy.ndarray
+        A `(packed.shape[0], ncols)` array of 0s and 1s with dtype `uint8`.
+    """
+    return _np.unpackbits(_np.ascontiguousarray(packed).view(_np.uint8), axis=1, count=ncols, bitorder='little')
 
 
 def diagonal_as_vec(m):
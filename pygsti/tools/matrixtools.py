@@ -16,7 +16,6 @@ import warnings as _warnings
 
 import numpy as _np
 import scipy.linalg as _spl
-import scipy.optimize as _spo
 import scipy.sparse as _sps
 import scipy.sparse.linalg as _spsl
 
@@ -784,6 +783,7 @@ def approximate_matrix_log(m, target_logm, target_weight=10.0, tol=1e-6):
         #      _np.linalg.norm(_spl.expm(logM).flatten()-m.flatten(), 1),
         #      _np.linalg.norm(logM-target_logm)**2)
 
+        import scipy.optimize as _spo  # (slow to import, so only import when needed)
         solution = _spo.minimize(_objective, initial_flat_logM, options={'maxiter': 1000},
                                  method='L-BFGS-B', callback=print_obj_func, tol=tol)
         logM = solution.x.reshape(mx_shape)
@@ -1124,6 +1124,7 @@ def minweight_match(a, b, metricfn=None, return_pairs=True,
         for i, x in enumerate(a):
             weightMx[i, :] = _np.ravel(_np.array([metricfn(x, y) for j, y in enumerate(b)]))
 
+    import scipy.optimize as _spo  # (slow to import, so only import when needed)
     a_inds, b_inds = _spo.linear_sum_assignment(weightMx)
     assert(_np.allclose(a_inds, range(D))), "linear_sum_assignment returned unexpected row indices!"
 
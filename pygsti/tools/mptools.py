@@ -10,23 +10,96 @@ Functions for working with Python multiprocessing (more than just map)
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import collections as _collections
 import itertools as _itertools
 import multiprocessing as _mp
 
+from pygsti.tools import sharedmemtools as _smt
+
 
 # Modified from https://stackoverflow.com/a/53173433
-def starmap_with_kwargs(fn, num_runs, num_processors, args_list, kwargs_list):
+def starmap_with_kwargs(fn, num_runs, num_processors, args_list, kwargs_list, broadcast=False):
+    """
+    Call `fn(*args_list[i], **kwargs_list[i])` for each `i < num_runs` using a pool of processes.
+
+    Parameters
+    ----------
+    fn : function
+        The (picklable) function to call.
+
+    num_runs : int
+        The number of times to call `fn`.
+
+    num_processors : int
+        The number of processes to use.  If 1, then `fn` is called serially in this process.
+
+    args_list : list
+        A list of positional-argument tuples, one per run.
+
+    kwargs_list : list
+        A list of keyword-argument dictionaries, one per run.
+
+    broadcast : bool, optional
+        If True, then argument objects that are passed to more than one run (e.g.
+        a common target model or data set) are placed into shared memory once, via
+        :func:`sharedmemtools.broadcast_object`, rather than being pickled into every
+        task.  Such arguments must not be modified by `fn`, as workers are given
+        read-only versions of them.
+
+    Returns
+    -------
+    list
+        The return values of `fn`, in order.
+    """
     # If only one processor, run serial (makes it easier to profile and avoids any Pool overhead)
     if num_processors == 1:
         return [fn(*args_list[i], **kwargs_list[i]) for i in range(num_runs)]
 
-    with _mp.Pool(num_processors) as pool:
-        args_for_starmap = zip(
-            _itertools.repeat(fn, num_runs),
-            args_list,
-            kwargs_list)
-        return pool.starmap(_apply_args_and_kwargs, args_for_starmap)
+    shms = []
+    if broadcast:
+        args_list, kwargs_list, shms = _broadcast_shared_arguments(args_list[0:num_runs], kwargs_list[0:num_runs])
+
+    try:
+        with _mp.Pool(num_processors) as pool:
+            args_for_starmap = zip(
+                _itertools.repeat(fn, num_runs),
+                args_list,
+                kwargs_list)
+            return pool.starmap(_apply_args_and_kwargs, args_for_starmap)
+    finally:
+        for shm in shms:
+            _smt.cleanup_shared_ndarray(shm)
+
+
+def _broadcast_shared_arguments(args_list, kwargs_list):
+    """ Replace argument objects used by more than one run with handles to a shared-memory copy """
+    counts = _collections.Counter(id(v) for v in _itertools.chain(
+        _itertools.chain.from_iterable(args_list), _itertools.chain.from_iterable(kw.values() for kw in kwargs_list)))
+
+    handles = {}; shms = []
+
+    def to_handle(v):
+        if counts[id(v)] < 2 or isinstance(v, _UNSHARED_TYPES):
+            return v
+        if id(v) not in handles:
+            handles[id(v)], shm = _smt.broadcast_object(v)
+            if shm is not None: shms.append(shm)
+        return handles[id(v)]
+
+    try:
+        args_list = [tuple(map(to_handle, args)) for args in args_list]
+        kwargs_list = [{k: to_handle(v) for k, v in kwargs.items()} for kwargs in kwargs_list]
+    except Exception:
+        for shm in shms:
+            _smt.cleanup_shared_ndarray(shm)
+        raise
+    return args_list, kwargs_list, shms
+
+
+_UNSHARED_TYPES = (type(None), bool, int, float, complex, str, bytes)  # cheap to pickle; never broadcast
 
 
 def _apply_args_and_kwargs(fn, args, kwargs):
+    args = [(a.get() if isinstance(a, _smt.SharedObjectHandle) else a) for a in args]
+    kwargs = {k: (v.get() if isinstance(v, _smt.SharedObjectHandle) else v) for k, v in kwargs.items()}
     return fn(*args, **kwargs)
@@ -29,6 +29,8 @@ from pygsti.baseobjs.errorgenlabel import LocalElementaryErrorgenLabel as _Local
 from pygsti.tools.legacytools import deprecate as _deprecated_fn
 
 IMAG_TOL = 1e-7  # tolerance for imaginary part being considered zero
+_DIAMOND_NORM_TOL = 1e-9  # tolerance used to detect the cases where diamond norms are computed analytically
+_DIAMOND_NORM_SDPS = {}  # cached diamond-norm SDPs: (dim, smallDim, trace_annihilating) => (prob, params, X)
 
 
 def _flat_mut_blks(i, j, block_dims):
@@ -301,32 +303,121 @@ def diamonddist(a, b, mx_basis='pp', return_x=False):
     W : numpy array
         Only returned if `return_x = True`.  Encodes the state rho, such that
         `dm = trace( |(J(a)-J(b)).T * W| )`.
+
+    Notes
+    -----
+    When the difference `a - b` is (numerically) Pauli-diagonal, or more generally
+    when a maximally entangled input state is certifiably optimal, and when `a` and
+    `b` are both unitary channels (and `return_x` is False), the diamond norm is
+    computed analytically.  Otherwise a semidefinite program is solved using cvxpy.
+    These programs are parameterized by the Jamiolkowski matrix of `a - b` and are
+    cached, so that repeated calls for same-sized gates don't rebuild them.  Use
+    :func:`diamonddists` to compute the diamond norms of many gate pairs at once.
     """
     mx_basis = _bt.create_basis_for_matrix(a, mx_basis)
+    return _diamond_norm_from_choi(_unnormalized_choi(a, mx_basis), _unnormalized_choi(b, mx_basis), return_x)
 
-    # currently cvxpy is only needed for this function, so don't import until here
-    import cvxpy as _cvxpy
-    old_cvxpy = bool(tuple(map(int, _cvxpy.__version__.split('.'))) < (1, 0))
-    if old_cvxpy:
-        raise RuntimeError('CVXPY 0.4 is no longer supported. Please upgrade to CVXPY 1.0 or higher.')
 
+def diamonddists(a_list, b_list, mx_basis='pp', return_x=False):
+    """
+    Returns the approximate diamond norms describing the differences between many pairs of gate matrices.
+
+    This gives the same results as calling :func:`diamonddist` on each `(a, b)` pair, but
+    computes the Jamiolkowski matrix of each distinct gate matrix only once and solves
+    the semidefinite programs of all the pairs using the same (cached) cvxpy problem,
+    warm-starting each solve from the previous solution when the solver supports it.
+
+    Parameters
+    ----------
+    a_list : list of numpy arrays
+        First matrices.
+
+    b_list : list of numpy arrays or numpy array
+        Second matrices, one per element of `a_list`.  A single matrix may be given
+        to compute the diamond norms between each element of `a_list` and this matrix.
+
+    mx_basis : Basis object
+        The source and destination basis, respectively.  Allowed
+        values are Matrix-unit (std), Gell-Mann (gm), Pauli-product (pp),
+        and Qutrit (qt) (or a custom basis object).
+
+    return_x : bool, optional
+        Whether to return, for each pair, a numpy array encoding the state (rho)
+        at which the maximal trace distance occurs (see :func:`diamonddist`).
+
+    Returns
+    -------
+    list
+        The diamond norms, or `(dm, W)` tuples if `return_x = True`, of each pair.
+        An element is -2 (or `(-2, zeros)`) when the corresponding solve fails.
+    """
+    if len(a_list) == 0:
+        return []
+    if isinstance(b_list, _np.ndarray):
+        b_list = [b_list] * len(a_list)
+    assert len(a_list) == len(b_list), "`a_list` and `b_list` must have the same length!"
+    mx_basis = _bt.create_basis_for_matrix(a_list[0], mx_basis)
+
+    chois = {}  # id(mx) => (mx, choi_matrix); mx is kept so its id isn't reused during this function
+
+    def _choi(mx):
+        if id(mx) not in chois:
+            chois[id(mx)] = (mx, _unnormalized_choi(mx, mx_basis))
+        return chois[id(mx)][1]
+
+    return [_diamond_norm_from_choi(_choi(a), _choi(b), return_x) for a, b in zip(a_list, b_list)]
+
+
+def _unnormalized_choi(mx, mx_basis):
     # _jam code below assumes *un-normalized* Jamiol-isomorphism.
-    # It will convert a & b to a "single-block" basis representation
+    # It will convert mx to a "single-block" basis representation
     # when mx_basis has multiple blocks. So after we call it, we need
     # to multiply by mx dimension (`smallDim`).
-    JAstd = _jam.fast_jamiolkowski_iso_std(a, mx_basis)
-    JBstd = _jam.fast_jamiolkowski_iso_std(b, mx_basis)
-    dim = JAstd.shape[0]
-    smallDim = int(_np.sqrt(dim))
-    JAstd *= smallDim
-    JBstd *= smallDim
-    assert(dim == JAstd.shape[1] == JBstd.shape[0] == JBstd.shape[1])
+    Jstd = _jam.fast_jamiolkowski_iso_std(mx, mx_basis)
+    smallDim = int(round(_np.sqrt(Jstd.shape[0])))
+    return Jstd * smallDim
 
+
+def _diamond_norm_from_choi(JAstd, JBstd, return_x=False):
+    # The diamond norm of the map with (un-normalized, standard basis) Jamiolkowski
+    # matrix J = JBstd - JAstd.  The first tensor-product factor of these Jamiolkowski
+    # matrices is the output space and the second is the input space.
+    dim = JAstd.shape[0]
+    smallDim = int(round(_np.sqrt(dim)))
+    assert dim == JAstd.shape[1] == JBstd.shape[0] == JBstd.shape[1]
     J = JBstd - JAstd
-    prob, vars = _diamond_norm_model(dim, smallDim, J)
+
+    # The shortcuts below only give the diamond norm's value.  When `return_x` is True the general SDP is
+    # always solved, since its X is used (e.g. by reportables) as the norm's gradient with respect to any,
+    # not necessarily trace preserving, perturbation of J.
+    trace_annihilating = False
+    if not return_x and _np.allclose(JAstd, JAstd.conj().T, atol=_DIAMOND_NORM_TOL) \
+       and _np.allclose(JBstd, JBstd.conj().T, atol=_DIAMOND_NORM_TOL):
+        # For a Hermiticity-preserving map, || J ||_1 / smallDim (the value at a maximally entangled input)
+        # and || Tr_out |J| ||_inf bound the diamond norm from below and above.  These bounds coincide when,
+        # e.g., the map is Pauli-diagonal, in which case the maximally entangled input is optimal.
+        J = (J + J.conj().T) / 2
+        evals, evecs = _np.linalg.eigh(J)
+        lower_bound = _np.sum(_np.abs(evals)) / smallDim
+        abs_J = _np.dot(evecs * _np.abs(evals), evecs.conj().T)
+        upper_bound = _np.linalg.eigvalsh(_partial_trace_over_output(abs_J, smallDim))[-1]
+        if upper_bound - lower_bound <= _DIAMOND_NORM_TOL * max(1.0, upper_bound):
+            return lower_bound
+
+        unitary_dd = _unitary_diamonddist(JAstd, JBstd, smallDim)
+        if unitary_dd is not None:
+            return unitary_dd
+
+        trace_annihilating = _np.allclose(_partial_trace_over_output(J, smallDim), 0, atol=_DIAMOND_NORM_TOL)
+
+    # currently cvxpy is only needed for this function, so don't import until here
+    import cvxpy as _cvxpy
+    prob, (K, L), X = _diamond_norm_sdp(dim, smallDim, trace_annihilating)
+    K.value = J.real
+    L.value = J.imag
 
     try:
-        prob.solve(solver='CVXOPT')
+        prob.solve(solver='CVXOPT', warm_start=True)
     except _cvxpy.error.SolverError as e:
         _warnings.warn("CVXPY failed: %s - diamonddist returning -2!" % str(e))
         return (-2, _np.zeros((dim, dim))) if return_x else -2
@@ -335,13 +426,61 @@ def diamonddist(a, b, mx_basis='pp', return_x=False):
         return (-2, _np.zeros((dim, dim))) if return_x else -2
 
     if return_x:
-        return prob.value, vars[0].value
+        return prob.value, X.value
     else:
         return prob.value
 
 
-def _diamond_norm_model(dim, smallDim, J):
-    # return a model for computing the diamond norm.
+def _partial_trace_over_output(J, smallDim):
+    # trace out the first (output) tensor-product factor of a smallDim^2 x smallDim^2 Jamiolkowski matrix
+    return _np.einsum('ijik->jk', J.reshape((smallDim,) * 4))
+
+
+def _unitary_diamonddist(JAstd, JBstd, smallDim):
+    # The diamond norm of the difference between two unitary channels, or None if either
+    # channel isn't unitary.  This is 2 * sqrt(1 - r^2), where r is the distance from 0 to
+    # the convex hull of the eigenvalues of U_A^dag U_B (see, e.g., Watrous, "The Theory of
+    # Quantum Information", Thm. 3.55).
+    unitaries = []
+    for Jstd in (JAstd, JBstd):
+        evals, evecs = _np.linalg.eigh(Jstd)
+        if abs(evals[-1] - smallDim) > _DIAMOND_NORM_TOL * smallDim \
+           or _np.max(_np.abs(evals[:-1])) > _DIAMOND_NORM_TOL * smallDim:
+            return None  # not a rank-1 Jamiolkowski matrix
+        U = _np.sqrt(evals[-1]) * evecs[:, -1].reshape((smallDim, smallDim))  # (up to a transpose & phase)
+        if not _np.allclose(_np.dot(U, U.conj().T), _np.identity(smallDim), atol=_DIAMOND_NORM_TOL * smallDim):
+            return None  # not trace preserving
+        unitaries.append(U)
+
+    phases = _np.sort(_np.angle(_np.linalg.eigvals(_np.dot(unitaries[0].conj().T, unitaries[1]))))
+    gaps = _np.diff(_np.concatenate((phases, [phases[0] + 2 * _np.pi])))
+    arc = 2 * _np.pi - _np.max(gaps)  # angle of the smallest arc of the unit circle containing all the eigenvalues
+    return 2 * _np.sin(arc / 2) if arc < _np.pi else 2.0
+
+
+def _diamond_norm_sdp(dim, smallDim, trace_annihilating):
+    # return a (cached) cvxpy problem computing the diamond norm, parameterized by
+    # the real and imaginary parts (K, L) of J(phi), along with the variable X.
+    key = (dim, smallDim, trace_annihilating)
+    if key not in _DIAMOND_NORM_SDPS:
+        import cvxpy as _cp
+        old_cvxpy = bool(tuple(map(int, _cp.__version__.split('.'))) < (1, 0))
+        if old_cvxpy:
+            raise RuntimeError('CVXPY 0.4 is no longer supported. Please upgrade to CVXPY 1.0 or higher.')
+
+        K = _cp.Parameter((dim, dim), name='K')
+        L = _cp.Parameter((dim, dim), name='L')
+        if trace_annihilating:
+            prob, vars = _trace_annihilating_diamond_norm_model(dim, smallDim, K, L)
+        else:
+            prob, vars = _diamond_norm_model(dim, smallDim, K, L)
+        _DIAMOND_NORM_SDPS[key] = (prob, (K, L), vars[0])
+    return _DIAMOND_NORM_SDPS[key]
+
+
+def _diamond_norm_model(dim, smallDim, K, L):
+    # return a model for computing the diamond norm of the map whose
+    # Jamiolkowski matrix J(phi) has real and imaginary parts K and L.
     #
     # Uses the primal SDP from arXiv:1207.5726v2, Sec 3.2
     #
@@ -359,8 +498,6 @@ def _diamond_norm_model(dim, smallDim, J):
     Y = _cp.real(X)
     Z = _cp.imag(X)
 
-    K = J.real
-    L = J.imag
     if hasattr(_cp, 'scalar_product'):
         objective_expr = _cp.scalar_product(K, Y) + _cp.scalar_product(L, Z)
     else:
@@ -396,6 +533,33 @@ def _diamond_norm_model(dim, smallDim, J):
     return prob, [X, rho0, rho1]
 
 
+def _trace_annihilating_diamond_norm_model(dim, smallDim, K, L):
+    # return a model for computing the diamond norm of a trace-annihilating
+    # map (e.g. the difference of two trace-preserving maps) whose Jamiolkowski
+    # matrix J(phi) has real and imaginary parts K and L.  This SDP is much
+    # smaller than the general one above.
+    #
+    # Uses the primal SDP from arXiv:0901.4709v2, Sec 4 (scaled by 2):
+    #
+    # Maximize < J(phi), X >
+    # Subject to  0 << X << 2 I otimes rho
+    #             rho is a density matrix
+
+    import cvxpy as _cp
+
+    rho = _cp.Variable((smallDim, smallDim), name='rho', hermitian=True)
+    X = _cp.Variable((dim, dim), name='X', hermitian=True)
+
+    objective = _cp.Maximize(_cp.scalar_product(K, _cp.real(X)) + _cp.scalar_product(L, _cp.imag(X)))
+    constraints = [
+        X >> 0,
+        2 * _cp.kron(_np.identity(smallDim, 'd'), rho) - X >> 0,
+        _cp.trace(rho) == 1.
+    ]
+    prob = _cp.Problem(objective, constraints)
+    return prob, [X, rho]
+
+
 def jtracedist(a, b, mx_basis='pp'):  # Jamiolkowski trace distance:  Tr(|J(a)-J(b)|)
     """
     Compute the Jamiolkowski trace distance between operation matrices.
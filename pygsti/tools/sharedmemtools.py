@@ -10,7 +10,9 @@ Utility functions for working with shared memory
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import multiprocessing as _mp
 import os as _os
+import pickle as _pickle
 
 import numpy as _np
 
@@ -175,3 +177,178 @@ def cleanup_shared_ndarray(shm):
             shm.unlink()
         except FileNotFoundError:
             _resource_tracker.unregister('/' + shm.name, 'shared_memory')
+
+
+_SHARED_BUFFER_ALIGNMENT = 64  # byte alignment of each out-of-band buffer within a broadcast segment
+_ATTACHED_SHARED_OBJECTS = {}  # shared memory name => (SharedMemory, object), per process
+_RELEASED_SHARED_MEMORY = []  # released segments that could not be closed yet, per process
+
+
+class SharedObjectHandle(object):
+    """
+    A lightweight, picklable reference to an object broadcast to shared memory by :func:`broadcast_object`.
+
+    Pickling a handle only pickles the name and layout of the shared memory segment
+    holding the object, so handles can be sent to worker processes cheaply.  Calling
+    :meth:`get` in a worker process unpickles the object *once per process*, with its
+    large numpy arrays (and other large buffers) referencing the shared memory directly
+    rather than being copied.  These arrays are read-only.
+
+    Parameters
+    ----------
+    shm_name : str or None
+        The name of the shared memory segment holding the object, or `None` if the
+        object is held (and pickled) by this handle directly.
+
+    pickle_nbytes : int
+        The length of the object's pickle data, which begins the shared memory segment.
+
+    buffer_extents : list
+        A list of `(offset, nbytes)` tuples giving the locations of the object's
+        out-of-band buffers within the shared memory segment.
+
+    obj : object, optional
+        The broadcast object itself, which is returned by :meth:`get` in the process
+        that created the handle (it is not pickled when `shm_name` is not `None`).
+    """
+
+    def __init__(self, shm_name, pickle_nbytes, buffer_extents, obj=None):
+        self.shm_name = shm_name
+        self.pickle_nbytes = pickle_nbytes
+        self.buffer_extents = buffer_extents
+        self._obj = obj
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.shm_name is not None:
+            state['_obj'] = None  # the whole point: don't pickle the object
+        return state
+
+    def get(self):
+        """
+        The broadcast object.
+
+        Returns
+        -------
+        object
+        """
+        if self._obj is not None or self.shm_name is None:
+            return self._obj
+        if self.shm_name not in _ATTACHED_SHARED_OBJECTS:
+            shm = _shared_memory.SharedMemory(name=self.shm_name)
+            buf = shm.buf.toreadonly()
+            buffers = [buf[offset:offset + nbytes] for offset, nbytes in self.buffer_extents]
+            obj = _pickle.loads(buf[0:self.pickle_nbytes], buffers=buffers)
+            _ATTACHED_SHARED_OBJECTS[self.shm_name] = (shm, obj)  # shm must stay open while obj is alive
+        return _ATTACHED_SHARED_OBJECTS[self.shm_name][1]
+
+    def release(self):
+        """
+        Detaches this process from the broadcast object, e.g. once a worker no longer needs it.
+
+        The (read-only) object obtained via :meth:`get` must no longer be used.  If
+        references to it remain, detaching the shared memory segment is deferred until
+        a later call to :meth:`release` finds them gone.
+
+        Returns
+        -------
+        None
+        """
+        if self.shm_name is not None and self.shm_name in _ATTACHED_SHARED_OBJECTS:
+            _RELEASED_SHARED_MEMORY.append(_ATTACHED_SHARED_OBJECTS.pop(self.shm_name)[0])
+        for shm in list(_RELEASED_SHARED_MEMORY):
+            try:
+                shm.close()
+                _RELEASED_SHARED_MEMORY.remove(shm)
+            except BufferError:
+                pass  # the object (or part of it) is still referenced
+
+
+def ensure_resource_tracker_running():
+    """
+    Starts this process's shared memory resource tracker, if it is not already running.
+
+    Call this before creating a (long-lived) pool whose workers will use objects
+    broadcast later by :func:`broadcast_object`.  Workers share the tracker of the
+    process that created them only if it was running when they were created;
+    otherwise they track the segments they attach to on their own, and report them
+    as leaked when they exit.
+
+    Returns
+    -------
+    None
+    """
+    if _resource_tracker is not None:
+        _resource_tracker.ensure_running()
+
+
+def broadcast_object(obj, min_shared_nbytes=1024, skip_if_forking=False):
+    """
+    Places an object into shared memory so it can be sent to process-pool workers without copying.
+
+    The object is pickled (using pickle protocol 5) with its buffers of at least
+    `min_shared_nbytes` bytes - e.g. the arrays of a :class:`DataSet`, a model's
+    parameter vector and dense representations, or a layout's index arrays - stored
+    out-of-band.  The pickle data and these buffers are copied once into a single
+    shared memory segment, and the returned handle, which is cheap to pickle, is sent
+    to workers in place of `obj`.  Workers obtain the object via :meth:`SharedObjectHandle.get`.
+
+    The broadcast object must not be modified while it is in use by workers, and
+    workers see a read-only version of it.  When shared memory is not enabled (see
+    :func:`shared_mem_is_enabled`), or `obj` is small, the returned handle simply
+    holds `obj` and is pickled along with it.
+
+    Parameters
+    ----------
+    obj : object
+        The (picklable) object to broadcast.
+
+    min_shared_nbytes : int, optional
+        Buffers smaller than this are kept within the pickle data rather than stored separately.
+
+    skip_if_forking : bool, optional
+        If True, `obj` is not placed in shared memory when new processes are started by
+        forking.  This is appropriate for objects given to pool workers via the pool's
+        `initargs`, which forked workers inherit (sharing memory copy-on-write) without
+        any copying.
+
+    Returns
+    -------
+    handle : SharedObjectHandle
+        A picklable handle to the broadcast object.
+
+    shm : multiprocessing.shared_memory.SharedMemory
+        A shared memory object needed to cleanup the shared memory, or `None` if
+        none was allocated.  Provide this to :func:`cleanup_shared_ndarray` once
+        the workers no longer need the object.
+    """
+    if not shared_mem_is_enabled() or (skip_if_forking and _mp.get_start_method() == 'fork'):
+        return SharedObjectHandle(None, 0, [], obj), None
+
+    buffers = []
+
+    def store_out_of_band(pickle_buffer):
+        if pickle_buffer.raw().nbytes < min_shared_nbytes:
+            return True  # serialize in-band
+        buffers.append(pickle_buffer)
+        return False
+
+    pickle_data = _pickle.dumps(obj, protocol=5, buffer_callback=store_out_of_band)
+    if len(buffers) == 0 and len(pickle_data) < min_shared_nbytes:
+        return SharedObjectHandle(None, 0, [], obj), None  # not worth a shared memory segment
+
+    def _aligned(offset):
+        return -(-offset // _SHARED_BUFFER_ALIGNMENT) * _SHARED_BUFFER_ALIGNMENT
+
+    buffer_extents = []; offset = len(pickle_data)
+    for pickle_buffer in buffers:
+        offset = _aligned(offset)
+        buffer_extents.append((offset, pickle_buffer.raw().nbytes))
+        offset += pickle_buffer.raw().nbytes
+
+    shm = _shared_memory.SharedMemory(create=True, size=max(offset, 1))  # size must be > 0
+    shm.buf[0:len(pickle_data)] = pickle_data
+    for pickle_buffer, (offset, nbytes) in zip(buffers, buffer_extents):
+        shm.buf[offset:offset + nbytes] = pickle_buffer.raw()
+
+    return SharedObjectHandle(shm.name, len(pickle_data), buffer_extents, obj), shm
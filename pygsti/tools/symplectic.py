@@ -1782,19 +1782,17 @@ def symplectic_innerproduct(v, w):
     Parameters
     ----------
     v : numpy.ndarray
-        A length-2n vector.
+        A length-2n vector, or a 2D array whose rows are length-2n vectors.
 
     w : numpy.ndarray
         A length-2n vector.
 
     Returns
     -------
-    int
+    int or numpy.ndarray
+        The inner product (mod 2), or an array of the inner products of each row of `v` with `w`.
     """
-    t = 0
-    for i in range(0, _np.size(v) >> 1):
-        t += v[2 * i] * w[2 * i + 1]
-        t += w[2 * i] * v[2 * i + 1]
+    t = _np.sum(v[..., 0::2] * w[1::2], axis=-1) + _np.sum(v[..., 1::2] * w[0::2], axis=-1)
     return t % 2
 
 
@@ -1811,12 +1809,15 @@ def symplectic_transvection(k, v):
         A length-2n vector.
 
     v : numpy.ndarray
-        A length-2n vector.
+        A length-2n vector, or a 2D array whose rows are length-2n vectors (in
+        which case the transvection is applied to every row).
 
     Returns
     -------
     numpy.ndarray
     """
+    if _np.ndim(v) > 1:
+        return ((v + _np.outer(symplectic_innerproduct(v, k), k)) % 2).astype(v.dtype, copy=False)
     return (v + symplectic_innerproduct(k, v) * k) % 2
 
 
@@ -2025,11 +2026,11 @@ def compute_symplectic_matrix(i, n):
     else:
         g = id2
 
-    for j in range(0, nn):
-        g[j] = symplectic_transvection(T[0], g[j])
-        g[j] = symplectic_transvection(T[1], g[j])
-        g[j] = symplectic_transvection(h0, g[j])
-        g[j] = symplectic_transvection(f1, g[j])
+    # (transvections are applied to all the rows of g at once)
+    g = symplectic_transvection(T[0], g)
+    g = symplectic_transvection(T[1], g)
+    g = symplectic_transvection(h0, g)
+    g = symplectic_transvection(f1, g)
 
     return g
 
@@ -2095,16 +2096,11 @@ def compute_symplectic_label(gn, n=None):
         return cvw
 
     #step 6
-    gprime = _np.copy(gn)
+    gprime = _np.array(gn)
+    gprime = symplectic_transvection(T[1], symplectic_transvection(T[0], gprime))
+    gprime = symplectic_transvection(h0, gprime)
     if b == 0:
-        for j in range(0, nn):
-            gprime[j] = symplectic_transvection(T[1], symplectic_transvection(T[0], gn[j]))
-            gprime[j] = symplectic_transvection(h0, gprime[j])
-            gprime[j] = symplectic_transvection(e1, gprime[j])
-    else:
-        for j in range(0, nn):
-            gprime[j] = symplectic_transvection(T[1], symplectic_transvection(T[0], gn[j]))
-            gprime[j] = symplectic_transvection(h0, gprime[j])
+        gprime = symplectic_transvection(e1, gprime)
 
     # step 7
     gnew = gprime[2:nn, 2:nn]  # take submatrix
@@ -2137,18 +2133,14 @@ def random_symplectic_index(n, rand_state=None):
     if rand_state is None:
         rand_state = _np.random.RandomState()
 
-    def zeros_string(k):
-        zeros_str = ''
-        for j in range(0, k):
-            zeros_str += '0'
-        return zeros_str
-
     if cardinality <= max_integer:
         index = rand_state.randint(cardinality, dtype=_np.int64)
 
     else:
-        digits1 = len(str(cardinality))
-        digits2 = len(str(max_integer)) - 1
+        # The index is assembled from base-10**digits2 "digits" sampled as int64s.  (Integer arithmetic
+        # is used rather than string manipulation, which fails for very large cardinalities.)
+        digits1 = _num_decimal_digits(cardinality)
+        digits2 = _num_decimal_digits(max_integer) - 1
         n = digits1 // digits2
         m = digits1 - n * digits2
 
@@ -2157,16 +2149,17 @@ def random_symplectic_index(n, rand_state=None):
 
             temp = 0
             for i in range(0, n):
-                add = zeros_string(m)
-                sample = rand_state.randint(10**digits2, dtype=_np.int64)
-                for j in range(0, i):
-                    add += zeros_string(digits2)
-                add += str(sample)
-                for j in range(i + 1, n):
-                    add += zeros_string(digits2)
-                temp += int(add)
-
-            add = str(rand_state.randint(10**m, dtype=_np.int64)) + zeros_string(n * digits2)
-            index = int(add) + temp
+                sample = int(rand_state.randint(10**digits2, dtype=_np.int64))
+                temp += sample * 10**((n - 1 - i) * digits2)
+
+            index = int(rand_state.randint(10**m, dtype=_np.int64)) * 10**(n * digits2) + temp
 
     return index
+
+
+def _num_decimal_digits(i):
+    """ The number of decimal digits of the positive integer `i`, i.e. `len(str(i))`. """
+    ndigits = max(int(i.bit_length() * 0.30102999566398114) - 1, 1)  # 0.30103 ~= log10(2)
+    while 10**ndigits <= i:
+        ndigits += 1
+    return ndigits
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Benchmarks the time taken by a cold `import pygsti`.
+
+Each import is performed in a fresh Python process (so nothing is already in `sys.modules`),
+and the median wall-clock time over several runs is reported together with the slowest
+(cumulative) imports reported by `python -X importtime`.  Use `--max-seconds` to make the
+script exit with a non-zero status when the median import time exceeds a given budget, and
+`--forbid` to check that slow optional dependencies are not imported eagerly.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_FORBIDDEN = ('pygsti.report', 'pygsti.protocols', 'pygsti.drivers', 'pygsti.algorithms',
+                     'matplotlib', 'plotly', 'scipy.stats', 'scipy.optimize')
+
+
+def time_cold_imports(module='pygsti', num_runs=5):
+    """ Wall-clock times (in seconds) of `num_runs` cold imports of `module`. """
+    times = []
+    for _ in range(num_runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'import %s' % module], check=True)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def slowest_imports(module='pygsti', num_to_show=15):
+    """ (cumulative microseconds, module name) pairs for the slowest imports, from `-X importtime`. """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+                            check=True, capture_output=True, text=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line: continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        entries.append((int(cumulative), name.strip()))
+    return sorted(entries, reverse=True)[0:num_to_show]
+
+
+def imported_modules(module='pygsti'):
+    """ The names of all the modules in `sys.modules` after importing `module` in a fresh process. """
+    result = subprocess.run([sys.executable, '-c', 'import sys, %s; print("\\n".join(sys.modules))' % module],
+                            check=True, capture_output=True, text=True)
+    return set(result.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help="number of cold imports to time")
+    parser.add_argument('--max-seconds', type=float, default=None, help="fail if the median time exceeds this")
+    parser.add_argument('--forbid', nargs='*', default=DEFAULT_FORBIDDEN,
+                        help="modules that must not be imported by `import pygsti`")
+    args = parser.parse_args()
+
+    times = time_cold_imports('pygsti', args.runs)
+    median = statistics.median(times)
+    print("Cold `import pygsti`: median %.3fs over %d runs (min %.3fs, max %.3fs)"
+          % (median, len(times), min(times), max(times)))
+
+    print("Slowest imports (cumulative):")
+    for cumulative_us, name in slowest_imports('pygsti'):
+        print("  %8.3fs  %s" % (cumulative_us / 1e6, name))
+
+    ok = True
+    loaded = imported_modules('pygsti')
+    eager = sorted(name for name in args.forbid if name in loaded)
+    if eager:
+        print("FAIL: these modules should not be imported by `import pygsti`: %s" % ", ".join(eager))
+        ok = False
+    if args.max_seconds is not None and median > args.max_seconds:
+        print("FAIL: median import time %.3fs exceeds the %.3fs budget" % (median, args.max_seconds))
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,19 @@
 import collections
+import json
 import os
+import re
 import shutil
 import subprocess
 import unittest
 
 import numpy as np
+from plotly.utils import PlotlyJSONEncoder
 
 import pygsti
 from pygsti.modelpacks import smq1Q_XY as std
 # Inherit setup from here
 from .reportBaseCase import ReportBaseCase
-from ..testutils import compare_files, temp_files
+from ..testutils import BaseTestCase, compare_files, temp_files
 
 bLatex = bool('PYGSTI_LATEX_TESTING' in os.environ and
               os.environ['PYGSTI_LATEX_TESTING'].lower() in ("yes","1","true"))
@@ -20,6 +23,36 @@ try:
 except ImportError:
     bPandas = False
 
+def _square(x):
+    return x * x
+
+
+def _increment(x):
+    return x + 1
+
+
+def _fail(x):
+    raise ValueError("Cannot compute %d" % x)
+
+
+class TestWorkspaceParallelPrecompute(BaseTestCase):
+
+    def build(self, ws, fn=_square):
+        values = [ws.switched_compute(fn, x)[0][0] for x in range(4)]
+        return [ws.switched_compute(_increment, v)[0][0] for v in values]  # depend on the first computations
+
+    def test_precompute_in_parallel(self):
+        ws = pygsti.report.Workspace()
+        self.assertEqual(ws.precompute_in_parallel(lambda: self.build(ws), 2), 8)
+        self.assertEqual(self.build(ws), self.build(pygsti.report.Workspace()))
+        self.assertEqual(sum(ws.smartCache.misses.values()), 0)  # everything was computed in parallel
+
+    def test_precompute_in_parallel_error(self):
+        ws = pygsti.report.Workspace()
+        with self.assertRaises(ValueError):
+            ws.precompute_in_parallel(lambda: self.build(ws, _fail), 2)
+
+
 class TestReport(ReportBaseCase):
 
     def checkFile(self, fn):
@@ -84,6 +117,32 @@ class TestReport(ReportBaseCase):
         #self.checkFile("general_reportA%s.html" % vs)
 
 
+    def test_reports_parallel_build(self):
+        rpt = pygsti.report.construct_standard_report(self.results, "Parallel report", confidence_level=None,
+                                                      advanced_options={'num_processes': 2}, verbosity=3)
+        rpt.write_html(temp_files + "/general_reportA_parallel", auto_open=False)
+
+        serial_rpt = pygsti.report.construct_standard_report(self.results, "Parallel report", confidence_level=None,
+                                                             verbosity=3)
+        serial_rpt._build()
+        cache = rpt._workspace.smartCache.cache
+        serial_cache = serial_rpt._workspace.smartCache.cache
+        shared_keys = set(cache.keys()) & set(serial_cache.keys())
+        self.assertGreater(len(shared_keys), 0)
+
+        def content(output):  # excludes the (random) element ids used when rendering plots
+            if isinstance(output, pygsti.report.figure.ReportFigure):  # (plotly doesn't keep key order)
+                return json.dumps(output.plotlyfig, cls=PlotlyJSONEncoder, sort_keys=True)
+            if isinstance(output, pygsti.report.workspace.WorkspacePlot):
+                return [content(fig) for fig in output.figs]
+            if isinstance(output, pygsti.report.table.ReportTable):
+                return [[content(cell.data.value) for cell in row.cells] for row in output._rows]
+            if isinstance(output, pygsti.report.textblock.ReportText):
+                return str(output.render('html', text_id='text'))
+            return re.sub(r" at 0x[0-9a-f]+", "", str(output))  # (object addresses differ too)
+        for key in shared_keys:
+            self.assertEqual(content(cache[key]), content(serial_cache[key]))
+
     def test_reports_chi2_wCIs(self):
         crfact = self.results.estimates['default'].add_confidence_region_factory('go0', 'final')
         crfact.compute_hessian(comm=None)